@@ -0,0 +1,35 @@
+"""Add sync_watermark table for incremental BigQuery syncs
+
+Revision ID: 011_add_sync_watermark
+Revises: 010_add_share_link
+Create Date: 2026-03-16
+
+Stores a per-table high-water mark so scheduled syncs only pull tasks
+changed in BigQuery since the previous run, plus the time of the last
+full reconciliation.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '011_add_sync_watermark'
+down_revision = '010_add_share_link'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_watermark',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('table_name', sa.String(100), nullable=False, unique=True, index=True),
+        sa.Column('high_water_mark', sa.DateTime(), nullable=True),
+        sa.Column('last_full_sync_at', sa.DateTime(), nullable=True),
+        sa.Column('last_sync_mode', sa.String(20), nullable=True),
+        sa.Column('rows_changed', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_watermark')
@@ -0,0 +1,62 @@
+"""Add trainer fact tables for the POD Lead and Project hierarchies
+
+Revision ID: 012_add_trainer_fact_tables
+Revises: 011_add_sync_watermark
+Create Date: 2026-03-20
+
+Pre-aggregated trainer x project x day metrics (trainer_daily_fact) and
+task-grain completion facts (trainer_task_daily_fact), rebuilt as the last
+stage of every sync so the hierarchy endpoints only range-sum rows.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '012_add_trainer_fact_tables'
+down_revision = '011_add_sync_watermark'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'trainer_daily_fact',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('trainer_email', sa.String(255), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('fact_date', sa.Date(), nullable=True),
+        sa.Column('sum_turns', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('approved_tasks', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('approved_rework', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('delivered_tasks', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('in_delivery_queue', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('revenue', sa.Float(), nullable=True, server_default='0'),
+        sa.Column('manual_reviews', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('manual_score', sa.Float(), nullable=True, server_default='0'),
+        sa.Column('agentic_reviews', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('agentic_score', sa.Float(), nullable=True, server_default='0'),
+    )
+    op.create_index('ix_trainer_daily_fact_project_date', 'trainer_daily_fact', ['project_id', 'fact_date'])
+    op.create_index('ix_trainer_daily_fact_trainer_date', 'trainer_daily_fact', ['trainer_email', 'fact_date'])
+
+    op.create_table(
+        'trainer_task_daily_fact',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('trainer_email', sa.String(255), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.BigInteger(), nullable=False),
+        sa.Column('fact_date', sa.Date(), nullable=True),
+        sa.Column('new_completions', sa.Integer(), nullable=True, server_default='0'),
+        sa.Column('rework_completions', sa.Integer(), nullable=True, server_default='0'),
+    )
+    op.create_index('ix_trainer_task_daily_fact_project_date', 'trainer_task_daily_fact', ['project_id', 'fact_date'])
+    op.create_index('ix_trainer_task_daily_fact_trainer_date', 'trainer_task_daily_fact', ['trainer_email', 'fact_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trainer_task_daily_fact_trainer_date', table_name='trainer_task_daily_fact')
+    op.drop_index('ix_trainer_task_daily_fact_project_date', table_name='trainer_task_daily_fact')
+    op.drop_table('trainer_task_daily_fact')
+    op.drop_index('ix_trainer_daily_fact_trainer_date', table_name='trainer_daily_fact')
+    op.drop_index('ix_trainer_daily_fact_project_date', table_name='trainer_daily_fact')
+    op.drop_table('trainer_daily_fact')
@@ -0,0 +1,43 @@
+"""Add fpy_review table for locally computed first-pass yield
+
+Revision ID: 013_add_fpy_review
+Revises: 012_add_trainer_fact_tables
+Create Date: 2026-03-27
+
+Published manual reviews (conversation, project, reviewer, action, date)
+synced from BigQuery, so Reviewer / Auditor FPY is computed in SQL instead
+of scanning review ⨝ conversation ⨝ contributor on every request.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '013_add_fpy_review'
+down_revision = '012_add_trainer_fact_tables'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fpy_review',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('review_id', sa.BigInteger(), nullable=True),
+        sa.Column('conversation_id', sa.BigInteger(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('reviewer_email', sa.String(255), nullable=True),
+        sa.Column('action_type', sa.String(50), nullable=True),
+        sa.Column('submitted_at', sa.DateTime(), nullable=False),
+        sa.Column('review_date', sa.Date(), nullable=False),
+        sa.Column('last_synced', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    )
+    op.create_index('ix_fpy_review_review_id', 'fpy_review', ['review_id'], unique=True)
+    op.create_index('ix_fpy_review_conversation_id', 'fpy_review', ['conversation_id'])
+    op.create_index('ix_fpy_review_project_date', 'fpy_review', ['project_id', 'review_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fpy_review_project_date', table_name='fpy_review')
+    op.drop_index('ix_fpy_review_conversation_id', table_name='fpy_review')
+    op.drop_index('ix_fpy_review_review_id', table_name='fpy_review')
+    op.drop_table('fpy_review')
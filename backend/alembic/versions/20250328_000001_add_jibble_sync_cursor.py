@@ -0,0 +1,34 @@
+"""Add jibble_sync_cursor table for incremental Jibble hours syncs
+
+Revision ID: 014_add_jibble_sync_cursor
+Revises: 013_add_fpy_review
+Create Date: 2026-03-28
+
+Per-project and per-person cursors so the TimeEntries sync only re-fetches
+days since the last run instead of every person's full history.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '014_add_jibble_sync_cursor'
+down_revision = '013_add_fpy_review'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jibble_sync_cursor',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('source', sa.String(50), nullable=False),
+        sa.Column('scope', sa.String(20), nullable=False),
+        sa.Column('cursor_key', sa.String(100), nullable=False),
+        sa.Column('synced_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_jibble_sync_cursor_key', 'jibble_sync_cursor', ['source', 'scope', 'cursor_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jibble_sync_cursor_key', table_name='jibble_sync_cursor')
+    op.drop_table('jibble_sync_cursor')
@@ -0,0 +1,63 @@
+"""Add composite indexes for task_history_raw and task_raw hot queries
+
+Revision ID: 015_add_task_hot_indexes
+Revises: 014_add_jibble_sync_cursor
+Create Date: 2026-04-02
+
+Metric queries read completion events from task_history_raw by project and
+date range (grouped by author) or by task_id, and filter task_raw by
+project, derived_status and last_completed_date or r_updated_at. Until now
+only single-column indexes existed, so these were served by the
+new_status index (or a scan of task_raw) plus a filter over every row.
+
+Both tables are large and written by every sync, so the indexes are built
+CONCURRENTLY (outside the migration transaction) instead of locking out
+writes for the length of the build.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '015_add_task_hot_indexes'
+down_revision = '014_add_jibble_sync_cursor'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_task_history_completed_project_date',
+            'task_history_raw',
+            ['project_id', 'date', 'author'],
+            postgresql_where=sa.text("new_status = 'completed'"),
+            postgresql_include=['task_id', 'completed_status_count', 'old_status'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_task_history_completed_task',
+            'task_history_raw',
+            ['task_id'],
+            postgresql_where=sa.text("new_status = 'completed'"),
+            postgresql_include=['author', 'completed_status_count', 'old_status', 'time_stamp'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_task_raw_project_status_completed',
+            'task_raw',
+            ['project_id', 'derived_status', 'last_completed_date'],
+            postgresql_include=['trainer'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_task_raw_project_reviewed', 'task_raw', ['project_id', 'r_updated_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_task_raw_project_reviewed', table_name='task_raw', postgresql_concurrently=True)
+        op.drop_index('ix_task_raw_project_status_completed', table_name='task_raw', postgresql_concurrently=True)
+        op.drop_index('ix_task_history_completed_task', table_name='task_history_raw', postgresql_concurrently=True)
+        op.drop_index('ix_task_history_completed_project_date', table_name='task_history_raw', postgresql_concurrently=True)
@@ -60,6 +60,17 @@ def _extract_token(request: Request) -> str:
     return auth_header[7:]
 
 
+def has_valid_bearer(authorization: str) -> bool:
+    """Whether an Authorization header value carries a valid, unexpired JWT."""
+    if not authorization.startswith("Bearer "):
+        return False
+    try:
+        decode_jwt(authorization[7:])
+    except HTTPException:
+        return False
+    return True
+
+
 async def get_current_user(request: Request) -> dict:
     """FastAPI dependency – extracts JWT, verifies it, returns user dict."""
     token = _extract_token(request)
@@ -74,6 +74,12 @@ class Settings(BaseSettings):
     # Google Cloud Credentials - Optional (can use default credentials)
     google_application_credentials: Optional[str] = None
     
+    # Cached BigQuery reads (keyed on SQL + parameters); BigQuery data changes
+    # outside our sync, so entries only live for the TTL
+    bigquery_result_cache_ttl_seconds: int = 600
+    bigquery_result_cache_max_entries: int = 256
+    bigquery_result_cache_max_mb: int = 128
+    
     # ==========================================================================
     # API Settings
     # ==========================================================================
@@ -86,12 +92,59 @@ class Settings(BaseSettings):
     default_page_size: int = 100
     max_page_size: int = 1000
     
+    # Responses smaller than this are sent uncompressed (gzip costs more than it saves)
+    gzip_minimum_size: int = 1024
+    
     # ==========================================================================
     # Data Sync Settings (sensible defaults)
     # ==========================================================================
     sync_interval_minutes: int = 15
     initial_sync_on_startup: bool = True
     
+    # Incremental sync: only pull tasks changed since the per-table watermark,
+    # with a periodic full reload to reconcile deletes and missed changes
+    incremental_sync_enabled: bool = True
+    full_sync_interval_hours: int = 24
+    incremental_sync_lookback_minutes: int = 60
+    
+    # Max table syncs run concurrently (independent tables sync in parallel)
+    sync_max_workers: int = 4
+    
+    # ==========================================================================
+    # Read Pool Settings (sensible defaults)
+    # ==========================================================================
+    # Threads running blocking reads for async route handlers; keep below the
+    # DB connection pool size (10 + 20 overflow) so sync jobs still get connections
+    read_pool_max_workers: int = 16
+    
+    # ==========================================================================
+    # Query Cache Settings (sensible defaults)
+    # ==========================================================================
+    cache_max_entries: int = 1000
+    cache_max_memory_mb: int = 512  # Approximate payload bytes, not exact RSS
+    cache_lock_stripes: int = 4  # Each stripe gets an equal share of the limits
+    # Largest share of the memory budget any one endpoint prefix may use
+    cache_prefix_max_share: float = 0.5
+    # Per-prefix quotas in MB as JSON, e.g. {"project_stats": 128}
+    cache_prefix_quotas_json: str = "{}"
+    
+    # Shared cache between workers: "memory" (per-worker only), "redis" or "sqlite"
+    cache_backend: str = "memory"
+    cache_redis_url: str = "redis://localhost:6379/0"  # Any Redis-protocol server
+    cache_sqlite_path: str = "/tmp/nvidia_dashboard_cache.sqlite3"  # Single-host deployments
+    cache_namespace: str = "nvidia_dashboard"
+    # How often each worker checks for invalidations made by other workers
+    cache_generation_check_seconds: float = 1.0
+    
+    @property
+    def cache_prefix_quotas_mb(self) -> dict:
+        """Parse per-prefix cache quotas (MB) from JSON string"""
+        import json
+        try:
+            return {str(k): int(v) for k, v in json.loads(self.cache_prefix_quotas_json).items()}
+        except (json.JSONDecodeError, ValueError, AttributeError):
+            return {}
+    
     # ==========================================================================
     # Project Settings - REQUIRED
     # ==========================================================================
@@ -116,6 +169,16 @@ class Settings(BaseSettings):
     jibble_time_attendance_url: str = "https://time-attendance.prod.jibble.io/v1"
     jibble_project_name: Optional[str] = None
     
+    # API client: request rate shared by all Jibble calls (halved on a 429,
+    # then recovers) and concurrent connections for per-person fetches
+    jibble_requests_per_second: float = 5.0
+    jibble_max_concurrency: int = 8
+    
+    # Incremental hours syncs re-fetch from each cursor minus this many days,
+    # since Jibble entries can be edited after the fact (full reconciliation
+    # follows full_sync_interval_hours)
+    jibble_incremental_lookback_days: int = 3
+    
     # Nvidia Jibble Project IDs (UUIDs from Jibble API)
     # These are the project IDs for filtering time entries
     jibble_nvidia_project_ids: str = ",".join([
@@ -8,6 +8,11 @@ This package contains cross-cutting concerns:
 - resilience: Circuit breakers and retry logic
 - health: Health check functionality
 - cache: Query result caching
+- pagination: Keyset (cursor) pagination for list endpoints
+- export: Streaming NDJSON/CSV/XLSX exports
+- responses: orjson and columnar JSON responses
+- conditional: ETag/Last-Modified validators and 304s for API GETs
+- bigquery_client: Shared BigQuery client and cached BigQuery reads
 - async_utils: Async/sync bridge utilities
 - exceptions: Custom exception classes
 """
@@ -49,6 +54,31 @@ from app.core.cache import (
     cached,
     invalidate_stats_cache,
 )
+from app.core.pagination import (
+    KeysetPage,
+    PageRequest,
+    paginate,
+)
+from app.core.export import (
+    ExportFormat,
+    export_response,
+)
+from app.core.responses import (
+    ORJSONResponse,
+    negotiated_response,
+    to_columnar,
+)
+from app.core.conditional import (
+    ConditionalGetMiddleware,
+    make_etag,
+)
+from app.core.bigquery_client import (
+    get_bigquery_client,
+    execute_query,
+    run_query,
+    clear_bigquery_cache,
+    get_bigquery_stats,
+)
 from app.core.async_utils import (
     run_in_thread,
     async_wrap,
@@ -105,6 +135,26 @@ __all__ = [
     "get_query_cache",
     "cached",
     "invalidate_stats_cache",
+    # Pagination
+    "KeysetPage",
+    "PageRequest",
+    "paginate",
+    # Export
+    "ExportFormat",
+    "export_response",
+    # Responses
+    "ORJSONResponse",
+    "negotiated_response",
+    "to_columnar",
+    # Conditional requests
+    "ConditionalGetMiddleware",
+    "make_etag",
+    # BigQuery
+    "get_bigquery_client",
+    "execute_query",
+    "run_query",
+    "clear_bigquery_cache",
+    "get_bigquery_stats",
     # Async Utils
     "run_in_thread",
     "async_wrap",
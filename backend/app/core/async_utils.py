@@ -3,11 +3,19 @@ Async utilities for running blocking operations in thread pools.
 
 This module provides utilities to safely run synchronous (blocking) operations
 from async contexts without blocking the event loop.
+
+Two pools are kept apart so request traffic can't starve background work:
+- The general pool (``run_in_thread``) for startup, sync and other jobs
+- The read pool (``run_read``) for blocking database/BigQuery reads made by
+  async route handlers, sized separately and instrumented with queue-depth
+  and wait-time metrics
 """
 import asyncio
+import contextvars
 import logging
 import signal
 import sys
+import time
 from concurrent.futures import ThreadPoolExecutor, Future
 from functools import wraps, partial
 from typing import Callable, TypeVar, Any, Optional, List
@@ -20,6 +28,9 @@ _MAX_WORKERS = 4  # Limit concurrent blocking operations
 _pending_futures: List[Future] = []  # Track pending futures for cancellation
 _shutdown_requested = False
 
+# Separate pool for blocking reads from route handlers (sized by read_pool_max_workers)
+_read_pool: Optional[ThreadPoolExecutor] = None
+
 
 def get_thread_pool() -> ThreadPoolExecutor:
     """Get or create the global thread pool."""
@@ -32,15 +43,27 @@ def get_thread_pool() -> ThreadPoolExecutor:
     return _thread_pool
 
 
+def get_read_pool() -> ThreadPoolExecutor:
+    """Get or create the read pool used by route handlers."""
+    global _read_pool
+    if _read_pool is None:
+        from app.config import get_settings
+        _read_pool = ThreadPoolExecutor(
+            max_workers=get_settings().read_pool_max_workers,
+            thread_name_prefix="read_worker_"
+        )
+    return _read_pool
+
+
 def shutdown_thread_pool(wait: bool = False, timeout: float = 2.0):
     """
-    Shutdown the global thread pool.
+    Shutdown the global thread pool and the read pool.
     
     Args:
         wait: If True, wait for pending tasks (with timeout)
         timeout: Maximum seconds to wait if wait=True
     """
-    global _thread_pool, _shutdown_requested, _pending_futures
+    global _thread_pool, _read_pool, _shutdown_requested, _pending_futures
     _shutdown_requested = True
     
     if _thread_pool is not None:
@@ -59,6 +82,11 @@ def shutdown_thread_pool(wait: bool = False, timeout: float = 2.0):
         
         _thread_pool = None
         logger.info("Thread pool shut down")
+    
+    if _read_pool is not None:
+        _read_pool.shutdown(wait=wait, cancel_futures=True)
+        _read_pool = None
+        logger.info("Read pool shut down")
 
 
 def is_shutdown_requested() -> bool:
@@ -119,6 +147,60 @@ async def run_in_thread(func: Callable[..., T], *args, **kwargs) -> T:
             _pending_futures.remove(future)
 
 
+async def run_read(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking read (database query, BigQuery call) in the read pool.
+    
+    Use this in async route handlers for any synchronous service call so a
+    slow query only ties up a read pool thread, not the event loop. The
+    caller's context variables (e.g. the request ID used in logs) are
+    carried over to the worker thread.
+    
+    Args:
+        func: The synchronous function to run
+        *args, **kwargs: Arguments to pass to the function
+        
+    Returns:
+        The result of the function
+        
+    Example:
+        result = await run_read(service.get_project_stats_with_pod_leads, start_date=start_date)
+    """
+    from app.core.metrics import (
+        READ_POOL_ACTIVE,
+        READ_POOL_CALL_DURATION_SECONDS,
+        READ_POOL_QUEUE_DEPTH,
+        READ_POOL_WAIT_SECONDS,
+    )
+    
+    if _shutdown_requested:
+        raise asyncio.CancelledError("Shutdown requested")
+    
+    operation = getattr(func, '__qualname__', None) or getattr(func, '__name__', 'anonymous')
+    context = contextvars.copy_context()
+    submitted = time.perf_counter()
+    
+    def call():
+        started = time.perf_counter()
+        READ_POOL_QUEUE_DEPTH.dec()
+        READ_POOL_WAIT_SECONDS.observe(started - submitted)
+        READ_POOL_ACTIVE.inc()
+        try:
+            return context.run(func, *args, **kwargs)
+        finally:
+            READ_POOL_ACTIVE.dec()
+            READ_POOL_CALL_DURATION_SECONDS.labels(operation=operation).observe(time.perf_counter() - started)
+    
+    READ_POOL_QUEUE_DEPTH.inc()
+    future = get_read_pool().submit(call)
+    try:
+        return await asyncio.wrap_future(future)
+    finally:
+        # A call cancelled while still queued never ran, so it never left the queue
+        if future.cancelled():
+            READ_POOL_QUEUE_DEPTH.dec()
+
+
 def async_wrap(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to wrap a synchronous function for async execution.
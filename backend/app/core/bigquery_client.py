@@ -0,0 +1,209 @@
+"""
+Shared BigQuery access layer.
+
+One process-wide BigQuery client (credentials loaded and HTTP session set up
+once, with a connection pool sized for the read and sync pools) is used by
+every service, instead of each service building its own.
+
+Two ways to run a query:
+- ``execute_query`` always runs the job; used by data sync, which needs
+  fresh data on every run
+- ``run_query`` serves repeated reads from a content-addressed result cache
+  keyed on the SQL text and query parameters, with a short TTL since
+  BigQuery data changes independently of our sync
+
+Both record per-query latency, bytes processed/billed and cache hits to
+Prometheus.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, List, Optional, Sequence
+
+from app.core.cache import QueryCache
+from app.core.metrics import (
+    BIGQUERY_BYTES_BILLED_TOTAL,
+    BIGQUERY_BYTES_PROCESSED_TOTAL,
+    BIGQUERY_NATIVE_CACHE_HITS_TOTAL,
+    BIGQUERY_QUERIES_TOTAL,
+    BIGQUERY_QUERY_DURATION_SECONDS,
+    BIGQUERY_RESULT_CACHE_TOTAL,
+)
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_lock = threading.Lock()
+
+_result_cache: Optional[QueryCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def _http_pool_size(settings) -> int:
+    """Connections to keep open: enough for every read and sync worker at once."""
+    return max(10, settings.read_pool_max_workers + settings.sync_max_workers)
+
+
+def get_bigquery_client():
+    """Get or create the process-wide BigQuery client."""
+    global _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            from google.cloud import bigquery
+            from app.config import get_settings
+
+            settings = get_settings()
+            credentials_path = settings.google_application_credentials
+
+            if credentials_path and os.path.exists(credentials_path):
+                from google.oauth2 import service_account
+                credentials = service_account.Credentials.from_service_account_file(credentials_path)
+                client = bigquery.Client(credentials=credentials, project=settings.gcp_project_id)
+            else:
+                # Use default credentials (useful for GCP environments)
+                client = bigquery.Client(project=settings.gcp_project_id)
+
+            try:
+                from requests.adapters import HTTPAdapter
+                pool_size = _http_pool_size(settings)
+                client._http.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+            except Exception as e:
+                logger.warning(f"Could not resize BigQuery HTTP connection pool: {e}")
+
+            _client = client
+            logger.info("BigQuery client initialized")
+    return _client
+
+
+def reset_bigquery_client():
+    """Drop the shared client (and cached results) so the next call rebuilds it."""
+    global _client
+    with _client_lock:
+        _client = None
+    clear_bigquery_cache()
+
+
+def _job_config(params: Optional[Sequence[Any]]):
+    if not params:
+        return None
+    from google.cloud import bigquery
+    return bigquery.QueryJobConfig(query_parameters=list(params))
+
+
+def _record_job(operation: str, job) -> None:
+    bytes_processed = getattr(job, "total_bytes_processed", None)
+    bytes_billed = getattr(job, "total_bytes_billed", None)
+    if isinstance(bytes_processed, int):
+        BIGQUERY_BYTES_PROCESSED_TOTAL.labels(operation=operation).inc(bytes_processed)
+    if isinstance(bytes_billed, int):
+        BIGQUERY_BYTES_BILLED_TOTAL.labels(operation=operation).inc(bytes_billed)
+    if getattr(job, "cache_hit", None) is True:
+        BIGQUERY_NATIVE_CACHE_HITS_TOTAL.labels(operation=operation).inc()
+
+
+def execute_query(
+    sql: str,
+    params: Optional[Sequence[Any]] = None,
+    operation: str = "query",
+    client=None,
+):
+    """
+    Run a query and wait for its rows (no result caching).
+
+    Args:
+        sql: Standard SQL text
+        params: Optional bigquery ScalarQueryParameter/ArrayQueryParameter list
+        operation: Metrics label identifying the caller
+        client: Client to use instead of the shared one
+
+    Returns:
+        The job's RowIterator
+    """
+    client = client or get_bigquery_client()
+    start = time.perf_counter()
+    try:
+        job = client.query(sql, job_config=_job_config(params))
+        rows = job.result()
+    except Exception:
+        BIGQUERY_QUERIES_TOTAL.labels(operation=operation, status="error").inc()
+        raise
+    finally:
+        BIGQUERY_QUERY_DURATION_SECONDS.labels(operation=operation).observe(time.perf_counter() - start)
+    BIGQUERY_QUERIES_TOTAL.labels(operation=operation, status="success").inc()
+    _record_job(operation, job)
+    return rows
+
+
+def get_bigquery_result_cache() -> QueryCache:
+    """Get or create the BigQuery result cache (per process, TTL-bound)."""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                from app.config import get_settings
+                settings = get_settings()
+                _result_cache = QueryCache(
+                    default_ttl=settings.bigquery_result_cache_ttl_seconds,
+                    max_size=settings.bigquery_result_cache_max_entries,
+                    max_bytes=settings.bigquery_result_cache_max_mb * 1024 * 1024,
+                )
+    return _result_cache
+
+
+def result_cache_key(sql: str, params: Optional[Sequence[Any]] = None, operation: str = "query") -> str:
+    """Content-addressed key: the same SQL text and parameters give the same key."""
+    digest = hashlib.sha256(sql.strip().encode())
+    for param in params or ():
+        digest.update(json.dumps(param.to_api_repr(), sort_keys=True, default=str).encode())
+    return f"bigquery.{operation}:{digest.hexdigest()}"
+
+
+def run_query(
+    sql: str,
+    params: Optional[Sequence[Any]] = None,
+    operation: str = "query",
+    ttl: Optional[int] = None,
+) -> List[Any]:
+    """
+    Run a read query through the result cache.
+
+    Identical concurrent misses share one BigQuery job.
+
+    Returns:
+        List of bigquery Row objects (support row.name, row['name'] and dict(row))
+    """
+    from google.cloud.bigquery import Row
+
+    ran = False
+
+    def compute():
+        nonlocal ran
+        ran = True
+        rows = execute_query(sql, params, operation=operation)
+        fields = {field.name: i for i, field in enumerate(rows.schema or ())}
+        return {"fields": fields, "rows": [tuple(row.values()) for row in rows]}
+
+    payload = get_bigquery_result_cache().get_or_compute(
+        result_cache_key(sql, params, operation), compute, ttl=ttl,
+    )
+    BIGQUERY_RESULT_CACHE_TOTAL.labels(operation=operation, result="miss" if ran else "hit").inc()
+    return [Row(values, payload["fields"]) for values in payload["rows"]]
+
+
+def clear_bigquery_cache():
+    """Drop all cached BigQuery results."""
+    if _result_cache is not None:
+        _result_cache.clear()
+
+
+def get_bigquery_stats() -> dict:
+    """Client and result cache status for the monitoring endpoints."""
+    return {
+        "client_initialized": _client is not None,
+        "result_cache": get_bigquery_result_cache().get_stats(),
+    }
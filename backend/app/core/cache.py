@@ -7,16 +7,27 @@ This cache is **event-driven**, not time-driven:
 - Optional safety TTL as a fallback (default: 24 hours)
 
 This ensures we don't re-query unchanged data between sync intervals.
+
+With several workers, a shared backend (see ``cache_backends``) acts as L2
+behind each worker's in-process cache, and invalidations are broadcast to
+all workers through a shared sync generation number.
 """
 import logging
 import time
 import hashlib
+import inspect
 import json
-from datetime import datetime, timedelta
-from threading import Lock
-from typing import Optional, Any, Dict, Callable, TypeVar
+import sys
+import uuid
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta
+from threading import Event, Lock
+from typing import Optional, Any, Dict, Callable, Iterable, TypeVar
 from functools import wraps
 
+from app.core.cache_backends import CacheBackend, create_cache_backend
+from app.core.metrics import CACHE_COALESCED_REQUESTS_TOTAL
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -24,14 +35,43 @@ T = TypeVar('T')
 # Very long TTL as safety net (24 hours) - cache is primarily invalidated by sync events
 DEFAULT_SAFETY_TTL = 86400  # 24 hours
 
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_LOCK_STRIPES = 4
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate in-memory size of a cached payload in bytes.
+    
+    Walks dicts/lists/tuples/sets and sums sys.getsizeof of every object,
+    counting shared objects once. Good enough for budgeting, not exact.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
 
 class CacheEntry:
     """A single cache entry with optional TTL."""
     
-    def __init__(self, value: Any, ttl_seconds: Optional[int] = None):
+    def __init__(self, value: Any, ttl_seconds: Optional[int] = None, size: int = 0):
         self.value = value
         self.created_at = time.time()
         self.ttl_seconds = ttl_seconds or DEFAULT_SAFETY_TTL
+        self.size = size
         self.hits = 0
     
     @property
@@ -44,37 +84,183 @@ class CacheEntry:
         return time.time() - self.created_at
 
 
+class _CacheShard:
+    """
+    One lock stripe of the cache: an LRU over its keys plus a per-prefix LRU,
+    so both global and per-prefix eviction pop the oldest entry in O(1).
+    """
+    
+    def __init__(self):
+        self.lock = Lock()
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.by_prefix: Dict[str, "OrderedDict[str, None]"] = defaultdict(OrderedDict)
+        self.prefix_bytes: Dict[str, int] = defaultdict(int)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+        self.prefix_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+    
+    def remove(self, key: str, prefix: str) -> Optional[CacheEntry]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+            self.prefix_bytes[prefix] -= entry.size
+            keys = self.by_prefix[prefix]
+            keys.pop(key, None)
+            if not keys:
+                del self.by_prefix[prefix]
+                del self.prefix_bytes[prefix]
+        return entry
+    
+    def clear(self) -> int:
+        count = len(self.entries)
+        self.entries.clear()
+        self.by_prefix.clear()
+        self.prefix_bytes.clear()
+        self.bytes = 0
+        return count
+
+
+class _Flight:
+    """An in-progress computation that identical concurrent requests wait on."""
+    
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
 class QueryCache:
     """
     Thread-safe in-memory cache for query results.
     
     This cache is designed for data that only changes on sync:
-    - Entries persist until explicitly invalidated (on sync) or max size reached
+    - Entries persist until explicitly invalidated (on sync) or evicted
     - Safety TTL (24h) prevents stale data if sync fails repeatedly
-    - LRU eviction when max size reached
+    - O(1) LRU eviction bounded by entry count and approximate bytes
+    - Per-prefix memory quotas so one endpoint can't push out the rest
+    - Lock striping: keys are hashed onto independent shards, each with its
+      own lock and an equal share of the limits
+    - Optional shared L2 backend: L1 misses are looked up there, and
+      invalidations bump a shared generation that other workers pick up
+    - Single-flight misses (``get_or_compute``): concurrent identical
+      requests wait for one computation instead of each running it
     - Statistics tracking
-    - Thread-safe operations
     """
     
-    def __init__(self, default_ttl: int = DEFAULT_SAFETY_TTL, max_size: int = 1000):
+    def __init__(
+        self,
+        default_ttl: int = DEFAULT_SAFETY_TTL,
+        max_size: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        prefix_quotas: Optional[Dict[str, int]] = None,
+        prefix_max_share: float = 1.0,
+        stripes: int = DEFAULT_LOCK_STRIPES,
+        backend: Optional[CacheBackend] = None,
+        generation_check_interval: float = 1.0,
+    ):
         """
         Initialize cache.
         
         Args:
             default_ttl: Safety TTL in seconds (24 hours default - cache is invalidated by sync events)
             max_size: Maximum number of entries
+            max_bytes: Memory budget in (approximate) bytes
+            prefix_quotas: Byte quota per key prefix, overriding prefix_max_share
+            prefix_max_share: Fraction of max_bytes any single prefix may use
+            stripes: Number of independently locked shards
+            backend: Shared L2 store (None for a per-process cache only)
+            generation_check_interval: Seconds between checks of the shared generation
         """
         self.default_ttl = default_ttl
         self.max_size = max_size
-        self._cache: Dict[str, CacheEntry] = {}
-        self._lock = Lock()
+        self.max_bytes = max_bytes
+        self.prefix_quotas = dict(prefix_quotas or {})
+        self.prefix_max_share = prefix_max_share
+        self._shards = [_CacheShard() for _ in range(max(1, stripes))]
         self._last_invalidation: Optional[float] = None
-        
-        # Statistics
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+        # Bumped on every invalidation so results computed before it are not stored after it
+        self._generation = 0
         self._invalidations = 0
+        # Distinguishes this process's generations in data_version
+        self._instance_token = uuid.uuid4().hex[:8]
+        self._created_at = time.time()
+        
+        self._flights: Dict[tuple, _Flight] = {}
+        self._flights_lock = Lock()
+        self._coalesced: Dict[str, int] = defaultdict(int)
+        
+        self.backend = backend
+        self.generation_check_interval = generation_check_interval
+        self._l2_lock = Lock()
+        self._l2_hits = 0
+        self._l2_errors = 0
+        self._shared_generation = 0
+        self._last_generation_check = time.monotonic()
+        if backend is not None:
+            self._shared_generation = self._backend_call(backend.get_generation) or 0
+    
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; changes whenever cached data is invalidated."""
+        return self._generation
+    
+    @property
+    def data_version(self) -> str:
+        """
+        Token for the synced data currently served (used in HTTP validators).
+        
+        With a shared backend this is the shared generation, so every worker
+        reports the same version; otherwise it is unique to this process.
+        """
+        if self.backend is not None:
+            self._sync_generation()
+            return f"s{self._shared_generation}"
+        return f"{self._instance_token}.{self._generation}"
+    
+    @property
+    def data_updated_at(self) -> float:
+        """Epoch seconds of the last invalidation seen by this process (or its start)."""
+        return self._last_invalidation or self._created_at
+    
+    @staticmethod
+    def _prefix_of(key: str) -> str:
+        return key.split(":", 1)[0]
+    
+    def _shard_for(self, key: str) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+    
+    def _prefix_quota(self, prefix: str) -> int:
+        return self.prefix_quotas.get(prefix, int(self.max_bytes * self.prefix_max_share))
+    
+    def _backend_call(self, func: Callable, *args) -> Any:
+        """Call the L2 backend; failures are logged and treated as a miss."""
+        try:
+            return func(*args)
+        except Exception as e:
+            with self._l2_lock:
+                self._l2_errors += 1
+            logger.warning(f"Shared cache backend error ({self.backend.name}): {e}")
+            return None
+    
+    def _l2_key(self, key: str) -> str:
+        return f"g{self._shared_generation}:{key}"
+    
+    def _sync_generation(self):
+        """Drop L1 if another worker has invalidated the shared cache."""
+        if self.backend is None:
+            return
+        now = time.monotonic()
+        if now - self._last_generation_check < self.generation_check_interval:
+            return
+        self._last_generation_check = now
+        shared = self._backend_call(self.backend.get_generation)
+        if shared is not None and shared != self._shared_generation:
+            count = self._clear_local()
+            self._shared_generation = shared
+            logger.info(f"Cache invalidated by another worker: {count} entries dropped")
     
     def _make_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate a cache key from function arguments."""
@@ -98,102 +284,275 @@ class QueryCache:
         return key_str
     
     def get(self, key: str) -> Optional[Any]:
-        """Get a value from cache."""
-        with self._lock:
-            entry = self._cache.get(key)
+        """Get a value from cache (L1, then the shared backend if any)."""
+        self._sync_generation()
+        prefix = self._prefix_of(key)
+        shard = self._shard_for(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            prefix_stats = shard.prefix_stats[prefix]
             
-            if entry is None:
-                self._misses += 1
-                return None
+            if entry is not None and entry.is_expired:
+                shard.remove(key, prefix)
+                entry = None
             
-            if entry.is_expired:
-                del self._cache[key]
-                self._misses += 1
-                return None
+            if entry is not None:
+                shard.entries.move_to_end(key)
+                shard.by_prefix[prefix].move_to_end(key)
+                entry.hits += 1
+                shard.hits += 1
+                prefix_stats["hits"] += 1
+                return entry.value
             
-            entry.hits += 1
-            self._hits += 1
-            return entry.value
+            if self.backend is None:
+                shard.misses += 1
+                prefix_stats["misses"] += 1
+                return None
+        
+        generation = self._generation
+        value = self._backend_call(self.backend.get, self._l2_key(key))
+        with shard.lock:
+            if value is None:
+                shard.misses += 1
+                prefix_stats["misses"] += 1
+                return None
+            shard.hits += 1
+            prefix_stats["hits"] += 1
+        with self._l2_lock:
+            self._l2_hits += 1
+        self._store_local(key, value, self.default_ttl, generation)
+        return value
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        """Set a value in cache."""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, generation: Optional[int] = None):
+        """
+        Set a value in cache (and in the shared backend, if any).
+        
+        If ``generation`` is given and the cache has been invalidated since,
+        the (now stale) value is not stored. Values larger than a shard's share
+        of the memory budget or prefix quota are not kept in L1.
+        """
         ttl = ttl or self.default_ttl
+        if generation is not None and generation != self._generation:
+            return
+        self._store_local(key, value, ttl, generation)
+        if self.backend is not None:
+            self._backend_call(self.backend.set, self._l2_key(key), value, ttl)
+    
+    def _store_local(self, key: str, value: Any, ttl: int, generation: Optional[int]):
+        """Store in this process's LRU, evicting as needed."""
+        prefix = self._prefix_of(key)
+        size = estimate_size(value)
         
-        with self._lock:
-            # Evict if at capacity
-            if len(self._cache) >= self.max_size:
-                self._evict_oldest()
+        stripes = len(self._shards)
+        max_entries = max(1, self.max_size // stripes)
+        max_bytes = self.max_bytes // stripes
+        prefix_quota = self._prefix_quota(prefix) // stripes
+        
+        shard = self._shard_for(key)
+        with shard.lock:
+            if generation is not None and generation != self._generation:
+                return
+            
+            shard.remove(key, prefix)
+            if size > max_bytes or size > prefix_quota:
+                shard.rejected += 1
+                logger.debug(f"Not caching {prefix} entry of ~{size} bytes (over budget)")
+                return
+            
+            # Make room: first within the prefix quota, then within the shard limits
+            prefix_keys = shard.by_prefix[prefix]
+            while prefix_keys and shard.prefix_bytes[prefix] + size > prefix_quota:
+                oldest = next(iter(prefix_keys))
+                shard.remove(oldest, prefix)
+                shard.evictions += 1
+            while shard.entries and (len(shard.entries) >= max_entries or shard.bytes + size > max_bytes):
+                oldest, _ = next(iter(shard.entries.items()))
+                shard.remove(oldest, self._prefix_of(oldest))
+                shard.evictions += 1
             
-            self._cache[key] = CacheEntry(value, ttl)
+            shard.entries[key] = CacheEntry(value, ttl, size)
+            shard.by_prefix[prefix][key] = None
+            shard.prefix_bytes[prefix] += size
+            shard.bytes += size
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """
+        Get a value, computing and caching it on a miss.
+        
+        Concurrent misses for the same key (and cache generation) are
+        coalesced: the first caller computes, the others block until it
+        finishes and share its result or exception.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        generation = self._generation
+        flight_key = (generation, key)
+        with self._flights_lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+        
+        if not leader:
+            prefix = self._prefix_of(key)
+            with self._flights_lock:
+                self._coalesced[prefix] += 1
+            CACHE_COALESCED_REQUESTS_TOTAL.labels(prefix=prefix).inc()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        
+        try:
+            flight.result = compute()
+            self.set(key, flight.result, ttl=ttl, generation=generation)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(flight_key, None)
+            flight.done.set()
     
     def delete(self, key: str):
         """Delete a specific key."""
-        with self._lock:
-            self._cache.pop(key, None)
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.remove(key, self._prefix_of(key))
     
-    def clear(self):
-        """Clear all cache entries (typically called after sync)."""
-        with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
+    def _lock_all(self):
+        for shard in self._shards:
+            shard.lock.acquire()
+    
+    def _unlock_all(self):
+        for shard in reversed(self._shards):
+            shard.lock.release()
+    
+    def _clear_local(self) -> int:
+        self._lock_all()
+        try:
+            count = sum(shard.clear() for shard in self._shards)
             self._invalidations += 1
+            self._generation += 1
             self._last_invalidation = time.time()
-            logger.info(f"Cache cleared: {count} entries invalidated")
+        finally:
+            self._unlock_all()
+        return count
+    
+    def _broadcast_invalidation(self):
+        """Bump the shared generation so every worker drops its cached data."""
+        if self.backend is None:
+            return
+        shared = self._backend_call(self.backend.bump_generation)
+        if shared is not None:
+            self._shared_generation = shared
+    
+    def clear(self):
+        """Clear all cache entries (typically called after sync)."""
+        count = self._clear_local()
+        self._broadcast_invalidation()
+        logger.info(f"Cache cleared: {count} entries invalidated")
     
     def clear_prefix(self, prefix: str):
-        """Clear all entries with a given prefix."""
-        with self._lock:
-            keys_to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
-            for key in keys_to_delete:
-                del self._cache[key]
-            if keys_to_delete:
+        """
+        Clear all entries with a given prefix.
+        
+        The shared backend can only be invalidated as a whole, so with a
+        backend configured this also invalidates other workers entirely.
+        """
+        self._lock_all()
+        try:
+            deleted = 0
+            for shard in self._shards:
+                keys_to_delete = [k for k in shard.entries if k.startswith(prefix)]
+                for key in keys_to_delete:
+                    shard.remove(key, self._prefix_of(key))
+                deleted += len(keys_to_delete)
+            if deleted:
                 self._invalidations += 1
                 self._last_invalidation = time.time()
-            logger.info(f"Cleared {len(keys_to_delete)} entries with prefix '{prefix}'")
-    
-    def _evict_oldest(self):
-        """Evict the oldest entry (LRU)."""
-        if not self._cache:
-            return
-        
-        # Find oldest entry
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].created_at)
-        del self._cache[oldest_key]
-        self._evictions += 1
+            self._generation += 1
+        finally:
+            self._unlock_all()
+        self._broadcast_invalidation()
+        logger.info(f"Cleared {deleted} entries with prefix '{prefix}'")
     
     def cleanup_expired(self):
         """Remove all expired entries."""
-        with self._lock:
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired]
-            for key in expired_keys:
-                del self._cache[key]
-            
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        expired = 0
+        for shard in self._shards:
+            with shard.lock:
+                expired_keys = [k for k, v in shard.entries.items() if v.is_expired]
+                for key in expired_keys:
+                    shard.remove(key, self._prefix_of(key))
+                expired += len(expired_keys)
+        
+        if expired:
+            logger.debug(f"Cleaned up {expired} expired cache entries")
+    
+    def _shared_stats(self) -> Optional[Dict[str, Any]]:
+        if self.backend is None:
+            return None
+        with self._l2_lock:
+            stats = {"hits": self._l2_hits, "errors": self._l2_errors, "generation": self._shared_generation}
+        return {**(self._backend_call(self.backend.stats) or {"backend": self.backend.name}), **stats}
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
+        shared = self._shared_stats()
+        self._lock_all()
+        try:
+            hits = sum(shard.hits for shard in self._shards)
+            misses = sum(shard.misses for shard in self._shards)
+            total_requests = hits + misses
+            hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
             
             # Calculate time since last invalidation
             last_invalidation_ago = None
             if self._last_invalidation:
                 last_invalidation_ago = round(time.time() - self._last_invalidation, 1)
             
+            by_prefix: Dict[str, Dict[str, Any]] = {}
+            for shard in self._shards:
+                for prefix in set(shard.prefix_stats) | set(shard.by_prefix):
+                    stats = by_prefix.setdefault(prefix, {"entries": 0, "bytes": 0, "hits": 0, "misses": 0})
+                    stats["entries"] += len(shard.by_prefix.get(prefix, ()))
+                    stats["bytes"] += shard.prefix_bytes.get(prefix, 0)
+                    stats["hits"] += shard.prefix_stats.get(prefix, {}).get("hits", 0)
+                    stats["misses"] += shard.prefix_stats.get(prefix, {}).get("misses", 0)
+            with self._flights_lock:
+                coalesced = dict(self._coalesced)
+            for prefix, count in coalesced.items():
+                by_prefix.setdefault(prefix, {"entries": 0, "bytes": 0, "hits": 0, "misses": 0})
+            for prefix, stats in by_prefix.items():
+                stats["coalesced"] = coalesced.get(prefix, 0)
+                requests = stats["hits"] + stats["misses"]
+                stats["hit_rate_percent"] = round(stats["hits"] / requests * 100, 2) if requests else 0
+            
             return {
-                "size": len(self._cache),
+                "size": sum(len(shard.entries) for shard in self._shards),
                 "max_size": self.max_size,
-                "hits": self._hits,
-                "misses": self._misses,
+                "bytes": sum(shard.bytes for shard in self._shards),
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
                 "hit_rate_percent": round(hit_rate, 2),
-                "evictions": self._evictions,
+                "evictions": sum(shard.evictions for shard in self._shards),
+                "rejected_oversized": sum(shard.rejected for shard in self._shards),
                 "invalidations": self._invalidations,
                 "last_invalidation_seconds_ago": last_invalidation_ago,
+                "generation": self._generation,
+                "lock_stripes": len(self._shards),
                 "safety_ttl_seconds": self.default_ttl,
-                "strategy": "event-driven (invalidated on sync)",
+                "strategy": "event-driven (invalidated on sync), LRU",
+                "by_prefix": dict(sorted(by_prefix.items())),
+                "shared": shared,
             }
+        finally:
+            self._unlock_all()
 
 
 # Global cache instance
@@ -204,14 +563,50 @@ def get_query_cache() -> QueryCache:
     """Get or create the global query cache."""
     global _query_cache
     if _query_cache is None:
+        from app.config import get_settings
+        settings = get_settings()
         # Cache is event-driven (invalidated on sync), safety TTL is 24 hours
-        _query_cache = QueryCache(default_ttl=DEFAULT_SAFETY_TTL, max_size=1000)
+        _query_cache = QueryCache(
+            default_ttl=DEFAULT_SAFETY_TTL,
+            max_size=settings.cache_max_entries,
+            max_bytes=settings.cache_max_memory_mb * 1024 * 1024,
+            prefix_quotas={
+                prefix: mb * 1024 * 1024 for prefix, mb in settings.cache_prefix_quotas_mb.items()
+            },
+            prefix_max_share=settings.cache_prefix_max_share,
+            stripes=settings.cache_lock_stripes,
+            backend=create_cache_backend(settings),
+            generation_check_interval=settings.cache_generation_check_seconds,
+        )
     return _query_cache
 
 
+def normalize_cache_arg(value: Any) -> Any:
+    """
+    Canonical, JSON-serializable form of an argument for cache keys.
+    
+    Dict entries with None values are dropped and keys sorted, so filter dicts
+    that differ only in unset filters or ordering share a cache entry.
+    """
+    if isinstance(value, dict):
+        return {str(k): normalize_cache_arg(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0])) if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [normalize_cache_arg(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((normalize_cache_arg(v) for v in value), key=str)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "model_dump"):
+        return normalize_cache_arg(value.model_dump())
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
 def cached(
     prefix: Optional[str] = None,
     key_builder: Optional[Callable] = None,
+    ignore: Iterable[str] = (),
 ):
     """
     Decorator to cache function results.
@@ -219,17 +614,39 @@ def cached(
     Cache is event-driven - entries persist until invalidated by sync.
     No TTL needed since data only changes when sync completes.
     
+    Keys are built from the bound arguments (defaults applied, ``self`` and
+    ``ignore`` parameters skipped, values normalized), so equivalent calls
+    share an entry whether arguments are passed positionally or by name.
+    
     Args:
-        prefix: Cache key prefix (uses function name if not specified)
+        prefix: Cache key prefix (uses function name if not specified); also
+            the name hit/miss stats are reported under
         key_builder: Custom function to build cache key
+        ignore: Parameter names excluded from the key (e.g. a DB session)
         
     Example:
         @cached(prefix="domain_stats")
         def get_domain_aggregation(filters):
             ...
     """
+    ignored = set(ignore) | {"self", "cls"}
+    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         cache_prefix = prefix or func.__name__
+        signature = inspect.signature(func)
+        
+        def build_key(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_args = {
+                name: normalize_cache_arg(value)
+                for name, value in bound.arguments.items()
+                if name not in ignored
+            }
+            digest = hashlib.md5(
+                json.dumps(key_args, sort_keys=True, default=str).encode()
+            ).hexdigest()
+            return f"{cache_prefix}:{digest}"
         
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -239,35 +656,27 @@ def cached(
             if key_builder:
                 cache_key = key_builder(*args, **kwargs)
             else:
-                cache_key = cache._make_key(cache_prefix, *args, **kwargs)
+                cache_key = build_key(*args, **kwargs)
             
-            # Try to get from cache
-            cached_value = cache.get(cache_key)
-            if cached_value is not None:
-                logger.debug(f"Cache hit for {cache_prefix}")
-                return cached_value
-            
-            # Execute function and cache result (no TTL - invalidated on sync)
-            result = func(*args, **kwargs)
-            cache.set(cache_key, result)
-            logger.debug(f"Cache miss for {cache_prefix}, cached result")
-            
-            return result
+            # Serve from cache, or execute and cache the result (no TTL -
+            # invalidated on sync); identical concurrent misses share one execution
+            return cache.get_or_compute(cache_key, lambda: func(*args, **kwargs))
         
         # Add cache control methods to the wrapped function
-        wrapper.cache_clear = lambda: get_query_cache().clear_prefix(cache_prefix)
+        wrapper.cache_clear = lambda: get_query_cache().clear_prefix(cache_prefix + ":")
         wrapper.cache_key_prefix = cache_prefix
+        wrapper.cache_key = build_key
         
         return wrapper
     return decorator
 
 
 def invalidate_stats_cache():
-    """Invalidate all statistics-related cache entries."""
-    cache = get_query_cache()
-    cache.clear_prefix("domain")
-    cache.clear_prefix("reviewer")
-    cache.clear_prefix("trainer")
-    cache.clear_prefix("overall")
-    cache.clear_prefix("pod_lead")
+    """
+    Invalidate all statistics-related cache entries.
+    
+    Every cached read is derived from synced tables, so the whole cache is
+    dropped; called when sync_all_tables finishes.
+    """
+    get_query_cache().clear()
     logger.info("Statistics cache invalidated")
@@ -0,0 +1,181 @@
+"""
+Shared (L2) backends for the query cache.
+
+Each uvicorn worker keeps its own in-process ``QueryCache`` (L1). A shared
+backend lets workers reuse each other's results and see each other's
+invalidations:
+
+- Values are stored under keys that include the current *sync generation*
+- Invalidation bumps the shared generation counter, which makes every older
+  entry unreachable; workers notice the new number and drop their L1
+- Backends are best effort - any error degrades to L1-only caching
+
+Backends:
+- ``redis``: any Redis-protocol server (Redis, Valkey, KeyDB, Dragonfly).
+  Requires the optional ``redis`` package.
+- ``sqlite``: a SQLite file, for several workers on a single host.
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class CacheBackend(ABC):
+    """Interface for a cache store shared between workers."""
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: int):
+        """Store a value for ttl_seconds."""
+
+    @abstractmethod
+    def get_generation(self) -> int:
+        """Current shared sync generation."""
+
+    @abstractmethod
+    def bump_generation(self) -> int:
+        """Invalidate everything for all workers; returns the new generation."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name}
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend on a Redis-protocol server."""
+
+    name = "redis"
+
+    def __init__(self, url: str, namespace: str = "nvidia_dashboard", socket_timeout: float = 0.5):
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package not installed - install with: pip install redis")
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout
+        )
+        self._namespace = namespace
+        self._generation_key = f"{namespace}:generation"
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:v:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        data = self._client.get(self._key(key))
+        return pickle.loads(data) if data is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: int):
+        self._client.set(self._key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=ttl_seconds)
+
+    def get_generation(self) -> int:
+        return int(self._client.get(self._generation_key) or 0)
+
+    def bump_generation(self) -> int:
+        # Entries of older generations are never read again and expire via their TTL
+        return int(self._client.incr(self._generation_key))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "namespace": self._namespace}
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache backend in a SQLite file shared by workers on one host."""
+
+    name = "sqlite"
+
+    # Expired rows are purged every this many writes
+    PURGE_EVERY = 200
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        conn.execute("INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('generation', 0)")
+        conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        row = self._conn().execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl_seconds: int):
+        conn = self._conn()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now + ttl_seconds)
+        )
+        self._writes += 1
+        if self._writes % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        conn.commit()
+
+    def get_generation(self) -> int:
+        row = self._conn().execute("SELECT value FROM cache_meta WHERE name = 'generation'").fetchone()
+        return int(row[0]) if row else 0
+
+    def bump_generation(self) -> int:
+        conn = self._conn()
+        conn.execute("UPDATE cache_meta SET value = value + 1 WHERE name = 'generation'")
+        # Older generations are unreachable anyway; reclaim the space now
+        conn.execute("DELETE FROM cache_entries")
+        conn.commit()
+        return self.get_generation()
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self._conn().execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        return {"backend": self.name, "path": self.path, "entries": entries}
+
+
+def create_cache_backend(settings) -> Optional[CacheBackend]:
+    """
+    Build the shared backend configured by ``cache_backend``.
+
+    Returns None for the in-process-only ``memory`` backend, or if the
+    configured backend can't be set up (caching then stays per-worker).
+    """
+    backend = (settings.cache_backend or "memory").lower()
+    try:
+        if backend == "redis":
+            return RedisCacheBackend(settings.cache_redis_url, namespace=settings.cache_namespace)
+        if backend == "sqlite":
+            return SQLiteCacheBackend(settings.cache_sqlite_path)
+        if backend != "memory":
+            logger.warning(f"Unknown cache backend '{backend}' - using in-process cache only")
+    except Exception as e:
+        logger.warning(f"Shared cache backend '{backend}' unavailable, using in-process cache only: {e}")
+    return None
@@ -0,0 +1,141 @@
+"""
+HTTP conditional GETs for synced dashboard data.
+
+Dashboard data only changes when a sync completes and the query cache is
+invalidated, so GET responses under the API prefix carry validators derived
+from the cache's ``data_version``:
+
+- ETag: weak tag of (data version, path, sorted query parameters, Accept)
+- Last-Modified: when this worker last saw the data change
+- Cache-Control: no-cache, must-revalidate - browsers and proxies may keep
+  the response, but check it with the server (one cheap 304) before reuse
+
+A request whose If-None-Match (or, without one, If-Modified-Since) still
+matches is answered with 304 before the route runs, so no query executes.
+Only requests with valid credentials are answered this way; anything else
+falls through to the route and its auth dependency.
+
+Paths whose responses change between syncs (auth, user and config edits,
+Jibble, live rubric reads, sync status, targets) are left alone.
+"""
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, Iterable
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers
+
+from app.core.cache import get_query_cache
+
+CACHE_CONTROL = "no-cache, must-revalidate"
+VARY = "Accept, Accept-Encoding"
+
+# Relative to the API prefix
+DEFAULT_EXCLUDED_PATHS = (
+    "/auth",
+    "/users",
+    "/shared",
+    "/config",
+    "/jibble",
+    "/quality-rubrics",
+    "/sync",
+    "/health",
+    "/target-comparison",
+)
+
+
+def make_etag(data_version: str, path: str, query_string: bytes, accept: str = "") -> str:
+    """Weak ETag for a GET of ``path`` against ``data_version`` (query order does not matter)."""
+    query = urlencode(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+    digest = hashlib.md5(f"{path}?{query}|{accept}".encode()).hexdigest()[:16]
+    return f'W/"{data_version}-{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(headers: Headers, etag: str, updated_at: float) -> bool:
+    """Whether the client's validators still match (If-None-Match takes precedence)."""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or _opaque(etag) in {_opaque(tag) for tag in tags}
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(updated_at) <= since
+    return False
+
+
+class ConditionalGetMiddleware:
+    """
+    ASGI middleware adding ETag/Last-Modified to API GETs and answering 304s.
+    """
+
+    def __init__(
+        self,
+        app,
+        prefix: str,
+        authorize: Callable[[str], bool],
+        excluded_paths: Iterable[str] = DEFAULT_EXCLUDED_PATHS,
+    ):
+        """
+        Args:
+            app: ASGI app
+            prefix: API prefix (e.g. "/api")
+            authorize: Returns whether an Authorization header value is valid
+            excluded_paths: Path prefixes, relative to ``prefix``, to leave alone
+        """
+        self.app = app
+        self.prefix = prefix.rstrip("/") + "/"
+        self.excluded = tuple(prefix.rstrip("/") + path for path in excluded_paths)
+        self.authorize = authorize
+
+    def _applies(self, scope) -> bool:
+        if scope["type"] != "http" or scope.get("method") not in ("GET", "HEAD"):
+            return False
+        path = scope.get("path", "")
+        return path.startswith(self.prefix) and not path.startswith(self.excluded)
+
+    async def __call__(self, scope, receive, send):
+        if not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not self.authorize(headers.get("authorization", "")):
+            await self.app(scope, receive, send)
+            return
+
+        cache = get_query_cache()
+        data_version = cache.data_version
+        updated_at = cache.data_updated_at
+        etag = make_etag(data_version, scope["path"], scope.get("query_string", b""), headers.get("accept", ""))
+        validators = [
+            (b"etag", etag.encode()),
+            (b"last-modified", formatdate(updated_at, usegmt=True).encode()),
+            (b"cache-control", CACHE_CONTROL.encode()),
+        ]
+
+        if is_not_modified(headers, etag, updated_at):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": validators + [(b"vary", VARY.encode())],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                response_headers = list(message.get("headers", []))
+                present = {name.lower() for name, _ in response_headers}
+                message["headers"] = response_headers + [h for h in validators if h[0] not in present]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
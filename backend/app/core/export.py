@@ -0,0 +1,123 @@
+"""
+Streaming table exports (NDJSON, CSV, XLSX).
+
+Export endpoints pass an iterator of row dicts, typically read from the
+database with ``Query.yield_per`` (a server-side cursor on PostgreSQL),
+and get back a StreamingResponse. Rows are encoded in chunks as they
+arrive, so memory stays flat regardless of row count.
+
+NDJSON and CSV bytes reach the client as soon as the first chunk is
+encoded. XLSX is a zip archive that can only be finished once every row
+is written: rows go to an openpyxl write-only sheet (constant memory),
+spooled to a temporary file, and the file is then streamed.
+"""
+import csv
+import io
+import json
+import tempfile
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from fastapi.responses import StreamingResponse
+
+CHUNK_ROWS = 500
+CHUNK_BYTES = 64 * 1024
+XLSX_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _cell(value: Any) -> Any:
+    """Flat cell value for CSV/XLSX (nested values are JSON-encoded)."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """One JSON object per line, yielded in chunks of CHUNK_ROWS rows."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str))
+        if len(lines) >= CHUNK_ROWS:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], columns: List[str]) -> Iterator[bytes]:
+    """Header plus one line per row, yielded in chunks of CHUNK_ROWS rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for i, row in enumerate(rows, start=1):
+        writer.writerow([_cell(row.get(column)) for column in columns])
+        if i % CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def iter_xlsx(rows: Iterable[Dict[str, Any]], columns: List[str], sheet_title: str = "Export") -> Iterator[bytes]:
+    """An XLSX workbook with one sheet, streamed once every row is written."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_title[:31])
+    sheet.append(columns)
+    for row in rows:
+        sheet.append([_cell(row.get(column)) for column in columns])
+
+    with tempfile.SpooledTemporaryFile(max_size=XLSX_SPOOL_BYTES) as spool:
+        workbook.save(spool)
+        spool.seek(0)
+        while chunk := spool.read(CHUNK_BYTES):
+            yield chunk
+
+
+def export_response(
+    rows: Iterable[Dict[str, Any]],
+    columns: List[str],
+    export_format: ExportFormat,
+    filename: str,
+    flatten: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+) -> StreamingResponse:
+    """
+    Stream ``rows`` as an attachment.
+
+    Args:
+        rows: Row dicts; consumed lazily while the response is sent
+        columns: Column order for CSV/XLSX (NDJSON writes every key)
+        export_format: ndjson, csv or xlsx
+        filename: Download name without extension
+        flatten: Optional row transform applied for CSV/XLSX only
+    """
+    if export_format == ExportFormat.NDJSON:
+        body = iter_ndjson(rows)
+    else:
+        if flatten is not None:
+            rows = (flatten(row) for row in rows)
+        if export_format == ExportFormat.CSV:
+            body = iter_csv(rows, columns)
+        else:
+            body = iter_xlsx(rows, columns, sheet_title=filename)
+
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
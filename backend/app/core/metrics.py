@@ -5,6 +5,10 @@ Provides Prometheus metrics for:
 - HTTP request metrics (count, latency, errors)
 - Database operation metrics
 - BigQuery sync metrics
+- Read pool queueing (blocking calls offloaded from async routes)
+- Query cache request coalescing
+- BigQuery queries (latency, bytes processed/billed, result cache hits)
+- Jibble API requests and adaptive rate limit
 - Circuit breaker state
 - Application health
 
@@ -143,6 +147,110 @@ LAST_SYNC_TIMESTAMP = Gauge(
 )
 
 
+# =============================================================================
+# Read Pool Metrics
+# =============================================================================
+
+READ_POOL_QUEUE_DEPTH = Gauge(
+    'read_pool_queue_depth',
+    'Blocking read calls waiting for a read pool thread'
+)
+
+READ_POOL_ACTIVE = Gauge(
+    'read_pool_active',
+    'Blocking read calls currently running in the read pool'
+)
+
+READ_POOL_WAIT_SECONDS = Histogram(
+    'read_pool_wait_seconds',
+    'Time blocking read calls spent queued before starting',
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+READ_POOL_CALL_DURATION_SECONDS = Histogram(
+    'read_pool_call_duration_seconds',
+    'Blocking read call run time in the read pool',
+    ['operation'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+
+# =============================================================================
+# Query Cache Metrics
+# =============================================================================
+
+CACHE_COALESCED_REQUESTS_TOTAL = Counter(
+    'cache_coalesced_requests_total',
+    'Cache misses that waited for an identical in-flight computation instead of running it',
+    ['prefix']
+)
+
+
+# =============================================================================
+# BigQuery Metrics
+# =============================================================================
+
+BIGQUERY_QUERIES_TOTAL = Counter(
+    'bigquery_queries_total',
+    'BigQuery jobs run',
+    ['operation', 'status']
+)
+
+BIGQUERY_QUERY_DURATION_SECONDS = Histogram(
+    'bigquery_query_duration_seconds',
+    'BigQuery job latency in seconds, including fetching rows',
+    ['operation'],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+
+BIGQUERY_BYTES_PROCESSED_TOTAL = Counter(
+    'bigquery_bytes_processed_total',
+    'Bytes processed by BigQuery jobs',
+    ['operation']
+)
+
+BIGQUERY_BYTES_BILLED_TOTAL = Counter(
+    'bigquery_bytes_billed_total',
+    'Bytes billed for BigQuery jobs',
+    ['operation']
+)
+
+BIGQUERY_NATIVE_CACHE_HITS_TOTAL = Counter(
+    'bigquery_native_cache_hits_total',
+    'BigQuery jobs answered from BigQuery\'s own cached results',
+    ['operation']
+)
+
+BIGQUERY_RESULT_CACHE_TOTAL = Counter(
+    'bigquery_result_cache_total',
+    'Cached BigQuery reads by outcome (hit = no job was run)',
+    ['operation', 'result']
+)
+
+
+# =============================================================================
+# Jibble API Metrics
+# =============================================================================
+
+JIBBLE_REQUESTS_TOTAL = Counter(
+    'jibble_requests_total',
+    'Jibble API requests by response status (timeout/error when there was no response)',
+    ['endpoint', 'status']
+)
+
+JIBBLE_REQUEST_DURATION_SECONDS = Histogram(
+    'jibble_request_duration_seconds',
+    'Jibble API request latency in seconds',
+    ['endpoint'],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+
+JIBBLE_RATE_LIMIT_PER_SECOND = Gauge(
+    'jibble_rate_limit_per_second',
+    'Current adaptive Jibble request rate (drops on 429 responses)'
+)
+
+
 # =============================================================================
 # Circuit Breaker Metrics
 # =============================================================================
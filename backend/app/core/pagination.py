@@ -0,0 +1,165 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are read with ``WHERE (sort_key, id) > (last_sort_key, last_id)
+ORDER BY sort_key, id LIMIT page_size + 1`` instead of OFFSET, so the cost
+of a page depends on the page size, not on how deep into the table it is.
+
+The cursor is an opaque, URL-safe token holding the sort field, direction
+and the (sort_key, id) of the last row served. NULL sort keys sort last in
+either direction.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.core.exceptions import ValidationException
+
+MAX_PAGE_SIZE = 500
+
+
+@dataclass
+class KeysetPage:
+    """One page of rows plus the cursor for the next one."""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def to_dict(self, data: Optional[List[Any]] = None) -> dict:
+        """Response body, optionally with the rows already serialized."""
+        return {
+            "data": self.items if data is None else data,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+            "total": self.total,
+        }
+
+
+@dataclass
+class PageRequest:
+    """Sort field, direction, size and position of a requested page."""
+    sort: str
+    descending: bool = False
+    page_size: int = 100
+    cursor: Optional[str] = None
+    include_total: bool = False
+    after: Optional[Tuple[Any, Any]] = field(default=None, init=False)
+
+    def __post_init__(self):
+        if not 1 <= self.page_size <= MAX_PAGE_SIZE:
+            raise ValidationException(f"page_size must be between 1 and {MAX_PAGE_SIZE}", field="page_size")
+        if self.cursor:
+            self.after = decode_cursor(self.cursor, self.sort, self.descending)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("unknown cursor value")
+    return value
+
+
+def encode_cursor(sort: str, descending: bool, key: Sequence[Any]) -> str:
+    """Opaque cursor for resuming after the row with ``key`` = (sort_key, id)."""
+    payload = {"s": sort, "o": "desc" if descending else "asc", "k": [_encode_value(v) for v in key]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple[Any, Any]:
+    """
+    (sort_key, id) from a cursor.
+
+    Raises:
+        ValidationException: if the cursor is malformed or was issued for a
+            different sort field or direction
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        sort_value, row_id = (_decode_value(v) for v in payload["k"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationException("Invalid cursor", field="cursor")
+
+    if payload.get("s") != sort or payload.get("o") != ("desc" if descending else "asc"):
+        raise ValidationException("Cursor does not match the requested sort", field="cursor")
+    return sort_value, row_id
+
+
+def keyset_order(sort_column, id_column, descending: bool = False, nullable: bool = True) -> list:
+    """ORDER BY for a keyset page: NULL sort keys last, ``id`` as tie-breaker."""
+    order = [sort_column.desc(), id_column.desc()] if descending else [sort_column, id_column]
+    return [sort_column.is_(None)] + order if nullable else order
+
+
+def keyset_after(
+    sort_column,
+    id_column,
+    after: Tuple[Any, Any],
+    descending: bool = False,
+    nullable: bool = True,
+):
+    """WHERE clause selecting the rows that come after ``after`` in keyset_order."""
+    sort_value, row_id = after
+    past_id = id_column < row_id if descending else id_column > row_id
+    if sort_value is None:
+        return and_(sort_column.is_(None), past_id)
+
+    past_sort = sort_column < sort_value if descending else sort_column > sort_value
+    after_key = or_(past_sort, and_(sort_column == sort_value, past_id))
+    return or_(after_key, sort_column.is_(None)) if nullable else after_key
+
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    page: PageRequest,
+    key: Callable[[Any], Tuple[Any, Any]],
+    nullable: bool = True,
+) -> KeysetPage:
+    """
+    Read one keyset page of ``query``.
+
+    Args:
+        query: Filtered query, without ORDER BY / LIMIT
+        sort_column: Column (or labelled expression) sorted on
+        id_column: Unique tie-breaker column
+        page: Requested page
+        key: Returns (sort_key, id) for a result row, for the next cursor
+        nullable: Whether the sort key can be NULL (False keeps ORDER BY
+            a plain index order)
+    """
+    total = query.order_by(None).count() if page.include_total else None
+
+    if page.after is not None:
+        query = query.filter(keyset_after(sort_column, id_column, page.after, page.descending, nullable))
+    order = keyset_order(sort_column, id_column, page.descending, nullable)
+    rows = query.order_by(*order).limit(page.page_size + 1).all()
+
+    next_cursor = None
+    if len(rows) > page.page_size:
+        rows = rows[:page.page_size]
+        next_cursor = encode_cursor(page.sort, page.descending, key(rows[-1]))
+    return KeysetPage(items=rows, next_cursor=next_cursor, total=total)
@@ -11,6 +11,7 @@ Features:
 """
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from datetime import datetime
 import logging
@@ -23,7 +24,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from app.config import get_settings
 from app.routers import stats, jibble, config, analytics, quality_rubrics, shared
 from app.routers import auth as auth_router, users as users_router
-from app.auth import get_current_user, seed_initial_admin  # noqa: F401 – used in router deps
+from app.auth import get_current_user, has_valid_bearer, seed_initial_admin  # noqa: F401 – used in router deps
 from app.schemas.response_schemas import HealthResponse, ErrorResponse
 from app.services.db_service import get_db_service
 from app.services.data_sync_service import get_data_sync_service
@@ -40,6 +41,8 @@ from app.core.metrics import (
     update_table_metrics,
 )
 from app.core.async_utils import run_in_thread, shutdown_thread_pool, setup_signal_handlers
+from app.core.responses import ORJSONResponse
+from app.core.conditional import ConditionalGetMiddleware
 
 # Configure structured logging
 logging.basicConfig(level=logging.INFO)
@@ -90,7 +93,8 @@ app = FastAPI(
     description="Backend API for Nvidia Dashboard - Data synced from BigQuery to PostgreSQL",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
-    openapi_url="/openapi.json" if settings.debug else None
+    openapi_url="/openapi.json" if settings.debug else None,
+    default_response_class=ORJSONResponse
 )
 
 # Create scheduler for periodic data sync
@@ -103,6 +107,10 @@ setup_signal_handlers()
 # Middleware Configuration
 # =============================================================================
 
+# Answer unchanged API GETs with 304 between syncs (innermost, so CORS and
+# logging also apply to 304s)
+app.add_middleware(ConditionalGetMiddleware, prefix=settings.api_prefix, authorize=has_valid_bearer)
+
 # Add Prometheus metrics middleware
 app.add_middleware(PrometheusMiddleware)
 
@@ -122,6 +130,9 @@ app.add_middleware(
 # Add logging middleware
 app.add_middleware(LoggingMiddleware)
 
+# Compress responses (outermost, so every middleware above sees plain bodies)
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size)
+
 # =============================================================================
 # Exception Handlers
 # =============================================================================
@@ -148,6 +159,8 @@ async def get_circuit_breakers():
 # Cache Management Endpoints
 # =============================================================================
 from app.core.cache import get_query_cache, invalidate_stats_cache
+from app.core.bigquery_client import clear_bigquery_cache, get_bigquery_stats
+from app.services.rate_index import invalidate_rate_index
 
 @app.get("/cache/stats", tags=["Monitoring"])
 async def get_cache_stats():
@@ -156,10 +169,18 @@ async def get_cache_stats():
     return cache.get_stats()
 
 
+@app.get("/cache/bigquery/stats", tags=["Monitoring"])
+async def get_bigquery_cache_stats():
+    """Get BigQuery client and result cache statistics."""
+    return get_bigquery_stats()
+
+
 @app.post("/cache/clear", tags=["Monitoring"])
 async def clear_cache():
     """Clear all cache entries."""
     invalidate_stats_cache()
+    clear_bigquery_cache()
+    invalidate_rate_index()
     return {"status": "cleared", "message": "Statistics cache invalidated"}
 
 
@@ -9,7 +9,7 @@ This module defines all database models with:
 
 Note: Foreign keys use ondelete="SET NULL" or "CASCADE" depending on the relationship.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Date, BigInteger, Boolean, ForeignKey, Index, func
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Date, BigInteger, Boolean, ForeignKey, Index, func, text
 from sqlalchemy.orm import relationship, declarative_base
 
 Base = declarative_base()
@@ -128,6 +128,26 @@ class DataSyncLog(Base):
     error_message = Column(Text)
 
 
+class SyncWatermark(Base):
+    """
+    Per-table high-water mark for incremental BigQuery syncs.
+    
+    Incremental syncs only pull tasks touched in BigQuery since
+    high_water_mark (minus a lookback overlap). A full reload runs when no
+    watermark exists or last_full_sync_at is older than the reconciliation
+    interval, which also clears rows that disappeared upstream.
+    """
+    __tablename__ = 'sync_watermark'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String(100), unique=True, nullable=False, index=True)
+    high_water_mark = Column(DateTime)  # Source time covered by the last successful sync (UTC)
+    last_full_sync_at = Column(DateTime)  # Last full reload / reconciliation (UTC)
+    last_sync_mode = Column(String(20))  # 'full' or 'incremental'
+    rows_changed = Column(Integer, default=0)  # Rows written by the last sync
+    updated_at = Column(DateTime)
+
+
 class TaskReviewedInfo(Base):
     """Task reviewed info table - synced from BigQuery CTE"""
     __tablename__ = 'task_reviewed_info'
@@ -308,6 +328,23 @@ class TaskHistoryRaw(Base):
     last_completed_date = Column(Date)  # Column I
     project_id = Column(Integer)  # Column J
     batch_name = Column(String(255))  # Column K
+    
+    # Completion events are what every metric reads: by project and date
+    # range (grouped by author), or by task_id for a set of tasks
+    __table_args__ = (
+        Index(
+            'ix_task_history_completed_project_date', 'project_id', 'date', 'author',
+            postgresql_where=text("new_status = 'completed'"),
+            sqlite_where=text("new_status = 'completed'"),
+            postgresql_include=['task_id', 'completed_status_count', 'old_status'],
+        ),
+        Index(
+            'ix_task_history_completed_task', 'task_id',
+            postgresql_where=text("new_status = 'completed'"),
+            sqlite_where=text("new_status = 'completed'"),
+            postgresql_include=['author', 'completed_status_count', 'old_status', 'time_stamp'],
+        ),
+    )
 
 
 class TaskRaw(Base):
@@ -369,6 +406,14 @@ class TaskRaw(Base):
     
     # Derived status (Column AP in spreadsheet) - calculated based on task_status and review info
     derived_status = Column(String(50), index=True)
+    
+    __table_args__ = (
+        Index(
+            'ix_task_raw_project_status_completed', 'project_id', 'derived_status', 'last_completed_date',
+            postgresql_include=['trainer'],
+        ),
+        Index('ix_task_raw_project_reviewed', 'project_id', 'r_updated_at'),
+    )
 
 
 class PodLeadMapping(Base):
@@ -475,6 +520,28 @@ class JibbleHours(Base):
     )
 
 
+
+class JibbleSyncCursor(Base):
+    """
+    Per-project and per-person cursors for the incremental Jibble TimeEntries sync.
+    
+    Each run re-fetches entries from synced_at minus
+    jibble_incremental_lookback_days and replaces only those days in
+    jibble_hours. Person cursors are keyed '<project_id>:<person_id>' since
+    people are discovered per project.
+    """
+    __tablename__ = 'jibble_sync_cursor'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source = Column(String(50), nullable=False)  # jibble_hours.source the cursor belongs to
+    scope = Column(String(20), nullable=False)  # 'project' or 'person'
+    cursor_key = Column(String(100), nullable=False)
+    synced_at = Column(DateTime, nullable=False)  # Start of the last successful sync (UTC)
+    
+    __table_args__ = (
+        Index('ix_jibble_sync_cursor_key', 'source', 'scope', 'cursor_key', unique=True),
+    )
+
 # ==================== Trainer Review Attribution ====================
 
 class TrainerReviewStats(Base):
@@ -527,6 +594,97 @@ class TrainerReviewStats(Base):
     )
 
 
+class FpyReview(Base):
+    """
+    Published manual reviews, the inputs to Reviewer / Auditor first-pass yield.
+    
+    One row per BigQuery review (review ⨝ conversation ⨝ contributor), synced
+    so FPY is computed locally in SQL instead of scanning BigQuery per request.
+    """
+    __tablename__ = 'fpy_review'
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    review_id = Column(BigInteger, unique=True, index=True)  # BigQuery review.id
+    conversation_id = Column(BigInteger, nullable=False, index=True)
+    project_id = Column(Integer, nullable=False)  # Dashboard project ID
+    reviewer_email = Column(String(255))  # lower-cased
+    action_type = Column(String(50))  # review_action.type, lower-cased ('rework' = FPY fail)
+    submitted_at = Column(DateTime, nullable=False)
+    review_date = Column(Date, nullable=False)
+    last_synced = Column(DateTime, server_default='now()')
+    
+    __table_args__ = (
+        Index('ix_fpy_review_project_date', 'project_id', 'review_date'),
+    )
+
+
+# ==================== Trainer Fact Tables ====================
+
+class TrainerDailyFact(Base):
+    """
+    Pre-aggregated trainer x project x day metrics, rebuilt at the end of each sync.
+
+    The POD Lead and Project hierarchies range-sum these rows instead of
+    re-deriving them from task_raw / task_history_raw / trainer_review_stats
+    on every request. Each measure is dated the way the live queries filter it:
+    - sum_turns, approved_*: task_raw.last_completed_date
+    - delivered_tasks, revenue: task_raw.delivery_date
+    - *_reviews, *_score: trainer_review_stats.review_date
+    - in_delivery_queue: current snapshot, stored on rows with fact_date NULL
+
+    Approvals and deliveries are attributed to the task's last completer.
+    Distinct task counts live in TrainerTaskDailyFact.
+    """
+    __tablename__ = 'trainer_daily_fact'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    trainer_email = Column(String(255), nullable=False)  # lower-cased
+    project_id = Column(Integer, nullable=False)
+    fact_date = Column(Date)
+
+    sum_turns = Column(Integer, default=0)
+    approved_tasks = Column(Integer, default=0)  # Approved, first author == last completer
+    approved_rework = Column(Integer, default=0)  # Approved after someone else's rework
+    delivered_tasks = Column(Integer, default=0)
+    in_delivery_queue = Column(Integer, default=0)
+    revenue = Column(Float, default=0)  # SUM(bill_rate_task) of delivered tasks
+    manual_reviews = Column(Integer, default=0)
+    manual_score = Column(Float, default=0)
+    agentic_reviews = Column(Integer, default=0)
+    agentic_score = Column(Float, default=0)
+
+    __table_args__ = (
+        Index('ix_trainer_daily_fact_project_date', 'project_id', 'fact_date'),
+        Index('ix_trainer_daily_fact_trainer_date', 'trainer_email', 'fact_date'),
+    )
+
+
+class TrainerTaskDailyFact(Base):
+    """
+    Task completions per trainer x project x task x day, rebuilt at the end of each sync.
+
+    Only completions of tasks still in the completed pipeline are included.
+    Kept at task grain so distinct counts (unique tasks, tasks with rework)
+    stay exact for any date range and any group of trainers. Completions
+    without an author are stored with trainer_email '' so project-level
+    counts still include them.
+    """
+    __tablename__ = 'trainer_task_daily_fact'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    trainer_email = Column(String(255), nullable=False)  # lower-cased
+    project_id = Column(Integer, nullable=False)
+    task_id = Column(BigInteger, nullable=False)
+    fact_date = Column(Date)
+    new_completions = Column(Integer, default=0)  # completed_status_count = 1
+    rework_completions = Column(Integer, default=0)  # completed_status_count > 1
+
+    __table_args__ = (
+        Index('ix_trainer_task_daily_fact_project_date', 'project_id', 'fact_date'),
+        Index('ix_trainer_task_daily_fact_trainer_date', 'trainer_email', 'fact_date'),
+    )
+
+
 # ==================== AHT Configuration ====================
 
 class AHTConfiguration(Base):
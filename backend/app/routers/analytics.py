@@ -6,13 +6,18 @@ Provides time-series data for interactive charts with filtering by:
 - Date range: start_date, end_date
 - Project: optional project_id filter
 """
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from typing import Optional, Dict, Any
 import logging
 from datetime import datetime, timedelta
 
+from app.core.async_utils import run_read
+from app.core.responses import negotiated_response
 from app.services.db_service import get_db_service
-from app.services.analytics_service import get_analytics_time_series
+from app.services.analytics_service import (
+    get_analytics_time_series,
+    get_analytics_time_series_by_project,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
@@ -34,6 +39,7 @@ def _validate_date(date_str: Optional[str], field_name: str) -> Optional[str]:
 
 @router.get("/time-series")
 async def get_time_series(
+    request: Request,
     granularity: str = Query(
         default="weekly",
         regex="^(daily|weekly|monthly)$",
@@ -86,20 +92,22 @@ async def get_time_series(
                 detail=f"Invalid project_id: {project_id}. Valid IDs: {valid_ids}"
             )
     
-    try:
+    def load_time_series():
         db_service = get_db_service()
         session = db_service.SessionLocal()
         try:
-            result = get_analytics_time_series(
+            return get_analytics_time_series(
                 session=session,
                 start_date=start_date,
                 end_date=end_date,
                 granularity=granularity,
                 project_id=project_id,
             )
-            return result
         finally:
             session.close()
+    
+    try:
+        return negotiated_response(request, await run_read(load_time_series))
     except HTTPException:
         raise
     except Exception as e:
@@ -112,11 +120,13 @@ async def get_time_series(
 
 @router.get("/daily-by-project")
 async def get_daily_by_project(
+    request: Request,
     start_date: Optional[str] = Query(default=None),
     end_date: Optional[str] = Query(default=None),
 ) -> Dict[str, Any]:
     """
     Get daily time-series for EACH project in one call.
+    All projects are computed in a single pass (queries grouped by project and day).
     Returns { project_id: [AnalyticsDataPoint, ...], ... }
     """
     _validate_date(start_date, "start_date")
@@ -126,32 +136,22 @@ async def get_daily_by_project(
     if not start_date:
         start_date = (datetime.now() - timedelta(weeks=1)).strftime('%Y-%m-%d')
 
-    from app.constants import get_constants
-    from app.services.analytics_service import prefetch_fpy_data
-    constants = get_constants()
-    project_ids = constants.projects.ALL_PROJECT_IDS
-
-    try:
+    def load_daily_by_project():
         db_service = get_db_service()
         session = db_service.SessionLocal()
         try:
-            fpy_reviews, fpy_roles = prefetch_fpy_data(session, start_date, end_date)
-            result: Dict[str, list] = {}
-            for pid in project_ids:
-                ts = get_analytics_time_series(
-                    session=session,
-                    start_date=start_date,
-                    end_date=end_date,
-                    granularity='daily',
-                    project_id=pid,
-                    skip_bigquery_fpy=True,
-                    prefetched_fpy_reviews=fpy_reviews,
-                    prefetched_fpy_role_map=fpy_roles,
-                )
-                result[str(pid)] = ts.get('data', [])
-            return result
+            by_project = get_analytics_time_series_by_project(
+                session=session,
+                start_date=start_date,
+                end_date=end_date,
+                granularity='daily',
+            )
+            return {str(pid): data for pid, data in by_project.items()}
         finally:
             session.close()
+
+    try:
+        return negotiated_response(request, await run_read(load_daily_by_project))
     except Exception as e:
         logger.error(f"Daily-by-project error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
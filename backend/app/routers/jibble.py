@@ -3,11 +3,14 @@ Jibble API endpoints for time tracking data
 """
 import logging
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Iterator, List, Optional
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 from sqlalchemy import func
 
+from app.core.async_utils import run_in_thread, run_read
+from app.core.export import ExportFormat, export_response
 from app.services.db_service import get_db_session, get_db_service
 from app.services.jibble_service import JibbleService, JibbleSyncService
 from app.models.db_models import JibbleHours, TimeTheftExclusion, TaskHistoryRaw, TaskRaw
@@ -57,7 +60,7 @@ async def test_jibble_connection():
     """Test the Jibble API connection"""
     try:
         jibble = JibbleService()
-        result = jibble.test_connection()
+        result = await run_read(jibble.test_connection)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error testing Jibble: {str(e)}")
@@ -67,10 +70,13 @@ async def test_jibble_connection():
 async def sync_jibble_data():
     """Sync all Jibble data (people + time entries for current month)"""
     try:
-        with get_db_session() as session:
-            sync_service = JibbleSyncService(session)
-            result = sync_service.full_sync()
-            return result
+        def run_sync():
+            with get_db_session() as session:
+                sync_service = JibbleSyncService(session)
+                result = sync_service.full_sync()
+                return result
+
+        return await run_in_thread(run_sync)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error syncing Jibble: {str(e)}")
 
@@ -100,10 +106,13 @@ async def get_trainer_hours(
         else:
             end_dt = datetime.now()
         
-        with get_db_session() as session:
-            sync_service = JibbleSyncService(session)
-            results = sync_service.get_trainer_hours(start_dt, end_dt)
-            return results
+        def load_hours():
+            with get_db_session() as session:
+                sync_service = JibbleSyncService(session)
+                results = sync_service.get_trainer_hours(start_dt, end_dt)
+                return results
+
+        return await run_read(load_hours)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching trainer hours (daily): {str(e)}")
@@ -134,37 +143,40 @@ async def get_trainer_hours_summary(
         else:
             end_dt = datetime.now()
         
-        with get_db_session() as session:
-            sync_service = JibbleSyncService(session)
-            entries = sync_service.get_trainer_hours(start_dt, end_dt)
+        def load_summary():
+            with get_db_session() as session:
+                sync_service = JibbleSyncService(session)
+                entries = sync_service.get_trainer_hours(start_dt, end_dt)
             
-            # Aggregate by trainer
-            trainer_data = {}
-            for entry in entries:
-                email = entry["trainer_email"]
-                if email not in trainer_data:
-                    trainer_data[email] = {
-                        "trainer_email": email,
-                        "trainer_name": entry.get("trainer_name"),
-                        "total_hours": 0,
-                        "pod_lead": entry.get("pod_lead"),
-                        "status": entry.get("status"),
-                        "daily_hours": [],
-                    }
+                # Aggregate by trainer
+                trainer_data = {}
+                for entry in entries:
+                    email = entry["trainer_email"]
+                    if email not in trainer_data:
+                        trainer_data[email] = {
+                            "trainer_email": email,
+                            "trainer_name": entry.get("trainer_name"),
+                            "total_hours": 0,
+                            "pod_lead": entry.get("pod_lead"),
+                            "status": entry.get("status"),
+                            "daily_hours": [],
+                        }
                 
-                trainer_data[email]["total_hours"] += entry.get("hours", 0)
-                trainer_data[email]["daily_hours"].append({
-                    "date": entry.get("date"),
-                    "hours": entry.get("hours", 0),
-                })
+                    trainer_data[email]["total_hours"] += entry.get("hours", 0)
+                    trainer_data[email]["daily_hours"].append({
+                        "date": entry.get("date"),
+                        "hours": entry.get("hours", 0),
+                    })
             
-            # Round total hours
-            for data in trainer_data.values():
-                data["total_hours"] = round(data["total_hours"], 2)
-                # Sort daily hours by date
-                data["daily_hours"].sort(key=lambda x: x["date"] if x["date"] else "")
+                # Round total hours
+                for data in trainer_data.values():
+                    data["total_hours"] = round(data["total_hours"], 2)
+                    # Sort daily hours by date
+                    data["daily_hours"].sort(key=lambda x: x["date"] if x["date"] else "")
             
-            return list(trainer_data.values())
+                return list(trainer_data.values())
+
+        return await run_read(load_summary)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching trainer hours (summary): {str(e)}")
@@ -202,44 +214,47 @@ async def get_project_jibble_hours(
                 jibble_project_names.extend(names)
             jibble_project_names = list(set(jibble_project_names))
 
-        with db.get_session() as session:
-            query = session.query(
-                JibbleHours.full_name,
-                JibbleHours.turing_email,
-                JibbleHours.jibble_email,
-                JibbleHours.member_code,
-                JibbleHours.project,
-                func.sum(JibbleHours.logged_hours).label('total_hours'),
-            )
-
-            if jibble_project_names:
-                query = query.filter(JibbleHours.project.in_(jibble_project_names))
-
-            if start_date:
-                query = query.filter(JibbleHours.entry_date >= start_date)
-            if end_date:
-                query = query.filter(JibbleHours.entry_date <= end_date)
-
-            query = query.group_by(
-                JibbleHours.member_code,
-                JibbleHours.full_name,
-                JibbleHours.turing_email,
-                JibbleHours.jibble_email,
-                JibbleHours.project,
-            ).order_by(func.sum(JibbleHours.logged_hours).desc())
-
-            results = []
-            for row in query.all():
-                results.append(JibbleUserHours(
-                    full_name=row.full_name,
-                    turing_email=row.turing_email,
-                    jibble_email=row.jibble_email,
-                    member_code=row.member_code,
-                    total_hours=round(float(row.total_hours or 0), 2),
-                    project=row.project,
-                ))
-
-            return results
+        def load_hours():
+            with db.get_session() as session:
+                query = session.query(
+                    JibbleHours.full_name,
+                    JibbleHours.turing_email,
+                    JibbleHours.jibble_email,
+                    JibbleHours.member_code,
+                    JibbleHours.project,
+                    func.sum(JibbleHours.logged_hours).label('total_hours'),
+                )
+
+                if jibble_project_names:
+                    query = query.filter(JibbleHours.project.in_(jibble_project_names))
+
+                if start_date:
+                    query = query.filter(JibbleHours.entry_date >= start_date)
+                if end_date:
+                    query = query.filter(JibbleHours.entry_date <= end_date)
+
+                query = query.group_by(
+                    JibbleHours.member_code,
+                    JibbleHours.full_name,
+                    JibbleHours.turing_email,
+                    JibbleHours.jibble_email,
+                    JibbleHours.project,
+                ).order_by(func.sum(JibbleHours.logged_hours).desc())
+
+                results = []
+                for row in query.all():
+                    results.append(JibbleUserHours(
+                        full_name=row.full_name,
+                        turing_email=row.turing_email,
+                        jibble_email=row.jibble_email,
+                        member_code=row.member_code,
+                        total_hours=round(float(row.total_hours or 0), 2),
+                        project=row.project,
+                    ))
+
+                return results
+
+        return await run_read(load_hours)
 
     except Exception as e:
         logger.error(f"Error fetching project jibble hours: {e}")
@@ -264,6 +279,107 @@ class ExcludeRequest(BaseModel):
     reason: Optional[str] = None
 
 
+def _time_theft_scope(project_id: Optional[int]):
+    """(labeling tool project IDs, Jibble project names) for one project or all primary projects."""
+    constants = get_constants()
+    jibble_config = constants.jibble
+    if project_id:
+        return [project_id], jibble_config.PROJECT_ID_TO_JIBBLE_NAMES.get(project_id, [])
+
+    jibble_project_names: List[str] = []
+    for names in jibble_config.PROJECT_ID_TO_JIBBLE_NAMES.values():
+        jibble_project_names.extend(names)
+    return constants.projects.PRIMARY_PROJECT_IDS, list(set(jibble_project_names))
+
+
+def iter_time_theft(
+    session,
+    project_id: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    show_excluded: bool = False,
+    batch_size: int = 1000,
+) -> Iterator[dict]:
+    """
+    Time theft rows, most hours first.
+
+    Active and excluded emails are loaded up front; the grouped Jibble hours
+    are then read with ``yield_per`` and filtered as they stream in.
+    """
+    project_ids, jibble_project_names = _time_theft_scope(project_id)
+
+    # 1. Build set of labeling-tool-active emails
+    active_emails: set = set()
+
+    # Task creators — anyone who ever created a task, regardless of status
+    author_q = session.query(distinct(func.lower(TaskHistoryRaw.author))).filter(
+        TaskHistoryRaw.project_id.in_(project_ids),
+        TaskHistoryRaw.author.isnot(None),
+    )
+    if start_date:
+        author_q = author_q.filter(TaskHistoryRaw.date >= start_date)
+    if end_date:
+        author_q = author_q.filter(TaskHistoryRaw.date <= end_date)
+    for row in author_q.all():
+        if row[0]:
+            active_emails.add(row[0].lower().strip())
+
+    # Reviewers — anyone who reviewed a task on the project
+    reviewer_q = session.query(distinct(func.lower(TaskRaw.reviewer))).filter(
+        TaskRaw.project_id.in_(project_ids),
+        TaskRaw.reviewer.isnot(None),
+    )
+    for row in reviewer_q.all():
+        if row[0]:
+            active_emails.add(row[0].lower().strip())
+
+    # 2. Get excluded emails
+    excluded_set: set = set()
+    for row in session.query(TimeTheftExclusion.turing_email).all():
+        excluded_set.add(row.turing_email.lower().strip())
+
+    logger.info(f"Time theft: {len(active_emails)} active emails (task creators + reviewers)")
+
+    # 3. People with Jibble hours, most hours first
+    total_hours = func.sum(JibbleHours.logged_hours).label('total_hours')
+    jibble_query = session.query(
+        JibbleHours.full_name,
+        JibbleHours.turing_email,
+        JibbleHours.jibble_email,
+        JibbleHours.project,
+        total_hours,
+    )
+    if jibble_project_names:
+        jibble_query = jibble_query.filter(JibbleHours.project.in_(jibble_project_names))
+    if start_date:
+        jibble_query = jibble_query.filter(JibbleHours.entry_date >= start_date)
+    if end_date:
+        jibble_query = jibble_query.filter(JibbleHours.entry_date <= end_date)
+    jibble_query = jibble_query.group_by(
+        JibbleHours.turing_email, JibbleHours.full_name,
+        JibbleHours.jibble_email, JibbleHours.project,
+    ).order_by(total_hours.desc(), JibbleHours.turing_email, JibbleHours.project)
+
+    # 4. Keep people with Jibble hours but NOT in active_emails
+    for row in jibble_query.yield_per(batch_size):
+        email = (row.turing_email or '').lower().strip()
+        if not email:
+            email = (row.jibble_email or '').lower().strip()
+        if email in active_emails:
+            continue
+        is_excluded = email in excluded_set
+        if is_excluded and not show_excluded:
+            continue
+        yield {
+            'full_name': row.full_name,
+            'turing_email': row.turing_email,
+            'jibble_email': row.jibble_email,
+            'total_hours': round(float(row.total_hours or 0), 2),
+            'project': row.project,
+            'excluded': is_excluded,
+        }
+
+
 @router.get("/time-theft", response_model=List[TimeTheftEntry])
 async def get_time_theft(
     project_id: Optional[int] = None,
@@ -276,119 +392,63 @@ async def get_time_theft(
     (no task completions, no reviews, no deliveries) for the given project/date range.
     """
     try:
-        constants = get_constants()
-        jibble_config = constants.jibble
         db = get_db_service()
 
-        project_ids: List[int] = []
-        jibble_project_names: List[str] = []
-        if project_id:
-            project_ids = [project_id]
-            jibble_project_names = jibble_config.PROJECT_ID_TO_JIBBLE_NAMES.get(project_id, [])
-        else:
-            project_ids = constants.projects.PRIMARY_PROJECT_IDS
-            for names in jibble_config.PROJECT_ID_TO_JIBBLE_NAMES.values():
-                jibble_project_names.extend(names)
-            jibble_project_names = list(set(jibble_project_names))
+        def load_time_theft():
+            with db.get_session() as session:
+                return [
+                    TimeTheftEntry(**row)
+                    for row in iter_time_theft(session, project_id, start_date, end_date, show_excluded)
+                ]
 
-        with db.get_session() as session:
-            # 1. Get all people with Jibble hours
-            jibble_query = session.query(
-                JibbleHours.full_name,
-                JibbleHours.turing_email,
-                JibbleHours.jibble_email,
-                JibbleHours.project,
-                func.sum(JibbleHours.logged_hours).label('total_hours'),
-            )
-            if jibble_project_names:
-                jibble_query = jibble_query.filter(JibbleHours.project.in_(jibble_project_names))
-            if start_date:
-                jibble_query = jibble_query.filter(JibbleHours.entry_date >= start_date)
-            if end_date:
-                jibble_query = jibble_query.filter(JibbleHours.entry_date <= end_date)
-            jibble_query = jibble_query.group_by(
-                JibbleHours.turing_email, JibbleHours.full_name,
-                JibbleHours.jibble_email, JibbleHours.project,
-            )
-            jibble_rows = jibble_query.all()
-
-            # 2. Build set of labeling-tool-active emails
-            active_emails: set = set()
-
-            # Task creators — anyone who ever created a task, regardless of status
-            author_q = session.query(distinct(func.lower(TaskHistoryRaw.author))).filter(
-                TaskHistoryRaw.project_id.in_(project_ids),
-                TaskHistoryRaw.author.isnot(None),
-            )
-            if start_date:
-                author_q = author_q.filter(TaskHistoryRaw.date >= start_date)
-            if end_date:
-                author_q = author_q.filter(TaskHistoryRaw.date <= end_date)
-            for row in author_q.all():
-                if row[0]:
-                    active_emails.add(row[0].lower().strip())
-
-            # Reviewers — anyone who reviewed a task on the project
-            reviewer_q = session.query(distinct(func.lower(TaskRaw.reviewer))).filter(
-                TaskRaw.project_id.in_(project_ids),
-                TaskRaw.reviewer.isnot(None),
-            )
-            for row in reviewer_q.all():
-                if row[0]:
-                    active_emails.add(row[0].lower().strip())
-
-            logger.info(f"Time theft: {len(active_emails)} active emails (task creators + reviewers), {len(jibble_rows)} jibble rows")
-
-            # 3. Get excluded emails
-            excluded_set: set = set()
-            for row in session.query(TimeTheftExclusion.turing_email).all():
-                excluded_set.add(row.turing_email.lower().strip())
-
-            # 4. Filter to people with Jibble hours but NOT in active_emails
-            results = []
-            for row in jibble_rows:
-                email = (row.turing_email or '').lower().strip()
-                if not email:
-                    email = (row.jibble_email or '').lower().strip()
-                if email in active_emails:
-                    continue
-                is_excluded = email in excluded_set
-                if is_excluded and not show_excluded:
-                    continue
-                results.append(TimeTheftEntry(
-                    full_name=row.full_name,
-                    turing_email=row.turing_email,
-                    jibble_email=row.jibble_email,
-                    total_hours=round(float(row.total_hours or 0), 2),
-                    project=row.project,
-                    excluded=is_excluded,
-                ))
-
-            results.sort(key=lambda x: -x.total_hours)
-            return results
+        return await run_read(load_time_theft)
 
     except Exception as e:
         logger.error(f"Error fetching time theft data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+TIME_THEFT_EXPORT_COLUMNS = ['full_name', 'turing_email', 'jibble_email', 'total_hours', 'project', 'excluded']
+
+
+@router.get("/time-theft/export")
+async def export_time_theft(
+    format: ExportFormat = ExportFormat.NDJSON,
+    project_id: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    show_excluded: bool = False,
+) -> StreamingResponse:
+    """Stream the time theft list as NDJSON, CSV or XLSX."""
+    db = get_db_service()
+
+    def rows():
+        with db.get_session() as session:
+            yield from iter_time_theft(session, project_id, start_date, end_date, show_excluded)
+
+    return export_response(rows(), TIME_THEFT_EXPORT_COLUMNS, format, "time_theft")
+
+
 @router.post("/time-theft/exclude")
 async def exclude_from_time_theft(req: ExcludeRequest):
     """Mark a person as excluded from the time theft list (e.g., managers)."""
     try:
         db = get_db_service()
-        with db.get_session() as session:
-            existing = session.query(TimeTheftExclusion).filter(
-                func.lower(TimeTheftExclusion.turing_email) == req.turing_email.lower().strip()
-            ).first()
-            if existing:
-                return {"status": "already_excluded", "email": req.turing_email}
-            session.add(TimeTheftExclusion(
-                turing_email=req.turing_email.lower().strip(),
-                reason=req.reason,
-            ))
-            session.commit()
-            return {"status": "excluded", "email": req.turing_email}
+        def add_exclusion():
+            with db.get_session() as session:
+                existing = session.query(TimeTheftExclusion).filter(
+                    func.lower(TimeTheftExclusion.turing_email) == req.turing_email.lower().strip()
+                ).first()
+                if existing:
+                    return {"status": "already_excluded", "email": req.turing_email}
+                session.add(TimeTheftExclusion(
+                    turing_email=req.turing_email.lower().strip(),
+                    reason=req.reason,
+                ))
+                session.commit()
+                return {"status": "excluded", "email": req.turing_email}
+
+        return await run_in_thread(add_exclusion)
     except Exception as e:
         logger.error(f"Error excluding from time theft: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -399,12 +459,15 @@ async def remove_time_theft_exclusion(turing_email: str):
     """Remove a person from the time theft exclusion list."""
     try:
         db = get_db_service()
-        with db.get_session() as session:
-            deleted = session.query(TimeTheftExclusion).filter(
-                func.lower(TimeTheftExclusion.turing_email) == turing_email.lower().strip()
-            ).delete(synchronize_session=False)
-            session.commit()
-            return {"status": "removed" if deleted else "not_found", "email": turing_email}
+        def remove_exclusion():
+            with db.get_session() as session:
+                deleted = session.query(TimeTheftExclusion).filter(
+                    func.lower(TimeTheftExclusion.turing_email) == turing_email.lower().strip()
+                ).delete(synchronize_session=False)
+                session.commit()
+                return {"status": "removed" if deleted else "not_found", "email": turing_email}
+
+        return await run_in_thread(remove_exclusion)
     except Exception as e:
         logger.error(f"Error removing time theft exclusion: {e}")
         raise HTTPException(status_code=500, detail=str(e))
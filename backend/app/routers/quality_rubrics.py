@@ -3,6 +3,7 @@ import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
 
+from app.core.async_utils import run_read
 from app.services.quality_rubrics_service import get_quality_rubrics_service
 
 logger = logging.getLogger(__name__)
@@ -22,7 +23,8 @@ async def get_quality_rubrics_data(
 ):
     try:
         service = get_quality_rubrics_service()
-        data = service.get_data(
+        data = await run_read(
+            service.get_data,
             project_id=project_id,
             force_refresh=refresh,
             start_date=start_date,
@@ -7,9 +7,10 @@ All endpoints include:
 - Rate limiting (where applicable)
 """
 from fastapi import APIRouter, HTTPException, Query, Depends, Request
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Dict, Any, Union
 import logging
-from datetime import datetime
+from datetime import date, datetime
 import re
 
 from app.schemas.response_schemas import (
@@ -19,7 +20,9 @@ from app.schemas.response_schemas import (
     TrainerLevelAggregation,
     PodLeadAggregation,
     OverallAggregation,
-    TaskLevelInfo
+    TaskLevelInfo,
+    TaskLevelPage,
+    CursorPaginatedResponse
 )
 from app.schemas.request_schemas import (
     StatsFilterParams,
@@ -33,6 +36,10 @@ from app.services.query_service import get_query_service
 from app.services.data_sync_service import get_data_sync_service
 from app.services.db_service import get_db_service
 from app.core.exceptions import ValidationError, ServiceError
+from app.core.async_utils import run_in_thread, run_read
+from app.core.export import ExportFormat, export_response
+from app.core.responses import negotiated_response
+from app.core.pagination import MAX_PAGE_SIZE, PageRequest
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -89,6 +96,28 @@ def validate_project_id(project_id: Optional[int]) -> Optional[int]:
     return project_id
 
 
+def page_request(
+    sort: str,
+    order: str,
+    limit: Optional[int],
+    cursor: Optional[str],
+    include_total: bool,
+    sorts
+) -> Optional[PageRequest]:
+    """Keyset page request, or None when neither limit nor cursor is given (full list)."""
+    if limit is None and cursor is None:
+        return None
+    if sort not in sorts:
+        raise ValidationError(f"sort must be one of: {sorted(sorts)}")
+    return PageRequest(
+        sort=sort,
+        descending=order == "desc",
+        page_size=limit or 100,
+        cursor=cursor,
+        include_total=include_total
+    )
+
+
 @router.get(
     "/by-domain",
     response_model=List[DomainAggregation],
@@ -107,7 +136,7 @@ async def get_stats_by_domain(
     try:
         service = get_query_service()
         filters = {'domain': domain, 'reviewer': reviewer_id, 'trainer': trainer_id}
-        result = service.get_domain_aggregation(filters)
+        result = await run_read(service.get_domain_aggregation, filters)
         return [DomainAggregation(**item) for item in result]
     except ValidationError:
         raise
@@ -130,7 +159,7 @@ async def get_stats_by_reviewer(
     try:
         service = get_query_service()
         filters = {'domain': domain, 'reviewer': reviewer, 'trainer': trainer}
-        result = service.get_reviewer_aggregation(filters)
+        result = await run_read(service.get_reviewer_aggregation, filters)
         return [ReviewerAggregation(**item) for item in result]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -149,7 +178,7 @@ async def get_reviewers_with_trainers(
     try:
         service = get_query_service()
         filters = {'domain': domain, 'reviewer': reviewer}
-        result = service.get_reviewers_with_trainers(filters)
+        result = await run_read(service.get_reviewers_with_trainers, filters)
         return [ReviewerWithTrainers(**item) for item in result]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -169,7 +198,7 @@ async def get_stats_by_trainer_level(
     try:
         service = get_query_service()
         filters = {'domain': domain, 'reviewer': reviewer, 'trainer': trainer}
-        result = service.get_trainer_aggregation(filters)
+        result = await run_read(service.get_trainer_aggregation, filters)
         return [TrainerLevelAggregation(**item) for item in result]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -180,15 +209,38 @@ async def get_stats_by_trainer_level(
     summary="Get trainer statistics at date level (trainer x date)"
 )
 async def get_trainer_daily_stats(
-    trainer: Optional[str] = Query(None, description="Filter by trainer ID"),
-    project_id: Optional[int] = Query(None, description="Filter by project ID")
+    trainer: Optional[str] = Query(None, description="Filter by trainer ID (paged mode)"),
+    project_id: Optional[int] = Query(None, description="Filter by project ID"),
+    start_date: Optional[str] = Query(None, description="Start date YYYY-MM-DD (paged mode)"),
+    end_date: Optional[str] = Query(None, description="End date YYYY-MM-DD (paged mode)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables keyset pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    sort: str = Query("submission_date", description="Sort field: submission_date, trainer_id, total_submissions"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
+    include_total: bool = Query(False, description="Include the total row count (extra COUNT query)")
 ):
-    """Get trainer statistics at date level for time-series analysis"""
+    """Get trainer statistics at date level for time-series analysis.
+    
+    Without ``limit`` or ``cursor`` every row is returned as a list. With
+    them, one keyset page is returned as {data, next_cursor, has_more, total}.
+    """
     try:
         service = get_query_service()
-        filters = {'trainer': trainer, 'project_id': project_id}
-        result = service.get_trainer_daily_stats(filters)
-        return result
+        page = page_request(sort, order, limit, cursor, include_total, service.TRAINER_DAILY_SORTS)
+        if page is None:
+            filters = {'trainer': trainer, 'project_id': project_id}
+            return await run_read(service.get_trainer_daily_stats, filters)
+        
+        filters = {
+            'trainer': validate_integer_param(trainer, "trainer"),
+            'project_id': project_id,
+            'start_date': validate_date_format(start_date, "start_date") and date.fromisoformat(start_date),
+            'end_date': validate_date_format(end_date, "end_date") and date.fromisoformat(end_date),
+        }
+        result = await run_read(service.get_trainer_daily_stats_page, filters, page)
+        return CursorPaginatedResponse(**result)
+    except ValidationError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
@@ -205,7 +257,7 @@ async def get_trainer_overall_stats(
     try:
         service = get_query_service()
         filters = {'trainer': trainer, 'project_id': project_id}
-        result = service.get_trainer_overall_stats(filters)
+        result = await run_read(service.get_trainer_overall_stats, filters)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -222,7 +274,7 @@ async def get_reviewer_daily_stats(
     try:
         service = get_query_service()
         filters = {'reviewer': reviewer}
-        result = service.get_reviewer_daily_stats(filters)
+        result = await run_read(service.get_reviewer_daily_stats, filters)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -239,7 +291,7 @@ async def get_trainers_by_reviewer_date(
     try:
         service = get_query_service()
         filters = {'reviewer': reviewer}
-        result = service.get_trainers_by_reviewer_date(filters)
+        result = await run_read(service.get_trainers_by_reviewer_date, filters)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -257,7 +309,7 @@ async def get_stats_by_pod_lead(
     try:
         service = get_query_service()
         filters = {'domain': domain}
-        result = service.get_pod_lead_aggregation(filters)
+        result = await run_read(service.get_pod_lead_aggregation, filters)
         return [PodLeadAggregation(**item) for item in result]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -277,7 +329,7 @@ async def get_overall_stats(
     try:
         service = get_query_service()
         filters = {'domain': domain, 'reviewer': reviewer, 'trainer': trainer}
-        result = service.get_overall_aggregation(filters)
+        result = await run_read(service.get_overall_aggregation, filters)
         return OverallAggregation(**result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -285,20 +337,77 @@ async def get_overall_stats(
 
 @router.get(
     "/task-level",
-    response_model=List[TaskLevelInfo],
+    response_model=Union[List[TaskLevelInfo], TaskLevelPage],
     summary="Get task-level information"
 )
 async def get_task_level_info(
+    domain: Optional[str] = Query(None, description="Filter by domain"),
+    reviewer: Optional[str] = Query(None, description="Filter by reviewer ID"),
+    trainer: Optional[str] = Query(None, description="Filter by trainer level ID"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables keyset pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    sort: str = Query("task_id", description="Sort field: task_id, updated_at, task_score"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="Sort direction"),
+    include_total: bool = Query(False, description="Include the total task count (extra COUNT query)")
+) -> Union[List[TaskLevelInfo], TaskLevelPage]:
+    """Get task-level information.
+    
+    Without ``limit`` or ``cursor`` every task is returned as a list. With
+    them, one keyset page is returned as {data, next_cursor, has_more, total}.
+    """
+    try:
+        service = get_query_service()
+        filters = {'domain': domain, 'reviewer': reviewer, 'trainer': trainer}
+        page = page_request(sort, order, limit, cursor, include_total, service.TASK_LEVEL_SORTS)
+        if page is None:
+            result = await run_read(service.get_task_level_data, filters)
+            return [TaskLevelInfo(**item) for item in result]
+        
+        result = await run_read(service.get_task_level_page, filters, page)
+        return TaskLevelPage(**result)
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
+
+TASK_LEVEL_EXPORT_COLUMNS = [
+    'task_id', 'task_score', 'annotator_id', 'annotator_name', 'annotator_email',
+    'reviewer_id', 'reviewer_name', 'reviewer_email', 'colab_link', 'updated_at',
+    'week_number', 'rework_count', 'duration_minutes',
+]
+
+
+@router.get(
+    "/task-level/export",
+    summary="Export task-level information (streamed)"
+)
+async def export_task_level_info(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson, csv or xlsx"),
     domain: Optional[str] = Query(None, description="Filter by domain"),
     reviewer: Optional[str] = Query(None, description="Filter by reviewer ID"),
     trainer: Optional[str] = Query(None, description="Filter by trainer level ID")
-) -> List[TaskLevelInfo]:
-    """Get task-level information"""
+) -> StreamingResponse:
+    """Stream every task-level row as NDJSON, CSV or XLSX.
+
+    NDJSON rows match /task-level items. CSV and XLSX have one column per
+    quality dimension instead of the nested quality_dimensions object.
+    """
     try:
         service = get_query_service()
         filters = {'domain': domain, 'reviewer': reviewer, 'trainer': trainer}
-        result = service.get_task_level_data(filters)
-        return [TaskLevelInfo(**item) for item in result]
+        columns = TASK_LEVEL_EXPORT_COLUMNS
+        if format != ExportFormat.NDJSON:
+            columns = columns + await run_read(service.get_task_level_dimensions, filters)
+
+        def flatten(row):
+            flat = {key: value for key, value in row.items() if key != 'quality_dimensions'}
+            flat.update(row['quality_dimensions'])
+            return flat
+
+        return export_response(
+            service.iter_task_level_rows(filters), columns, format, "task_level", flatten=flatten
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
@@ -313,10 +422,16 @@ async def get_task_level_info(
     response_model=Dict[str, Any],
     summary="Trigger data synchronization"
 )
-async def trigger_sync(request: Request) -> Dict[str, Any]:
+async def trigger_sync(
+    request: Request,
+    full_refresh: bool = Query(False, description="Force a full reload instead of an incremental sync")
+) -> Dict[str, Any]:
     """
     Manually trigger data synchronization from BigQuery.
     
+    Task-keyed tables sync incrementally from their watermark unless
+    full_refresh is set.
+    
     This endpoint is rate-limited to protect BigQuery quotas.
     Rate limit is configured via RATE_LIMIT_SYNC_REQUESTS and RATE_LIMIT_SYNC_WINDOW
     environment variables (default: 5 requests per minute).
@@ -324,17 +439,22 @@ async def trigger_sync(request: Request) -> Dict[str, Any]:
     The global rate limit from SlowAPIMiddleware also applies.
     """
     try:
-        logger.info("Manual sync triggered")
-        
-        data_sync_service = get_data_sync_service()
-        data_sync_service.initialize_bigquery_client()
+        logger.info(f"Manual sync triggered (full_refresh={full_refresh})")
         
-        results = data_sync_service.sync_all_tables(sync_type='manual')
+        def run_sync():
+            data_sync_service = get_data_sync_service()
+            data_sync_service.initialize_bigquery_client()
+            
+            results = data_sync_service.sync_all_tables(sync_type='full' if full_refresh else 'manual')
+            
+            db_service = get_db_service()
+            row_counts = {}
+            for table in ['task', 'review_detail', 'contributor']:
+                row_counts[table] = db_service.get_table_row_count(table)
+            return results, row_counts
         
-        db_service = get_db_service()
-        row_counts = {}
-        for table in ['task', 'review_detail', 'contributor']:
-            row_counts[table] = db_service.get_table_row_count(table)
+        # Long-running write: use the general pool, not the read pool
+        results, row_counts = await run_in_thread(run_sync)
         
         return {
             "status": "completed",
@@ -356,13 +476,17 @@ async def trigger_sync(request: Request) -> Dict[str, Any]:
 async def check_health() -> Dict[str, Any]:
     """Check database health and return table counts"""
     try:
-        db_service = get_db_service()
-        
-        table_status = db_service.check_tables_exist()
+        def load_status():
+            db_service = get_db_service()
+            
+            table_status = db_service.check_tables_exist()
+            
+            row_counts = {}
+            for table in ['task', 'review_detail', 'contributor', 'work_item']:
+                row_counts[table] = db_service.get_table_row_count(table)
+            return table_status, row_counts
         
-        row_counts = {}
-        for table in ['task', 'review_detail', 'contributor', 'work_item']:
-            row_counts[table] = db_service.get_table_row_count(table)
+        table_status, row_counts = await run_read(load_status)
         
         from app.config import get_settings
         settings = get_settings()
@@ -396,52 +520,55 @@ async def get_sync_info() -> Dict[str, Any]:
         settings = get_settings()
         db_service = get_db_service()
         
-        with db_service.get_session() as session:
-            last_sync = session.query(DataSyncLog).filter(
-                DataSyncLog.sync_status == 'completed'
-            ).order_by(
-                desc(DataSyncLog.sync_completed_at)
-            ).first()
-            
-            current_utc = datetime.now(timezone.utc)
-            
-            # Calculate next sync time based on last sync + interval
-            sync_interval_minutes = settings.sync_interval_minutes
-            next_sync_time = None
-            seconds_until_next_sync = None
-            
-            if last_sync and last_sync.sync_completed_at:
-                last_sync_utc = last_sync.sync_completed_at.replace(tzinfo=timezone.utc) if last_sync.sync_completed_at.tzinfo is None else last_sync.sync_completed_at
-                next_sync = last_sync_utc + timedelta(minutes=settings.sync_interval_minutes)
-                next_sync_time = next_sync.isoformat()
-                seconds_until_next_sync = max(0, int((next_sync - current_utc).total_seconds()))
-            
-            sync_info = {
-                'current_utc_time': current_utc.isoformat(),
-                'last_sync_time': last_sync.sync_completed_at.isoformat() if last_sync and last_sync.sync_completed_at else None,
-                'last_sync_type': last_sync.sync_type if last_sync else None,
-                'sync_interval_minutes': sync_interval_minutes,
-                'next_sync_time': next_sync_time,
-                'seconds_until_next_sync': seconds_until_next_sync,
-                'tables_synced': []
-            }
-            
-            if last_sync:
-                recent_syncs = session.query(DataSyncLog).filter(
-                    DataSyncLog.sync_completed_at == last_sync.sync_completed_at,
+        def load_sync_info():
+            with db_service.get_session() as session:
+                last_sync = session.query(DataSyncLog).filter(
                     DataSyncLog.sync_status == 'completed'
-                ).all()
+                ).order_by(
+                    desc(DataSyncLog.sync_completed_at)
+                ).first()
                 
-                sync_info['tables_synced'] = [
-                    {
-                        'table_name': sync.table_name,
-                        'records_synced': sync.records_synced,
-                        'sync_started_at': sync.sync_started_at.isoformat() if sync.sync_started_at else None
-                    }
-                    for sync in recent_syncs
-                ]
-            
-            return sync_info
+                current_utc = datetime.now(timezone.utc)
+                
+                # Calculate next sync time based on last sync + interval
+                sync_interval_minutes = settings.sync_interval_minutes
+                next_sync_time = None
+                seconds_until_next_sync = None
+                
+                if last_sync and last_sync.sync_completed_at:
+                    last_sync_utc = last_sync.sync_completed_at.replace(tzinfo=timezone.utc) if last_sync.sync_completed_at.tzinfo is None else last_sync.sync_completed_at
+                    next_sync = last_sync_utc + timedelta(minutes=settings.sync_interval_minutes)
+                    next_sync_time = next_sync.isoformat()
+                    seconds_until_next_sync = max(0, int((next_sync - current_utc).total_seconds()))
+                
+                sync_info = {
+                    'current_utc_time': current_utc.isoformat(),
+                    'last_sync_time': last_sync.sync_completed_at.isoformat() if last_sync and last_sync.sync_completed_at else None,
+                    'last_sync_type': last_sync.sync_type if last_sync else None,
+                    'sync_interval_minutes': sync_interval_minutes,
+                    'next_sync_time': next_sync_time,
+                    'seconds_until_next_sync': seconds_until_next_sync,
+                    'tables_synced': []
+                }
+                
+                if last_sync:
+                    recent_syncs = session.query(DataSyncLog).filter(
+                        DataSyncLog.sync_completed_at == last_sync.sync_completed_at,
+                        DataSyncLog.sync_status == 'completed'
+                    ).all()
+                    
+                    sync_info['tables_synced'] = [
+                        {
+                            'table_name': sync.table_name,
+                            'records_synced': sync.records_synced,
+                            'sync_started_at': sync.sync_started_at.isoformat() if sync.sync_started_at else None
+                        }
+                        for sync in recent_syncs
+                    ]
+                
+                return sync_info
+        
+        return await run_read(load_sync_info)
             
     except Exception as e:
         logger.error(f"Error getting sync info: {e}")
@@ -459,7 +586,7 @@ async def get_rating_trends(
     """Get rating trends showing how ratings have improved over time"""
     try:
         service = get_query_service()
-        result = service.get_rating_trends(trainer_email=trainer_email, granularity=granularity)
+        result = await run_read(service.get_rating_trends, trainer_email=trainer_email, granularity=granularity)
         return result
     except Exception as e:
         logger.error(f"Error getting rating trends: {e}")
@@ -492,7 +619,8 @@ async def get_rating_comparison(
     
     try:
         service = get_query_service()
-        result = service.get_rating_comparison(
+        result = await run_read(
+            service.get_rating_comparison,
             period1_start=period1_start,
             period1_end=period1_end,
             period2_start=period2_start,
@@ -512,6 +640,7 @@ async def get_rating_comparison(
     summary="Get POD Lead stats with trainers under each POD"
 )
 async def get_pod_lead_stats(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     timeframe: str = Query("overall", description="Timeframe: daily, weekly, overall"),
@@ -531,13 +660,14 @@ async def get_pod_lead_stats(
     
     try:
         service = get_query_service()
-        result = service.get_pod_lead_stats_with_trainers(
+        result = await run_read(
+            service.get_pod_lead_stats_with_trainers,
             start_date=start_date,
             end_date=end_date,
             timeframe=timeframe,
             project_id=project_id
         )
-        return result
+        return negotiated_response(request, result)
     except ValidationError:
         raise
     except Exception as e:
@@ -550,9 +680,10 @@ async def get_pod_lead_stats(
     summary="Get Project stats with POD Leads under each project"
 )
 async def get_project_stats(
+    request: Request,
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    include_tasks: bool = Query(False, description="Include task-level details under each trainer")
+    include_tasks: bool = Query(False, description="Include task-level details under each trainer (prefer /project-stats/tasks per trainer)")
 ) -> List[Dict[str, Any]]:
     """Get Project stats with POD Leads aggregated under each project.
     
@@ -563,17 +694,82 @@ async def get_project_stats(
     """
     try:
         service = get_query_service()
-        result = service.get_project_stats_with_pod_leads(
+        result = await run_read(
+            service.get_project_stats_with_pod_leads,
             start_date=start_date,
             end_date=end_date,
             include_tasks=include_tasks
         )
-        return result
+        return negotiated_response(request, result)
     except Exception as e:
         logger.error(f"Error getting project stats: {e}")
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+@router.get(
+    "/project-stats/tasks",
+    summary="Get task-level details for one trainer in a project"
+)
+async def get_project_trainer_tasks(
+    project_id: int = Query(..., description="Project ID"),
+    trainer_email: str = Query(..., description="Trainer email", max_length=255),
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)")
+) -> List[Dict[str, Any]]:
+    """Task rows under one trainer of /project-stats, loaded when the trainer is expanded.
+
+    Returns the same rows that include_tasks=true embeds under the trainer.
+    """
+    try:
+        validate_project_id(project_id)
+        validate_date_format(start_date, "start_date")
+        validate_date_format(end_date, "end_date")
+        service = get_query_service()
+        return await run_read(
+            service.get_project_trainer_tasks,
+            project_id,
+            trainer_email,
+            start_date=start_date,
+            end_date=end_date
+        )
+    except ValidationError:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting trainer tasks: {e}")
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
+
+PROJECT_TASK_EXPORT_COLUMNS = [
+    'project_id', 'project_name', 'pod_lead_email', 'pod_lead_name', 'trainer_email', 'trainer_name',
+    'task_id', 'colab_link', 'is_new', 'rework_count', 'reviews', 'avg_rating', 'agentic_reviews',
+    'agentic_rating', 'is_delivered', 'is_in_queue', 'task_status', 'last_completed_date', 'aht_mins',
+    'accounted_hours', 'rework_percent', 'is_calibrated', 'calibration_passed',
+]
+
+
+@router.get(
+    "/project-stats/export",
+    summary="Export project stats task rows (streamed)"
+)
+async def export_project_stats(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="ndjson, csv or xlsx"),
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)")
+) -> StreamingResponse:
+    """Stream the /project-stats?include_tasks=true task rows, one per project, POD lead, trainer and task.
+
+    Rows are built one project at a time while streaming; the cached
+    hierarchy is not used.
+    """
+    try:
+        service = get_query_service()
+        rows = service.iter_project_task_rows(start_date=start_date, end_date=end_date)
+        return export_response(rows, PROJECT_TASK_EXPORT_COLUMNS, format, "project_stats_tasks")
+    except Exception as e:
+        logger.error(f"Error exporting project stats: {e}")
+        raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+
+
 @router.get(
     "/project-summary",
     summary="Get project summary report with FPY and status indicators"
@@ -589,7 +785,7 @@ async def get_project_summary(
     """
     try:
         service = get_query_service()
-        result = service.get_project_summary(start_date=start_date, end_date=end_date)
+        result = await run_read(service.get_project_summary, start_date=start_date, end_date=end_date)
         return result
     except Exception as e:
         logger.error(f"Error getting project summary: {e}")
@@ -604,10 +800,11 @@ async def get_project_fpy(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
 ) -> Dict[str, Any]:
-    """Compute Reviewer/Auditor FPY per project from BigQuery reviews."""
+    """Compute Reviewer/Auditor FPY per project from the synced fpy_review table."""
     try:
         service = get_query_service()
-        raw = service._compute_fpy_from_reviews(
+        raw = await run_read(
+            service._compute_fpy_from_reviews,
             project_ids=service.settings.all_project_ids_list,
             start_date=start_date, end_date=end_date,
         )
@@ -654,7 +851,8 @@ async def get_trainer_target_comparison(
         rollup_enum = RollupPeriod(rollup.lower())
         
         service = get_target_comparison_service()
-        comparisons = service.get_trainer_comparison(
+        comparisons = await run_read(
+            service.get_trainer_comparison,
             project_id=project_id,
             trainer_email=trainer_email,
             start_date=parsed_start,
@@ -718,7 +916,8 @@ async def get_project_target_summary(
         rollup_enum = RollupPeriod(rollup.lower())
         
         service = get_target_comparison_service()
-        summary = service.get_project_summary(
+        summary = await run_read(
+            service.get_project_summary,
             project_id=project_id,
             start_date=parsed_start,
             end_date=parsed_end,
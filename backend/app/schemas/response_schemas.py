@@ -48,6 +48,14 @@ class PaginatedResponse(BaseModel):
         )
 
 
+class CursorPaginatedResponse(BaseModel):
+    """Keyset-paginated response wrapper."""
+    data: List[Any] = Field(..., description="List of items")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (null on the last page)")
+    has_more: bool = Field(..., description="Whether there is a next page")
+    total: Optional[int] = Field(None, description="Total number of items (only when include_total=true)")
+
+
 # =============================================================================
 # Quality Dimension Schema
 # =============================================================================
@@ -201,6 +209,11 @@ class TaskLevelInfo(BaseModel):
     quality_dimensions: Dict[str, float] = {}
 
 
+class TaskLevelPage(CursorPaginatedResponse):
+    """Keyset page of task-level information"""
+    data: List[TaskLevelInfo]
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str
@@ -16,7 +16,7 @@ from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict
 
-from sqlalchemy import func, case, distinct, extract, text, and_, or_, literal
+from sqlalchemy import func, case, distinct, extract, text, and_, or_, literal, literal_column, cast, Date
 from sqlalchemy.orm import Session
 
 from app.models.db_models import (
@@ -31,8 +31,11 @@ from app.models.db_models import (
     ProjectCostDaily,
     PodLeadMapping,
     TrainerReviewStats,
+    FpyReview,
 )
 from app.constants import get_constants
+from app.core.cache import cached
+from app.services.fpy_reviews import fpy_counts, fpy_rates
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +129,47 @@ def _get_period_boundaries(start_date: date, end_date: date, granularity: str) -
     return periods
 
 
+def _period_start(value: Any, granularity: str) -> date:
+    """Map a date (or DB date/datetime value) to the start of its period."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    elif isinstance(value, datetime):
+        value = value.date()
+    if granularity == 'weekly':
+        return value - timedelta(days=value.weekday())
+    if granularity == 'monthly':
+        return value.replace(day=1)
+    return value
+
+
+def _period_bucket(session: Session, column, granularity: str, periods: Optional[List[Dict]] = None):
+    """
+    SQL expression bucketing a date column into periods.
+    
+    Uses date_trunc on PostgreSQL (weeks start on Monday, matching
+    _get_period_boundaries). Other dialects group by day and rows are folded
+    into periods with _period_start, so every measure bucketed this way
+    must be additive or a distinct set - unless ``periods`` is given, in
+    which case they get an exact CASE over the period boundaries.
+    """
+    if granularity == 'daily':
+        return column
+    if session.get_bind().dialect.name == 'postgresql':
+        unit = 'week' if granularity == 'weekly' else 'month'
+        return cast(func.date_trunc(literal_column(f"'{unit}'"), column), Date)
+    if periods:
+        return case(*[(column.between(p['start'], p['end']), p['start']) for p in periods])
+    return column
+
+
+def _on_days(column, start: date, end: date):
+    """Filter a timestamp column to the days ``start``..``end`` without wrapping it in DATE()."""
+    return and_(
+        column >= datetime.combine(start, datetime.min.time()),
+        column < datetime.combine(end + timedelta(days=1), datetime.min.time()),
+    )
+
+
 def _get_project_ids_filter(project_id: Optional[int]) -> List[int]:
     """Get list of project IDs to filter on."""
     constants = get_constants()
@@ -134,95 +178,134 @@ def _get_project_ids_filter(project_id: Optional[int]) -> List[int]:
     return constants.projects.PRIMARY_PROJECT_IDS
 
 
-def prefetch_fpy_data(
-    session: Session,
-    start_date: str,
-    end_date: str,
-) -> tuple:
-    """
-    Fetch ALL FPY review data from BigQuery in one call (all projects).
-    Returns (fpy_reviews_by_date, fpy_role_map) to pass into get_analytics_time_series.
-    """
-    from datetime import datetime, date
-    parsed_start = datetime.strptime(start_date, '%Y-%m-%d').date()
-    parsed_end = datetime.strptime(end_date, '%Y-%m-%d').date()
-    constants = get_constants()
-    all_project_ids = constants.projects.ALL_PROJECT_IDS
-
-    fpy_reviews_by_date: Dict[date, list] = defaultdict(list)
-    fpy_role_map: dict = {}
-
-    try:
-        from app.config import get_settings
-        settings = get_settings()
-        from google.cloud import bigquery as bq_module
-        bq_client = bq_module.Client(project=settings.gcp_project_id)
-        gcp_p, gcp_d = settings.gcp_project_id, settings.bigquery_dataset
-        pid_list = ','.join(str(i) for i in all_project_ids)
+def _new_period_totals() -> Dict[str, Any]:
+    """Raw per-period accumulators consumed by _build_data_point."""
+    return {
+        'unique_tasks': 0, 'new_tasks': 0, 'rework_tasks': 0,
+        'delivered': 0, 'in_queue': 0, 'reviewed': 0,
+        'sum_score': 0.0, 'count_reviews': 0,
+        'human_score': 0.0, 'human_reviews': 0,
+        'agentic_score': 0.0, 'agentic_reviews': 0,
+        'trainers': set(), 'reviewers': set(), 'jibble_people': set(),
+        'jibble_hours': 0.0, 'reviewer_jibble_hours': 0.0,
+        'revenue': 0.0, 'work_cost': 0.0, 'non_work_cost': 0.0,
+        'fpy': {'r_total': 0, 'r_pass': 0, 'a_total': 0, 'a_pass': 0},
+    }
 
-        fpy_query = f"""
-        SELECT
-            conv.project_id,
-            r.conversation_id,
-            cont.turing_email AS reviewer_email,
-            JSON_EXTRACT_SCALAR(r.review_action, '$.type') AS action_type,
-            DATE(r.submitted_at) AS review_date
-        FROM `{gcp_p}.{gcp_d}.review` r
-        JOIN `{gcp_p}.{gcp_d}.conversation` conv ON conv.id = r.conversation_id
-        LEFT JOIN `{gcp_p}.{gcp_d}.contributor` cont ON cont.id = r.reviewer_id
-        WHERE conv.project_id IN ({pid_list})
-          AND r.review_type = 'manual'
-          AND r.status = 'published'
-          AND r.submitted_at IS NOT NULL
-          AND DATE(r.submitted_at) >= '{parsed_start.isoformat()}'
-          AND DATE(r.submitted_at) <= '{parsed_end.isoformat()}'
-        ORDER BY r.conversation_id, r.submitted_at ASC
-        """
-        fpy_rows = list(bq_client.query(fpy_query).result())
-        for row in fpy_rows:
-            rd = row['review_date']
-            if isinstance(rd, datetime):
-                rd = rd.date()
-            fpy_reviews_by_date[rd].append({
-                'project_id': row['project_id'],
-                'conversation_id': row['conversation_id'],
-                'reviewer_email': (row['reviewer_email'] or '').lower().strip(),
-                'action_type': (row['action_type'] or '').lower(),
-            })
 
-        pod_rows = session.query(PodLeadMapping.trainer_email, PodLeadMapping.role).all()
-        for pr in pod_rows:
-            if pr.trainer_email and pr.role:
-                rl = pr.role.lower().strip()
-                em = pr.trainer_email.lower().strip()
-                if rl in ('pod lead', 'sub pod lead', 'pod_lead'):
-                    fpy_role_map[em] = 'reviewer'
-                elif rl in ('calibrator', 'auditor', 'team lead'):
-                    fpy_role_map[em] = 'calibrator'
-        try:
-            from app.services.quality_rubrics_service import QualityRubricsService
-            qr_svc = QualityRubricsService()
-            for email, role in qr_svc._fetch_team_roles().items():
-                fpy_role_map[email.lower().strip()] = role
-        except Exception:
-            pass
+def _build_data_point(
+    period: Dict[str, date],
+    totals: Dict[str, Any],
+    aht_new: float,
+    aht_rework: float,
+    team_size: int,
+) -> Dict[str, Any]:
+    """Derive one AnalyticsDataPoint from a period's raw totals."""
+    p_start = period['start']
+    p_end = period['end']
+    
+    # --- Tasks ---
+    unique = totals['unique_tasks']
+    new = totals['new_tasks']
+    rework = totals['rework_tasks']
+    
+    # --- Quality ---
+    total_reviews = totals['count_reviews']
+    human_reviews = totals['human_reviews']
+    agentic_reviews = totals['agentic_reviews']
+    avg_rating = round(totals['sum_score'] / total_reviews, 2) if total_reviews > 0 else None
+    human_avg_rating = round(totals['human_score'] / human_reviews, 2) if human_reviews > 0 else None
+    agentic_avg_rating = round(totals['agentic_score'] / agentic_reviews, 2) if agentic_reviews > 0 else None
+    # Rework % = rework / (rework + new_tasks) * 100  (caps at 100%)
+    # Consistent with query_service.py formula
+    submissions = new + rework
+    rework_pct = round((rework / submissions) * 100, 1) if submissions > 0 else None
+    
+    # --- People (distinct trainers across the whole period) ---
+    period_trainers = totals['trainers']
+    active_trainers = len(period_trainers)
+    # Labeling tool people = trainers + reviewers (union)
+    labeling_tool_people = len(period_trainers | totals['reviewers'])
+    jibble_people = len(totals['jibble_people'])
+    
+    # --- Jibble Hours ---
+    period_jibble = round(totals['jibble_hours'], 1)
+    
+    # --- AHT & Accounted Hours ---
+    accounted = round(new * aht_new + rework * aht_rework, 1) if (new + rework) > 0 else 0
+    aht_avg = round(accounted / unique, 1) if unique > 0 else None
+    
+    # --- Efficiency ---
+    eff_pct = round((accounted / period_jibble) * 100, 1) if period_jibble > 0 and accounted > 0 else None
 
-        logger.info(f"Prefetch FPY: Loaded {len(fpy_rows)} review rows for all projects")
-    except Exception as e:
-        logger.warning(f"Prefetch FPY failed (non-fatal): {e}")
+    # --- Target (trainer hours only / new_task_aht) ---
+    period_reviewer_jibble = round(totals['reviewer_jibble_hours'], 1)
+    trainer_only_jibble = max(period_jibble - period_reviewer_jibble, 0)
+    target = round(trainer_only_jibble / aht_new, 1) if trainer_only_jibble > 0 and aht_new > 0 else 0
+    
+    # --- Revenue & Cost ---
+    period_revenue = totals['revenue']
+    period_cost = round(totals['work_cost'] + totals['non_work_cost'], 2)
+    
+    # --- Margin ---
+    period_margin = round(period_revenue - period_cost, 2) if period_revenue > 0 else None
+    period_margin_pct = round(((period_revenue - period_cost) / period_revenue) * 100, 1) if period_revenue > 0 else None
+    
+    # --- FPY (Reviewer & Auditor) ---
+    reviewer_fpy_pct, auditor_fpy_pct = fpy_rates(totals['fpy'])
 
-    return fpy_reviews_by_date, fpy_role_map
+    # --- Avg Rework Per Task ---
+    avg_rework_per_task = round(rework / unique, 2) if unique > 0 else None
+    
+    return {
+        'period': p_start.isoformat(),
+        'period_end': p_end.isoformat(),
+        'period_label': period['label'],
+        # Tasks
+        'unique_tasks': unique,
+        'new_tasks': new,
+        'rework_tasks': rework,
+        'delivered': totals['delivered'],
+        'in_queue': totals['in_queue'],
+        # Quality
+        'avg_rating': avg_rating,
+        'human_avg_rating': human_avg_rating,
+        'agentic_avg_rating': agentic_avg_rating,
+        'rework_percent': rework_pct,
+        'reviewer_fpy_pct': reviewer_fpy_pct,
+        'auditor_fpy_pct': auditor_fpy_pct,
+        'avg_rework_per_task': avg_rework_per_task,
+        # Time & Efficiency
+        'aht_avg': aht_avg,
+        'accounted_hours': accounted,
+        'jibble_hours': period_jibble,
+        'efficiency_percent': eff_pct,
+        # Finance
+        'revenue': round(period_revenue, 2),
+        'cost': period_cost,
+        'work_cost': round(totals['work_cost'], 2),
+        'non_work_cost': round(totals['non_work_cost'], 2),
+        'margin': period_margin,
+        'margin_percent': period_margin_pct,
+        # People
+        'trainers_active': active_trainers,
+        'team_size': team_size,
+        'labeling_tool_people': labeling_tool_people,
+        'jibble_people': jibble_people,
+        # Additional delivery
+        'completed': unique,
+        'reviewed': totals['reviewed'],
+        'target': target,
+    }
 
 
+@cached(prefix="analytics_time_series", ignore=("session",))
 def get_analytics_time_series(
     session: Session,
     start_date: str,
     end_date: str,
     granularity: str = 'weekly',
     project_id: Optional[int] = None,
-    skip_bigquery_fpy: bool = False,
-    prefetched_fpy_reviews: Optional[Dict] = None,
-    prefetched_fpy_role_map: Optional[Dict] = None,
 ) -> Dict[str, Any]:
     """
     Get time-series data for the Analytics page.
@@ -499,8 +582,7 @@ def get_analytics_time_series(
         ).filter(
             TaskRaw.project_id.in_(project_ids),
             TaskRaw.r_updated_at.isnot(None),
-            func.date(TaskRaw.r_updated_at) >= parsed_start,
-            func.date(TaskRaw.r_updated_at) <= parsed_end,
+            _on_days(TaskRaw.r_updated_at, parsed_start, parsed_end),
             TaskRaw.count_reviews > 0,
         ).group_by(func.date(TaskRaw.r_updated_at)).all()
         for row in reviewed_rows:
@@ -684,78 +766,22 @@ def get_analytics_time_series(
         aht_rework = constants.daily_targets.DEFAULT_REWORK_AHT
     
     # =========================================================================
-    # QUERY 10: FPY from BigQuery reviews (reviewer & auditor, per date)
+    # QUERY 10: FPY from the synced fpy_review table (first review per
+    # conversation and role within each period)
     # =========================================================================
-    fpy_reviews_by_date: Dict[date, list] = defaultdict(list)
-    fpy_role_map: dict = {}
-
-    if prefetched_fpy_reviews is not None and prefetched_fpy_role_map is not None:
-        # Use pre-fetched data — filter to this project's IDs
-        for d, revs in prefetched_fpy_reviews.items():
-            for rev in revs:
-                if rev['project_id'] in project_ids:
-                    fpy_reviews_by_date[d].append(rev)
-        fpy_role_map = prefetched_fpy_role_map
-    elif not skip_bigquery_fpy:
-        try:
-            from app.config import get_settings
-            settings = get_settings()
-            from google.cloud import bigquery as bq_module
-            bq_client = bq_module.Client(project=settings.gcp_project_id)
-            gcp_p, gcp_d = settings.gcp_project_id, settings.bigquery_dataset
-            pid_list = ','.join(str(i) for i in project_ids)
-
-            fpy_query = f"""
-            SELECT
-                conv.project_id,
-                r.conversation_id,
-                cont.turing_email AS reviewer_email,
-                JSON_EXTRACT_SCALAR(r.review_action, '$.type') AS action_type,
-                DATE(r.submitted_at) AS review_date
-            FROM `{gcp_p}.{gcp_d}.review` r
-            JOIN `{gcp_p}.{gcp_d}.conversation` conv ON conv.id = r.conversation_id
-            LEFT JOIN `{gcp_p}.{gcp_d}.contributor` cont ON cont.id = r.reviewer_id
-            WHERE conv.project_id IN ({pid_list})
-              AND r.review_type = 'manual'
-              AND r.status = 'published'
-              AND r.submitted_at IS NOT NULL
-              AND DATE(r.submitted_at) >= '{parsed_start.isoformat()}'
-              AND DATE(r.submitted_at) <= '{parsed_end.isoformat()}'
-            ORDER BY r.conversation_id, r.submitted_at ASC
-            """
-            fpy_rows = list(bq_client.query(fpy_query).result())
-            for row in fpy_rows:
-                rd = row['review_date']
-                if isinstance(rd, datetime):
-                    rd = rd.date()
-                fpy_reviews_by_date[rd].append({
-                    'project_id': row['project_id'],
-                    'conversation_id': row['conversation_id'],
-                    'reviewer_email': (row['reviewer_email'] or '').lower().strip(),
-                    'action_type': (row['action_type'] or '').lower(),
-                })
-
-            # Build role map
-            pod_rows = session.query(PodLeadMapping.trainer_email, PodLeadMapping.role).all()
-            for pr in pod_rows:
-                if pr.trainer_email and pr.role:
-                    rl = pr.role.lower().strip()
-                    em = pr.trainer_email.lower().strip()
-                    if rl in ('pod lead', 'sub pod lead', 'pod_lead'):
-                        fpy_role_map[em] = 'reviewer'
-                    elif rl in ('calibrator', 'auditor', 'team lead'):
-                        fpy_role_map[em] = 'calibrator'
-            try:
-                from app.services.quality_rubrics_service import QualityRubricsService
-                qr_svc = QualityRubricsService()
-                for email, role in qr_svc._fetch_team_roles().items():
-                    fpy_role_map[email.lower().strip()] = role
-            except Exception:
-                pass
-
-            logger.info(f"Analytics: Loaded {len(fpy_rows)} FPY review rows for time-series")
-        except Exception as e:
-            logger.warning(f"Analytics: FPY query failed (non-fatal): {e}")
+    fpy_by_period: Dict[date, Dict[str, int]] = defaultdict(lambda: {
+        'r_total': 0, 'r_pass': 0, 'a_total': 0, 'a_pass': 0,
+    })
+    try:
+        fpy_period = _period_bucket(session, FpyReview.review_date, granularity, periods)
+        for (_, period_value), counts in fpy_counts(
+            session, project_ids, parsed_start, parsed_end, period=fpy_period,
+        ).items():
+            target_counts = fpy_by_period[_period_start(period_value, granularity)]
+            for name, value in counts.items():
+                target_counts[name] += value
+    except Exception as e:
+        logger.warning(f"Analytics: FPY query failed (non-fatal): {e}")
 
     # =========================================================================
     # AGGREGATE BY PERIOD
@@ -765,186 +791,60 @@ def get_analytics_time_series(
     for period in periods:
         p_start = period['start']
         p_end = period['end']
+        totals = _new_period_totals()
         
-        # --- Tasks ---
-        unique = 0
-        new = 0
-        rework = 0
         for d, vals in task_data.items():
             if p_start <= d <= p_end:
-                unique += vals['unique_tasks']
-                new += vals['new_tasks']
-                rework += vals['rework_tasks']
+                totals['unique_tasks'] += vals['unique_tasks']
+                totals['new_tasks'] += vals['new_tasks']
+                totals['rework_tasks'] += vals['rework_tasks']
         
-        # --- Delivered & In Queue ---
-        delivered = sum(v for d, v in delivery_data.items() if p_start <= d <= p_end)
-        in_queue = sum(v for d, v in queue_data.items() if p_start <= d <= p_end)
+        totals['delivered'] = sum(v for d, v in delivery_data.items() if p_start <= d <= p_end)
+        totals['in_queue'] = sum(v for d, v in queue_data.items() if p_start <= d <= p_end)
         
-        # --- Quality ---
-        total_score = 0.0
-        total_reviews = 0
-        human_score = 0.0
-        human_reviews = 0
-        agentic_score = 0.0
-        agentic_reviews = 0
         for d, vals in quality_data.items():
             if p_start <= d <= p_end:
-                total_score += vals['sum_score']
-                total_reviews += vals['count_reviews']
+                totals['sum_score'] += vals['sum_score']
+                totals['count_reviews'] += vals['count_reviews']
         for d, vals in human_quality_data.items():
             if p_start <= d <= p_end:
-                human_score += vals['sum_score']
-                human_reviews += vals['count_reviews']
+                totals['human_score'] += vals['sum_score']
+                totals['human_reviews'] += vals['count_reviews']
         for d, vals in agentic_quality_data.items():
             if p_start <= d <= p_end:
-                agentic_score += vals['sum_score']
-                agentic_reviews += vals['count_reviews']
+                totals['agentic_score'] += vals['sum_score']
+                totals['agentic_reviews'] += vals['count_reviews']
         
-        avg_rating = round(total_score / total_reviews, 2) if total_reviews > 0 else None
-        human_avg_rating = round(human_score / human_reviews, 2) if human_reviews > 0 else None
-        agentic_avg_rating = round(agentic_score / agentic_reviews, 2) if agentic_reviews > 0 else None
-        # Rework % = rework / (rework + new_tasks) * 100  (caps at 100%)
-        # Consistent with query_service.py formula
-        submissions = new + rework
-        rework_pct = round((rework / submissions) * 100, 1) if submissions > 0 else None
-        
-        # --- People (distinct trainers across the whole period) ---
-        period_trainers: set = set()
         for d, emails in people_data_by_day.items():
             if p_start <= d <= p_end:
-                period_trainers.update(emails)
-        active_trainers = len(period_trainers)
-
-        # --- Reviewers active in period ---
-        period_reviewers: set = set()
+                totals['trainers'].update(emails)
         for d, emails in reviewer_emails_by_day.items():
             if p_start <= d <= p_end:
-                period_reviewers.update(emails)
-
-        # Labeling tool people = trainers + reviewers (union)
-        labeling_tool_people = len(period_trainers | period_reviewers)
-
-        # --- Jibble people in period ---
-        period_jibble_people: set = set()
+                totals['reviewers'].update(emails)
         for d, emails in jibble_people_by_day.items():
             if p_start <= d <= p_end:
-                period_jibble_people.update(emails)
-        jibble_people = len(period_jibble_people)
-
-        # --- Completed (= unique tasks from task_history_raw, consistent with accounted) ---
-        period_completed = unique
-        # --- Reviewed ---
-        period_reviewed = sum(v for d, v in reviewed_by_day.items() if p_start <= d <= p_end)
-
-        # --- Jibble Hours ---
-        period_jibble = round(sum(v for d, v in jibble_data.items() if p_start <= d <= p_end), 1)
+                totals['jibble_people'].update(emails)
         
-        # --- AHT & Accounted Hours ---
-        accounted = round(new * aht_new + rework * aht_rework, 1) if (new + rework) > 0 else 0
-        aht_avg = round(accounted / unique, 1) if unique > 0 else None
-        
-        # --- Efficiency ---
-        eff_pct = round((accounted / period_jibble) * 100, 1) if period_jibble > 0 and accounted > 0 else None
-
-        # --- Target (trainer hours only / new_task_aht) ---
-        period_reviewer_jibble = round(sum(v for d, v in reviewer_jibble_data.items() if p_start <= d <= p_end), 1)
-        trainer_only_jibble = max(period_jibble - period_reviewer_jibble, 0)
-        target = round(trainer_only_jibble / aht_new, 1) if trainer_only_jibble > 0 and aht_new > 0 else 0
+        totals['reviewed'] = sum(v for d, v in reviewed_by_day.items() if p_start <= d <= p_end)
+        totals['jibble_hours'] = sum(v for d, v in jibble_data.items() if p_start <= d <= p_end)
+        totals['reviewer_jibble_hours'] = sum(
+            v for d, v in reviewer_jibble_data.items() if p_start <= d <= p_end
+        )
         
-        # --- Revenue (use midpoint matching) ---
-        period_revenue = 0.0
+        # Revenue uses midpoint matching
         for rv in revenue_data:
             if p_start <= rv['midpoint'] <= p_end:
-                period_revenue += rv['revenue']
+                totals['revenue'] += rv['revenue']
         
-        # --- Cost ---
-        period_work_cost = 0.0
-        period_non_work_cost = 0.0
         for d, vals in cost_data.items():
             if p_start <= d <= p_end:
-                period_work_cost += vals['work']
-                period_non_work_cost += vals['non_work']
-        period_cost = round(period_work_cost + period_non_work_cost, 2)
-        period_work_cost = round(period_work_cost, 2)
-        period_non_work_cost = round(period_non_work_cost, 2)
-        
-        # --- Margin ---
-        period_margin = round(period_revenue - period_cost, 2) if period_revenue > 0 else None
-        period_margin_pct = round(((period_revenue - period_cost) / period_revenue) * 100, 1) if period_revenue > 0 else None
+                totals['work_cost'] += vals['work']
+                totals['non_work_cost'] += vals['non_work']
         
-        # --- FPY (Reviewer & Auditor) ---
-        period_reviews: list = []
-        for d, revs in fpy_reviews_by_date.items():
-            if p_start <= d <= p_end:
-                period_reviews.extend(revs)
-
-        r_total, r_pass, a_total, a_pass = 0, 0, 0, 0
-        seen_fpy: dict = {}  # conv_id → {reviewer: bool, calibrator: bool}
-        for rev in period_reviews:
-            cid = rev['conversation_id']
-            email = rev['reviewer_email']
-            action = rev['action_type']
-            role = fpy_role_map.get(email, 'reviewer')
-
-            if cid not in seen_fpy:
-                seen_fpy[cid] = {}
-            if role == 'reviewer' and 'reviewer' not in seen_fpy[cid]:
-                seen_fpy[cid]['reviewer'] = True
-                r_total += 1
-                if action != 'rework':
-                    r_pass += 1
-            elif role == 'calibrator' and 'calibrator' not in seen_fpy[cid]:
-                seen_fpy[cid]['calibrator'] = True
-                a_total += 1
-                if action != 'rework':
-                    a_pass += 1
-
-        reviewer_fpy_pct = round(r_pass / r_total * 100, 1) if r_total > 0 else None
-        auditor_fpy_pct = round(a_pass / a_total * 100, 1) if a_total > 0 else None
-
-        # --- Avg Rework Per Task ---
-        avg_rework_per_task = round(rework / unique, 2) if unique > 0 else None
+        if p_start in fpy_by_period:
+            totals['fpy'] = fpy_by_period[p_start]
         
-        result_data.append({
-            'period': p_start.isoformat(),
-            'period_end': p_end.isoformat(),
-            'period_label': period['label'],
-            # Tasks
-            'unique_tasks': unique,
-            'new_tasks': new,
-            'rework_tasks': rework,
-            'delivered': delivered,
-            'in_queue': in_queue,
-            # Quality
-            'avg_rating': avg_rating,
-            'human_avg_rating': human_avg_rating,
-            'agentic_avg_rating': agentic_avg_rating,
-            'rework_percent': rework_pct,
-            'reviewer_fpy_pct': reviewer_fpy_pct,
-            'auditor_fpy_pct': auditor_fpy_pct,
-            'avg_rework_per_task': avg_rework_per_task,
-            # Time & Efficiency
-            'aht_avg': aht_avg,
-            'accounted_hours': accounted,
-            'jibble_hours': period_jibble,
-            'efficiency_percent': eff_pct,
-            # Finance
-            'revenue': round(period_revenue, 2),
-            'cost': period_cost,
-            'work_cost': period_work_cost,
-            'non_work_cost': period_non_work_cost,
-            'margin': period_margin,
-            'margin_percent': period_margin_pct,
-            # People
-            'trainers_active': active_trainers,
-            'team_size': team_size,
-            'labeling_tool_people': labeling_tool_people,
-            'jibble_people': jibble_people,
-            # Additional delivery
-            'completed': period_completed,
-            'reviewed': period_reviewed,
-            'target': target,
-        })
+        result_data.append(_build_data_point(period, totals, aht_new, aht_rework, team_size))
     
     # =========================================================================
     # COMPUTE SUMMARY CARDS (current period vs previous period)
@@ -966,6 +866,381 @@ def get_analytics_time_series(
     }
 
 
+@cached(prefix="analytics_time_series_by_project", ignore=("session",))
+def get_analytics_time_series_by_project(
+    session: Session,
+    start_date: str,
+    end_date: str,
+    granularity: str = 'daily',
+    project_ids: Optional[List[int]] = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Get per-project time-series data for several projects in one pass.
+    
+    Equivalent to calling get_analytics_time_series(project_id=pid) for each
+    project, but every source is read once with queries grouped by
+    project_id x period, so the query count doesn't grow with the number of
+    projects. Returns {project_id: [AnalyticsDataPoint, ...]}.
+    """
+    try:
+        parsed_start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        parsed_end = datetime.strptime(end_date, '%Y-%m-%d').date()
+    except (ValueError, TypeError) as e:
+        logger.error(f"Invalid date format: {e}")
+        return {}
+    
+    constants = get_constants()
+    project_ids = list(project_ids or constants.projects.ALL_PROJECT_IDS)
+    periods = _get_period_boundaries(parsed_start, parsed_end, granularity)
+    if not periods:
+        return {pid: [] for pid in project_ids}
+    first_start = periods[0]['start']
+    
+    logger.info(
+        f"Analytics by project: {granularity} from {start_date} to {end_date}, "
+        f"projects={project_ids}, periods={len(periods)}"
+    )
+    
+    totals: Dict[tuple, Dict[str, Any]] = defaultdict(_new_period_totals)
+    
+    def bucket(column):
+        return _period_bucket(session, column, granularity)
+    
+    def key(project_id, value):
+        return project_id, _period_start(value, granularity)
+    
+    # =========================================================================
+    # Task metrics from task_history_raw (per-task max completed_status_count per day)
+    # =========================================================================
+    try:
+        task_sub = session.query(
+            TaskHistoryRaw.project_id,
+            TaskHistoryRaw.date,
+            TaskHistoryRaw.task_id,
+            func.max(TaskHistoryRaw.completed_status_count).label('max_csc'),
+        ).filter(
+            TaskHistoryRaw.new_status == 'completed',
+            TaskHistoryRaw.project_id.in_(project_ids),
+            TaskHistoryRaw.date >= parsed_start,
+            TaskHistoryRaw.date <= parsed_end,
+        ).group_by(
+            TaskHistoryRaw.project_id, TaskHistoryRaw.date, TaskHistoryRaw.task_id
+        ).subquery()
+        
+        task_period = bucket(task_sub.c.date)
+        for row in session.query(
+            task_sub.c.project_id,
+            task_period.label('period'),
+            func.count(task_sub.c.task_id).label('unique_tasks'),
+            func.sum(case((task_sub.c.max_csc == 1, 1), else_=0)).label('new_tasks'),
+            func.sum(case((task_sub.c.max_csc > 1, 1), else_=0)).label('rework_tasks'),
+        ).group_by(task_sub.c.project_id, task_period).all():
+            t = totals[key(row.project_id, row.period)]
+            t['unique_tasks'] += int(row.unique_tasks or 0)
+            t['new_tasks'] += int(row.new_tasks or 0)
+            t['rework_tasks'] += int(row.rework_tasks or 0)
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying task metrics: {e}")
+    
+    # =========================================================================
+    # Delivered (by delivery_date) and in-queue (by last_completed_date) from task_raw
+    # =========================================================================
+    try:
+        delivered_period = bucket(TaskRaw.delivery_date)
+        for row in session.query(
+            TaskRaw.project_id,
+            delivered_period.label('period'),
+            func.count(distinct(TaskRaw.task_id)).label('cnt'),
+        ).filter(
+            TaskRaw.project_id.in_(project_ids),
+            TaskRaw.delivery_date.isnot(None),
+            TaskRaw.delivery_date >= parsed_start,
+            TaskRaw.delivery_date <= parsed_end,
+            TaskRaw.delivery_status == 'delivered',
+        ).group_by(TaskRaw.project_id, delivered_period).all():
+            totals[key(row.project_id, row.period)]['delivered'] += int(row.cnt or 0)
+        
+        queue_period = bucket(TaskRaw.last_completed_date)
+        for row in session.query(
+            TaskRaw.project_id,
+            queue_period.label('period'),
+            func.count(distinct(TaskRaw.task_id)).label('cnt'),
+        ).filter(
+            TaskRaw.project_id.in_(project_ids),
+            TaskRaw.last_completed_date.isnot(None),
+            TaskRaw.last_completed_date >= parsed_start,
+            TaskRaw.last_completed_date <= parsed_end,
+            TaskRaw.derived_status == 'In Queue',
+        ).group_by(TaskRaw.project_id, queue_period).all():
+            totals[key(row.project_id, row.period)]['in_queue'] += int(row.cnt or 0)
+        
+        reviewed_period = bucket(func.date(TaskRaw.r_updated_at))
+        for row in session.query(
+            TaskRaw.project_id,
+            reviewed_period.label('period'),
+            func.count(distinct(TaskRaw.task_id)).label('cnt'),
+        ).filter(
+            TaskRaw.project_id.in_(project_ids),
+            TaskRaw.r_updated_at.isnot(None),
+            _on_days(TaskRaw.r_updated_at, parsed_start, parsed_end),
+            TaskRaw.count_reviews > 0,
+        ).group_by(TaskRaw.project_id, reviewed_period).all():
+            totals[key(row.project_id, row.period)]['reviewed'] += int(row.cnt or 0)
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying delivery metrics: {e}")
+    
+    # =========================================================================
+    # Quality from trainer_review_stats, split human (manual/null) vs agentic (auto)
+    # =========================================================================
+    try:
+        review_period = bucket(TrainerReviewStats.review_date)
+        for row in session.query(
+            TrainerReviewStats.project_id,
+            review_period.label('period'),
+            TrainerReviewStats.review_type,
+            func.sum(TrainerReviewStats.score).label('sum_score'),
+            func.count(TrainerReviewStats.id).label('count_reviews'),
+        ).filter(
+            TrainerReviewStats.project_id.in_(project_ids),
+            TrainerReviewStats.review_date >= parsed_start,
+            TrainerReviewStats.review_date <= parsed_end,
+            TrainerReviewStats.score.isnot(None),
+        ).group_by(
+            TrainerReviewStats.project_id, review_period, TrainerReviewStats.review_type
+        ).all():
+            t = totals[key(row.project_id, row.period)]
+            score = float(row.sum_score or 0)
+            count = int(row.count_reviews or 0)
+            t['sum_score'] += score
+            t['count_reviews'] += count
+            if row.review_type == 'auto':
+                t['agentic_score'] += score
+                t['agentic_reviews'] += count
+            else:
+                t['human_score'] += score
+                t['human_reviews'] += count
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying quality metrics: {e}")
+    
+    # =========================================================================
+    # People: distinct trainers and reviewers per project x period, plus the
+    # per-project labeling-tool-active emails used to filter Jibble hours
+    # =========================================================================
+    labeling_active_emails: Dict[int, set] = defaultdict(set)
+    try:
+        people_period = bucket(TaskHistoryRaw.date)
+        for row in session.query(
+            TaskHistoryRaw.project_id,
+            people_period.label('period'),
+            TaskHistoryRaw.author,
+        ).filter(
+            TaskHistoryRaw.new_status == 'completed',
+            TaskHistoryRaw.project_id.in_(project_ids),
+            TaskHistoryRaw.date >= parsed_start,
+            TaskHistoryRaw.date <= parsed_end,
+            TaskHistoryRaw.author.isnot(None),
+        ).distinct().all():
+            totals[key(row.project_id, row.period)]['trainers'].add(row.author)
+            if row.author:
+                labeling_active_emails[row.project_id].add(row.author.lower().strip())
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying people metrics: {e}")
+    
+    try:
+        for row in session.query(
+            TaskRaw.project_id,
+            func.lower(TaskRaw.trainer).label('email'),
+        ).filter(
+            TaskRaw.project_id.in_(project_ids),
+            TaskRaw.trainer.isnot(None),
+        ).distinct().all():
+            if row.email:
+                labeling_active_emails[row.project_id].add(row.email.lower().strip())
+        
+        reviewer_period = bucket(func.date(ReviewDetail.updated_at))
+        for row in session.query(
+            Task.project_id,
+            reviewer_period.label('period'),
+            func.lower(Contributor.turing_email).label('email'),
+        ).join(
+            Contributor, ReviewDetail.reviewer_id == Contributor.id
+        ).join(
+            Task, ReviewDetail.conversation_id == Task.id
+        ).filter(
+            Task.project_id.in_(project_ids),
+            Contributor.turing_email.isnot(None),
+            ReviewDetail.updated_at >= parsed_start,
+            ReviewDetail.updated_at <= parsed_end,
+        ).distinct().all():
+            if row.email:
+                labeling_active_emails[row.project_id].add(row.email.lower().strip())
+                if row.period:
+                    totals[key(row.project_id, row.period)]['reviewers'].add(row.email.strip())
+    except Exception as e:
+        logger.warning(f"Analytics by project: Could not build active-emails sets: {e}")
+    
+    # =========================================================================
+    # Team size (distinct trainers mapped to each project)
+    # =========================================================================
+    team_size: Dict[int, int] = {}
+    try:
+        project_names = {pid: constants.projects.PROJECT_ID_TO_NAME.get(pid, '') for pid in project_ids}
+        team_by_name = dict(session.query(
+            PodLeadMapping.jibble_project,
+            func.count(distinct(PodLeadMapping.trainer_email)),
+        ).filter(
+            PodLeadMapping.jibble_project.in_(list(project_names.values()))
+        ).group_by(PodLeadMapping.jibble_project).all())
+        team_size = {pid: team_by_name.get(name, 0) for pid, name in project_names.items()}
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying team size: {e}")
+    
+    # =========================================================================
+    # Jibble hours, split into reviewer vs trainer hours for the target calc.
+    # Several projects share a Jibble project name, so hours are read once per
+    # (Jibble project, email, period) and attributed in Python.
+    # =========================================================================
+    jibble_names = {pid: constants.jibble.PROJECT_ID_TO_JIBBLE_NAMES.get(pid, []) for pid in project_ids}
+    review_roles = ('pod lead', 'sub pod lead', 'pod_lead', 'calibrator', 'auditor', 'team lead')
+    review_role_emails: Dict[int, set] = defaultdict(set)
+    try:
+        for pr in session.query(
+            PodLeadMapping.trainer_email, PodLeadMapping.role, PodLeadMapping.jibble_project,
+        ).all():
+            if pr.trainer_email and pr.role and pr.role.lower().strip() in review_roles:
+                for pid in project_ids:
+                    if not jibble_names[pid] or pr.jibble_project in jibble_names[pid]:
+                        review_role_emails[pid].add(pr.trainer_email.lower().strip())
+        # Team sheet roles are specific to Math Proof Eval projects (59, 60)
+        sheet_pids = [pid for pid in project_ids if pid in (59, 60)]
+        if sheet_pids:
+            try:
+                from app.services.quality_rubrics_service import QualityRubricsService
+                team_roles = QualityRubricsService()._fetch_team_roles()
+                for pid in sheet_pids:
+                    review_role_emails[pid].update(email.lower().strip() for email in team_roles)
+            except Exception:
+                pass
+    except Exception:
+        pass
+    
+    try:
+        jibble_period = bucket(JibbleHours.entry_date)
+        jibble_q = session.query(
+            JibbleHours.project,
+            func.lower(JibbleHours.turing_email).label('email'),
+            jibble_period.label('period'),
+            func.sum(JibbleHours.logged_hours).label('total_hours'),
+        ).filter(
+            JibbleHours.entry_date >= parsed_start,
+            JibbleHours.entry_date <= parsed_end,
+        )
+        if all(jibble_names.values()):
+            jibble_q = jibble_q.filter(
+                JibbleHours.project.in_({n for names in jibble_names.values() for n in names})
+            )
+        jibble_q = jibble_q.group_by(
+            JibbleHours.project,
+            func.lower(JibbleHours.turing_email),
+            jibble_period,
+        )
+        for row in jibble_q.all():
+            hours = float(row.total_hours or 0)
+            for pid in project_ids:
+                if jibble_names[pid] and row.project not in jibble_names[pid]:
+                    continue
+                active = labeling_active_emails.get(pid)
+                if active and row.email not in active:
+                    continue
+                t = totals[key(pid, row.period)]
+                t['jibble_hours'] += hours
+                if row.email in review_role_emails[pid]:
+                    t['reviewer_jibble_hours'] += hours
+                if row.email:
+                    t['jibble_people'].add(row.email.strip())
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying jibble hours: {e}")
+    
+    # =========================================================================
+    # Revenue (weekly rows, matched to the period containing the week midpoint)
+    # =========================================================================
+    try:
+        for row in session.query(
+            ProjectRevenueWeekly.project_id,
+            ProjectRevenueWeekly.week_start_date,
+            func.sum(ProjectRevenueWeekly.actual_revenue).label('revenue'),
+        ).filter(
+            ProjectRevenueWeekly.project_id.in_(project_ids),
+            ProjectRevenueWeekly.week_start_date >= parsed_start - timedelta(days=7),
+            ProjectRevenueWeekly.week_start_date <= parsed_end,
+        ).group_by(
+            ProjectRevenueWeekly.project_id,
+            ProjectRevenueWeekly.week_start_date,
+            ProjectRevenueWeekly.week_end_date,
+        ).all():
+            midpoint = row.week_start_date + timedelta(days=3)
+            if first_start <= midpoint <= parsed_end:
+                totals[key(row.project_id, midpoint)]['revenue'] += float(row.revenue or 0)
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying revenue: {e}")
+    
+    # =========================================================================
+    # Cost (daily)
+    # =========================================================================
+    try:
+        cost_period = bucket(ProjectCostDaily.date)
+        for row in session.query(
+            ProjectCostDaily.project_id,
+            cost_period.label('period'),
+            ProjectCostDaily.activity_type,
+            func.sum(ProjectCostDaily.total_cost).label('total_cost'),
+        ).filter(
+            ProjectCostDaily.project_id.in_(project_ids),
+            ProjectCostDaily.date >= parsed_start,
+            ProjectCostDaily.date <= parsed_end,
+        ).group_by(
+            ProjectCostDaily.project_id, cost_period, ProjectCostDaily.activity_type,
+        ).all():
+            t = totals[key(row.project_id, row.period)]
+            if 'non' in (row.activity_type or '').lower():
+                t['non_work_cost'] += float(row.total_cost or 0)
+            else:
+                t['work_cost'] += float(row.total_cost or 0)
+    except Exception as e:
+        logger.error(f"Analytics by project: Error querying cost data: {e}")
+    
+    # =========================================================================
+    # FPY from the synced fpy_review table
+    # =========================================================================
+    try:
+        fpy_period = _period_bucket(session, FpyReview.review_date, granularity, periods)
+        for (pid, period_value), counts in fpy_counts(
+            session, project_ids, parsed_start, parsed_end, period=fpy_period,
+        ).items():
+            totals[key(pid, period_value)]['fpy'] = counts
+    except Exception as e:
+        logger.warning(f"Analytics by project: FPY query failed (non-fatal): {e}")
+    
+    # =========================================================================
+    # BUILD DATA POINTS
+    # =========================================================================
+    result: Dict[int, List[Dict[str, Any]]] = {}
+    for pid in project_ids:
+        proj_aht = constants.daily_targets.get_aht(pid)
+        aht_new = proj_aht.get('new_task_aht', constants.daily_targets.DEFAULT_NEW_TASK_AHT)
+        aht_rework = proj_aht.get('rework_aht', constants.daily_targets.DEFAULT_REWORK_AHT)
+        result[pid] = [
+            _build_data_point(
+                period,
+                totals.get((pid, period['start'])) or _new_period_totals(),
+                aht_new, aht_rework, team_size.get(pid, 0),
+            )
+            for period in periods
+        ]
+    
+    return result
+
+
 def _compute_summary_cards(
     data: List[Dict],
     start_date: date,
@@ -1,12 +1,11 @@
 """
 BigQuery service for database operations
 """
-from google.cloud import bigquery
-from google.oauth2 import service_account
 from typing import List, Dict, Any, Optional
-import os
 from collections import defaultdict
+from google.cloud import bigquery
 from app.config import get_settings
+from app.core.bigquery_client import get_bigquery_client, run_query
 
 
 class BigQueryService:
@@ -15,78 +14,63 @@ class BigQueryService:
     def __init__(self):
         """Initialize BigQuery client"""
         self.settings = get_settings()
-        self.client = self._create_client()
-    
-    def _create_client(self) -> bigquery.Client:
-        """Create and return BigQuery client with credentials"""
-        credentials_path = self.settings.google_application_credentials
-        
-        if credentials_path and os.path.exists(credentials_path):
-            credentials = service_account.Credentials.from_service_account_file(
-                credentials_path
-            )
-            return bigquery.Client(
-                credentials=credentials,
-                project=self.settings.gcp_project_id
-            )
-        else:
-            # Use default credentials (useful for GCP environments)
-            return bigquery.Client(project=self.settings.gcp_project_id)
+        self.client = get_bigquery_client()
+        # Filter values are bound as query parameters, so the SQL text is the
+        # same for every request and can be built once
+        self._review_detail_sql = self._build_review_detail_query()
     
-    def _build_filter_clauses(self, filters: Optional[Dict[str, Any]] = None) -> str:
+    def _build_filter_clauses(self) -> str:
         """
-        Build WHERE clause conditions from filters
+        Build WHERE clause conditions for the filter parameters
+        
+        An unset filter is bound as NULL and matches every row.
         
-        Args:
-            filters: Dictionary of filter key-value pairs
-            
         Returns:
             SQL WHERE conditions string
         """
-        if not filters:
-            return ""
-        
-        conditions = []
-        
-        # Filter by domain
-        if filters.get('domain'):
-            conditions.append(f"domain = '{filters['domain']}'")
-        
-        # Filter by reviewer
-        if filters.get('reviewer'):
-            conditions.append(f"reviewer_id = '{filters['reviewer']}'")
-        
-        # Filter by trainer/annotator
-        if filters.get('trainer'):
-            conditions.append(f"human_role_id = '{filters['trainer']}'")
-        
-        # Filter by quality dimension
-        if filters.get('quality_dimension'):
-            conditions.append(f"name = '{filters['quality_dimension']}'")
-        
-        # Filter by score range
-        if filters.get('min_score') is not None:
-            conditions.append(f"score >= {filters['min_score']}")
-        
-        if filters.get('max_score') is not None:
-            conditions.append(f"score <= {filters['max_score']}")
-        
-        if conditions:
-            return " AND " + " AND ".join(conditions)
-        return ""
+        return """
+                        AND (@domain IS NULL OR task_.domain = @domain)
+                        AND (@reviewer_id IS NULL OR a.reviewer_id = @reviewer_id)
+                        AND (@human_role_id IS NULL OR task_.human_role_id = @human_role_id)
+                        AND (@quality_dimension IS NULL OR rqd.name = @quality_dimension)
+                        AND (@min_score IS NULL OR b.score >= @min_score)
+                        AND (@max_score IS NULL OR b.score <= @max_score)"""
     
-    def _build_review_detail_query(self, filters: Optional[Dict[str, Any]] = None) -> str:
+    def _query_parameters(self, filters: Optional[Dict[str, Any]] = None) -> List[bigquery.ScalarQueryParameter]:
         """
-        Build the base review_detail CTE query
+        Bind filter values for the review_detail query
         
         Args:
             filters: Dictionary of filter key-value pairs
         
         Returns:
-            SQL query string for review_detail
+            Query parameters for every placeholder in the review_detail query
         """
-        filter_clause = self._build_filter_clauses(filters)
+        filters = filters or {}
+        
+        def value(key, convert):
+            raw = filters.get(key)
+            if raw is None or raw == '':
+                return None
+            return convert(raw)
+        
+        return [
+            bigquery.ScalarQueryParameter('project_id', 'INT64', self.settings.project_id_filter),
+            bigquery.ScalarQueryParameter('domain', 'STRING', value('domain', str)),
+            bigquery.ScalarQueryParameter('reviewer_id', 'INT64', value('reviewer', int)),
+            bigquery.ScalarQueryParameter('human_role_id', 'INT64', value('trainer', int)),
+            bigquery.ScalarQueryParameter('quality_dimension', 'STRING', value('quality_dimension', str)),
+            bigquery.ScalarQueryParameter('min_score', 'FLOAT64', value('min_score', float)),
+            bigquery.ScalarQueryParameter('max_score', 'FLOAT64', value('max_score', float)),
+        ]
+    
+    def _build_review_detail_query(self) -> str:
+        """
+        Build the base review_detail CTE query template
         
+        Returns:
+            SQL query string for review_detail, with @-parameters for the filters
+        """
         return f"""
                 WITH task_reviewed_info AS ( 
                     SELECT DISTINCT 
@@ -114,7 +98,7 @@ class BigQueryService:
                         ON bt.task_id = c.id
                     LEFT JOIN `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.contributor` cb
                         ON cb.id = c.current_user_id
-                    WHERE c.project_id = {self.settings.project_id_filter}
+                    WHERE c.project_id = @project_id
                         -- AND c.batch_id IN (772, 805)
                         AND c.status IN ('completed', 'validated')
                         AND r.review_type NOT IN ('auto')
@@ -142,7 +126,7 @@ class BigQueryService:
                     FROM `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.conversation` as task_
                     RIGHT JOIN task_reviewed_info AS tdi
                         ON tdi.r_id = task_.id
-                    WHERE project_id = {self.settings.project_id_filter} 
+                    WHERE project_id = @project_id
                 ),
                 review AS (
                     SELECT 
@@ -176,7 +160,7 @@ class BigQueryService:
                         ON b.review_id = a.id
                     LEFT JOIN `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.quality_dimension` AS rqd
                         ON rqd.id = b.quality_dimension_id
-                    WHERE 1=1 {filter_clause}
+                    WHERE 1=1 {self._build_filter_clauses()}
                 )
         """
     
@@ -413,7 +397,7 @@ class BigQueryService:
         Returns:
             List of domain aggregations with quality dimension stats
         """
-        base_query = self._build_review_detail_query(filters)
+        base_query = self._review_detail_sql
         
         query = base_query + """
         SELECT DISTINCT
@@ -426,8 +410,8 @@ class BigQueryService:
         WHERE name IS NOT NULL
         """
         
-        query_job = self.client.query(query)
-        results = [dict(row) for row in query_job.result()]
+        params = self._query_parameters(filters)
+        results = [dict(row) for row in run_query(query, params, operation='domain_aggregation')]
         
         return self._process_aggregation_results(results, 'domain')
     
@@ -441,7 +425,7 @@ class BigQueryService:
         Returns:
             List of reviewer aggregations with quality dimension stats and reviewer names
         """
-        base_query = self._build_review_detail_query(filters)
+        base_query = self._review_detail_sql
         
         query = base_query + f"""
         SELECT DISTINCT
@@ -457,8 +441,8 @@ class BigQueryService:
         WHERE rd.name IS NOT NULL
         """
         
-        query_job = self.client.query(query)
-        results = [dict(row) for row in query_job.result()]
+        params = self._query_parameters(filters)
+        results = [dict(row) for row in run_query(query, params, operation='reviewer_aggregation')]
         
         return self._process_reviewer_aggregation_results(results)
     
@@ -472,7 +456,7 @@ class BigQueryService:
         Returns:
             List of trainer level aggregations with quality dimension stats and trainer names
         """
-        base_query = self._build_review_detail_query(filters)
+        base_query = self._review_detail_sql
         
         query = base_query + f"""
         SELECT DISTINCT
@@ -488,8 +472,8 @@ class BigQueryService:
         WHERE rd.name IS NOT NULL
         """
         
-        query_job = self.client.query(query)
-        results = [dict(row) for row in query_job.result()]
+        params = self._query_parameters(filters)
+        results = [dict(row) for row in run_query(query, params, operation='trainer_level_aggregation')]
         
         return self._process_trainer_level_aggregation_results(results)
     
@@ -503,7 +487,7 @@ class BigQueryService:
         Returns:
             List of task-level information with annotator names and quality dimensions
         """
-        base_query = self._build_review_detail_query(filters)
+        base_query = self._review_detail_sql
         
         query = base_query + f"""
         SELECT DISTINCT
@@ -524,8 +508,8 @@ class BigQueryService:
         ORDER BY rd.conversation_id, rd.name
         """
         
-        query_job = self.client.query(query)
-        results = [dict(row) for row in query_job.result()]
+        params = self._query_parameters(filters)
+        results = [dict(row) for row in run_query(query, params, operation='task_level_info')]
         
         return self._process_task_level_results(results)
     
@@ -604,7 +588,7 @@ class BigQueryService:
         Returns:
             Overall aggregation with quality dimension stats
         """
-        base_query = self._build_review_detail_query(filters)
+        base_query = self._review_detail_sql
         
         # Combined query to get both quality dimensions and counts in one go
         query = base_query + """
@@ -634,8 +618,8 @@ class BigQueryService:
         CROSS JOIN count_data cd
         """
         
-        query_job = self.client.query(query)
-        results = [dict(row) for row in query_job.result()]
+        params = self._query_parameters(filters)
+        results = [dict(row) for row in run_query(query, params, operation='overall_aggregation')]
         
         # Extract counts from first row (they'll be the same for all rows)
         reviewer_count = results[0]['reviewer_count'] if results else 0
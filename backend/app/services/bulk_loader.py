@@ -0,0 +1,165 @@
+"""
+Streaming bulk loader for synced tables.
+
+Feeds an iterable of row dicts (typically a generator over BigQuery result
+pages) into a table without materializing the result set or ORM objects.
+On PostgreSQL rows are streamed through ``COPY ... FROM STDIN``; other
+dialects (SQLite in tests) fall back to batched executemany inserts.
+"""
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import Column, Integer, Table, column, insert, table as table_clause
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def _table_of(model_or_table) -> Table:
+    return model_or_table if isinstance(model_or_table, Table) else model_or_table.__table__
+
+
+def _is_generated(col: Column) -> bool:
+    """True for columns the database fills in (serial PKs, server defaults)."""
+    if col.server_default is not None:
+        return True
+    return col.primary_key and col is col.table.autoincrement_column
+
+
+def _load_columns(table: Table, first_record: Dict[str, Any]) -> List[Column]:
+    """
+    Columns to load: every column present in the records, plus every column
+    with no database-side default (filled from its Python default, like an
+    ORM insert would).
+    """
+    unknown = set(first_record) - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown column(s) for {table.name}: {sorted(unknown)}")
+    return [c for c in table.columns if c.name in first_record or not _is_generated(c)]
+
+
+def _column_defaults(columns: List[Column]) -> Dict[str, Any]:
+    return {
+        c.name: c.default.arg if c.default is not None and c.default.is_scalar else None
+        for c in columns
+    }
+
+
+def _copy_value(value: Any, column: Column) -> str:
+    """Render a value in PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (float, Decimal)) and isinstance(column.type, Integer):
+        # Integer columns accept integral floats on INSERT but not in COPY
+        value = int(round(value))
+    if isinstance(value, datetime):
+        text = value.isoformat(sep=' ')
+    elif isinstance(value, (date, time)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return (
+        text.replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r')
+    )
+
+
+class _CopyStream:
+    """File-like object that renders rows for COPY lazily, one read() at a time."""
+
+    def __init__(self, lines: Iterator[str]):
+        self._lines = lines
+        self._buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line.encode('utf-8')
+        if size < 0:
+            size = len(self._buffer)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
+    readline = read
+
+
+def _progress(records: Iterable[Dict[str, Any]], table_name: str, log_every: int) -> Iterator[Dict[str, Any]]:
+    count = 0
+    for record in records:
+        yield record
+        count += 1
+        if count % log_every == 0:
+            logger.info(f"Loaded {count} {table_name} records")
+
+
+def bulk_load(
+    session: Session,
+    model_or_table,
+    records: Iterable[Dict[str, Any]],
+    batch_size: int = 5000,
+    table_name: Optional[str] = None
+) -> int:
+    """
+    Stream ``records`` into a table inside the session's current transaction.
+
+    Args:
+        session: Session whose transaction the load joins (the caller commits)
+        model_or_table: ORM model or Table describing the columns
+        records: Iterable of column -> value dicts; consumed lazily
+        batch_size: Rows per executemany batch (non-PostgreSQL) and progress log interval
+        table_name: Load into this table instead (e.g. a staging copy with the same columns)
+
+    Returns:
+        Number of rows loaded
+    """
+    table = _table_of(model_or_table)
+    target = table_name or table.name
+
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return 0
+
+    columns = _load_columns(table, first)
+    defaults = _column_defaults(columns)
+    rows = _progress(chain([first], records), target, batch_size)
+
+    count = 0
+    if session.get_bind().dialect.name == 'postgresql':
+        def lines() -> Iterator[str]:
+            nonlocal count
+            for record in rows:
+                count += 1
+                yield '\t'.join(
+                    _copy_value(record.get(c.name, defaults[c.name]), c) for c in columns
+                ) + '\n'
+
+        column_list = ', '.join(f'"{c.name}"' for c in columns)
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f'COPY "{target}" ({column_list}) FROM STDIN', _CopyStream(lines()))
+        finally:
+            cursor.close()
+    else:
+        target_table = table if table_name is None else table_clause(target, *[column(c.name) for c in columns])
+        statement = insert(target_table)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            session.execute(statement, [
+                {c.name: record.get(c.name, defaults[c.name]) for c in columns} for record in batch
+            ])
+            count += len(batch)
+
+    return count
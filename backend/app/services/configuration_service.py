@@ -17,7 +17,7 @@ Features:
 import json
 import logging
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from enum import Enum
 
 from sqlalchemy import and_, or_, func
@@ -331,6 +331,67 @@ class ConfigurationService:
         
         return None
     
+    def get_throughput_targets(
+        self,
+        project_id: int,
+        entity_type: str = "trainer",
+        entity_ids: Iterable[int] = (),
+        as_of_date: Optional[date] = None
+    ) -> Tuple[Optional[float], Dict[int, float]]:
+        """
+        Get the project default and entity-specific throughput targets in one query.
+        
+        Resolves like get_throughput_target for each entity: an entity's own
+        'daily_tasks' target if set, else the 'daily_tasks_default' target.
+        When several configs are effective on as_of_date, the one that took
+        effect last wins.
+        
+        Returns:
+            (project default target or None, {entity_id: target})
+        """
+        if as_of_date is None:
+            as_of_date = date.today()
+        entity_ids = [entity_id for entity_id in set(entity_ids) if entity_id]
+        
+        scope = and_(
+            ProjectConfiguration.config_key == "daily_tasks_default",
+            ProjectConfiguration.entity_type.is_(None)
+        )
+        if entity_ids:
+            scope = or_(scope, and_(
+                ProjectConfiguration.config_key == "daily_tasks",
+                ProjectConfiguration.entity_type == entity_type,
+                ProjectConfiguration.entity_id.in_(entity_ids)
+            ))
+        
+        with self.db_service.get_session() as session:
+            configs = session.query(ProjectConfiguration).filter(
+                ProjectConfiguration.project_id == project_id,
+                ProjectConfiguration.config_type == ConfigType.THROUGHPUT_TARGET,
+                ProjectConfiguration.effective_from <= as_of_date,
+                or_(
+                    ProjectConfiguration.effective_to.is_(None),
+                    ProjectConfiguration.effective_to >= as_of_date
+                ),
+                scope
+            ).order_by(
+                ProjectConfiguration.effective_from.desc(),
+                ProjectConfiguration.id.desc()
+            ).all()
+            
+            # Configs are newest first; keep the first per entity (None = project default)
+            targets: Dict[Optional[int], Optional[float]] = {}
+            for config in configs:
+                key = None if config.entity_type is None else config.entity_id
+                if key not in targets:
+                    targets[key] = self._config_to_dict(config)['config_value'].get('target')
+            
+            default_target = targets.pop(None, None)
+            entity_targets = {
+                entity_id: target for entity_id, target in targets.items() if target is not None
+            }
+            return default_target, entity_targets
+    
     def set_throughput_target(
         self,
         project_id: int,
@@ -3,16 +3,24 @@ Data synchronization service to sync CTE results from BigQuery to PostgreSQL
 For nvidia: prod_labeling_tool_n
 """
 import os
+import time
 import logging
-from datetime import datetime
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from sqlalchemy import delete, text
-from google.cloud import bigquery
 
 from app.config import get_settings
 from app.services.db_service import get_db_service
-from app.models.db_models import ReviewDetail, Task, Contributor, DataSyncLog, TaskReviewedInfo, TaskAHT, ContributorTaskStats, ContributorDailyStats, ReviewerDailyStats, TaskRaw, TaskHistoryRaw, PodLeadMapping, ReviewerTrainerDailyStats, TrainerReviewStats, ProjectRevenueWeekly, ProjectCostDaily, ProjectFTECostMonthly
+from app.services.bulk_loader import bulk_load
+from app.services.table_swap import supports_table_swap, load_via_shadow_table, restore_previous_table
+from app.services.trainer_facts import build_trainer_facts
+from app.models.db_models import Base, ReviewDetail, Task, Contributor, DataSyncLog, SyncWatermark, TaskReviewedInfo, TaskAHT, ContributorTaskStats, ContributorDailyStats, ReviewerDailyStats, TaskRaw, TaskHistoryRaw, PodLeadMapping, ReviewerTrainerDailyStats, TrainerReviewStats, ProjectRevenueWeekly, ProjectCostDaily, ProjectFTECostMonthly, TrainerDailyFact, TrainerTaskDailyFact, FpyReview, JibbleHours, JibbleSyncCursor
 from app.constants import get_constants
+from app.core.bigquery_client import execute_query, get_bigquery_client
+from app.core.cache import invalidate_stats_cache
+from app.core.metrics import SYNC_DURATION_SECONDS, SYNC_OPERATIONS_TOTAL, LAST_SYNC_TIMESTAMP
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,80 @@ def calculate_week_number(task_date: datetime, project_start_date: str) -> Optio
         return None
 
 
+@dataclass
+class SyncNode:
+    """A table sync in the sync DAG."""
+    name: str
+    func: Callable[[str], bool]
+    depends_on: List[str] = field(default_factory=list)
+
+
+def run_sync_dag(
+    nodes: List[SyncNode],
+    sync_type: str,
+    max_workers: int = 4,
+    on_error: Optional[Callable[[str, Exception, float], None]] = None
+) -> Dict[str, bool]:
+    """
+    Run table syncs concurrently, starting each node once its dependencies finish.
+    
+    Dependencies only order the work: a node still runs when an upstream sync
+    failed, matching the old sequential behaviour. Each node's duration and
+    outcome are recorded in the sync Prometheus metrics.
+    
+    Returns a mapping of node name -> success, in declaration order.
+    """
+    by_name = {node.name: node for node in nodes}
+    for node in nodes:
+        missing = [dep for dep in node.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"Sync node '{node.name}' depends on unknown node(s): {missing}")
+    
+    pending = {node.name: set(node.depends_on) for node in nodes}
+    results: Dict[str, bool] = {}
+    
+    def run_node(node: SyncNode) -> bool:
+        logger.info(f"Syncing: {node.name}")
+        start = time.time()
+        try:
+            success = bool(node.func(sync_type))
+        except Exception as e:
+            logger.error(f"Error syncing {node.name}: {e}")
+            if on_error:
+                on_error(node.name, e, start)
+            success = False
+        duration = time.time() - start
+        
+        SYNC_DURATION_SECONDS.labels(sync_type=sync_type, table=node.name).observe(duration)
+        SYNC_OPERATIONS_TOTAL.labels(
+            sync_type=sync_type, table=node.name, status='success' if success else 'error'
+        ).inc()
+        if success:
+            LAST_SYNC_TIMESTAMP.labels(sync_type=sync_type, table=node.name).set(time.time())
+        logger.info(f"Finished {node.name} in {duration:.1f}s ({'ok' if success else 'failed'})")
+        return success
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="table_sync_") as executor:
+        running = {}
+        while pending or running:
+            ready = [name for name, deps in pending.items() if not deps]
+            for name in ready:
+                del pending[name]
+                running[executor.submit(run_node, by_name[name])] = name
+            
+            if not running:
+                raise ValueError(f"Sync DAG has a dependency cycle among: {sorted(pending)}")
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                for deps in pending.values():
+                    deps.discard(name)
+    
+    return {node.name: results[node.name] for node in nodes}
+
+
 class DataSyncService:
     """Service for syncing CTE results from BigQuery to PostgreSQL"""
     
@@ -64,31 +146,20 @@ class DataSyncService:
         return ", ".join(str(id) for id in ids)
     
     def initialize_bigquery_client(self):
-        """Initialize BigQuery client"""
+        """Attach the shared, process-wide BigQuery client"""
+        if self.bq_client is not None:
+            return
         try:
-            import os
-            from google.oauth2 import service_account
-            
-            credentials_path = self.settings.google_application_credentials
-            
-            if credentials_path and os.path.exists(credentials_path):
-                credentials = service_account.Credentials.from_service_account_file(
-                    credentials_path
-                )
-                self.bq_client = bigquery.Client(
-                    credentials=credentials,
-                    project=self.settings.gcp_project_id
-                )
-            else:
-                self.bq_client = bigquery.Client(
-                    project=self.settings.gcp_project_id
-                )
-            
+            self.bq_client = get_bigquery_client()
             logger.info("BigQuery client initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing BigQuery client: {e}")
             raise
     
+    def _run_bq_query(self, query: str, operation: str, params: Optional[list] = None):
+        """Run a sync query (never served from the result cache) with BigQuery metrics."""
+        return execute_query(query, params=params, operation=f"sync_{operation}", client=self.bq_client)
+    
     def log_sync_start(self, table_name: str, sync_type: str = 'scheduled') -> int:
         """Log the start of a sync operation"""
         try:
@@ -123,8 +194,207 @@ class DataSyncService:
         except Exception as e:
             logger.error(f"Error logging sync complete: {e}")
     
-    def _build_review_detail_query(self) -> str:
-        """Build the complete review_detail CTE query"""
+    # =========================================================================
+    # INCREMENTAL SYNC (per-table watermarks)
+    # =========================================================================
+    
+    # Above this many changed tasks an incremental pass is no cheaper than a reload
+    MAX_INCREMENTAL_TASKS = 50000
+    
+    def get_sync_cutoff(self, table_name: str, sync_type: str = 'scheduled') -> Optional[datetime]:
+        """
+        Decide between a full reload and an incremental sync for a table.
+        
+        Returns the ``changed_since`` cutoff (watermark minus lookback overlap)
+        for an incremental sync, or None when a full reload is required:
+        - incremental sync disabled, or sync_type is 'initial' / 'full'
+        - no watermark recorded yet
+        - last full reload older than full_sync_interval_hours (reconciliation)
+        """
+        if not self.settings.incremental_sync_enabled or sync_type in ('initial', 'full'):
+            return None
+        
+        try:
+            with self.db_service.get_session() as session:
+                watermark = session.query(SyncWatermark).filter(
+                    SyncWatermark.table_name == table_name
+                ).first()
+                if watermark is None or watermark.high_water_mark is None or watermark.last_full_sync_at is None:
+                    return None
+                
+                reconcile_after = timedelta(hours=self.settings.full_sync_interval_hours)
+                if datetime.utcnow() - watermark.last_full_sync_at >= reconcile_after:
+                    logger.info(f"{table_name}: last full sync at {watermark.last_full_sync_at}, running full reconciliation")
+                    return None
+                
+                return watermark.high_water_mark - timedelta(minutes=self.settings.incremental_sync_lookback_minutes)
+        except Exception as e:
+            logger.warning(f"Could not read sync watermark for {table_name}, falling back to full sync: {e}")
+            return None
+    
+    def save_sync_watermark(self, table_name: str, high_water_mark: datetime, full: bool, rows_changed: int):
+        """Record a successful sync so the next run can continue from high_water_mark."""
+        try:
+            with self.db_service.get_session() as session:
+                watermark = session.query(SyncWatermark).filter(
+                    SyncWatermark.table_name == table_name
+                ).first()
+                if watermark is None:
+                    watermark = SyncWatermark(table_name=table_name)
+                    session.add(watermark)
+                
+                watermark.high_water_mark = high_water_mark
+                watermark.last_sync_mode = 'full' if full else 'incremental'
+                watermark.rows_changed = rows_changed
+                watermark.updated_at = datetime.utcnow()
+                if full:
+                    watermark.last_full_sync_at = high_water_mark
+                session.commit()
+        except Exception as e:
+            logger.error(f"Error saving sync watermark for {table_name}: {e}")
+    
+    def _changed_task_ids_sql(self, changed_since: datetime) -> str:
+        """
+        BigQuery subquery selecting conversation IDs touched since ``changed_since``.
+        
+        Synced task rows are derived from the conversation, its status history,
+        its reviews, its batch and its delivery batch, so a change to any of them
+        marks the task as changed. Source columns are UTC DATETIMEs.
+        """
+        ds = f"{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}"
+        since = f"DATETIME '{changed_since.strftime('%Y-%m-%d %H:%M:%S')}'"
+        return f"""
+            SELECT id AS task_id FROM `{ds}.conversation` WHERE updated_at >= {since}
+            UNION DISTINCT
+            SELECT conversation_id FROM `{ds}.conversation_status_history` WHERE created_at >= {since}
+            UNION DISTINCT
+            SELECT conversation_id FROM `{ds}.review` WHERE updated_at >= {since}
+            UNION DISTINCT
+            SELECT t.id FROM `{ds}.conversation` t
+                INNER JOIN `{ds}.batch` b ON t.batch_id = b.id
+                WHERE b.updated_at >= {since}
+            UNION DISTINCT
+            SELECT dbt.task_id FROM `{ds}.delivery_batch_task` dbt
+                LEFT JOIN `{ds}.delivery_batch` db ON db.id = dbt.delivery_batch_id
+                WHERE dbt.updated_at >= {since} OR db.updated_at >= {since}
+        """
+    
+    def fetch_changed_task_ids(self, changed_since: datetime) -> List[int]:
+        """Fetch the IDs of conversations changed in BigQuery since ``changed_since``."""
+        query = f"SELECT DISTINCT task_id FROM ({self._changed_task_ids_sql(changed_since)}) WHERE task_id IS NOT NULL"
+        results = self._run_bq_query(query, 'changed_task_ids')
+        return [row.task_id for row in results]
+    
+    @staticmethod
+    def _task_id_filter_sql(column: str, task_ids: Optional[List[int]]) -> str:
+        """
+        SQL predicate restricting ``column`` to the @task_ids array parameter
+        (empty for full syncs). Run the query with ``_task_id_params(task_ids)``.
+        """
+        if task_ids is None:
+            return ""
+        return f"AND {column} IN UNNEST(@task_ids)"
+    
+    @staticmethod
+    def _task_id_params(task_ids: Optional[List[int]]) -> Optional[list]:
+        """The @task_ids query parameter for ``_task_id_filter_sql`` (None for full syncs)."""
+        if task_ids is None:
+            return None
+        from google.cloud import bigquery
+        return [bigquery.ArrayQueryParameter("task_ids", "INT64", [int(task_id) for task_id in task_ids])]
+    
+    def _plan_incremental_sync(self, table_name: str, sync_type: str) -> Optional[List[int]]:
+        """
+        Return the changed task IDs to re-sync, or None for a full reload.
+        
+        Falls back to a full reload if the delta is too large to be worth it.
+        """
+        changed_since = self.get_sync_cutoff(table_name, sync_type)
+        if changed_since is None:
+            logger.info(f"{table_name}: full sync")
+            return None
+        
+        task_ids = self.fetch_changed_task_ids(changed_since)
+        if len(task_ids) > self.MAX_INCREMENTAL_TASKS:
+            logger.info(f"{table_name}: {len(task_ids)} changed tasks since {changed_since}, running full sync instead")
+            return None
+        
+        logger.info(f"{table_name}: incremental sync of {len(task_ids)} tasks changed since {changed_since}")
+        return task_ids
+    
+    def _replace_table_rows(self, model, records: Iterable[dict], batch_size: int = 5000) -> int:
+        """
+        Replace a table's contents with ``records``, streamed in via the bulk loader.
+        
+        On PostgreSQL, tables without inbound foreign keys are loaded into a
+        shadow copy and swapped in atomically, so readers never see them empty
+        or half-loaded. Others are cleared and reloaded in place.
+        
+        Returns the number of rows loaded.
+        """
+        table_name = model.__tablename__
+        
+        with self.db_service.get_session() as session:
+            if supports_table_swap(session, model):
+                return load_via_shadow_table(session, model, records, batch_size=batch_size)
+            
+            logger.info(f"Clearing existing {table_name} data...")
+            session.execute(delete(model))
+            session.commit()
+            
+            count = bulk_load(session, model, records, batch_size=batch_size)
+            session.commit()
+        
+        logger.info(f"Synced {count} {table_name} records")
+        return count
+    
+    def rollback_table_sync(self, table_name: str) -> bool:
+        """Roll a table back to the copy replaced by its last full sync (PostgreSQL only)."""
+        model = next(
+            (m.class_ for m in Base.registry.mappers if m.class_.__tablename__ == table_name),
+            None
+        )
+        if model is None:
+            raise ValueError(f"Unknown table: {table_name}")
+        
+        with self.db_service.get_session() as session:
+            if not supports_table_swap(session, model):
+                return False
+            restored = restore_previous_table(session, model)
+        
+        if restored:
+            logger.info(f"[OK] Rolled back {table_name} to its previous copy")
+        else:
+            logger.warning(f"No previous copy of {table_name} to roll back to")
+        return restored
+    
+    def _write_task_rows(self, model, key_column: str, records: Iterable[dict], task_ids: Optional[List[int]], batch_size: int = 5000) -> int:
+        """
+        Write synced rows keyed by task.
+        
+        Full sync (task_ids is None): replace the whole table.
+        Incremental sync: delete rows for the changed tasks and insert their
+        fresh rows in a single transaction (an upsert by task), so tasks that
+        no longer qualify upstream are removed as well.
+        
+        Returns the number of rows loaded.
+        """
+        if task_ids is None:
+            return self._replace_table_rows(model, records, batch_size)
+        
+        key = getattr(model, key_column)
+        with self.db_service.get_session() as session:
+            for i in range(0, len(task_ids), 1000):
+                session.execute(delete(model).where(key.in_(task_ids[i:i + 1000])))
+            
+            count = bulk_load(session, model, records, batch_size=batch_size)
+            session.commit()
+        
+        logger.info(f"Synced {count} {model.__tablename__} records for {len(task_ids)} changed tasks")
+        return count
+    
+    def _build_review_detail_query(self, task_ids: Optional[List[int]] = None) -> str:
+        """Build the complete review_detail CTE query, optionally limited to ``task_ids``"""
         return f"""
             WITH task_reviewed_info AS ( 
                 SELECT DISTINCT 
@@ -163,6 +433,7 @@ class DataSyncService:
                             AND rn.review_type = 'manual'
                             AND rn.status = 'published'
                     )
+                    {self._task_id_filter_sql('c.id', task_ids)}
             ),
             task AS (
                 SELECT 
@@ -211,34 +482,24 @@ class DataSyncService:
         """
     
     def sync_review_detail(self, sync_type: str = 'scheduled') -> bool:
-        """Sync review_detail CTE result from BigQuery"""
+        """Sync review_detail CTE result from BigQuery (incremental by conversation)"""
         log_id = self.log_sync_start('review_detail', sync_type)
         try:
-            logger.info("Fetching review_detail data from BigQuery...")
-            query = self._build_review_detail_query()
-            
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
+            sync_started_at = datetime.utcnow()
+            task_ids = self._plan_incremental_sync('review_detail', sync_type)
             
-            data = [dict(row) for row in results]
-            
-            logger.info(f"Fetched {len(data)} records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing review_detail data...")
-                session.execute(delete(ReviewDetail))
-                session.commit()
+            results = []
+            if task_ids is None or task_ids:
+                logger.info("Fetching review_detail data from BigQuery...")
+                query = self._build_review_detail_query(task_ids)
                 
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [ReviewDetail(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} review_detail records")
+                results = self._run_bq_query(query, 'review_detail', self._task_id_params(task_ids))
+            
+            count = self._write_task_rows(ReviewDetail, 'conversation_id', (dict(row) for row in results), task_ids)
+            self.save_sync_watermark('review_detail', sync_started_at, task_ids is None, count)
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} review_detail records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} review_detail records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -329,39 +590,25 @@ class DataSyncService:
             logger.info("Fetching task data from BigQuery...")
             query = self._build_task_query()
             
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
+            results = self._run_bq_query(query, 'task')
             
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                task_date = row_dict.get('updated_at') or row_dict.get('created_at')
-                if task_date:
-                    row_dict['week_number'] = calculate_week_number(
-                        task_date, 
-                        self.settings.project_start_date
-                    )
-                else:
-                    row_dict['week_number'] = None
-                data.append(row_dict)
-            
-            logger.info(f"Fetched {len(data)} task records from BigQuery")
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    task_date = row_dict.get('updated_at') or row_dict.get('created_at')
+                    if task_date:
+                        row_dict['week_number'] = calculate_week_number(
+                            task_date, 
+                            self.settings.project_start_date
+                        )
+                    else:
+                        row_dict['week_number'] = None
+                    yield row_dict
             
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing task data...")
-                session.execute(delete(Task))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [Task(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} task records")
+            count = self._replace_table_rows(Task, records())
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} task records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} task records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -390,41 +637,40 @@ class DataSyncService:
                 FROM `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.contributor`
             """
             
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
+            results = self._run_bq_query(query, 'contributor')
             
-            data = [dict(row) for row in results]
+            team_lead_mapping = {}  # id -> team_lead_id
             
-            logger.info(f"Fetched {len(data)} contributor records from BigQuery")
+            def records():
+                # Two-pass approach for self-referential FK
+                # Pass 1: Insert all contributors without team_lead_id
+                for row in results:
+                    record = dict(row)
+                    if record.get('team_lead_id'):
+                        team_lead_mapping[record['id']] = record['team_lead_id']
+                    record['team_lead_id'] = None  # Clear for initial insert
+                    yield record
             
             with self.db_service.get_session() as session:
                 logger.info("Clearing existing contributor data...")
                 session.execute(delete(Contributor))
                 session.commit()
                 
-                # Two-pass approach for self-referential FK
-                # Pass 1: Insert all contributors without team_lead_id
-                team_lead_mapping = {}  # id -> team_lead_id
-                for record in data:
-                    if record.get('team_lead_id'):
-                        team_lead_mapping[record['id']] = record['team_lead_id']
-                    record_copy = record.copy()
-                    record_copy['team_lead_id'] = None  # Clear for initial insert
-                    session.add(Contributor(**record_copy))
+                count = bulk_load(session, Contributor, records())
                 session.commit()
                 
                 # Pass 2: Update team_lead_id for all contributors
                 if team_lead_mapping:
                     logger.info(f"Updating team_lead_id for {len(team_lead_mapping)} contributors...")
-                    for contributor_id, team_lead_id in team_lead_mapping.items():
-                        session.execute(
-                            text("UPDATE contributor SET team_lead_id = :team_lead_id WHERE id = :id"),
-                            {"team_lead_id": team_lead_id, "id": contributor_id}
-                        )
+                    session.execute(
+                        text("UPDATE contributor SET team_lead_id = :team_lead_id WHERE id = :id"),
+                        [{"team_lead_id": team_lead_id, "id": contributor_id}
+                         for contributor_id, team_lead_id in team_lead_mapping.items()]
+                    )
                     session.commit()
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} contributor records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} contributor records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -478,42 +724,28 @@ class DataSyncService:
                 SELECT * FROM task_reviewed_info
             """
             
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'r_id': row_dict.get('r_id'),
-                    'delivered_id': row_dict.get('delivered_id'),
-                    'rlhf_link': row_dict.get('RLHF_Link'),
-                    'is_delivered': row_dict.get('is_delivered'),
-                    'status': row_dict.get('status'),
-                    'task_score': row_dict.get('task_score'),
-                    'updated_at': row_dict.get('updated_at'),
-                    'name': row_dict.get('name'),
-                    'annotation_date': row_dict.get('annotation_date')
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} task_reviewed_info records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing task_reviewed_info data...")
-                session.execute(delete(TaskReviewedInfo))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [TaskReviewedInfo(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} task_reviewed_info records")
-            
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} task_reviewed_info records")
+            results = self._run_bq_query(query, 'task_reviewed_info')
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'r_id': row_dict.get('r_id'),
+                        'delivered_id': row_dict.get('delivered_id'),
+                        'rlhf_link': row_dict.get('RLHF_Link'),
+                        'is_delivered': row_dict.get('is_delivered'),
+                        'status': row_dict.get('status'),
+                        'task_score': row_dict.get('task_score'),
+                        'updated_at': row_dict.get('updated_at'),
+                        'name': row_dict.get('name'),
+                        'annotation_date': row_dict.get('annotation_date')
+                    }
+                    yield mapped_row
+            
+            count = self._replace_table_rows(TaskReviewedInfo, records())
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} task_reviewed_info records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -601,52 +833,46 @@ class DataSyncService:
             """
             
             logger.info(f"Executing AHT query for project_id={project_id}")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'task_id': row_dict.get('task_id'),
-                    'contributor_id': row_dict.get('author_id'),
-                    'contributor_name': row_dict.get('contributor_name'),
-                    'batch_id': row_dict.get('batch_id'),
-                    'start_time': row_dict.get('starting_timestamp'),
-                    'end_time': row_dict.get('completed_timestamp'),
-                    'duration_seconds': row_dict.get('duration_seconds'),
-                    'duration_minutes': row_dict.get('duration_minutes')
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} task_aht records from BigQuery")
+            results = self._run_bq_query(query, 'task_aht')
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'task_id': row_dict.get('task_id'),
+                        'contributor_id': row_dict.get('author_id'),
+                        'contributor_name': row_dict.get('contributor_name'),
+                        'batch_id': row_dict.get('batch_id'),
+                        'start_time': row_dict.get('starting_timestamp'),
+                        'end_time': row_dict.get('completed_timestamp'),
+                        'duration_seconds': row_dict.get('duration_seconds'),
+                        'duration_minutes': row_dict.get('duration_minutes')
+                    }
+                    yield mapped_row
             
             with self.db_service.get_session() as session:
                 # Get existing task IDs to filter AHT data (avoid FK violations)
                 result = session.execute(text("SELECT id FROM task"))
                 existing_task_ids = {row[0] for row in result.fetchall()}
                 logger.info(f"Found {len(existing_task_ids)} existing tasks in database")
-                
-                # Filter data to only include tasks that exist locally
-                original_count = len(data)
-                data = [r for r in data if r['task_id'] in existing_task_ids]
-                filtered_count = original_count - len(data)
-                if filtered_count > 0:
-                    logger.info(f"Filtered out {filtered_count} AHT records for non-existent tasks")
-                
-                logger.info("Clearing existing task_aht data...")
-                session.execute(delete(TaskAHT))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [TaskAHT(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} task_aht records")
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} task_aht records")
+            # Filter data to only include tasks that exist locally
+            fetched_count = 0
+            
+            def existing_task_records():
+                nonlocal fetched_count
+                for record in records():
+                    fetched_count += 1
+                    if record['task_id'] in existing_task_ids:
+                        yield record
+            
+            count = self._replace_table_rows(TaskAHT, existing_task_records())
+            filtered_count = fetched_count - count
+            if filtered_count > 0:
+                logger.info(f"Filtered out {filtered_count} AHT records for non-existent tasks")
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} task_aht records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -731,39 +957,26 @@ class DataSyncService:
             """
             
             logger.info(f"Executing contributor task stats query for project_id={project_id}")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'contributor_id': row_dict.get('contributor_id'),
-                    'new_tasks_submitted': row_dict.get('new_tasks_submitted', 0),
-                    'rework_submitted': row_dict.get('rework_submitted', 0),
-                    'total_unique_tasks': row_dict.get('total_unique_tasks', 0),
-                    'first_submission_date': row_dict.get('first_submission_date'),
-                    'last_submission_date': row_dict.get('last_submission_date'),
-                    'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0)
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} contributor_task_stats records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing contributor_task_stats data...")
-                session.execute(delete(ContributorTaskStats))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [ContributorTaskStats(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} contributor_task_stats records")
-            
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} contributor_task_stats records")
+            results = self._run_bq_query(query, 'contributor_task_stats')
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'contributor_id': row_dict.get('contributor_id'),
+                        'new_tasks_submitted': row_dict.get('new_tasks_submitted', 0),
+                        'rework_submitted': row_dict.get('rework_submitted', 0),
+                        'total_unique_tasks': row_dict.get('total_unique_tasks', 0),
+                        'first_submission_date': row_dict.get('first_submission_date'),
+                        'last_submission_date': row_dict.get('last_submission_date'),
+                        'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0)
+                    }
+                    yield mapped_row
+            
+            count = self._replace_table_rows(ContributorTaskStats, records())
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} contributor_task_stats records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -860,37 +1073,24 @@ class DataSyncService:
             """
             
             logger.info(f"Executing contributor daily stats query for project_id={project_id}")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'contributor_id': row_dict.get('contributor_id'),
-                    'submission_date': row_dict.get('submission_date'),
-                    'new_tasks_submitted': row_dict.get('new_tasks_submitted', 0),
-                    'rework_submitted': row_dict.get('rework_submitted', 0),
-                    'total_submissions': row_dict.get('total_submissions', 0),
-                    'unique_tasks': row_dict.get('unique_tasks', 0),
-                    'tasks_ready_for_delivery': 0,  # Will be calculated from postgres after sync
-                    'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0),
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} contributor_daily_stats records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing contributor_daily_stats data...")
-                session.execute(delete(ContributorDailyStats))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [ContributorDailyStats(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} contributor_daily_stats records")
+            results = self._run_bq_query(query, 'contributor_daily_stats')
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'contributor_id': row_dict.get('contributor_id'),
+                        'submission_date': row_dict.get('submission_date'),
+                        'new_tasks_submitted': row_dict.get('new_tasks_submitted', 0),
+                        'rework_submitted': row_dict.get('rework_submitted', 0),
+                        'total_submissions': row_dict.get('total_submissions', 0),
+                        'unique_tasks': row_dict.get('unique_tasks', 0),
+                        'tasks_ready_for_delivery': 0,  # Will be calculated from postgres after sync
+                        'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0),
+                    }
+                    yield mapped_row
+            
+            count = self._replace_table_rows(ContributorDailyStats, records())
             
             # Now calculate tasks_ready_for_delivery from postgres
             # Tasks ready for delivery = tasks with reviews AND rework_count = 0
@@ -927,8 +1127,8 @@ class DataSyncService:
                 session.commit()
                 logger.info(f"Updated {result.rowcount} records with tasks_ready_for_delivery")
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} contributor_daily_stats records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} contributor_daily_stats records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -1024,37 +1224,24 @@ class DataSyncService:
             """
             
             logger.info(f"Executing reviewer daily stats query for project_id={project_id}")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'reviewer_id': row_dict.get('reviewer_id'),
-                    'review_date': row_dict.get('review_date'),
-                    'unique_tasks_reviewed': row_dict.get('unique_tasks_reviewed', 0),
-                    'new_tasks_reviewed': row_dict.get('new_tasks_reviewed', 0),
-                    'rework_reviewed': row_dict.get('rework_reviewed', 0),
-                    'total_reviews': row_dict.get('total_reviews', 0),
-                    'tasks_ready_for_delivery': 0,  # Will be calculated from postgres
-                    'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0),
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} reviewer_daily_stats records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing reviewer_daily_stats data...")
-                session.execute(delete(ReviewerDailyStats))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [ReviewerDailyStats(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} reviewer_daily_stats records")
+            results = self._run_bq_query(query, 'reviewer_daily_stats')
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'reviewer_id': row_dict.get('reviewer_id'),
+                        'review_date': row_dict.get('review_date'),
+                        'unique_tasks_reviewed': row_dict.get('unique_tasks_reviewed', 0),
+                        'new_tasks_reviewed': row_dict.get('new_tasks_reviewed', 0),
+                        'rework_reviewed': row_dict.get('rework_reviewed', 0),
+                        'total_reviews': row_dict.get('total_reviews', 0),
+                        'tasks_ready_for_delivery': 0,  # Will be calculated from postgres
+                        'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0),
+                    }
+                    yield mapped_row
+            
+            count = self._replace_table_rows(ReviewerDailyStats, records())
             
             # Calculate tasks_ready_for_delivery from postgres
             logger.info("Calculating tasks_ready_for_delivery for reviewers from postgres...")
@@ -1080,8 +1267,8 @@ class DataSyncService:
                 session.commit()
                 logger.info(f"Updated {result.rowcount} records with tasks_ready_for_delivery")
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} reviewer_daily_stats records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} reviewer_daily_stats records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -1182,138 +1369,37 @@ class DataSyncService:
             """
             
             logger.info(f"Executing reviewer-trainer daily stats query for project_id={project_id}")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'reviewer_id': row_dict.get('reviewer_id'),
-                    'trainer_id': row_dict.get('trainer_id'),
-                    'review_date': row_dict.get('review_date'),
-                    'tasks_reviewed': row_dict.get('tasks_reviewed', 0),
-                    'new_tasks_reviewed': row_dict.get('new_tasks_reviewed', 0),
-                    'rework_reviewed': row_dict.get('rework_reviewed', 0),
-                    'total_reviews': row_dict.get('total_reviews', 0),
-                    'ready_for_delivery': row_dict.get('ready_for_delivery', 0),
-                    'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0),
-                }
-                data.append(mapped_row)
+            results = self._run_bq_query(query, 'reviewer_trainer_daily_stats')
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'reviewer_id': row_dict.get('reviewer_id'),
+                        'trainer_id': row_dict.get('trainer_id'),
+                        'review_date': row_dict.get('review_date'),
+                        'tasks_reviewed': row_dict.get('tasks_reviewed', 0),
+                        'new_tasks_reviewed': row_dict.get('new_tasks_reviewed', 0),
+                        'rework_reviewed': row_dict.get('rework_reviewed', 0),
+                        'total_reviews': row_dict.get('total_reviews', 0),
+                        'ready_for_delivery': row_dict.get('ready_for_delivery', 0),
+                        'sum_number_of_turns': row_dict.get('sum_number_of_turns', 0),
+                    }
+                    yield mapped_row
             
-            logger.info(f"Fetched {len(data)} reviewer_trainer_daily_stats records from BigQuery")
             
             from app.models.db_models import ReviewerTrainerDailyStats
             
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing reviewer_trainer_daily_stats data...")
-                session.execute(delete(ReviewerTrainerDailyStats))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [ReviewerTrainerDailyStats(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} reviewer_trainer_daily_stats records")
+            count = self._replace_table_rows(ReviewerTrainerDailyStats, records())
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} reviewer_trainer_daily_stats records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} reviewer_trainer_daily_stats records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
             logger.error(f"[ERROR] Error syncing reviewer_trainer_daily_stats: {e}")
             return False
     
-    def sync_task_history_raw(self, sync_type: str = 'scheduled') -> bool:
-        """
-        Sync task_history_raw table - mirrors the spreadsheet's task_history_raw sheet.
-        This is the source of truth for unique tasks, new tasks submitted, and rework submitted.
-        """
-        log_id = self.log_sync_start('task_history_raw', sync_type)
-        
-        try:
-            self.initialize_bigquery_client()
-            
-            # This query exactly matches the user's task_history_raw spreadsheet query
-            query = f"""
-            SELECT 
-                th.conversation_id AS task_id, 
-                th.created_at AS time_stamp, 
-                DATE(TIMESTAMP(th.created_at)) AS date,
-                th.old_status, 
-                th.new_status, 
-                th.notes, 
-                c.turing_email AS author,
-                COUNTIF(th.new_status = 'completed') OVER (
-                    PARTITION BY th.conversation_id
-                    ORDER BY th.created_at
-                    ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
-                ) AS completed_status_count,
-                MAX(CASE WHEN th.new_status = 'completed' THEN DATE(TIMESTAMP(th.created_at)) END)
-                    OVER (
-                        PARTITION BY th.conversation_id
-                        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
-                    ) AS last_completed_date,
-                pr.project_id, 
-                pr.batch_name
-            FROM `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.conversation_status_history` th
-            LEFT JOIN `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.contributor` c ON th.author_id = c.id
-            INNER JOIN (
-                SELECT t.id, t.project_id, b.name AS batch_name
-                FROM `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.conversation` t
-                INNER JOIN `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.batch` b ON t.batch_id = b.id
-                WHERE t.project_id IN ({self._project_ids_sql})
-                  AND b.status != 'draft'
-                  AND {self._batch_exclusion_sql}
-            ) pr ON pr.id = th.conversation_id
-            ORDER BY th.conversation_id, th.created_at
-            """
-            
-            logger.info("Executing task_history_raw query...")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'task_id': row_dict.get('task_id'),
-                    'time_stamp': row_dict.get('time_stamp'),
-                    'date': row_dict.get('date'),
-                    'old_status': row_dict.get('old_status'),
-                    'new_status': row_dict.get('new_status'),
-                    'notes': row_dict.get('notes'),
-                    'author': row_dict.get('author'),
-                    'completed_status_count': row_dict.get('completed_status_count', 0),
-                    'last_completed_date': row_dict.get('last_completed_date'),
-                    'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id')),
-                    'batch_name': row_dict.get('batch_name'),
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} task_history_raw records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing task_history_raw data...")
-                session.execute(delete(TaskHistoryRaw))
-                session.commit()
-                
-                batch_size = 10000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [TaskHistoryRaw(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} task_history_raw records")
-            
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} task_history_raw records")
-            return True
-        except Exception as e:
-            self.log_sync_complete(log_id, 0, False, str(e))
-            logger.error(f"[ERROR] Error syncing task_history_raw: {e}")
-            return False
-    
     def sync_task_raw(self, sync_type: str = 'scheduled') -> bool:
         """
         Sync task_raw table - mirrors the spreadsheet's tasks_raw sheet exactly.
@@ -1323,6 +1409,8 @@ class DataSyncService:
         
         try:
             self.initialize_bigquery_client()
+            sync_started_at = datetime.utcnow()
+            task_ids = self._plan_incremental_sync('task_raw', sync_type)
             
             # This query exactly matches the user's tasks_raw spreadsheet query
             query = f"""
@@ -1443,115 +1531,106 @@ class DataSyncService:
             WHERE t.project_id IN ({self._project_ids_sql})
               AND b.status != 'draft'
               AND {self._batch_exclusion_sql}
+              {self._task_id_filter_sql('t.id', task_ids)}
             """
             
-            logger.info("Executing task_raw query...")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'task_id': row_dict.get('task_id'),
-                    'created_date': row_dict.get('created_date'),
-                    'updated_at': row_dict.get('updated_at'),
-                    'last_completed_at': row_dict.get('last_completed_at'),
-                    'last_completed_date': row_dict.get('last_completed_date'),
-                    'trainer': row_dict.get('trainer'),
-                    'first_completion_date': row_dict.get('first_completion_date'),
-                    'first_completer': row_dict.get('first_completer'),
-                    'colab_link': row_dict.get('colab_link'),
-                    'number_of_turns': row_dict.get('number_of_turns', 0),
-                    'task_status': row_dict.get('task_status'),
-                    'batch_name': row_dict.get('batch_name'),
-                    'task_duration': row_dict.get('task_duration'),
-                    'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id')),
-                    'delivery_batch_name': row_dict.get('delivery_batch_name'),
-                    'delivery_status': row_dict.get('delivery_status'),
-                    'delivery_batch_created_by': row_dict.get('delivery_batch_created_by'),
-                    'delivery_date': row_dict.get('delivery_date'),
-                    'db_open_date': row_dict.get('db_open_date'),
-                    'db_close_date': row_dict.get('db_close_date'),
-                    'conversation_id_rs': row_dict.get('conversation_id_rs'),
-                    'count_reviews': row_dict.get('count_reviews', 0),
-                    'sum_score': row_dict.get('sum_score'),
-                    'sum_ref_score': row_dict.get('sum_ref_score'),
-                    'sum_duration': row_dict.get('sum_duration'),
-                    'sum_followup_required': row_dict.get('sum_followup_required', 0),
-                    'task_id_r': row_dict.get('task_id_r'),
-                    'r_created_at': row_dict.get('r_created_at'),
-                    'r_updated_at': row_dict.get('r_updated_at'),
-                    'review_id': row_dict.get('review_id'),
-                    'reviewer': row_dict.get('reviewer'),
-                    'score': row_dict.get('score'),
-                    'reflected_score': row_dict.get('reflected_score'),
-                    'review_action': str(row_dict.get('review_action')) if row_dict.get('review_action') else None,
-                    'review_action_type': row_dict.get('review_action_type'),
-                    'r_feedback': row_dict.get('r_feedback'),
-                    'followup_required': row_dict.get('followup_required', 0),
-                    'r_duration': row_dict.get('r_duration'),
-                    'r_submitted_at': row_dict.get('r_submitted_at'),
-                    'r_submitted_date': row_dict.get('r_submitted_date'),
-                }
-                
-                # Calculate derived_status (Column AP in spreadsheet)
-                # Based on the formula shared by user
-                task_id = row_dict.get('task_id')
-                task_status = (row_dict.get('task_status') or '').lower()
-                count_reviews = row_dict.get('count_reviews') or 0
-                r_submitted_date = row_dict.get('r_submitted_date')
-                created_date = row_dict.get('created_date')
-                review_action_type = (row_dict.get('review_action_type') or '').lower()
-                
-                if not task_id:
-                    derived_status = None
-                elif task_status == 'completed':
-                    if count_reviews > 0:
-                        if review_action_type == 'rework':
-                            # Task was sent for rework but trainer re-completed it.
-                            # Current status is 'completed', so it's awaiting re-review.
-                            derived_status = 'Completed'
+            results = []
+            if task_ids is None or task_ids:
+                logger.info("Executing task_raw query...")
+                results = self._run_bq_query(query, 'task_raw', self._task_id_params(task_ids))
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'task_id': row_dict.get('task_id'),
+                        'created_date': row_dict.get('created_date'),
+                        'updated_at': row_dict.get('updated_at'),
+                        'last_completed_at': row_dict.get('last_completed_at'),
+                        'last_completed_date': row_dict.get('last_completed_date'),
+                        'trainer': row_dict.get('trainer'),
+                        'first_completion_date': row_dict.get('first_completion_date'),
+                        'first_completer': row_dict.get('first_completer'),
+                        'colab_link': row_dict.get('colab_link'),
+                        'number_of_turns': row_dict.get('number_of_turns', 0),
+                        'task_status': row_dict.get('task_status'),
+                        'batch_name': row_dict.get('batch_name'),
+                        'task_duration': row_dict.get('task_duration'),
+                        'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id')),
+                        'delivery_batch_name': row_dict.get('delivery_batch_name'),
+                        'delivery_status': row_dict.get('delivery_status'),
+                        'delivery_batch_created_by': row_dict.get('delivery_batch_created_by'),
+                        'delivery_date': row_dict.get('delivery_date'),
+                        'db_open_date': row_dict.get('db_open_date'),
+                        'db_close_date': row_dict.get('db_close_date'),
+                        'conversation_id_rs': row_dict.get('conversation_id_rs'),
+                        'count_reviews': row_dict.get('count_reviews', 0),
+                        'sum_score': row_dict.get('sum_score'),
+                        'sum_ref_score': row_dict.get('sum_ref_score'),
+                        'sum_duration': row_dict.get('sum_duration'),
+                        'sum_followup_required': row_dict.get('sum_followup_required', 0),
+                        'task_id_r': row_dict.get('task_id_r'),
+                        'r_created_at': row_dict.get('r_created_at'),
+                        'r_updated_at': row_dict.get('r_updated_at'),
+                        'review_id': row_dict.get('review_id'),
+                        'reviewer': row_dict.get('reviewer'),
+                        'score': row_dict.get('score'),
+                        'reflected_score': row_dict.get('reflected_score'),
+                        'review_action': str(row_dict.get('review_action')) if row_dict.get('review_action') else None,
+                        'review_action_type': row_dict.get('review_action_type'),
+                        'r_feedback': row_dict.get('r_feedback'),
+                        'followup_required': row_dict.get('followup_required', 0),
+                        'r_duration': row_dict.get('r_duration'),
+                        'r_submitted_at': row_dict.get('r_submitted_at'),
+                        'r_submitted_date': row_dict.get('r_submitted_date'),
+                    }
+                
+                    # Calculate derived_status (Column AP in spreadsheet)
+                    # Based on the formula shared by user
+                    task_id = row_dict.get('task_id')
+                    task_status = (row_dict.get('task_status') or '').lower()
+                    count_reviews = row_dict.get('count_reviews') or 0
+                    r_submitted_date = row_dict.get('r_submitted_date')
+                    created_date = row_dict.get('created_date')
+                    review_action_type = (row_dict.get('review_action_type') or '').lower()
+                
+                    if not task_id:
+                        derived_status = None
+                    elif task_status == 'completed':
+                        if count_reviews > 0:
+                            if review_action_type == 'rework':
+                                # Task was sent for rework but trainer re-completed it.
+                                # Current status is 'completed', so it's awaiting re-review.
+                                derived_status = 'Completed'
+                            else:
+                                derived_status = 'Reviewed'
                         else:
-                            derived_status = 'Reviewed'
+                            derived_status = 'Completed'
+                    elif task_status == 'pending':
+                        derived_status = 'Unclaimed'
+                    elif task_status == 'labeling':
+                        derived_status = 'In Progress'
+                    elif task_status == 'rework':
+                        derived_status = 'Rework'
+                    elif task_status == 'validated':
+                        derived_status = 'Validated'
+                    elif task_status == 'improper':
+                        derived_status = 'Improper'
+                    elif task_status == 'obsolete':
+                        derived_status = 'Obsolete'
+                    elif task_status == 'completed-approval':
+                        derived_status = 'Approval'
                     else:
-                        derived_status = 'Completed'
-                elif task_status == 'pending':
-                    derived_status = 'Unclaimed'
-                elif task_status == 'labeling':
-                    derived_status = 'In Progress'
-                elif task_status == 'rework':
-                    derived_status = 'Rework'
-                elif task_status == 'validated':
-                    derived_status = 'Validated'
-                elif task_status == 'improper':
-                    derived_status = 'Improper'
-                elif task_status == 'obsolete':
-                    derived_status = 'Obsolete'
-                elif task_status == 'completed-approval':
-                    derived_status = 'Approval'
-                else:
-                    derived_status = '-'
+                        derived_status = '-'
                 
-                mapped_row['derived_status'] = derived_status
-                data.append(mapped_row)
+                    mapped_row['derived_status'] = derived_status
+                    yield mapped_row
             
-            logger.info(f"Fetched {len(data)} task_raw records from BigQuery")
+            count = self._write_task_rows(TaskRaw, 'task_id', records(), task_ids)
+            self.save_sync_watermark('task_raw', sync_started_at, task_ids is None, count)
             
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing task_raw data...")
-                session.execute(delete(TaskRaw))
-                session.commit()
-                
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [TaskRaw(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} task_raw records")
-            
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} task_raw records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} task_raw records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -1570,6 +1649,10 @@ class DataSyncService:
         
         try:
             self.initialize_bigquery_client()
+            sync_started_at = datetime.utcnow()
+            # Window columns (completed_status_count, last_completed_date) span a task's
+            # whole history, so incremental syncs re-pull every event of a changed task
+            task_ids = self._plan_incremental_sync('task_history_raw', sync_type)
             
             # This query exactly matches the user's task_history_raw spreadsheet query
             query = f"""
@@ -1601,48 +1684,39 @@ class DataSyncService:
                 WHERE t.project_id IN ({self._project_ids_sql})
                   AND b.status != 'draft'
                   AND {self._batch_exclusion_sql}
+                  {self._task_id_filter_sql('t.id', task_ids)}
             ) pr ON pr.id = th.conversation_id
             ORDER BY task_id, time_stamp
             """
             
-            logger.info("Executing task_history_raw query...")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                mapped_row = {
-                    'task_id': row_dict.get('task_id'),
-                    'time_stamp': row_dict.get('time_stamp'),
-                    'date': row_dict.get('date'),
-                    'old_status': row_dict.get('old_status'),
-                    'new_status': row_dict.get('new_status'),
-                    'notes': row_dict.get('notes'),
-                    'author': row_dict.get('author'),
-                    'completed_status_count': row_dict.get('completed_status_count', 0),
-                    'last_completed_date': row_dict.get('last_completed_date'),
-                    'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id')),
-                    'batch_name': row_dict.get('batch_name'),
-                }
-                data.append(mapped_row)
-            
-            logger.info(f"Fetched {len(data)} task_history_raw records from BigQuery")
-            
-            with self.db_service.get_session() as session:
-                logger.info("Clearing existing task_history_raw data...")
-                session.execute(delete(TaskHistoryRaw))
-                session.commit()
-                
-                batch_size = 10000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [TaskHistoryRaw(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} task_history_raw records")
-            
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} task_history_raw records")
+            results = []
+            if task_ids is None or task_ids:
+                logger.info("Executing task_history_raw query...")
+                results = self._run_bq_query(query, 'task_history_raw', self._task_id_params(task_ids))
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    mapped_row = {
+                        'task_id': row_dict.get('task_id'),
+                        'time_stamp': row_dict.get('time_stamp'),
+                        'date': row_dict.get('date'),
+                        'old_status': row_dict.get('old_status'),
+                        'new_status': row_dict.get('new_status'),
+                        'notes': row_dict.get('notes'),
+                        'author': row_dict.get('author'),
+                        'completed_status_count': row_dict.get('completed_status_count', 0),
+                        'last_completed_date': row_dict.get('last_completed_date'),
+                        'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id')),
+                        'batch_name': row_dict.get('batch_name'),
+                    }
+                    yield mapped_row
+            
+            count = self._write_task_rows(TaskHistoryRaw, 'task_id', records(), task_ids, batch_size=10000)
+            self.save_sync_watermark('task_history_raw', sync_started_at, task_ids is None, count)
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} task_history_raw records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -2049,7 +2123,7 @@ class DataSyncService:
               AND MEMBER_CODE IS NOT NULL
               AND FULL_NAME IS NOT NULL
             """
-            results = self.bq_client.query(query).result()
+            results = self._run_bq_query(query, 'math_proof_eval_jibble_ids')
 
             bq_members = []
             for row in results:
@@ -2144,19 +2218,7 @@ class DataSyncService:
             """
             
             logger.info("Fetching Jibble hours from BigQuery...")
-            results = self.bq_client.query(query).result()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'member_code': str(row.member_code) if row.member_code else None,
-                    'entry_date': row.entry_date,
-                    'project': row.project,
-                    'full_name': row.full_name,
-                    'logged_hours': float(row.logged_hours) if row.logged_hours else 0.0
-                })
-            
-            logger.info(f"Fetched {len(data)} Jibble hours records from BigQuery")
+            results = self._run_bq_query(query, 'jibble_hours')
             
             with self.db_service.get_session() as session:
                 # Build member_code -> turing_email lookup from jibble_email_mapping
@@ -2172,33 +2234,37 @@ class DataSyncService:
                 except Exception as map_err:
                     logger.warning(f"Could not load jibble_email_mapping: {map_err}")
                 
-                # Clear existing data
-                session.execute(delete(JibbleHours))
-                
                 mapped_count = 0
-                for record in data:
-                    if record['member_code']:
-                        clean_code = record['member_code'].strip().replace(",", "").split(".")[0]
+                
+                def records():
+                    nonlocal mapped_count
+                    for row in results:
+                        if not row.member_code:
+                            continue
+                        member_code = str(row.member_code)
+                        clean_code = member_code.strip().replace(",", "").split(".")[0]
                         turing_email = email_map.get(clean_code)
                         if turing_email:
                             mapped_count += 1
                         
-                        jh = JibbleHours(
-                            member_code=record['member_code'],
-                            entry_date=record['entry_date'],
-                            project=record['project'],
-                            full_name=record['full_name'],
-                            logged_hours=record['logged_hours'],
-                            turing_email=turing_email,
-                            source='bigquery',
-                        )
-                        session.add(jh)
+                        yield {
+                            'member_code': member_code,
+                            'entry_date': row.entry_date,
+                            'project': row.project,
+                            'full_name': row.full_name,
+                            'logged_hours': float(row.logged_hours) if row.logged_hours else 0.0,
+                            'turing_email': turing_email,
+                            'source': 'bigquery',
+                        }
                 
+                # Clear existing data and reload in one transaction
+                session.execute(delete(JibbleHours))
+                count = bulk_load(session, JibbleHours, records())
                 session.commit()
-                logger.info(f"Mapped {mapped_count}/{len(data)} jibble_hours rows to turing_email")
+                logger.info(f"Mapped {mapped_count}/{count} jibble_hours rows to turing_email")
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} jibble_hours records")
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} jibble_hours records")
             return True
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
@@ -2321,6 +2387,134 @@ class DataSyncService:
             logger.error(f"[ERROR] Error syncing jibble_email_mapping: {e}")
             return False
     
+    # =========================================================================
+    # INCREMENTAL JIBBLE SYNC (cursors and changed-day upserts)
+    # =========================================================================
+    
+    def _upsert_jibble_days(
+        self,
+        source: str,
+        records: List[dict],
+        covers: Callable[[str, str, date], bool],
+        since: Optional[date] = None,
+    ) -> int:
+        """
+        Write re-fetched Jibble days into jibble_hours, touching only what changed.
+        
+        Existing ``source`` rows for which ``covers(member_code, project, entry_date)``
+        is true were re-fetched: changed ones are updated, days no longer
+        reported are deleted and new days are inserted. Everything else is left
+        alone. ``since`` narrows the rows read back to entry_date >= since.
+        
+        Returns the number of rows inserted, updated or deleted.
+        """
+        now = datetime.utcnow()
+        incoming = {(r['member_code'], r['project'], r['entry_date']): r for r in records}
+        updates, deletes = [], []
+        
+        with self.db_service.get_session() as session:
+            query = session.query(
+                JibbleHours.id, JibbleHours.member_code, JibbleHours.project, JibbleHours.entry_date,
+                JibbleHours.full_name, JibbleHours.logged_hours, JibbleHours.turing_email,
+            ).filter(JibbleHours.source == source)
+            if since is not None:
+                query = query.filter(JibbleHours.entry_date >= since)
+            
+            for row in query:
+                key = (row.member_code, row.project, row.entry_date)
+                if not covers(*key):
+                    continue
+                record = incoming.pop(key, None)
+                if record is None:
+                    deletes.append(row.id)
+                elif (row.logged_hours, row.full_name, row.turing_email) != (
+                        record['logged_hours'], record['full_name'], record['turing_email']):
+                    updates.append({
+                        'id': row.id,
+                        'full_name': record['full_name'],
+                        'logged_hours': record['logged_hours'],
+                        'turing_email': record['turing_email'],
+                        'last_synced': now,
+                    })
+            
+            inserts = [
+                {
+                    'member_code': r['member_code'],
+                    'entry_date': r['entry_date'],
+                    'project': r['project'],
+                    'full_name': r['full_name'],
+                    'logged_hours': r['logged_hours'],
+                    'turing_email': r['turing_email'],
+                    'source': source,
+                    'last_synced': now,
+                }
+                for r in incoming.values()
+            ]
+            
+            for i in range(0, len(deletes), 1000):
+                session.query(JibbleHours).filter(
+                    JibbleHours.id.in_(deletes[i:i + 1000])
+                ).delete(synchronize_session=False)
+            if updates:
+                session.bulk_update_mappings(JibbleHours, updates)
+            if inserts:
+                session.bulk_insert_mappings(JibbleHours, inserts)
+            session.commit()
+        
+        logger.info(
+            f"jibble_hours ({source}): {len(inserts)} inserted, {len(updates)} updated, "
+            f"{len(deletes)} deleted"
+        )
+        return len(inserts) + len(updates) + len(deletes)
+    
+    def _load_jibble_cursors(
+        self, source: str
+    ) -> Tuple[Dict[str, date], Dict[Tuple[str, str], date]]:
+        """
+        First day to re-sync per project and per (project_id, person_id):
+        the cursor minus jibble_incremental_lookback_days.
+        """
+        lookback = timedelta(days=self.settings.jibble_incremental_lookback_days)
+        project_since, person_since = {}, {}
+        with self.db_service.get_session() as session:
+            cursors = session.query(JibbleSyncCursor).filter(JibbleSyncCursor.source == source).all()
+            for cursor in cursors:
+                since = (cursor.synced_at - lookback).date()
+                if cursor.scope == 'project':
+                    project_since[cursor.cursor_key] = since
+                else:
+                    project_id, _, person_id = cursor.cursor_key.partition(':')
+                    person_since[(project_id, person_id)] = since
+        return project_since, person_since
+    
+    def _save_jibble_cursors(
+        self,
+        source: str,
+        project_ids: Iterable[str],
+        person_keys: Iterable[Tuple[str, str]],
+        synced_at: datetime,
+    ):
+        """Advance the cursors of everything a sync covered to ``synced_at``."""
+        keys = [('project', project_id) for project_id in project_ids]
+        keys += [('person', f"{project_id}:{person_id}") for project_id, person_id in person_keys]
+        if not keys:
+            return
+        
+        with self.db_service.get_session() as session:
+            existing = {
+                (cursor.scope, cursor.cursor_key): cursor
+                for cursor in session.query(JibbleSyncCursor).filter(JibbleSyncCursor.source == source)
+            }
+            for scope, cursor_key in keys:
+                cursor = existing.get((scope, cursor_key))
+                if cursor is None:
+                    session.add(JibbleSyncCursor(
+                        source=source, scope=scope, cursor_key=cursor_key, synced_at=synced_at
+                    ))
+                else:
+                    cursor.synced_at = synced_at
+            session.commit()
+    
     def sync_jibble_hours_from_api(self, sync_type: str = 'auto', days_back: int = None) -> bool:
         """
         Sync ALL Jibble hours from API to local database.
@@ -2331,12 +2525,14 @@ class DataSyncService:
         3. Filtering for Nvidia team happens at QUERY time using jibble_email_mapping
         
         Args:
-            sync_type: 'auto' (detect), 'initial' (90 days), 'scheduled' (7 days)
-            days_back: Override days to fetch (default: auto-detected)
+            sync_type: 'auto' / 'scheduled' (incremental), 'initial' / 'full' (90 days)
+            days_back: Override days to fetch (default: from the sync watermark)
         
-        Auto-detection:
-        - If no API records exist in jibble_hours, treat as initial (90 days)
-        - If API records exist, treat as scheduled (7 days)
+        Window:
+        - Incremental: from the last sync minus jibble_incremental_lookback_days
+        - Full (90 days): first sync, 'initial'/'full', or when the last full
+          sync is older than full_sync_interval_hours
+        Only days whose hours changed are written.
         
         Benefits:
         - Doesn't rely on flaky People endpoint
@@ -2344,33 +2540,28 @@ class DataSyncService:
         - Local filtering is fast and flexible
         - Hourly sync keeps data fresh
         """
-        from app.models.db_models import JibbleHours
         from app.services.jibble_service import JibbleService
-        from datetime import timedelta
         
         log_id = self.log_sync_start('jibble_hours_api', sync_type)
         
         try:
-            # Auto-detect sync type by checking if API data exists
-            if sync_type == 'auto' or days_back is None:
-                with self.db_service.get_session() as session:
-                    api_count = session.execute(text(
-                        "SELECT COUNT(*) FROM jibble_hours WHERE source = 'jibble_api'"
-                    )).scalar()
-                
-                is_first_sync = api_count == 0
-                
-                if days_back is None:
-                    if is_first_sync:
-                        days_back = 90  # 3 months for first sync
-                        sync_type = 'initial'
-                    else:
-                        days_back = 7   # 1 week for subsequent syncs
-                        sync_type = 'scheduled'
-                
-                logger.info(f"Auto-detected: {'First sync' if is_first_sync else 'Subsequent sync'} (API records: {api_count})")
+            sync_started_at = datetime.utcnow()
+            end_date = datetime.now()
             
-            logger.info(f"Starting Jibble API sync (last {days_back} days, type={sync_type})...")
+            # Incremental window from the watermark, unless days_back is given
+            full = False
+            if days_back is None:
+                changed_since = self.get_sync_cutoff('jibble_hours_api', sync_type)
+                if changed_since is None:
+                    full = True
+                    days_back = 90  # 3 months for first sync / reconciliation
+                else:
+                    lookback = timedelta(days=self.settings.jibble_incremental_lookback_days)
+                    start_date = datetime.combine((changed_since - lookback).date(), datetime.min.time())
+            if days_back is not None:
+                start_date = end_date - timedelta(days=days_back)
+            
+            logger.info(f"Starting Jibble API sync ({'full' if full else 'incremental'}, type={sync_type})...")
             
             # Initialize Jibble service
             jibble_service = JibbleService()
@@ -2380,10 +2571,6 @@ class DataSyncService:
             if not conn_test.get("success"):
                 raise Exception(f"Jibble API connection failed: {conn_test.get('message')}")
             
-            # Date range
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days_back)
-            
             logger.info(f"Fetching data from {start_date.date()} to {end_date.date()}")
             
             # Step 1: Fetch timesheets in chunks (API has date range limits)
@@ -2392,13 +2579,15 @@ class DataSyncService:
             timesheets = {}
             chunk_days = 14  # Smaller chunks for reliability
             current_start = start_date
+            fetched_ranges = []  # (first_day, last_day) of each chunk that arrived
+            failed_from = None  # start of the first chunk that failed
             
             while current_start < end_date:
                 chunk_end = min(current_start + timedelta(days=chunk_days), end_date)
                 logger.info(f"  Fetching: {current_start.date()} to {chunk_end.date()}")
                 
                 try:
-                    chunk_data = jibble_service.get_timesheets_summary(current_start, chunk_end)
+                    chunk_data = jibble_service.get_timesheets_summary(current_start, chunk_end, raise_errors=True)
                     
                     # Merge chunk data
                     for person_id, data in chunk_data.items():
@@ -2416,12 +2605,17 @@ class DataSyncService:
                                 if key not in timesheets[person_id]:
                                     timesheets[person_id][key] = value
                     
+                    fetched_ranges.append((current_start.date(), chunk_end.date()))
                     logger.info(f"    Got {len(chunk_data)} people")
                 except Exception as chunk_err:
                     logger.warning(f"    Chunk failed: {chunk_err}")
+                    if failed_from is None:
+                        failed_from = current_start
                 
                 current_start = chunk_end + timedelta(days=1)
             
+            if not fetched_ranges:
+                raise Exception("Every Jibble timesheet chunk failed")
             logger.info(f"Total: {len(timesheets)} people with timesheet data")
             
             # Step 2: Load email mapping for turing_email matching (optional enhancement)
@@ -2474,54 +2668,26 @@ class DataSyncService:
             
             logger.info(f"Prepared {len(records)} records to insert")
             
-            # Safety check: Only proceed if we have data to insert
+            # Safety check: Only proceed if we have data to write
             if not records:
-                logger.warning("No records fetched from API - skipping delete to preserve existing data")
+                logger.warning("No records fetched from API - skipping write to preserve existing data")
                 self.log_sync_complete(log_id, 0, True, "No new records fetched")
                 return True
             
-            # Step 4: Store ALL data in database (atomic transaction)
+            # Step 4: Write changed days for the chunks that arrived (atomic transaction);
+            # days of failed chunks are left as they are
             logger.info("Step 4: Storing in database...")
             
-            with self.db_service.get_session() as session:
-                # Clear existing API-sourced data for the date range
-                # This is safe because we verified we have records to insert above
-                deleted = session.execute(text("""
-                    DELETE FROM jibble_hours 
-                    WHERE source = 'jibble_api'
-                    AND entry_date >= :start_date 
-                    AND entry_date <= :end_date
-                """), {
-                    "start_date": start_date.date(),
-                    "end_date": end_date.date()
-                })
-                logger.info(f"Cleared {deleted.rowcount} old API records for date range")
-                
-                # Batch insert for performance
-                if records:
-                    # Insert in batches of 1000
-                    batch_size = 1000
-                    inserted = 0
-                    
-                    for i in range(0, len(records), batch_size):
-                        batch = records[i:i + batch_size]
-                        
-                        for record in batch:
-                            session.execute(text("""
-                                INSERT INTO jibble_hours 
-                                (member_code, entry_date, project, full_name, logged_hours, 
-                                 turing_email, source, last_synced)
-                                VALUES 
-                                (:member_code, :entry_date, :project, :full_name, :logged_hours,
-                                 :turing_email, 'jibble_api', NOW())
-                            """), record)
-                            inserted += 1
-                        
-                        logger.info(f"  Inserted batch {i//batch_size + 1}: {len(batch)} records")
-                    
-                    session.commit()
-                else:
-                    inserted = 0
+            def covers(member_code, project, entry_date):
+                return any(first_day <= entry_date <= last_day for first_day, last_day in fetched_ranges)
+            
+            changed = self._upsert_jibble_days('jibble_api', records, covers, since=fetched_ranges[0][0])
+            if failed_from is None:
+                self.save_sync_watermark('jibble_hours_api', sync_started_at, full, changed)
+            else:
+                # Resume from the first failed chunk; an incomplete full sync does not count as one
+                logger.warning(f"Jibble chunks failed from {failed_from.date()}; next sync resumes there")
+                self.save_sync_watermark('jibble_hours_api', failed_from, False, changed)
             
             # Count how many have turing_email for stats
             with self.db_service.get_session() as session:
@@ -2533,8 +2699,8 @@ class DataSyncService:
                     SELECT COUNT(*) FROM jibble_hours WHERE source = 'jibble_api'
                 """)).scalar()
             
-            self.log_sync_complete(log_id, inserted, True)
-            logger.info(f"Successfully synced {inserted} jibble_hours records from API")
+            self.log_sync_complete(log_id, changed, True)
+            logger.info(f"Successfully synced jibble_hours from API ({changed} rows changed)")
             logger.info(f"  With turing_email (Nvidia team): {matched}")
             logger.info(f"  Without turing_email (all others): {total - matched}")
             return True
@@ -2555,15 +2721,25 @@ class DataSyncService:
         2. Calculating hours from In/Out entry pairs
         3. Storing with actual project names for filtering
         
-        Slower than TimesheetsSummary but gives project breakdown.
+        Slower than TimesheetsSummary but gives project breakdown, so it runs
+        incrementally: each project and person is re-synced from its cursor
+        (minus jibble_incremental_lookback_days) and only changed days are
+        written. A full sync runs first, for 'initial'/'full', and every
+        full_sync_interval_hours to pick up deletions and back-dated entries.
         """
-        from app.models.db_models import JibbleHours
         from app.services.jibble_timeentries_sync import JibbleTimeEntriesSync, NVIDIA_PROJECTS
         
+        source = 'jibble_api_timeentries'
         log_id = self.log_sync_start('jibble_hours_by_project', sync_type)
         
         try:
-            logger.info("Starting Jibble TimeEntries sync for Nvidia projects...")
+            sync_started_at = datetime.utcnow()
+            full = self.get_sync_cutoff('jibble_hours_by_project', sync_type) is None
+            if full:
+                project_since, person_since = {}, {}
+            else:
+                project_since, person_since = self._load_jibble_cursors(source)
+            logger.info(f"Starting {'full' if full else 'incremental'} Jibble TimeEntries sync for Nvidia projects...")
             
             sync = JibbleTimeEntriesSync()
             all_records = []
@@ -2583,63 +2759,62 @@ class DataSyncService:
             
             logger.info(f"Loaded {len(name_to_turing)} name->turing_email mappings")
             
-            # Sync each Nvidia project
-            for project_id, project_name in NVIDIA_PROJECTS.items():
-                logger.info(f"Syncing {project_name}...")
+            # Sync all Nvidia projects concurrently (failed projects are logged and skipped)
+            results_by_project = sync.sync_all_nvidia_projects(project_since, person_since)
+            for project_name, results in results_by_project.items():
+                # Enrich with turing_email
+                for r in results:
+                    full_name = r.get("full_name", "")
+                    turing_email = name_to_turing.get(full_name.lower().strip()) if full_name else None
+                    all_records.append({
+                        'member_code': r['person_id'],
+                        'entry_date': date.fromisoformat(r['entry_date']),
+                        'project': r['project'],
+                        'full_name': full_name,
+                        'logged_hours': r['logged_hours'],
+                        'turing_email': turing_email,
+                    })
                 
-                try:
-                    results = sync.sync_nvidia_project_hours(project_id, project_name)
-                    
-                    # Enrich with turing_email
-                    for r in results:
-                        full_name = r.get("full_name", "")
-                        turing_email = name_to_turing.get(full_name.lower().strip()) if full_name else None
-                        r["turing_email"] = turing_email
-                    
-                    all_records.extend(results)
-                    logger.info(f"  Got {len(results)} records for {project_name}")
-                except Exception as proj_err:
-                    logger.warning(f"  Error syncing {project_name}: {proj_err}")
+                logger.info(f"  Got {len(results)} records for {project_name}")
             
             logger.info(f"Total records from all Nvidia projects: {len(all_records)}")
             
-            if not all_records:
+            if full and not all_records:
                 logger.warning("No records fetched - keeping existing data")
                 self.log_sync_complete(log_id, 0, True, "No new records")
                 return True
             
-            # Store in database
-            with self.db_service.get_session() as session:
-                # Delete existing project-specific entries (source='jibble_api_timeentries')
-                session.execute(text("""
-                    DELETE FROM jibble_hours 
-                    WHERE source = 'jibble_api_timeentries'
-                """))
-                
-                # Insert new records
-                inserted = 0
-                batch_size = 500
+            # Rows re-fetched by this run: whole projects for a full sync (people
+            # only, where some of a project's people failed), otherwise each
+            # (project, person) from its window start
+            if full:
+                complete_projects = {NVIDIA_PROJECTS[project_id] for project_id in sync.project_windows}
+                synced_people = {
+                    (NVIDIA_PROJECTS[project_id], person_id) for project_id, person_id in sync.person_windows
+                }
+                covers = lambda member_code, project, entry_date: (
+                    project in complete_projects or (project, member_code) in synced_people
+                )
+                since = None
+            else:
+                windows = {
+                    (NVIDIA_PROJECTS[project_id], person_id): start
+                    for (project_id, person_id), start in sync.person_windows.items()
+                }
                 
-                for i in range(0, len(all_records), batch_size):
-                    batch = all_records[i:i+batch_size]
-                    
-                    for record in batch:
-                        session.execute(text("""
-                            INSERT INTO jibble_hours 
-                            (member_code, entry_date, project, full_name, logged_hours, 
-                             turing_email, source, last_synced)
-                            VALUES 
-                            (:person_id, :entry_date, :project, :full_name, :logged_hours,
-                             :turing_email, 'jibble_api_timeentries', NOW())
-                        """), record)
-                        inserted += 1
-                    
-                    logger.info(f"  Inserted batch {i//batch_size + 1}")
+                def covers(member_code, project, entry_date):
+                    key = (project, member_code)
+                    return key in windows and (windows[key] is None or entry_date >= windows[key])
                 
-                session.commit()
+                starts = list(windows.values())
+                since = None if not starts or None in starts else min(starts)
+            
+            changed = self._upsert_jibble_days(source, all_records, covers, since)
+            self._save_jibble_cursors(source, sync.project_windows, sync.person_windows, sync_started_at)
+            self.save_sync_watermark('jibble_hours_by_project', sync_started_at, full, changed)
             
-            self.log_sync_complete(log_id, inserted, True)
-            logger.info(f"[OK] Successfully synced {inserted} jibble_hours records with project breakdown")
+            self.log_sync_complete(log_id, changed, True)
+            logger.info(f"[OK] Synced jibble_hours with project breakdown ({len(all_records)} records, {changed} rows changed)")
             return True
             
         except Exception as e:
@@ -2681,6 +2856,10 @@ class DataSyncService:
             
             logger.info(f"Syncing trainer_review_stats for projects: {all_project_ids}")
             
+            sync_started_at = datetime.utcnow()
+            task_ids = self._plan_incremental_sync('trainer_review_stats', sync_type)
+            task_filter = self._task_id_filter_sql('conv.id', task_ids)
+            
             # Query to attribute each review to the trainer who did the work
             query = f"""
             WITH completions AS (
@@ -2701,6 +2880,7 @@ class DataSyncService:
                 WHERE csh.new_status = 'completed'
                 AND csh.old_status != 'completed-approval'
                 AND conv.project_id IN ({project_filter})
+                {task_filter}
             ),
             reviews AS (
                 -- All published reviews (manual and auto/agentic)
@@ -2718,6 +2898,7 @@ class DataSyncService:
                 WHERE r.review_type IN ('manual', 'auto')
                 AND r.status = 'published'
                 AND conv.project_id IN ({project_filter})
+                {task_filter}
             ),
             review_completion_match AS (
                 -- Match each review to the completion that triggered it
@@ -2758,53 +2939,108 @@ class DataSyncService:
             ORDER BY review_time DESC
             """
             
-            logger.info("Fetching trainer review attribution from BigQuery...")
-            query_job = self.bq_client.query(query)
-            results = query_job.result()
+            results = []
+            if task_ids is None or task_ids:
+                logger.info("Fetching trainer review attribution from BigQuery...")
+                results = self._run_bq_query(query, 'trainer_review_stats', self._task_id_params(task_ids))
+            
+            def records():
+                for row in results:
+                    row_dict = dict(row)
+                    record = {
+                        'review_id': row_dict.get('review_id'),
+                        'task_id': row_dict.get('task_id'),
+                        'trainer_email': row_dict.get('trainer_email', '').lower().strip() if row_dict.get('trainer_email') else None,
+                        'completion_time': row_dict.get('completion_time'),
+                        'completion_number': row_dict.get('completion_number'),
+                        'review_time': row_dict.get('review_time'),
+                        'review_date': row_dict.get('review_date'),
+                        'score': float(row_dict.get('score')) if row_dict.get('score') is not None else None,
+                        'followup_required': int(row_dict.get('followup_required', 0)),
+                        'review_type': row_dict.get('review_type', 'manual'),  # 'manual' or 'auto' (agentic)
+                        'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id'))
+                    }
+                    if record['trainer_email']:
+                        yield record
+            
+            count = self._write_task_rows(TrainerReviewStats, 'task_id', records(), task_ids)
+            self.save_sync_watermark('trainer_review_stats', sync_started_at, task_ids is None, count)
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} trainer_review_stats records")
+            return True
             
-            data = []
-            for row in results:
-                row_dict = dict(row)
-                data.append({
-                    'review_id': row_dict.get('review_id'),
-                    'task_id': row_dict.get('task_id'),
-                    'trainer_email': row_dict.get('trainer_email', '').lower().strip() if row_dict.get('trainer_email') else None,
-                    'completion_time': row_dict.get('completion_time'),
-                    'completion_number': row_dict.get('completion_number'),
-                    'review_time': row_dict.get('review_time'),
-                    'review_date': row_dict.get('review_date'),
-                    'score': float(row_dict.get('score')) if row_dict.get('score') is not None else None,
-                    'followup_required': int(row_dict.get('followup_required', 0)),
-                    'review_type': row_dict.get('review_type', 'manual'),  # 'manual' or 'auto' (agentic)
-                    'project_id': self._constants.projects.remap_bq_to_dashboard(row_dict.get('project_id'))
-                })
+        except Exception as e:
+            self.log_sync_complete(log_id, 0, False, str(e))
+            logger.error(f"[ERROR] Error syncing trainer_review_stats: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def sync_fpy_reviews(self, sync_type: str = 'scheduled') -> bool:
+        """
+        Sync published manual reviews into fpy_review for Reviewer / Auditor FPY.
+        
+        One row per review with its conversation, project, reviewer email and
+        action type, so FPY is computed locally instead of scanning BigQuery
+        on every request.
+        """
+        log_id = self.log_sync_start('fpy_review', sync_type)
+        
+        try:
+            self.initialize_bigquery_client()
             
-            logger.info(f"Fetched {len(data)} trainer review attribution records")
+            sync_started_at = datetime.utcnow()
+            task_ids = self._plan_incremental_sync('fpy_review', sync_type)
+            task_filter = self._task_id_filter_sql('r.conversation_id', task_ids)
+            ds = f"{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}"
             
-            with self.db_service.get_session() as session:
-                # Clear existing data
-                logger.info("Clearing existing trainer_review_stats data...")
-                session.execute(delete(TrainerReviewStats))
-                session.commit()
-                
-                # Batch insert
-                batch_size = 5000
-                for i in range(0, len(data), batch_size):
-                    batch = data[i:i + batch_size]
-                    objects = [TrainerReviewStats(**record) for record in batch if record.get('trainer_email')]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(data))}/{len(data)} trainer_review_stats records")
+            query = f"""
+            SELECT
+                r.id AS review_id,
+                r.conversation_id,
+                conv.project_id,
+                cont.turing_email AS reviewer_email,
+                JSON_EXTRACT_SCALAR(r.review_action, '$.type') AS action_type,
+                r.submitted_at,
+                DATE(r.submitted_at) AS review_date
+            FROM `{ds}.review` r
+            JOIN `{ds}.conversation` conv ON conv.id = r.conversation_id
+            LEFT JOIN `{ds}.contributor` cont ON cont.id = r.reviewer_id
+            WHERE conv.project_id IN ({self._project_ids_sql})
+              AND r.review_type = 'manual'
+              AND r.status = 'published'
+              AND r.submitted_at IS NOT NULL
+              {task_filter}
+            """
             
-            self.log_sync_complete(log_id, len(data), True)
-            logger.info(f"[OK] Successfully synced {len(data)} trainer_review_stats records")
+            results = []
+            if task_ids is None or task_ids:
+                logger.info("Fetching FPY reviews from BigQuery...")
+                results = self._run_bq_query(query, 'fpy_review', self._task_id_params(task_ids))
+            
+            def records():
+                for row in results:
+                    yield {
+                        'review_id': row.review_id,
+                        'conversation_id': row.conversation_id,
+                        'project_id': self._constants.projects.remap_bq_to_dashboard(row.project_id),
+                        'reviewer_email': row.reviewer_email.lower().strip() if row.reviewer_email else None,
+                        'action_type': row.action_type.lower() if row.action_type else None,
+                        'submitted_at': row.submitted_at,
+                        'review_date': row.review_date,
+                    }
+            
+            count = self._write_task_rows(FpyReview, 'conversation_id', records(), task_ids, batch_size=10000)
+            self.save_sync_watermark('fpy_review', sync_started_at, task_ids is None, count)
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully synced {count} fpy_review records")
             return True
             
         except Exception as e:
             self.log_sync_complete(log_id, 0, False, str(e))
-            logger.error(f"[ERROR] Error syncing trainer_review_stats: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"[ERROR] Error syncing fpy_review: {e}")
             return False
     
     # =========================================================================
@@ -2974,19 +3210,8 @@ class DataSyncService:
             logger.info(f"Parsed {len(records)} revenue records from sheet")
             
             # Write to database
-            with self.db_service.get_session() as session:
-                # Clear existing data (full refresh for accuracy)
-                session.execute(delete(ProjectRevenueWeekly))
-                session.commit()
-                
-                # Batch insert
-                batch_size = 500
-                for i in range(0, len(records), batch_size):
-                    batch = records[i:i + batch_size]
-                    objects = [ProjectRevenueWeekly(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(records))}/{len(records)} revenue records")
+            # Clear existing data (full refresh for accuracy)
+            self._replace_table_rows(ProjectRevenueWeekly, records, batch_size=500)
             
             self.log_sync_complete(log_id, len(records), True)
             logger.info(f"[OK] Successfully synced {len(records)} revenue records")
@@ -3049,7 +3274,7 @@ class DataSyncService:
             """
             
             logger.info("Fetching cost data from BigQuery Jibblelogs...")
-            results = self.bq_client.query(query).result()
+            results = self._run_bq_query(query, 'cost_data')
             
             records = []
             for row in results:
@@ -3070,19 +3295,8 @@ class DataSyncService:
             logger.info(f"Fetched {len(records)} cost records from BigQuery")
             
             # Write to database
-            with self.db_service.get_session() as session:
-                # Clear existing data (full refresh for accuracy)
-                session.execute(delete(ProjectCostDaily))
-                session.commit()
-                
-                # Batch insert
-                batch_size = 5000
-                for i in range(0, len(records), batch_size):
-                    batch = records[i:i + batch_size]
-                    objects = [ProjectCostDaily(**record) for record in batch]
-                    session.bulk_save_objects(objects)
-                    session.commit()
-                    logger.info(f"Synced {min(i + batch_size, len(records))}/{len(records)} cost records")
+            # Clear existing data (full refresh for accuracy)
+            self._replace_table_rows(ProjectCostDaily, records)
             
             self.log_sync_complete(log_id, len(records), True)
             logger.info(f"[OK] Successfully synced {len(records)} cost records")
@@ -3176,14 +3390,7 @@ class DataSyncService:
                     'last_synced': datetime.utcnow(),
                 })
             
-            with self.db_service.get_session() as session:
-                session.execute(delete(ProjectFTECostMonthly))
-                session.commit()
-                
-                if records:
-                    objects = [ProjectFTECostMonthly(**r) for r in records]
-                    session.bulk_save_objects(objects)
-                    session.commit()
+            self._replace_table_rows(ProjectFTECostMonthly, records)
             
             self.log_sync_complete(log_id, len(records), True)
             logger.info(f"[OK] Synced {len(records)} FTE cost records from mom_fte_costs")
@@ -3196,47 +3403,124 @@ class DataSyncService:
             traceback.print_exc()
             return False
     
+    # =========================================================================
+    # DERIVED FACT TABLES
+    # =========================================================================
+    
+    def sync_trainer_facts(self, sync_type: str = 'scheduled') -> bool:
+        """
+        Rebuild trainer_task_daily_fact and trainer_daily_fact from the local
+        task_raw, task_history_raw, trainer_review_stats and revenue tables.
+        
+        Runs after those syncs so the POD Lead / Project hierarchies can
+        range-sum pre-aggregated rows instead of recomputing them per request.
+        """
+        log_id = self.log_sync_start('trainer_daily_fact', sync_type)
+        
+        try:
+            with self.db_service.get_session() as session:
+                task_facts, daily_facts = build_trainer_facts(session)
+            
+            count = self._replace_table_rows(TrainerTaskDailyFact, task_facts, batch_size=10000)
+            count += self._replace_table_rows(TrainerDailyFact, daily_facts)
+            
+            self.log_sync_complete(log_id, count, True)
+            logger.info(f"[OK] Successfully rebuilt {count} trainer fact records")
+            return True
+        except Exception as e:
+            self.log_sync_complete(log_id, 0, False, str(e))
+            logger.error(f"[ERROR] Error building trainer facts: {e}")
+            return False
+    
+    def _log_sync_exception(self, table_name: str, error: Exception, started_at: float, sync_type: str):
+        """Record a sync that raised instead of returning, so it still shows in data_sync_log."""
+        try:
+            with self.db_service.get_session() as session:
+                session.add(DataSyncLog(
+                    table_name=table_name,
+                    sync_started_at=datetime.utcfromtimestamp(started_at),
+                    sync_completed_at=datetime.utcnow(),
+                    records_synced=0,
+                    sync_status='failed',
+                    sync_type=sync_type,
+                    error_message=str(error)
+                ))
+                session.commit()
+        except Exception as e:
+            logger.error(f"Error logging sync failure for {table_name}: {e}")
+    
+    def get_sync_nodes(self) -> List[SyncNode]:
+        """
+        Table syncs and their dependencies.
+        
+        A node depends on another when it reads that table locally, has a foreign
+        key into it (the contributor reload cascades), or rewrites rows it owns.
+        """
+        return [
+            SyncNode('contributor', self.sync_contributor),
+            SyncNode('task_reviewed_info', self.sync_task_reviewed_info),
+            SyncNode('task', self.sync_task, ['contributor']),
+            SyncNode('review_detail', self.sync_review_detail, ['contributor', 'task']),
+            SyncNode('task_aht', self.sync_task_aht, ['contributor', 'task']),
+            SyncNode('contributor_task_stats', self.sync_contributor_task_stats, ['contributor']),
+            SyncNode('contributor_daily_stats', self.sync_contributor_daily_stats, ['contributor']),
+            SyncNode('reviewer_daily_stats', self.sync_reviewer_daily_stats, ['contributor']),
+            SyncNode('reviewer_trainer_daily_stats', self.sync_reviewer_trainer_daily_stats, ['contributor']),
+            SyncNode('task_raw', self.sync_task_raw),
+            SyncNode('task_history_raw', self.sync_task_history_raw),
+            SyncNode('pod_lead_mapping', self.sync_pod_lead_mapping),
+            # Rewrites its own rows inside pod_lead_mapping
+            SyncNode('math_proof_eval_team', self.sync_math_proof_eval_team, ['pod_lead_mapping']),
+            SyncNode('jibble_email_mapping', self.sync_jibble_email_mapping),  # Jibble ID to Turing email mapping
+            # Fill missing Jibble member_code mappings
+            SyncNode('math_proof_eval_jibble_ids', self.sync_math_proof_eval_jibble_ids,
+                     ['math_proof_eval_team', 'jibble_email_mapping']),
+            # Jibble hours from BigQuery, resolved through jibble_email_mapping
+            SyncNode('jibble_hours', self.sync_jibble_hours, ['jibble_email_mapping', 'math_proof_eval_jibble_ids']),
+            SyncNode('trainer_review_stats', self.sync_trainer_review_stats),  # Per-trainer review attribution
+            SyncNode('fpy_review', self.sync_fpy_reviews),  # Manual review actions for FPY
+            SyncNode('project_revenue_weekly', self.sync_revenue_data),  # Revenue from Google Sheet
+            SyncNode('project_cost_daily', self.sync_cost_data),  # Cost from BigQuery Jibblelogs
+            SyncNode('project_fte_cost_monthly', self.sync_fte_costs),  # FTE costs from client's PnL sheet
+            # Pre-aggregated hierarchy metrics, derived from the tables above
+            SyncNode('trainer_facts', self.sync_trainer_facts,
+                     ['task_raw', 'task_history_raw', 'trainer_review_stats', 'project_revenue_weekly']),
+        ]
+    
     def sync_all_tables(self, sync_type: str = 'scheduled') -> Dict[str, bool]:
-        """Sync all required data from BigQuery to PostgreSQL"""
+        """
+        Sync all required data from BigQuery to PostgreSQL.
+        
+        Independent tables sync concurrently (up to SYNC_MAX_WORKERS at a time);
+        see get_sync_nodes for the dependency graph.
+        """
         logger.info(f"Starting data sync ({sync_type})...")
         logger.info("=" * 80)
+        started = time.time()
         
-        results = {}
-        
-        sync_order = [
-            ('contributor', self.sync_contributor),
-            ('task_reviewed_info', self.sync_task_reviewed_info),
-            ('task', self.sync_task),
-            ('review_detail', self.sync_review_detail),
-            ('task_aht', self.sync_task_aht),
-            ('contributor_task_stats', self.sync_contributor_task_stats),
-            ('contributor_daily_stats', self.sync_contributor_daily_stats),
-            ('reviewer_daily_stats', self.sync_reviewer_daily_stats),
-            ('reviewer_trainer_daily_stats', self.sync_reviewer_trainer_daily_stats),
-            ('task_raw', self.sync_task_raw),
-            ('task_history_raw', self.sync_task_history_raw),
-            ('pod_lead_mapping', self.sync_pod_lead_mapping),
-            ('math_proof_eval_team', self.sync_math_proof_eval_team),
-            ('jibble_email_mapping', self.sync_jibble_email_mapping),  # Jibble ID to Turing email mapping
-            ('math_proof_eval_jibble_ids', self.sync_math_proof_eval_jibble_ids),  # Fill missing Jibble member_code mappings
-            ('jibble_hours', self.sync_jibble_hours),  # Jibble hours from BigQuery
-            ('trainer_review_stats', self.sync_trainer_review_stats),  # Per-trainer review attribution
-            ('project_revenue_weekly', self.sync_revenue_data),  # Revenue from Google Sheet
-            ('project_cost_daily', self.sync_cost_data),  # Cost from BigQuery Jibblelogs
-            ('project_fte_cost_monthly', self.sync_fte_costs),  # FTE costs from client's PnL sheet
-        ]
-        
-        for table_name, sync_func in sync_order:
+        # Some syncs use the shared client without initializing it themselves
+        if not self.bq_client:
             try:
-                logger.info(f"Syncing: {table_name}")
-                results[table_name] = sync_func(sync_type)
+                self.initialize_bigquery_client()
             except Exception as e:
-                logger.error(f"Error syncing {table_name}: {e}")
-                results[table_name] = False
+                logger.warning(f"BigQuery client not available before sync: {e}")
+        
+        results = run_sync_dag(
+            self.get_sync_nodes(),
+            sync_type,
+            max_workers=self.settings.sync_max_workers,
+            on_error=lambda name, error, started_at: self._log_sync_exception(name, error, started_at, sync_type)
+        )
+        
+        # Cached dashboard reads are derived from the synced tables
+        invalidate_stats_cache()
         
         success_count = sum(1 for v in results.values() if v)
         logger.info("=" * 80)
-        logger.info(f"Data sync completed: {success_count}/{len(results)} tables synced successfully")
+        logger.info(
+            f"Data sync completed: {success_count}/{len(results)} tables synced successfully "
+            f"in {time.time() - started:.1f}s"
+        )
         
         return results
 
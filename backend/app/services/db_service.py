@@ -144,7 +144,12 @@ class DatabaseService:
                 'task_reviewed_info',
                 'pod_lead_mapping',
                 'jibble_hours',
+                'jibble_sync_cursor',
                 'dashboard_user',
+                'sync_watermark',
+                'trainer_daily_fact',
+                'trainer_task_daily_fact',
+                'fpy_review',
             ]
             
             table_status = {}
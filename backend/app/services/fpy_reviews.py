@@ -0,0 +1,121 @@
+"""
+Reviewer / Auditor first-pass yield (FPY) from the synced fpy_review table.
+
+For each conversation, the FIRST published manual review by each role
+decides FPY: an action other than 'rework' is a pass.
+- Reviewer FPY = reviewer passes / conversations with a reviewer review
+- Auditor FPY  = calibrator passes / conversations with a calibrator review
+
+Reviewer roles come from pod_lead_mapping and the Math Proof Eval team sheet;
+anyone not mapped as a calibrator counts as a reviewer.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func, literal_column
+from sqlalchemy.orm import Session
+
+from app.models.db_models import FpyReview, PodLeadMapping
+
+logger = logging.getLogger(__name__)
+
+REVIEWER_ROLES = ('pod lead', 'sub pod lead', 'pod_lead')
+CALIBRATOR_ROLES = ('calibrator', 'auditor', 'team lead')
+
+
+def load_fpy_role_map(session: Session) -> Dict[str, str]:
+    """email -> 'reviewer' | 'calibrator' from pod_lead_mapping, overridden by the team sheet."""
+    role_map: Dict[str, str] = {}
+    for pr in session.query(PodLeadMapping.trainer_email, PodLeadMapping.role).all():
+        if pr.trainer_email and pr.role:
+            role = pr.role.lower().strip()
+            email = pr.trainer_email.lower().strip()
+            if role in REVIEWER_ROLES:
+                role_map[email] = 'reviewer'
+            elif role in CALIBRATOR_ROLES:
+                role_map[email] = 'calibrator'
+
+    try:
+        from app.services.quality_rubrics_service import QualityRubricsService
+        for email, role in QualityRubricsService()._fetch_team_roles().items():
+            role_map[email.lower().strip()] = role
+    except Exception as e:
+        logger.warning(f"Could not load team sheet roles for FPY: {e}")
+
+    return role_map
+
+
+def fpy_counts(
+    session: Session,
+    project_ids: List[int],
+    start_date=None,
+    end_date=None,
+    role_map: Optional[Dict[str, str]] = None,
+    period=None,
+) -> Dict[Tuple[int, Any], Dict[str, int]]:
+    """
+    First-review pass/total counts per role.
+
+    Args:
+        period: Optional SQL expression over FpyReview.review_date; when
+            given, first reviews are taken per period and results are keyed
+            by its value, otherwise the key's period is None.
+
+    Returns {(project_id, period): {'r_total', 'r_pass', 'a_total', 'a_pass'}}.
+    """
+    if not project_ids:
+        return {}
+    if role_map is None:
+        role_map = load_fpy_role_map(session)
+
+    calibrators = sorted(email for email, role in role_map.items() if role == 'calibrator')
+    role = (
+        case((FpyReview.reviewer_email.in_(calibrators), 'calibrator'), else_='reviewer')
+        if calibrators else literal_column("'reviewer'")
+    )
+    partition = [FpyReview.project_id, FpyReview.conversation_id, role]
+    if period is None:
+        period = literal_column('NULL')
+    else:
+        partition.append(period)
+
+    filters = [FpyReview.project_id.in_(project_ids)]
+    if start_date:
+        filters.append(FpyReview.review_date >= start_date)
+    if end_date:
+        filters.append(FpyReview.review_date <= end_date)
+
+    ranked = session.query(
+        FpyReview.project_id,
+        period.label('period'),
+        role.label('role'),
+        case((FpyReview.action_type == 'rework', 0), else_=1).label('passed'),
+        func.row_number().over(
+            partition_by=partition,
+            order_by=(FpyReview.submitted_at, FpyReview.id),
+        ).label('rn'),
+    ).filter(*filters).subquery()
+
+    counts: Dict[Tuple[int, Any], Dict[str, int]] = {}
+    for row in session.query(
+        ranked.c.project_id,
+        ranked.c.period,
+        ranked.c.role,
+        func.count().label('total'),
+        func.sum(ranked.c.passed).label('passed'),
+    ).filter(ranked.c.rn == 1).group_by(ranked.c.project_id, ranked.c.period, ranked.c.role).all():
+        entry = counts.setdefault(
+            (row.project_id, row.period), {'r_total': 0, 'r_pass': 0, 'a_total': 0, 'a_pass': 0}
+        )
+        prefix = 'a' if row.role == 'calibrator' else 'r'
+        entry[f'{prefix}_total'] += int(row.total or 0)
+        entry[f'{prefix}_pass'] += int(row.passed or 0)
+    return counts
+
+
+def fpy_rates(counts: Dict[str, int]) -> Tuple[Optional[float], Optional[float]]:
+    """(reviewer FPY %, auditor FPY %), None where there were no reviews."""
+    r_total, a_total = counts.get('r_total', 0), counts.get('a_total', 0)
+    reviewer_fpy = round(counts.get('r_pass', 0) / r_total * 100, 1) if r_total > 0 else None
+    auditor_fpy = round(counts.get('a_pass', 0) / a_total * 100, 1) if a_total > 0 else None
+    return reviewer_fpy, auditor_fpy
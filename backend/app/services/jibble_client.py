@@ -0,0 +1,338 @@
+"""
+Pooled, rate-limited Jibble API access.
+
+- OAuth tokens are cached per client id and reused by every caller until
+  they expire, instead of each service instance fetching its own
+- ``AsyncJibbleClient`` keeps one HTTP connection pool and runs many
+  requests concurrently under a shared token bucket; a 429 pauses the
+  bucket for Retry-After and halves its rate, which then recovers
+  gradually as requests succeed
+- ``get_session`` is a shared requests.Session (connection reuse) for the
+  synchronous JibbleService
+"""
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import get_settings
+from app.core.exceptions import JibbleException
+from app.core.metrics import (
+    JIBBLE_RATE_LIMIT_PER_SECOND,
+    JIBBLE_REQUEST_DURATION_SECONDS,
+    JIBBLE_REQUESTS_TOTAL,
+)
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://identity.prod.jibble.io/connect/token"
+
+# Retry settings
+MAX_RETRIES = 5
+INITIAL_BACKOFF = 30  # seconds, when a 429 has no Retry-After or a request times out
+MAX_BACKOFF = 300  # 5 minutes
+
+# Refresh tokens this long before Jibble expires them
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+
+class _TokenCache:
+    """Thread-safe OAuth tokens per client id, valid until shortly before expiry."""
+
+    def __init__(self):
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, client_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._tokens.get(client_id)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def put(self, client_id: str, token: str, expires_in: int) -> None:
+        expires_at = time.monotonic() + max(0, expires_in - TOKEN_EXPIRY_MARGIN_SECONDS)
+        with self._lock:
+            self._tokens[client_id] = (token, expires_at)
+
+    def invalidate(self, client_id: str) -> None:
+        with self._lock:
+            self._tokens.pop(client_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+
+_token_cache = _TokenCache()
+_token_fetch_lock = threading.Lock()
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _token_request(client_id: str, client_secret: str) -> Dict[str, Any]:
+    return {
+        "data": {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+        },
+        "headers": {"Content-Type": "application/x-www-form-urlencoded"},
+    }
+
+
+def get_session() -> requests.Session:
+    """Shared requests session so synchronous Jibble calls reuse connections."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                pool_size = get_settings().jibble_max_concurrency
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+                _session = session
+    return _session
+
+
+def get_access_token(client_id: str, client_secret: str) -> str:
+    """Get the cached OAuth token for a client, fetching a new one when expired."""
+    if not client_id or not client_secret:
+        raise ValueError("Jibble client_id and client_secret are required")
+
+    token = _token_cache.get(client_id)
+    if token:
+        return token
+    with _token_fetch_lock:
+        token = _token_cache.get(client_id)
+        if token:
+            return token
+        response = get_session().post(TOKEN_URL, timeout=30, **_token_request(client_id, client_secret))
+        response.raise_for_status()
+        data = response.json()
+        _token_cache.put(client_id, data["access_token"], data.get("expires_in", 3600))
+        logger.info("Successfully obtained Jibble access token")
+        return data["access_token"]
+
+
+def _retry_after_seconds(response, default: float) -> float:
+    """Parse Retry-After (seconds or HTTP date), falling back to ``default``."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class AdaptiveTokenBucket:
+    """
+    Async token bucket whose rate adapts to server throttling.
+
+    ``throttle`` (on a 429) stops all requests until Retry-After has passed
+    and halves the rate; ``succeed`` raises it again additively until it is
+    back at the configured maximum.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 min_rate: float = 0.2, recovery_step: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.recovery_step = recovery_step
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+        JIBBLE_RATE_LIMIT_PER_SECOND.set(self.rate)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        """Wait for a token; waiters are served in arrival order."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def throttle(self, retry_after: float) -> None:
+        """Back off after a 429."""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens = 0.0
+        self.paused_until = max(self.paused_until, now + retry_after)
+        self.rate = max(self.min_rate, self.rate / 2)
+        JIBBLE_RATE_LIMIT_PER_SECOND.set(self.rate)
+
+    def succeed(self) -> None:
+        """Recover toward the configured rate after a successful request."""
+        if self.rate < self.max_rate:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+            JIBBLE_RATE_LIMIT_PER_SECOND.set(self.rate)
+
+
+class AsyncJibbleClient:
+    """
+    Concurrent Jibble API client.
+
+    Usage:
+        async with AsyncJibbleClient(client_id, client_secret) as client:
+            entries = await client.get_paged(url, {"$filter": ...}, page_size=500)
+    """
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        requests_per_second: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: float = 120.0,
+        initial_backoff: float = INITIAL_BACKOFF,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        settings = get_settings()
+        self.client_id = client_id or settings.jibble_api_key
+        self.client_secret = client_secret or settings.jibble_api_secret
+        self.max_concurrency = max_concurrency or settings.jibble_max_concurrency
+        self.timeout = timeout
+        self.initial_backoff = initial_backoff
+        self.bucket = AdaptiveTokenBucket(requests_per_second or settings.jibble_requests_per_second)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._token_lock = asyncio.Lock()
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "AsyncJibbleClient":
+        self._http = httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=self._transport,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _get_token(self) -> str:
+        token = _token_cache.get(self.client_id)
+        if token:
+            return token
+        async with self._token_lock:
+            token = _token_cache.get(self.client_id)
+            if token:
+                return token
+            if not self.client_id or not self.client_secret:
+                raise ValueError("Jibble client_id and client_secret are required")
+            response = await self._http.post(TOKEN_URL, **_token_request(self.client_id, self.client_secret))
+            response.raise_for_status()
+            data = response.json()
+            _token_cache.put(self.client_id, data["access_token"], data.get("expires_in", 3600))
+            logger.info("Successfully obtained Jibble access token")
+            return data["access_token"]
+
+    async def get_json(self, url: str, params: Dict[str, Any], endpoint: str = "jibble") -> Optional[Dict]:
+        """
+        GET a Jibble endpoint, retrying 429s, timeouts and one expired token.
+
+        Returns:
+            Parsed JSON, or None if the request failed
+        """
+        backoff = self.initial_backoff
+        token_refreshed = False
+        for attempt in range(MAX_RETRIES):
+            await self.bucket.acquire()
+            headers = {"Authorization": f"Bearer {await self._get_token()}", "Accept": "application/json"}
+            start = time.perf_counter()
+            async with self._semaphore:
+                try:
+                    response = await self._http.get(url, params=params, headers=headers)
+                except httpx.TimeoutException:
+                    JIBBLE_REQUESTS_TOTAL.labels(endpoint=endpoint, status="timeout").inc()
+                    logger.warning(f"Jibble {endpoint} timeout. Retry {attempt + 1}/{MAX_RETRIES}")
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, MAX_BACKOFF)
+                    continue
+                except httpx.HTTPError as e:
+                    JIBBLE_REQUESTS_TOTAL.labels(endpoint=endpoint, status="error").inc()
+                    logger.error(f"Jibble {endpoint} request error: {e}")
+                    return None
+                finally:
+                    JIBBLE_REQUEST_DURATION_SECONDS.labels(endpoint=endpoint).observe(time.perf_counter() - start)
+            JIBBLE_REQUESTS_TOTAL.labels(endpoint=endpoint, status=str(response.status_code)).inc()
+
+            if response.status_code == 429:
+                wait_time = _retry_after_seconds(response, backoff)
+                self.bucket.throttle(wait_time)
+                logger.warning(
+                    f"Jibble rate limited (429). Pausing {wait_time:.0f}s, "
+                    f"rate now {self.bucket.rate:.2f}/s (retry {attempt + 1}/{MAX_RETRIES})"
+                )
+                backoff = min(backoff * 2, MAX_BACKOFF)
+                continue
+            if response.status_code == 401 and not token_refreshed:
+                _token_cache.invalidate(self.client_id)
+                token_refreshed = True
+                continue
+            if response.status_code != 200:
+                logger.warning(f"Jibble {endpoint} returned {response.status_code}")
+                return None
+
+            self.bucket.succeed()
+            return response.json()
+
+        logger.error(f"Jibble {endpoint}: max retries ({MAX_RETRIES}) exceeded")
+        return None
+
+    async def get_paged(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        page_size: int,
+        endpoint: str = "jibble",
+    ) -> List[Dict]:
+        """
+        Fetch every page of an OData collection ($top/$skip), in order.
+
+        Raises:
+            JibbleException: If any page failed, so a partial collection is
+                never mistaken for a complete one
+        """
+        items: List[Dict] = []
+        skip = 0
+        while True:
+            data = await self.get_json(url, {**params, "$top": page_size, "$skip": skip}, endpoint)
+            if data is None:
+                raise JibbleException(f"{endpoint} page at $skip={skip} failed")
+            page = data.get("value", [])
+            items.extend(page)
+            if len(page) < page_size:
+                break
+            skip += page_size
+        return items
@@ -0,0 +1,131 @@
+"""
+Batched payroll-hours engine for Jibble TimeEntries.
+
+Computes payroll hours for every person and project of a sync at once
+instead of walking each person's entries once per project (that per-person
+walk is kept as the parity oracle in tests/test_jibble_payroll.py):
+
+1. All entries go into one frame, sorted by person and time
+2. Each In is paired with the person's next Out with a reversed running
+   minimum over the Out positions
+3. Tracked hours are summed per person/project/day and per person/day in
+   one groupby each, and payroll hours are split proportionally:
+   project_payroll = day_payroll × (project_tracked / total_tracked)
+"""
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+RESULT_COLUMNS = ["project_id", "person_id", "entry_date", "logged_hours"]
+
+
+def entries_frame(entries_by_person: Mapping[str, List[Dict]]) -> pd.DataFrame:
+    """
+    One row per entry, in time order per person (same order as a stable sort on 'time').
+
+    ``person`` is an integer code per person, increasing down the frame.
+    """
+    rows = [
+        (person_id, entry.get("projectId"), entry.get("type"), entry.get("time") or "", entry.get("belongsToDate"))
+        for person_id, entries in entries_by_person.items()
+        for entry in entries
+    ]
+    frame = pd.DataFrame(rows, columns=["person_id", "project_id", "type", "time", "entry_date"])
+    lengths = [len(entries) for entries in entries_by_person.values()]
+    person = np.repeat(np.arange(len(lengths)), lengths)
+    # np.lexsort is stable, so equal times keep their input order
+    order = np.lexsort((frame["time"].to_numpy(dtype=str), person))
+    frame = frame.iloc[order].reset_index(drop=True)
+    frame["person"] = person[order]
+    return frame
+
+
+def tracked_hours(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tracked hours per In entry, paired with the next Out of the same person.
+
+    Pairs with an unparseable time, or lasting 24h or more, are dropped.
+
+    Returns:
+        DataFrame of person_id, project_id, entry_date, hours
+    """
+    if frame.empty:
+        return pd.DataFrame(columns=["person_id", "project_id", "entry_date", "hours"])
+
+    n = len(frame)
+    kind = frame["type"].to_numpy()
+    person = frame["person"].to_numpy()
+
+    # Position of the nearest Out at or after each row (n if none); for an
+    # In row that is the next Out, which must belong to the same person
+    out_pos = np.where(kind == "Out", np.arange(n), n)
+    next_out = np.minimum.accumulate(out_pos[::-1])[::-1]
+    has_out = next_out < n
+    has_out[has_out] = person[next_out[has_out]] == person[has_out]
+
+    times = pd.to_datetime(frame["time"], utc=True, errors="coerce", format="ISO8601")
+    times = times.dt.tz_localize(None).to_numpy()
+    out_times = np.full(n, np.datetime64("NaT"), dtype=times.dtype)
+    out_times[has_out] = times[next_out[has_out]]
+    hours = (out_times - times) / np.timedelta64(1, "h")
+
+    valid = (kind == "In") & has_out & frame["entry_date"].notna().to_numpy() & (hours > 0) & (hours < 24)
+    tracked = frame.loc[valid, ["person_id", "project_id", "entry_date"]]
+    return tracked.assign(hours=hours[valid])
+
+
+def project_payroll_hours(
+    entries_by_person: Mapping[str, List[Dict]],
+    payroll_by_person: Mapping[str, Dict[str, float]],
+    pairs: Optional[Iterable[Tuple[str, str]]] = None,
+) -> pd.DataFrame:
+    """
+    PAYROLL hours per project, person and day for many people at once.
+
+    Args:
+        entries_by_person: {person_id: TimeEntries (all projects)}
+        payroll_by_person: {person_id: {date_str: payroll_hours}} from TimesheetsSummary
+        pairs: (project_id, person_id) pairs to return (default: all)
+
+    Days without payroll data fall back to tracked hours.
+
+    Returns:
+        DataFrame of project_id, person_id, entry_date, logged_hours (rounded to 2 places)
+    """
+    if pairs is not None:
+        pairs = list(pairs)
+    tracked = tracked_hours(entries_frame(entries_by_person))
+    if tracked.empty or pairs == []:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    totals = tracked.groupby(["person_id", "entry_date"], sort=False)["hours"].sum().rename("total_hours")
+    per_project = tracked.groupby(["person_id", "project_id", "entry_date"], sort=False)["hours"].sum().reset_index()
+    if pairs is not None:
+        wanted = pd.MultiIndex.from_tuples(pairs, names=["project_id", "person_id"])
+        per_project = per_project[
+            pd.MultiIndex.from_frame(per_project[["project_id", "person_id"]]).isin(wanted)
+        ]
+
+    payroll = pd.DataFrame(
+        [
+            (person_id, date_str, hours)
+            for person_id, days in payroll_by_person.items()
+            for date_str, hours in days.items()
+        ],
+        columns=["person_id", "entry_date", "payroll_hours"],
+    )
+    merged = per_project.join(totals, on=["person_id", "entry_date"]).merge(
+        payroll, on=["person_id", "entry_date"], how="left"
+    )
+
+    day_payroll = merged["payroll_hours"].to_numpy(dtype=float, na_value=0.0)
+    project_hours = merged["hours"].to_numpy(dtype=float)
+    total_hours = merged["total_hours"].to_numpy(dtype=float)
+    split = np.where(
+        (total_hours > 0) & (day_payroll > 0),
+        day_payroll * (project_hours / np.where(total_hours > 0, total_hours, 1)),
+        project_hours,
+    )
+    merged["logged_hours"] = np.round(split, 2)
+    return merged.loc[merged["logged_hours"] > 0, RESULT_COLUMNS].reset_index(drop=True)
@@ -6,11 +6,12 @@ import re
 import logging
 import requests
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Dict, List, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import func, cast, Date
 
 from app.config import get_settings
+from app.services.jibble_client import get_access_token, get_session
 from app.models.db_models import JibblePerson, JibbleTimeEntry, JibbleEmailMapping, PodLeadMapping
 
 logger = logging.getLogger(__name__)
@@ -27,8 +28,6 @@ class JibbleService:
         self.time_tracking_url = settings.jibble_time_tracking_url
         self.time_attendance_url = settings.jibble_time_attendance_url
         self.project_name = settings.jibble_project_name
-        self.access_token: Optional[str] = None
-        self.token_expires_at: Optional[datetime] = None
         
         # Log credential status on init (without revealing secrets)
         if self.client_id and self.client_secret:
@@ -37,38 +36,9 @@ class JibbleService:
             logger.warning("Jibble credentials not configured - set JIBBLE_API_KEY and JIBBLE_API_SECRET in .env")
     
     def _get_access_token(self) -> str:
-        """Get OAuth2 access token using client credentials flow"""
-        # Return cached token if still valid
-        if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
-            return self.access_token
-        
-        if not self.client_id or not self.client_secret:
-            raise ValueError("Jibble client_id and client_secret are required")
-        
-        token_url = "https://identity.prod.jibble.io/connect/token"
-        
-        payload = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-        }
-        
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        """Get OAuth2 access token using client credentials flow (shared until it expires)"""
         try:
-            response = requests.post(token_url, data=payload, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            self.access_token = data["access_token"]
-            expires_in = data.get("expires_in", 3600)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
-            
-            logger.info("Successfully obtained Jibble access token")
-            return self.access_token
-            
+            return get_access_token(self.client_id, self.client_secret)
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to get Jibble access token: {e}")
             raise
@@ -86,7 +56,7 @@ class JibbleService:
         }
         
         try:
-            response = requests.request(method, url, headers=headers, params=params, timeout=60)
+            response = get_session().request(method, url, headers=headers, params=params, timeout=60)
             
             if response.status_code == 404:
                 logger.warning(f"Jibble API 404 for {endpoint}")
@@ -162,10 +132,16 @@ class JibbleService:
         
         return round(total_seconds / 3600, 2)
     
-    def get_timesheets_summary(self, start_date: datetime, end_date: datetime) -> Dict[str, Dict[str, float]]:
+    def get_timesheets_summary(
+        self, start_date: datetime, end_date: datetime, raise_errors: bool = False
+    ) -> Dict[str, Dict[str, float]]:
         """
         Fetch pre-calculated daily hours from TimesheetsSummary endpoint
         
+        Args:
+            raise_errors: Re-raise request errors instead of returning {} (so a
+                failed range can be told apart from one with no hours)
+        
         Returns: {person_id: {date_str: total_hours, _name: full_name, _total: total_hours}}
         """
         start_str = start_date.strftime('%Y-%m-%d')
@@ -217,6 +193,8 @@ class JibbleService:
             
         except Exception as e:
             logger.error(f"Error fetching timesheets summary: {e}")
+            if raise_errors:
+                raise
             return {}
     
     def test_connection(self) -> Dict[str, Any]:
@@ -7,30 +7,54 @@ This module:
 3. Calculates project-specific payroll hours proportionally
 
 Formula: project_payroll = payroll_hours × (project_tracked / total_tracked)
+
+Syncs can be incremental: given a start day per project and per
+(project, person), only entries from that day on are fetched and only those
+days are returned, so callers can replace just the re-synced days.
 """
 
 import os
 import re
+import asyncio
 import logging
-import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
-import requests
 
 from app.constants import get_constants
+from app.core.exceptions import JibbleException
+from app.services.jibble_client import AsyncJibbleClient
+from app.services.jibble_payroll import project_payroll_hours
 
 logger = logging.getLogger(__name__)
 
-# Retry settings
-MAX_RETRIES = 5
-INITIAL_BACKOFF = 30  # seconds
-MAX_BACKOFF = 300  # 5 minutes
+TIME_ENTRIES_URL = "https://time-tracking.prod.jibble.io/v1/TimeEntries"
+TIMESHEETS_SUMMARY_URL = "https://time-attendance.prod.jibble.io/v1/TimesheetsSummary"
 
 # Nvidia project IDs - get from centralized constants
 _constants = get_constants()
 NVIDIA_PROJECTS = _constants.jibble.JIBBLE_UUID_TO_NAME.copy()
 
+# Payroll hours fetched when a person has no start day (full history sync)
+DEFAULT_DAYS_BACK = 90
+
+
+def _earliest(first: Optional[date], second: Optional[date]) -> Optional[date]:
+    """Earlier of two start days, where None means 'from the beginning'."""
+    if first is None or second is None:
+        return None
+    return min(first, second)
+
+
+def _time_filter(base: str, since: Optional[date]) -> str:
+    """OData $filter for ``base`` entries from the day before ``since`` on.
+    
+    The extra day keeps In entries whose Out falls on ``since``.
+    """
+    if since is None:
+        return base
+    return f"{base} and time ge {(since - timedelta(days=1)).strftime('%Y-%m-%dT00:00:00Z')}"
+
 
 def parse_iso8601_duration(duration_str: str) -> float:
     """Parse ISO 8601 duration string to hours."""
@@ -63,371 +87,241 @@ class JibbleTimeEntriesSync:
     def __init__(self):
         self.client_id = os.getenv("JIBBLE_API_KEY")
         self.client_secret = os.getenv("JIBBLE_API_SECRET")
-        self.token = None
-        self.token_expires = None
-        # Cache for payroll hours: {person_id: {date: payroll_hours}}
-        self._payroll_cache = {}
-    
-    def _get_token(self) -> str:
-        """Get or refresh OAuth token."""
-        if self.token and self.token_expires and datetime.now() < self.token_expires:
-            return self.token
-        
-        response = requests.post(
-            "https://identity.prod.jibble.io/connect/token",
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=30
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        self.token = data["access_token"]
-        self.token_expires = datetime.now() + timedelta(seconds=data.get("expires_in", 3600) - 60)
-        
-        return self.token
+        # What the last run re-synced (None = full history):
+        # {project_id: start} and {(project_id, person_id): start}
+        self.project_windows: Dict[str, Optional[date]] = {}
+        self.person_windows: Dict[Tuple[str, str], Optional[date]] = {}
     
-    def _get_headers(self) -> Dict:
-        """Get request headers with auth token."""
-        return {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Accept": "application/json"
-        }
+    def _client(self) -> AsyncJibbleClient:
+        return AsyncJibbleClient(self.client_id, self.client_secret)
     
-    def _request_with_retry(self, url: str, params: Dict) -> Optional[requests.Response]:
-        """Make a request with exponential backoff retry on rate limiting."""
-        backoff = INITIAL_BACKOFF
-        
-        for attempt in range(MAX_RETRIES):
-            try:
-                resp = requests.get(
-                    url,
-                    headers=self._get_headers(),
-                    params=params,
-                    timeout=120
-                )
-                
-                if resp.status_code == 429:
-                    # Rate limited - wait and retry
-                    retry_after = int(resp.headers.get('Retry-After', backoff))
-                    wait_time = max(retry_after, backoff)
-                    logger.warning(f"Rate limited (429). Waiting {wait_time}s before retry {attempt + 1}/{MAX_RETRIES}")
-                    time.sleep(wait_time)
-                    backoff = min(backoff * 2, MAX_BACKOFF)
-                    continue
-                
-                return resp
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout. Retry {attempt + 1}/{MAX_RETRIES}")
-                time.sleep(backoff)
-                backoff = min(backoff * 2, MAX_BACKOFF)
-            except Exception as e:
-                logger.error(f"Request error: {e}")
-                return None
-        
-        logger.error(f"Max retries ({MAX_RETRIES}) exceeded")
-        return None
-    
-    def fetch_person_payroll_hours(self, person_id: str, days_back: int = 90) -> Dict[str, float]:
+    async def fetch_person_payroll_hours(
+        self, client: AsyncJibbleClient, person_id: str, since: Optional[date] = None
+    ) -> Dict[str, float]:
         """
         Fetch payroll hours per day for a person from TimesheetsSummary.
         Payroll hours = tracked time minus unpaid breaks.
         
+        Args:
+            since: First day to fetch (default: DEFAULT_DAYS_BACK days ago)
+        
         Returns: {date_str: payroll_hours}
-        """
-        # Check cache first
-        if person_id in self._payroll_cache:
-            return self._payroll_cache[person_id]
         
+        Raises:
+            JibbleException: If any chunk failed
+        """
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=days_back)
+        if since is None:
+            start_date = end_date - timedelta(days=DEFAULT_DAYS_BACK)
+        else:
+            start_date = datetime.combine(since, datetime.min.time())
         
-        # Fetch in 14-day chunks to avoid API limits
-        daily_payroll = {}
+        # Fetch in 14-day chunks to avoid API limits (concurrently, under the rate limit)
+        chunks = []
         current_start = start_date
-        
         while current_start < end_date:
             current_end = min(current_start + timedelta(days=14), end_date)
-            
-            params = {
+            chunks.append({
                 "period": "Custom",
                 "date": current_start.strftime("%Y-%m-%d"),
                 "endDate": current_end.strftime("%Y-%m-%d"),
                 "$filter": f"personId eq {person_id}"
-            }
-            
-            resp = self._request_with_retry(
-                "https://time-attendance.prod.jibble.io/v1/TimesheetsSummary",
-                params
-            )
-            
-            if resp and resp.status_code == 200:
-                data = resp.json()
-                for entry in data.get("value", []):
-                    for day in entry.get("daily", []):
-                        date_str = day.get("date")
-                        payroll_duration = day.get("payrollHours", "PT0S")
-                        payroll_hours = parse_iso8601_duration(payroll_duration)
-                        if date_str and payroll_hours > 0:
-                            daily_payroll[date_str] = payroll_hours
-            
+            })
             current_start = current_end + timedelta(days=1)
-            time.sleep(0.3)  # Small delay between chunks
         
-        # Cache result
-        self._payroll_cache[person_id] = daily_payroll
+        responses = await asyncio.gather(*(
+            client.get_json(TIMESHEETS_SUMMARY_URL, params, endpoint="TimesheetsSummary")
+            for params in chunks
+        ))
+        
+        if any(data is None for data in responses):
+            raise JibbleException(f"TimesheetsSummary for person {person_id} incomplete")
+        
+        daily_payroll = {}
+        for data in responses:
+            for entry in data.get("value", []):
+                for day in entry.get("daily", []):
+                    date_str = day.get("date")
+                    payroll_duration = day.get("payrollHours", "PT0S")
+                    payroll_hours = parse_iso8601_duration(payroll_duration)
+                    if date_str and payroll_hours > 0:
+                        daily_payroll[date_str] = payroll_hours
+        
         return daily_payroll
     
-    def fetch_project_in_entries(self, project_id: str, days_back: int = 90) -> List[Dict]:
-        """Fetch all 'In' entries for a specific project."""
-        all_entries = []
-        skip = 0
-        batch_size = 1000
-        
-        while True:
-            params = {
-                "$filter": f"projectId eq {project_id}",
-                "$top": batch_size,
-                "$skip": skip,
+    async def fetch_project_in_entries(
+        self, client: AsyncJibbleClient, project_id: str, since: Optional[date] = None
+    ) -> List[Dict]:
+        """Fetch all 'In' entries for a specific project (from ``since`` on, if given)."""
+        entries = await client.get_paged(
+            TIME_ENTRIES_URL,
+            {
+                "$filter": _time_filter(f"projectId eq {project_id}", since),
                 "$orderby": "time desc",
                 "$expand": "person($select=fullName)"
-            }
-            
-            resp = self._request_with_retry(
-                "https://time-tracking.prod.jibble.io/v1/TimeEntries",
-                params
-            )
-            
-            if resp is None or resp.status_code != 200:
-                if resp:
-                    logger.warning(f"Error fetching entries: {resp.status_code}")
-                break
-            
-            entries = resp.json().get("value", [])
-            if not entries:
-                break
-            
-            all_entries.extend(entries)
-            skip += batch_size
-            logger.info(f"    Fetched {len(all_entries)} entries so far...")
-            
-            if len(entries) < batch_size:
-                break
-            
-            # Small delay between batches to avoid rate limiting
-            time.sleep(1)
-        
-        return all_entries
+            },
+            page_size=1000,
+            endpoint="TimeEntries",
+        )
+        logger.info(f"    Fetched {len(entries)} entries")
+        return entries
     
-    def fetch_person_entries(self, person_id: str) -> List[Dict]:
-        """Fetch all entries for a person (to get Out entries)."""
-        all_entries = []
-        skip = 0
-        batch_size = 500
-        
-        while True:
-            params = {
-                "$filter": f"personId eq {person_id}",
-                "$top": batch_size,
-                "$skip": skip,
+    async def fetch_person_entries(
+        self, client: AsyncJibbleClient, person_id: str, since: Optional[date] = None
+    ) -> List[Dict]:
+        """Fetch all entries for a person (to get Out entries), from ``since`` on if given."""
+        return await client.get_paged(
+            TIME_ENTRIES_URL,
+            {
+                "$filter": _time_filter(f"personId eq {person_id}", since),
                 "$orderby": "time"
-            }
-            
-            resp = self._request_with_retry(
-                "https://time-tracking.prod.jibble.io/v1/TimeEntries",
-                params
-            )
-            
-            if resp is None or resp.status_code != 200:
-                break
-            
-            entries = resp.json().get("value", [])
-            if not entries:
-                break
-            
-            all_entries.extend(entries)
-            skip += batch_size
-            
-            if len(entries) < batch_size:
-                break
-            
-            # Small delay between batches
-            time.sleep(0.5)
-        
-        return all_entries
-    
-    def calculate_tracked_hours(self, person_entries: List[Dict], project_id: Optional[str] = None) -> Dict[str, float]:
-        """
-        Calculate tracked hours per day from In/Out pairs.
-        
-        If project_id is provided, only count hours for that project.
-        If project_id is None, count ALL hours (total tracked across all projects).
-        
-        Returns: {date_str: tracked_hours}
-        """
-        daily_hours = defaultdict(float)
-        
-        # Sort by time
-        person_entries.sort(key=lambda x: x.get("time", ""))
-        
-        for i, entry in enumerate(person_entries):
-            entry_project = entry.get("projectId")
-            
-            # Filter by project if specified (only when project_id is set)
-            # When project_id is None, include ALL entries regardless of their projectId
-            if project_id is not None and entry_project != project_id:
-                continue
-            
-            if entry.get("type") == "In":
-                in_time_str = entry.get("time")
-                date = entry.get("belongsToDate")
-                
-                if not in_time_str:
-                    continue
-                
-                try:
-                    in_time = datetime.fromisoformat(in_time_str.replace("Z", "+00:00"))
-                except:
-                    continue
-                
-                # Find the next Out entry
-                for j in range(i + 1, len(person_entries)):
-                    if person_entries[j].get("type") == "Out":
-                        out_time_str = person_entries[j].get("time")
-                        if out_time_str:
-                            try:
-                                out_time = datetime.fromisoformat(out_time_str.replace("Z", "+00:00"))
-                                duration_hours = (out_time - in_time).total_seconds() / 3600
-                                
-                                # Sanity check
-                                if 0 < duration_hours < 24:
-                                    daily_hours[date] += duration_hours
-                            except:
-                                pass
-                        break
-        
-        return dict(daily_hours)
-    
-    def calculate_project_payroll_hours(
-        self, 
-        person_id: str, 
-        person_entries: List[Dict], 
-        project_id: str
-    ) -> Dict[str, float]:
-        """
-        Calculate PAYROLL hours per day for a specific project.
-        
-        Formula: project_payroll = day_payroll × (project_tracked / total_tracked)
-        
-        This ensures breaks are excluded proportionally.
-        """
-        # Get tracked hours for this specific project
-        project_tracked = self.calculate_tracked_hours(person_entries, project_id)
-        
-        if not project_tracked:
-            return {}
-        
-        # Get total tracked hours (all projects) for this person
-        total_tracked = self.calculate_tracked_hours(person_entries, project_id=None)
-        
-        # Get payroll hours from TimesheetsSummary
-        payroll_hours = self.fetch_person_payroll_hours(person_id)
-        
-        # Calculate proportional payroll hours per day
-        daily_payroll = {}
-        for date, proj_hrs in project_tracked.items():
-            total_hrs = total_tracked.get(date, proj_hrs)
-            day_payroll = payroll_hours.get(date, 0)
-            
-            if total_hrs > 0 and day_payroll > 0:
-                # Apply proportion: project_payroll = payroll × (project / total)
-                ratio = proj_hrs / total_hrs
-                daily_payroll[date] = round(day_payroll * ratio, 2)
-            elif proj_hrs > 0:
-                # No payroll data available, fall back to tracked hours
-                # (This handles cases where TimesheetsSummary is missing)
-                daily_payroll[date] = round(proj_hrs, 2)
-        
-        return daily_payroll
+            },
+            page_size=500,
+            endpoint="TimeEntries",
+        )
     
-    def sync_nvidia_project_hours(self, project_id: str, project_name: str) -> List[Dict]:
-        """Sync PAYROLL hours for a single Nvidia project."""
-        logger.info(f"Syncing {project_name} (payroll hours)...")
-        
-        # Clear payroll cache for fresh data
-        self._payroll_cache = {}
+    async def _project_people(
+        self, client: AsyncJibbleClient, project_id: str, project_name: str, since: Optional[date]
+    ) -> Dict[str, str]:
+        """People with entries on a project since ``since``: {person_id: full_name}."""
+        logger.info(f"Syncing {project_name} (payroll hours{f' since {since}' if since else ''})...")
         
-        # Get all In entries for this project
-        in_entries = self.fetch_project_in_entries(project_id)
+        in_entries = await self.fetch_project_in_entries(client, project_id, since)
         logger.info(f"  Found {len(in_entries)} In entries")
         
-        if not in_entries:
-            return []
-        
-        # Get unique people
         people = {}
         for e in in_entries:
             pid = e.get("personId")
-            pname = e.get("person", {}).get("fullName", "Unknown")
-            people[pid] = pname
-        
-        logger.info(f"  Processing {len(people)} people for PAYROLL hours...")
-        
-        # Calculate payroll hours for each person
-        results = []
-        processed = 0
-        
-        for person_id, person_name in people.items():
-            processed += 1
+            if pid:
+                people[pid] = (e.get("person") or {}).get("fullName", "Unknown")
+        return people
+    
+    async def _fetch_person(
+        self, client: AsyncJibbleClient, person_id: str, since: Optional[date]
+    ) -> Tuple[List[Dict], Dict[str, float]]:
+        """A person's entries and payroll hours; these don't depend on the project."""
+        entries, payroll_hours = await asyncio.gather(
+            self.fetch_person_entries(client, person_id, since),
+            self.fetch_person_payroll_hours(client, person_id, since),
+        )
+        return entries, payroll_hours
+    
+    async def sync_projects(
+        self,
+        projects: Dict[str, str],
+        project_since: Optional[Dict[str, date]] = None,
+        person_since: Optional[Dict[Tuple[str, str], date]] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Sync PAYROLL hours for several projects concurrently over one client.
+        
+        Args:
+            projects: {project_id: project_name}
+            project_since: First day to look for activity per project; projects
+                not listed are scanned from the beginning
+            person_since: First day to re-sync per (project_id, person_id);
+                people not listed are synced in full
+        
+        Each person's entries and payroll hours are fetched once per run, from
+        their earliest window across projects, and PAYROLL hours for all of
+        them are computed in one batched pass. ``project_windows`` and
+        ``person_windows`` record what was re-synced: only people whose every
+        page arrived, and only projects all of whose people did.
+        
+        Returns {project_name: records}; projects that failed are logged and omitted.
+        """
+        project_since = project_since or {}
+        person_since = person_since or {}
+        self.project_windows = {}
+        self.person_windows = {}
+        
+        async with self._client() as client:
+            discovered = await asyncio.gather(
+                *(self._project_people(client, project_id, project_name, project_since.get(project_id))
+                  for project_id, project_name in projects.items()),
+                return_exceptions=True,
+            )
             
-            if processed % 20 == 0:
-                logger.info(f"    Processed {processed}/{len(people)} people")
+            people_by_project: Dict[str, Dict[str, str]] = {}
+            for (project_id, project_name), outcome in zip(projects.items(), discovered):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"  Error syncing {project_name}: {outcome}")
+                else:
+                    people_by_project[project_id] = outcome
             
-            # Fetch all entries for this person
-            person_entries = self.fetch_person_entries(person_id)
+            fetch_since: Dict[str, Optional[date]] = {}
+            for project_id, people in people_by_project.items():
+                for person_id in people:
+                    since = person_since.get((project_id, person_id))
+                    fetch_since[person_id] = _earliest(fetch_since.get(person_id, since), since)
             
-            # Calculate PAYROLL hours per day (excludes breaks)
-            daily_payroll = self.calculate_project_payroll_hours(
-                person_id, person_entries, project_id
-            )
+            logger.info(f"  Processing {len(fetch_since)} people for PAYROLL hours...")
             
-            # Create records
-            for date, hours in daily_payroll.items():
-                if hours > 0:
-                    results.append({
-                        "person_id": person_id,
-                        "full_name": person_name,
-                        "project": project_name,
-                        "project_id": project_id,
-                        "entry_date": date,
-                        "logged_hours": round(hours, 2),
-                        "source": "jibble_api_timeentries"
-                    })
-        
-        total_hours = sum(r["logged_hours"] for r in results)
-        logger.info(f"  Completed: {len(results)} records, {total_hours:.2f} total PAYROLL hours")
+            # All people are fetched concurrently; the client's rate limiter paces them
+            fetched = await asyncio.gather(
+                *(self._fetch_person(client, person_id, since) for person_id, since in fetch_since.items()),
+                return_exceptions=True,
+            )
         
-        return results
-    
-    def sync_all_nvidia_projects(self) -> Dict[str, List[Dict]]:
-        """Sync hours for all Nvidia projects."""
-        all_results = {}
+        person_data = {}
+        for person_id, outcome in zip(fetch_since, fetched):
+            if isinstance(outcome, Exception):
+                logger.warning(f"  Error fetching person {person_id}: {outcome}")
+            else:
+                person_data[person_id] = outcome
+        
+        # PAYROLL hours for every (project, person) pair in one batched pass
+        for project_id, people in people_by_project.items():
+            for person_id in people:
+                if person_id in person_data:
+                    self.person_windows[(project_id, person_id)] = person_since.get((project_id, person_id))
+        payroll = project_payroll_hours(
+            {person_id: entries for person_id, (entries, _) in person_data.items()},
+            {person_id: hours for person_id, (_, hours) in person_data.items()},
+            pairs=self.person_windows,
+        )
         
-        for i, (project_id, project_name) in enumerate(NVIDIA_PROJECTS.items()):
-            if i > 0:
-                # Wait between projects to avoid rate limiting
-                logger.info("Waiting 30s before next project to avoid rate limiting...")
-                time.sleep(30)
-            
-            results = self.sync_nvidia_project_hours(project_id, project_name)
-            all_results[project_name] = results
+        all_results = {projects[project_id]: [] for project_id in people_by_project}
+        for project_id, person_id, date_str, hours in payroll.itertuples(index=False):
+            since = self.person_windows[(project_id, person_id)]
+            if since is not None and date_str < since.isoformat():
+                continue
+            all_results[projects[project_id]].append({
+                "person_id": person_id,
+                "full_name": people_by_project[project_id][person_id],
+                "project": projects[project_id],
+                "project_id": project_id,
+                "entry_date": date_str,
+                "logged_hours": float(hours),
+                "source": "jibble_api_timeentries"
+            })
+        
+        for project_id, people in people_by_project.items():
+            # Keep the old project cursor until every person on it was fetched,
+            # so the next run still discovers the ones that failed
+            if all(person_id in person_data for person_id in people):
+                self.project_windows[project_id] = project_since.get(project_id)
+            project_name = projects[project_id]
+            total_hours = sum(r["logged_hours"] for r in all_results[project_name])
+            logger.info(
+                f"  Completed {project_name}: {len(all_results[project_name])} records, "
+                f"{total_hours:.2f} total PAYROLL hours"
+            )
         
         return all_results
+    
+    def sync_nvidia_project_hours(self, project_id: str, project_name: str) -> List[Dict]:
+        """Sync PAYROLL hours for a single Nvidia project."""
+        results = asyncio.run(self.sync_projects({project_id: project_name}))
+        return results.get(project_name, [])
+    
+    def sync_all_nvidia_projects(
+        self,
+        project_since: Optional[Dict[str, date]] = None,
+        person_since: Optional[Dict[Tuple[str, str], date]] = None,
+    ) -> Dict[str, List[Dict]]:
+        """Sync hours for all Nvidia projects (incrementally when start days are given)."""
+        return asyncio.run(self.sync_projects(NVIDIA_PROJECTS, project_since, person_since))
 
 
 def test_sync():
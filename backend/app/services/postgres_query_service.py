@@ -6,9 +6,10 @@ import logging
 from typing import List, Dict, Any, Optional, Set
 from collections import defaultdict
 from sqlalchemy import func
-from google.cloud import bigquery
 
 from app.config import get_settings
+from app.core.bigquery_client import run_query
+from app.core.cache import cached
 from app.services.db_service import get_db_service
 from app.models.db_models import ReviewDetail, Contributor, Task, WorkItem
 
@@ -39,16 +40,13 @@ class PostgresQueryService:
             return self._allowed_quality_dimensions_cache
         
         try:
-            # Initialize BigQuery client
-            client = bigquery.Client(project=self.settings.gcp_project_id)
-            
             query = f"""
             SELECT DISTINCT name 
             FROM `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.project_quality_dimension` 
             WHERE project_id = {self.settings.project_id_filter} AND is_enabled = 1
             """
             
-            results = client.query(query).result()
+            results = run_query(query, operation='allowed_quality_dimensions')
             
             # Store in cache
             self._allowed_quality_dimensions_cache = {row.name for row in results if row.name}
@@ -317,6 +315,7 @@ class PostgresQueryService:
         
         return result
     
+    @cached(prefix="pg_overall_aggregation")
     def get_overall_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get overall aggregation statistics"""
         try:
@@ -420,6 +419,7 @@ class PostgresQueryService:
             logger.error(f"Error getting overall aggregation: {e}")
             raise
     
+    @cached(prefix="pg_domain_aggregation")
     def get_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get domain-wise aggregation statistics"""
         try:
@@ -469,6 +469,7 @@ class PostgresQueryService:
             logger.error(f"Error getting domain aggregation: {e}")
             raise
     
+    @cached(prefix="pg_trainer_aggregation")
     def get_trainer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get trainer-wise aggregation statistics"""
         try:
@@ -526,6 +527,7 @@ class PostgresQueryService:
             logger.error(f"Error getting trainer aggregation: {e}")
             raise
     
+    @cached(prefix="pg_reviewer_aggregation")
     def get_reviewer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewer-wise aggregation statistics"""
         try:
@@ -583,6 +585,7 @@ class PostgresQueryService:
             logger.error(f"Error getting reviewer aggregation: {e}")
             raise
     
+    @cached(prefix="pg_reviewers_with_trainers")
     def get_reviewers_with_trainers(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewers with their trainers nested"""
         try:
@@ -738,6 +741,7 @@ class PostgresQueryService:
             logger.error(f"Error getting reviewers with trainers: {e}")
             raise
     
+    @cached(prefix="pg_task_level_data")
     def get_task_level_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get task-level data with all quality dimensions"""
         try:
@@ -846,6 +850,7 @@ class PostgresQueryService:
             logger.error(f"Error getting task level data: {e}")
             raise
     
+    @cached(prefix="pg_client_delivery_aggregation")
     def get_client_delivery_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get overall aggregation statistics for client delivery (delivered tasks only)
         Count directly from WorkItem table to include ALL delivered work items"""
@@ -971,6 +976,7 @@ class PostgresQueryService:
             logger.error(f"Error getting client delivery aggregation: {e}")
             raise
     
+    @cached(prefix="pg_client_delivery_domain_aggregation")
     def get_client_delivery_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get domain-wise aggregation for client delivery (delivered tasks only)
         Task count based on distinct work_item.task_id"""
@@ -1022,6 +1028,7 @@ class PostgresQueryService:
             logger.error(f"Error getting client delivery domain aggregation: {e}")
             raise
     
+    @cached(prefix="pg_client_delivery_trainer_aggregation")
     def get_client_delivery_trainer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get trainer-wise aggregation for client delivery (delivered tasks only)
         Task count based on distinct work_item.task_id"""
@@ -1083,6 +1090,7 @@ class PostgresQueryService:
             logger.error(f"Error getting client delivery trainer aggregation: {e}")
             raise
     
+    @cached(prefix="pg_client_delivery_reviewer_aggregation")
     def get_client_delivery_reviewer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewer-wise aggregation for client delivery (delivered tasks only)
         Task count based on distinct work_item.task_id"""
@@ -1142,6 +1150,7 @@ class PostgresQueryService:
             logger.error(f"Error getting client delivery reviewer aggregation: {e}")
             raise
     
+    @cached(prefix="pg_delivery_tracker")
     def get_delivery_tracker(self) -> List[Dict[str, Any]]:
         """
         Get delivery tracker information grouped by delivery date
@@ -1180,6 +1189,7 @@ class PostgresQueryService:
             logger.error(f"Error getting delivery tracker: {e}")
             raise
 
+    @cached(prefix="pg_client_delivery_task_wise")
     def get_client_delivery_task_wise(self) -> List[Dict[str, Any]]:
         """
         Get task-wise client delivery information
@@ -15,6 +15,8 @@ from collections import defaultdict
 from typing import Any
 from dotenv import load_dotenv
 
+from app.core.bigquery_client import run_query
+
 logger = logging.getLogger(__name__)
 
 CACHE_TTL_SECONDS = 300  # 5 minutes
@@ -111,7 +113,6 @@ class QualityRubricsService:
     def __init__(self):
         self._cache: dict[str, dict[str, Any]] = {}
         self._cache_times: dict[str, float] = {}
-        self._bq_client = None
 
     # ------------------------------------------------------------------
     # Google Sheet credentials
@@ -202,32 +203,6 @@ class QualityRubricsService:
         self._team_roles_cache_time = now
         return roles
 
-    # ------------------------------------------------------------------
-    # BigQuery client (lazy init)
-    # ------------------------------------------------------------------
-
-    def _get_bq_client(self):
-        if self._bq_client is not None:
-            return self._bq_client
-
-        from google.cloud import bigquery
-        from app.config import get_settings
-
-        settings = get_settings()
-        credentials_path = settings.google_application_credentials
-
-        if credentials_path and os.path.exists(credentials_path):
-            from google.oauth2 import service_account
-            credentials = service_account.Credentials.from_service_account_file(credentials_path)
-            self._bq_client = bigquery.Client(
-                credentials=credentials,
-                project=settings.gcp_project_id,
-            )
-        else:
-            self._bq_client = bigquery.Client(project=settings.gcp_project_id)
-
-        return self._bq_client
-
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
@@ -948,15 +923,13 @@ class QualityRubricsService:
         Prod shows 4 categories with 11 items (all from review.additional_data).
         Quality dimension scores are category-level and not shown as table columns.
         """
-        client = self._get_bq_client()
-
         rubric_categories = list(RUBRIC_CATEGORIES)
 
         team_roles = self._fetch_team_roles()
 
         # 1. Fetch all conversations for this project
         conv_query = self._build_conversations_query(project_id, start_date, end_date)
-        conv_rows = [dict(r) for r in client.query(conv_query).result()]
+        conv_rows = [dict(r) for r in run_query(conv_query, operation="rubrics_conversations")]
 
         conv_map: dict[int, dict[str, Any]] = {}
         for row in conv_rows:
@@ -991,7 +964,7 @@ class QualityRubricsService:
 
         # 2. Fetch additional_data (the actual rubric items shown on prod)
         ad_query = self._build_additional_data_query(project_id, start_date, end_date)
-        ad_rows = [dict(r) for r in client.query(ad_query).result()]
+        ad_rows = [dict(r) for r in run_query(ad_query, operation="rubrics_additional_data")]
         logger.info(f"BigQuery returned {len(ad_rows)} additional_data rows for project {project_id}")
 
         for ad_row in ad_rows:
@@ -1059,7 +1032,7 @@ class QualityRubricsService:
 
         qd_query = self._build_quality_dimensions_query(project_id, start_date, end_date)
         try:
-            qd_rows = [dict(r) for r in client.query(qd_query).result()]
+            qd_rows = [dict(r) for r in run_query(qd_query, operation="rubrics_quality_dimensions")]
             logger.info(f"BigQuery returned {len(qd_rows)} quality dimension rows for project {project_id}")
         except Exception as e:
             logger.warning(f"Quality dimension fallback query failed: {e}")
@@ -1120,7 +1093,7 @@ class QualityRubricsService:
 
         # 2c. Compute batch yield stats from conversation_status_history
         batch_yield_stats, conv_rework = self._compute_batch_yield_stats(
-            client, conv_map, project_id, team_roles, start_date, end_date,
+            conv_map, project_id, team_roles, start_date, end_date,
         )
 
         # 3. Build task_details in the same shape as the sheet parser
@@ -1190,7 +1163,7 @@ class QualityRubricsService:
 
         # 5. Compute daily rollup from BigQuery data
         daily_rollup = self._compute_daily_rollup_from_bq(
-            client, project_id, task_details, team_roles,
+            project_id, task_details, team_roles,
             start_date=start_date, end_date=end_date,
         )
 
@@ -1290,7 +1263,6 @@ class QualityRubricsService:
 
     def _compute_batch_yield_stats(
         self,
-        client: Any,
         conv_map: dict[int, dict[str, Any]],
         project_id: int,
         team_roles: dict[str, str],
@@ -1322,7 +1294,7 @@ class QualityRubricsService:
           {date_filter}
         ORDER BY csh.conversation_id, csh.id ASC
         """
-        history_rows = [dict(r) for r in client.query(history_query).result()]
+        history_rows = [dict(r) for r in run_query(history_query, operation="rubrics_status_history")]
 
         # Set of review IDs that actually triggered a rework in the workflow
         actual_rework_review_ids: set[int] = set()
@@ -1351,7 +1323,7 @@ class QualityRubricsService:
           {date_filter}
         ORDER BY r.conversation_id, r.id ASC
         """
-        review_rows = [dict(r) for r in client.query(review_query).result()]
+        review_rows = [dict(r) for r in run_query(review_query, operation="rubrics_reviews")]
 
         # Map review_id → resolved role
         review_role_map: dict[int, str] = {}
@@ -1515,7 +1487,6 @@ class QualityRubricsService:
 
     def _compute_daily_rollup_from_bq(
         self,
-        client,
         project_id: int,
         task_details: list[dict],
         team_roles: dict[str, str],
@@ -1542,7 +1513,7 @@ class QualityRubricsService:
         GROUP BY c.status
         """
         status_counts: dict[str, int] = {}
-        for row in client.query(status_query).result():
+        for row in run_query(status_query, operation="rubrics_status_counts"):
             status_counts[row["status"]] = row["cnt"]
 
         # L1 Annotations = all tasks that were ever worked on (completed + validated + rework)
@@ -1622,7 +1593,7 @@ class QualityRubricsService:
           {date_filter}
         ORDER BY r.conversation_id, r.submitted_at ASC
         """
-        fpy_rows = list(client.query(fpy_query).result())
+        fpy_rows = run_query(fpy_query, operation="rubrics_fpy")
 
         r_total, r_pass, a_total, a_pass = 0, 0, 0, 0
         seen: dict[int, dict] = {}
@@ -2,14 +2,18 @@
 PostgreSQL query service for nvidia dashboard statistics
 """
 import logging
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from collections import defaultdict
+from itertools import groupby
 from sqlalchemy import func, or_, and_, text
-from google.cloud import bigquery
 
 from app.config import get_settings
+from app.core.bigquery_client import run_query
+from app.core.cache import cached
+from app.core.pagination import PageRequest, paginate
 from app.services.db_service import get_db_service
-from app.models.db_models import ReviewDetail, Contributor, Task, WorkItem, TaskReviewedInfo, TaskAHT, ContributorTaskStats, ContributorDailyStats, ReviewerDailyStats, TaskRaw, TaskHistoryRaw, PodLeadMapping, ReviewerTrainerDailyStats, JibbleHours, TrainerReviewStats, ProjectRevenueWeekly, ProjectCostDaily, ProjectFTECostMonthly
+from app.services.rate_index import get_rate_index
+from app.models.db_models import ReviewDetail, Contributor, Task, WorkItem, TaskReviewedInfo, TaskAHT, ContributorTaskStats, ContributorDailyStats, ReviewerDailyStats, TaskRaw, TaskHistoryRaw, PodLeadMapping, ReviewerTrainerDailyStats, JibbleHours, TrainerReviewStats, ProjectRevenueWeekly, ProjectCostDaily, ProjectFTECostMonthly, TrainerDailyFact, TrainerTaskDailyFact
 from app.constants import get_constants
 
 logger = logging.getLogger(__name__)
@@ -40,7 +44,130 @@ class QueryService:
         if project_ids:
             q = q.filter(TaskRaw.project_id.in_(project_ids))
         return q.subquery()
-    
+
+    @staticmethod
+    def _filter_fact_dates(query, start_date=None, end_date=None, model=TrainerDailyFact):
+        if start_date:
+            query = query.filter(model.fact_date >= start_date)
+        if end_date:
+            query = query.filter(model.fact_date <= end_date)
+        return query
+
+    def _load_trainer_facts(self, session, project_ids, start_date=None, end_date=None) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Per-trainer hierarchy metrics range-summed from the trainer fact tables.
+
+        Keys: unique_tasks, new_tasks, rework, tasks_with_rework plus every
+        TrainerDailyFact measure. in_delivery_queue is the current queue and
+        ignores the date range, like the live query.
+
+        Returns None if the facts haven't been built yet, so callers can fall
+        back to computing the metrics from the raw tables.
+        """
+        if (session.query(TrainerTaskDailyFact.id).first() is None
+                and session.query(TrainerDailyFact.id).first() is None):
+            return None
+
+        from sqlalchemy import case, distinct
+
+        measures = ('sum_turns', 'approved_tasks', 'approved_rework', 'delivered_tasks', 'revenue',
+                    'manual_reviews', 'manual_score', 'agentic_reviews', 'agentic_score')
+        metrics: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            'unique_tasks': 0, 'new_tasks': 0, 'rework': 0, 'tasks_with_rework': 0, 'in_delivery_queue': 0,
+            **{m: 0 for m in measures},
+        })
+
+        task_query = session.query(
+            TrainerTaskDailyFact.trainer_email,
+            func.count(distinct(TrainerTaskDailyFact.task_id)).label('unique_tasks'),
+            func.sum(TrainerTaskDailyFact.new_completions).label('new_tasks'),
+            func.sum(TrainerTaskDailyFact.rework_completions).label('rework'),
+            func.count(distinct(case(
+                (TrainerTaskDailyFact.rework_completions > 0, TrainerTaskDailyFact.task_id),
+                else_=None
+            ))).label('tasks_with_rework'),
+        ).filter(
+            TrainerTaskDailyFact.project_id.in_(project_ids),
+            TrainerTaskDailyFact.trainer_email != '',
+        )
+        task_query = self._filter_fact_dates(task_query, start_date, end_date, TrainerTaskDailyFact)
+        for r in task_query.group_by(TrainerTaskDailyFact.trainer_email).all():
+            m = metrics[r.trainer_email]
+            m['unique_tasks'] = r.unique_tasks or 0
+            m['new_tasks'] = int(r.new_tasks or 0)
+            m['rework'] = int(r.rework or 0)
+            m['tasks_with_rework'] = r.tasks_with_rework or 0
+
+        daily_query = session.query(
+            TrainerDailyFact.trainer_email,
+            *[func.sum(getattr(TrainerDailyFact, name)).label(name) for name in measures]
+        ).filter(TrainerDailyFact.project_id.in_(project_ids))
+        daily_query = self._filter_fact_dates(daily_query, start_date, end_date)
+        for r in daily_query.group_by(TrainerDailyFact.trainer_email).all():
+            m = metrics[r.trainer_email]
+            for name in measures:
+                m[name] = getattr(r, name) or 0
+
+        queue_query = session.query(
+            TrainerDailyFact.trainer_email,
+            func.sum(TrainerDailyFact.in_delivery_queue).label('in_delivery_queue'),
+        ).filter(
+            TrainerDailyFact.project_id.in_(project_ids),
+            TrainerDailyFact.fact_date.is_(None),
+            TrainerDailyFact.in_delivery_queue > 0,
+        ).group_by(TrainerDailyFact.trainer_email)
+        for r in queue_query.all():
+            metrics[r.trainer_email]['in_delivery_queue'] = int(r.in_delivery_queue or 0)
+
+        return dict(metrics)
+
+    def _count_fact_tasks(self, session, project_ids, start_date=None, end_date=None,
+                          trainer_emails: Optional[List[str]] = None) -> tuple:
+        """
+        TRUE (unique_tasks, tasks_with_new, tasks_with_rework) from the task facts.
+
+        Tasks shared by several trainers count once. Without trainer_emails,
+        completions with no author are included (project-level counts).
+        """
+        from sqlalchemy import case, distinct
+
+        query = session.query(
+            func.count(distinct(TrainerTaskDailyFact.task_id)).label('unique_tasks'),
+            func.count(distinct(case(
+                (TrainerTaskDailyFact.new_completions > 0, TrainerTaskDailyFact.task_id),
+                else_=None
+            ))).label('tasks_with_new'),
+            func.count(distinct(case(
+                (TrainerTaskDailyFact.rework_completions > 0, TrainerTaskDailyFact.task_id),
+                else_=None
+            ))).label('tasks_with_rework'),
+        ).filter(TrainerTaskDailyFact.project_id.in_(project_ids))
+        if trainer_emails is not None:
+            query = query.filter(TrainerTaskDailyFact.trainer_email.in_([e.lower().strip() for e in trainer_emails]))
+        result = self._filter_fact_dates(query, start_date, end_date, TrainerTaskDailyFact).one()
+        return result.unique_tasks or 0, result.tasks_with_new or 0, result.tasks_with_rework or 0
+
+    @staticmethod
+    def _fact_history_map(facts: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+        """Trainers with completions in range -> the task_history_raw style counts."""
+        return {
+            email: {k: m[k] for k in ('unique_tasks', 'new_tasks', 'rework', 'tasks_with_rework')}
+            for email, m in facts.items() if m['unique_tasks'] > 0
+        }
+
+    @staticmethod
+    def _fact_measure_map(facts: Dict[str, Dict[str, Any]], measure: str) -> Dict[str, Any]:
+        """Trainer -> measure, for trainers where it's non-zero."""
+        return {email: m[measure] for email, m in facts.items() if m[measure]}
+
+    @staticmethod
+    def _fact_rating_map(facts: Dict[str, Dict[str, Any]], count_key: str, score_key: str) -> Dict[str, Optional[float]]:
+        """Trainer -> average score for trainers with reviews (None without a score)."""
+        return {
+            email: round(float(m[score_key]) / float(m[count_key]), 2) if m[score_key] else None
+            for email, m in facts.items() if m[count_key]
+        }
+
     def _calculate_merged_aht(self, tasks_with_new: int, tasks_with_rework: int, 
                                unique_tasks: int, project_id: int = None) -> Optional[float]:
         """
@@ -99,15 +226,13 @@ class QueryService:
             return self._allowed_quality_dimensions_cache
         
         try:
-            client = bigquery.Client(project=self.settings.gcp_project_id)
-            
             query = f"""
             SELECT DISTINCT name 
             FROM `{self.settings.gcp_project_id}.{self.settings.bigquery_dataset}.project_quality_dimension` 
             WHERE project_id = {self.settings.project_id_filter} AND is_enabled = 1
             """
             
-            results = client.query(query).result()
+            results = run_query(query, operation='allowed_quality_dimensions')
             self._allowed_quality_dimensions_cache = {row.name for row in results if row.name}
             
             logger.info(f"Loaded {len(self._allowed_quality_dimensions_cache)} enabled quality dimensions")
@@ -233,6 +358,7 @@ class QueryService:
         
         return result
     
+    @cached(prefix="overall_aggregation")
     def get_overall_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get overall aggregation statistics"""
         try:
@@ -364,6 +490,7 @@ class QueryService:
             logger.error(f"Error calculating average completion time: {e}")
             return None
     
+    @cached(prefix="domain_aggregation")
     def get_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get domain-wise aggregation statistics"""
         try:
@@ -400,6 +527,7 @@ class QueryService:
             logger.error(f"Error getting domain aggregation: {e}")
             raise
     
+    @cached(prefix="trainer_aggregation")
     def get_trainer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get trainer-wise aggregation statistics"""
         try:
@@ -521,6 +649,7 @@ class QueryService:
             logger.error(f"Error getting completion times by trainer: {e}")
             return {}
     
+    @cached(prefix="pod_lead_aggregation")
     def get_pod_lead_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get POD Lead aggregation with nested reviewers"""
         try:
@@ -682,6 +811,7 @@ class QueryService:
             logger.error(f"Error getting POD Lead aggregation: {e}")
             raise
     
+    @cached(prefix="reviewer_aggregation")
     def get_reviewer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewer-wise aggregation statistics"""
         try:
@@ -725,6 +855,7 @@ class QueryService:
             logger.error(f"Error getting reviewer aggregation: {e}")
             raise
     
+    @cached(prefix="reviewers_with_trainers")
     def get_reviewers_with_trainers(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewers with their trainers nested"""
         try:
@@ -874,17 +1005,20 @@ class QueryService:
             logger.error(f"Error getting reviewers with trainers: {e}")
             raise
     
-    def _get_task_aht_map(self) -> Dict[int, Dict[str, Any]]:
-        """Get task ID to AHT mapping"""
+    def _get_task_aht_map(self, task_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+        """Get task ID to AHT mapping (for ``task_ids`` only, if given)"""
         try:
             with self.db_service.get_session() as session:
-                aht_records = session.query(
+                query = session.query(
                     TaskAHT.task_id,
                     TaskAHT.duration_seconds,
                     TaskAHT.duration_minutes,
                     TaskAHT.start_time,
                     TaskAHT.end_time
-                ).all()
+                )
+                if task_ids is not None:
+                    query = query.filter(TaskAHT.task_id.in_(task_ids))
+                aht_records = query.all()
                 
                 aht_map = {}
                 for record in aht_records:
@@ -952,6 +1086,87 @@ class QueryService:
             logger.error(f"Error getting contributor task stats map: {e}")
             return {}
     
+    # Sort fields for paged task-level reads -> per-task sort key
+    TASK_LEVEL_SORTS = {
+        'task_id': ReviewDetail.conversation_id,
+        'updated_at': func.max(ReviewDetail.updated_at),
+        'task_score': func.max(ReviewDetail.task_score),
+    }
+    
+    def _task_level_query(self, session, filters: Optional[Dict[str, Any]] = None):
+        """Pre-delivery review_detail rows joined to their task, with filters applied"""
+        query = session.query(ReviewDetail, Task.colab_link, Task.week_number, Task.rework_count).outerjoin(
+            Task, ReviewDetail.conversation_id == Task.id
+        ).filter(ReviewDetail.is_delivered == 'False')
+        
+        if filters:
+            if filters.get('domain'):
+                query = query.filter(ReviewDetail.domain == filters['domain'])
+            if filters.get('reviewer'):
+                query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
+            if filters.get('trainer'):
+                query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
+        
+        return query
+    
+    def _build_task_level_rows(self, results, contributor_map, task_aht_map) -> Dict[int, Dict[str, Any]]:
+        """Group review_detail rows into one task-level dict per task, keyed by task ID"""
+        task_data = defaultdict(lambda: {
+            'task_id': None,
+            'task_score': None,
+            'annotator_id': None,
+            'annotator_name': None,
+            'annotator_email': None,
+            'reviewer_id': None,
+            'reviewer_name': None,
+            'reviewer_email': None,
+            'colab_link': None,
+            'updated_at': None,
+            'week_number': None,
+            'rework_count': None,
+            'duration_minutes': None,
+            'quality_dimensions': {}
+        })
+        
+        for row, colab_link, week_number, rework_count in results:
+            task_id = row.conversation_id
+            if not task_id:
+                continue
+            
+            if task_data[task_id]['task_id'] is None:
+                task_data[task_id]['task_id'] = task_id
+                task_data[task_id]['task_score'] = round(float(row.task_score), 2) if row.task_score is not None else None
+                task_data[task_id]['annotator_id'] = row.human_role_id
+                
+                annotator_info = contributor_map.get(row.human_role_id, {})
+                annotator_name = annotator_info.get('name', 'Unknown') if row.human_role_id else 'Unknown'
+                annotator_status = annotator_info.get('status', None)
+                task_data[task_id]['annotator_name'] = self._format_name_with_status(annotator_name, annotator_status) if row.human_role_id else 'Unknown'
+                task_data[task_id]['annotator_email'] = annotator_info.get('email', None) if row.human_role_id else None
+                
+                task_data[task_id]['reviewer_id'] = row.reviewer_id
+                
+                reviewer_info = contributor_map.get(row.reviewer_id, {})
+                reviewer_name = reviewer_info.get('name', 'Unknown') if row.reviewer_id else None
+                reviewer_status = reviewer_info.get('status', None)
+                task_data[task_id]['reviewer_name'] = self._format_name_with_status(reviewer_name, reviewer_status) if row.reviewer_id else None
+                task_data[task_id]['reviewer_email'] = reviewer_info.get('email', None) if row.reviewer_id else None
+                
+                task_data[task_id]['colab_link'] = colab_link
+                task_data[task_id]['updated_at'] = row.updated_at.isoformat() if row.updated_at else None
+                task_data[task_id]['week_number'] = week_number
+                task_data[task_id]['rework_count'] = rework_count
+                
+                # Add AHT data
+                aht_info = task_aht_map.get(task_id, {})
+                task_data[task_id]['duration_minutes'] = aht_info.get('duration_minutes')
+            
+            if row.name and row.score is not None:
+                task_data[task_id]['quality_dimensions'][row.name] = round(float(row.score), 2)
+        
+        return task_data
+    
+    @cached(prefix="task_level_data")
     def get_task_level_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get task-level data with all quality dimensions and AHT"""
         try:
@@ -959,72 +1174,8 @@ class QueryService:
             task_aht_map = self._get_task_aht_map()
             
             with self.db_service.get_session() as session:
-                query = session.query(ReviewDetail, Task.colab_link, Task.week_number, Task.rework_count).outerjoin(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).filter(ReviewDetail.is_delivered == 'False')
-                
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                
-                results = query.all()
-                
-                task_data = defaultdict(lambda: {
-                    'task_id': None,
-                    'task_score': None,
-                    'annotator_id': None,
-                    'annotator_name': None,
-                    'annotator_email': None,
-                    'reviewer_id': None,
-                    'reviewer_name': None,
-                    'reviewer_email': None,
-                    'colab_link': None,
-                    'updated_at': None,
-                    'week_number': None,
-                    'rework_count': None,
-                    'duration_minutes': None,
-                    'quality_dimensions': {}
-                })
-                
-                for row, colab_link, week_number, rework_count in results:
-                    task_id = row.conversation_id
-                    if not task_id:
-                        continue
-                    
-                    if task_data[task_id]['task_id'] is None:
-                        task_data[task_id]['task_id'] = task_id
-                        task_data[task_id]['task_score'] = round(float(row.task_score), 2) if row.task_score is not None else None
-                        task_data[task_id]['annotator_id'] = row.human_role_id
-                        
-                        annotator_info = contributor_map.get(row.human_role_id, {})
-                        annotator_name = annotator_info.get('name', 'Unknown') if row.human_role_id else 'Unknown'
-                        annotator_status = annotator_info.get('status', None)
-                        task_data[task_id]['annotator_name'] = self._format_name_with_status(annotator_name, annotator_status) if row.human_role_id else 'Unknown'
-                        task_data[task_id]['annotator_email'] = annotator_info.get('email', None) if row.human_role_id else None
-                        
-                        task_data[task_id]['reviewer_id'] = row.reviewer_id
-                        
-                        reviewer_info = contributor_map.get(row.reviewer_id, {})
-                        reviewer_name = reviewer_info.get('name', 'Unknown') if row.reviewer_id else None
-                        reviewer_status = reviewer_info.get('status', None)
-                        task_data[task_id]['reviewer_name'] = self._format_name_with_status(reviewer_name, reviewer_status) if row.reviewer_id else None
-                        task_data[task_id]['reviewer_email'] = reviewer_info.get('email', None) if row.reviewer_id else None
-                        
-                        task_data[task_id]['colab_link'] = colab_link
-                        task_data[task_id]['updated_at'] = row.updated_at.isoformat() if row.updated_at else None
-                        task_data[task_id]['week_number'] = week_number
-                        task_data[task_id]['rework_count'] = rework_count
-                        
-                        # Add AHT data
-                        aht_info = task_aht_map.get(task_id, {})
-                        task_data[task_id]['duration_minutes'] = aht_info.get('duration_minutes')
-                    
-                    if row.name and row.score is not None:
-                        task_data[task_id]['quality_dimensions'][row.name] = round(float(row.score), 2)
+                results = self._task_level_query(session, filters).all()
+                task_data = self._build_task_level_rows(results, contributor_map, task_aht_map)
                 
                 result = list(task_data.values())
                 result.sort(key=lambda x: x['task_id'])
@@ -1034,6 +1185,91 @@ class QueryService:
             logger.error(f"Error getting task level data: {e}")
             raise
     
+    @cached(prefix="task_level_page")
+    def get_task_level_page(self, filters: Optional[Dict[str, Any]], page: PageRequest) -> Dict[str, Any]:
+        """
+        One keyset page of task-level data, sorted server-side.
+        
+        Task IDs for the page are selected first (grouped, sorted and limited
+        in SQL); review rows and AHT are then loaded for those tasks only.
+        """
+        try:
+            contributor_map = self._get_contributor_map()
+            
+            with self.db_service.get_session() as session:
+                keys = self._task_level_query(session, filters).with_entities(
+                    ReviewDetail.conversation_id.label('task_id'),
+                    self.TASK_LEVEL_SORTS[page.sort].label('sort_value')
+                ).filter(
+                    ReviewDetail.conversation_id.isnot(None)
+                ).group_by(ReviewDetail.conversation_id).subquery()
+                
+                task_page = paginate(
+                    session.query(keys.c.task_id, keys.c.sort_value),
+                    keys.c.sort_value, keys.c.task_id, page,
+                    key=lambda row: (row.sort_value, row.task_id),
+                    nullable=page.sort != 'task_id'
+                )
+                task_ids = [row.task_id for row in task_page.items]
+                
+                rows = {}
+                if task_ids:
+                    results = self._task_level_query(session, filters).filter(
+                        ReviewDetail.conversation_id.in_(task_ids)
+                    ).all()
+                    rows = self._build_task_level_rows(results, contributor_map, self._get_task_aht_map(task_ids))
+                
+                return task_page.to_dict([rows[task_id] for task_id in task_ids])
+        except Exception as e:
+            logger.error(f"Error getting task level page: {e}")
+            raise
+
+    def iter_task_level_rows(self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Task-level rows in task ID order, streamed for exports.
+
+        Review rows are read with ``yield_per`` (a server-side cursor on
+        PostgreSQL) ordered by task, so each task's rows are consecutive.
+        Tasks are emitted in batches of ``batch_size``, loading AHT for one
+        batch at a time.
+        """
+        contributor_map = self._get_contributor_map()
+
+        with self.db_service.get_session() as session:
+            results = self._task_level_query(session, filters).filter(
+                ReviewDetail.conversation_id.isnot(None)
+            ).order_by(ReviewDetail.conversation_id, ReviewDetail.id).yield_per(batch_size)
+
+            batch = []
+            for _, task_rows in groupby(results, key=lambda result: result[0].conversation_id):
+                batch.append(list(task_rows))
+                if len(batch) >= batch_size:
+                    yield from self._task_level_batch(batch, contributor_map)
+                    batch = []
+            if batch:
+                yield from self._task_level_batch(batch, contributor_map)
+
+    def _task_level_batch(self, batch, contributor_map) -> Iterator[Dict[str, Any]]:
+        """Task-level rows for a batch of per-task review row groups"""
+        task_ids = [task_rows[0][0].conversation_id for task_rows in batch]
+        rows = self._build_task_level_rows(
+            [result for task_rows in batch for result in task_rows],
+            contributor_map,
+            self._get_task_aht_map(task_ids)
+        )
+        for task_id in task_ids:
+            yield rows[task_id]
+
+    def get_task_level_dimensions(self, filters: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Sorted quality dimension names present in the task-level data (export columns)"""
+        with self.db_service.get_session() as session:
+            names = self._task_level_query(session, filters).with_entities(ReviewDetail.name).filter(
+                ReviewDetail.name.isnot(None),
+                ReviewDetail.score.isnot(None)
+            ).distinct().all()
+            return sorted(row.name for row in names)
+
+    @cached(prefix="trainer_daily_stats")
     def get_trainer_daily_stats(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get trainer stats at date level - trainer x date granularity
@@ -1054,116 +1290,189 @@ class QueryService:
                 
                 daily_stats = query.all()
                 
-                # Get sum_turns per trainer per date from task_raw
-                # Filter by derived_status (column AP) IN ('Completed', 'Reviewed', 'Rework', 'Validated')
-                task_raw_query = session.query(
-                    TaskRaw.trainer,
-                    TaskRaw.last_completed_date,
-                    func.count(TaskRaw.task_id).label('unique_tasks_raw'),
-                    func.sum(TaskRaw.number_of_turns).label('sum_turns')
-                ).filter(
-                    TaskRaw.derived_status.in_(['Completed', 'Reviewed', 'Rework', 'Validated']),
-                    TaskRaw.last_completed_date.isnot(None)
+                return self._trainer_daily_rows(session, daily_stats, contributor_map, effective_project_id)
+        except Exception as e:
+            logger.error(f"Error getting trainer daily stats: {e}")
+            raise
+    
+    # Sort fields for paged trainer-daily reads
+    TRAINER_DAILY_SORTS = {
+        'submission_date': ContributorDailyStats.submission_date,
+        'trainer_id': ContributorDailyStats.contributor_id,
+        'total_submissions': ContributorDailyStats.total_submissions,
+    }
+    
+    @cached(prefix="trainer_daily_stats_page")
+    def get_trainer_daily_stats_page(self, filters: Optional[Dict[str, Any]], page: PageRequest) -> Dict[str, Any]:
+        """
+        One keyset page of trainer x date stats, filtered and sorted server-side.
+        
+        Filters: trainer (contributor ID), start_date, end_date, project_id.
+        The task_raw turn and rating rollups are only computed for the
+        trainers and dates on the page.
+        """
+        try:
+            filters = filters or {}
+            contributor_map = self._get_contributor_map()
+            project_id = filters.get('project_id')
+            effective_project_id = project_id if project_id is not None else self.settings.project_id_filter
+            
+            with self.db_service.get_session() as session:
+                query = session.query(ContributorDailyStats)
+                if filters.get('trainer'):
+                    query = query.filter(ContributorDailyStats.contributor_id == int(filters['trainer']))
+                if filters.get('start_date'):
+                    query = query.filter(ContributorDailyStats.submission_date >= filters['start_date'])
+                if filters.get('end_date'):
+                    query = query.filter(ContributorDailyStats.submission_date <= filters['end_date'])
+                
+                sort_column = self.TRAINER_DAILY_SORTS[page.sort]
+                stats_page = paginate(
+                    query, sort_column, ContributorDailyStats.id, page,
+                    key=lambda stat: (getattr(stat, sort_column.key), stat.id)
                 )
                 
-                # Apply project filter
-                if effective_project_id is not None:
-                    task_raw_query = task_raw_query.filter(TaskRaw.project_id == effective_project_id)
-                
-                task_raw_daily = task_raw_query.group_by(TaskRaw.trainer, TaskRaw.last_completed_date).all()
-                
-                # Build trainer+date to task_raw stats map
-                task_raw_map = {}
-                for tr in task_raw_daily:
-                    if tr.trainer and tr.last_completed_date:
-                        key = (tr.trainer, tr.last_completed_date.isoformat())
-                        task_raw_map[key] = {
-                            'unique_tasks_raw': tr.unique_tasks_raw or 0,
-                            'sum_turns': tr.sum_turns or 0
-                        }
-                
-                # Get avg_rating per trainer per date from task_raw
-                # Formula: SUM(sum_score) / SUM(count_reviews) WHERE count_reviews > 0 AND sum_followup_required = 0
-                rating_query = session.query(
-                    TaskRaw.trainer,
-                    TaskRaw.last_completed_date,
-                    func.sum(TaskRaw.sum_score).label('total_score'),
-                    func.sum(TaskRaw.count_reviews).label('total_reviews')
-                ).filter(
-                    TaskRaw.count_reviews > 0,
-                    # Removed sum_followup_required filter to include tasks sent to rework
-                    TaskRaw.last_completed_date.isnot(None)
+                emails = {contributor_map.get(stat.contributor_id, {}).get('email') for stat in stats_page.items}
+                dates = {stat.submission_date for stat in stats_page.items}
+                rows = self._trainer_daily_rows(
+                    session, stats_page.items, contributor_map, effective_project_id,
+                    emails=emails - {None}, dates=dates - {None}
                 )
-                
-                # Apply project filter
-                if effective_project_id is not None:
-                    rating_query = rating_query.filter(TaskRaw.project_id == effective_project_id)
-                
-                rating_daily = rating_query.group_by(TaskRaw.trainer, TaskRaw.last_completed_date).all()
-                
-                # Build trainer+date to rating map
-                rating_map = {}
-                for r in rating_daily:
-                    if r.trainer and r.last_completed_date:
-                        key = (r.trainer, r.last_completed_date.isoformat())
-                        total_score = r.total_score or 0
-                        total_reviews = r.total_reviews or 0
-                        avg_rating = round(total_score / total_reviews, 2) if total_reviews > 0 else None
-                        rating_map[key] = avg_rating
-                
-                result = []
-                for stat in daily_stats:
-                    contributor_info = contributor_map.get(stat.contributor_id, {})
-                    name = contributor_info.get('name', 'Unknown')
-                    status = contributor_info.get('status', None)
-                    email = contributor_info.get('email')
-                    
-                    new_tasks = stat.new_tasks_submitted or 0
-                    rework = stat.rework_submitted or 0
-                    unique_tasks = stat.unique_tasks or 0
-                    
-                    # Get task_raw stats for this trainer on this date
-                    date_str = stat.submission_date.isoformat() if stat.submission_date else None
-                    tr_stats = task_raw_map.get((email, date_str), {})
-                    unique_tasks_from_raw = tr_stats.get('unique_tasks_raw', 0)
-                    sum_turns = tr_stats.get('sum_turns', 0)
-                    
-                    # Avg Rework = ((total_completions / unique_tasks) - 1) * 100
-                    # Where total_completions = new_tasks + rework
-                    avg_rework = None
-                    total_completions = new_tasks + rework
-                    if unique_tasks > 0:
-                        avg_rework = round((total_completions / unique_tasks) - 1, 2)
-                    
-                    # Rework % = rework / (rework + new_tasks) * 100
-                    rework_percent = None
-                    if (rework + new_tasks) > 0:
-                        rework_percent = round((rework / (rework + new_tasks)) * 100, 0)
-                    
-                    # Get avg_rating for this trainer on this date
-                    avg_rating = rating_map.get((email, date_str))
-                    
-                    result.append({
-                        'trainer_id': stat.contributor_id,
-                        'trainer_name': self._format_name_with_status(name, status),
-                        'trainer_email': email,
-                        'submission_date': date_str,
-                        'new_tasks_submitted': new_tasks,
-                        'rework_submitted': rework,
-                        'total_submissions': stat.total_submissions or 0,
-                        'unique_tasks': unique_tasks_from_raw if unique_tasks_from_raw > 0 else unique_tasks,
-                        'tasks_ready_for_delivery': getattr(stat, 'tasks_ready_for_delivery', 0) or 0,
-                        'sum_number_of_turns': sum_turns,
-                        'avg_rework': avg_rework,
-                        'rework_percent': rework_percent,
-                        'avg_rating': avg_rating,
-                    })
-                
-                return result
+                return stats_page.to_dict(rows)
         except Exception as e:
-            logger.error(f"Error getting trainer daily stats: {e}")
+            logger.error(f"Error getting trainer daily stats page: {e}")
             raise
     
+    def _trainer_daily_rows(
+        self,
+        session,
+        daily_stats,
+        contributor_map: Dict[int, Dict[str, Any]],
+        effective_project_id: Optional[int],
+        emails: Optional[Set[str]] = None,
+        dates: Optional[Set[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Trainer x date rows for ContributorDailyStats records, with task_raw turns and ratings.
+        
+        ``emails`` / ``dates`` limit the task_raw rollups to the trainers and
+        dates that will actually be looked up.
+        """
+        scope = []
+        if emails is not None:
+            scope.append(TaskRaw.trainer.in_(emails))
+        if dates is not None:
+            scope.append(TaskRaw.last_completed_date.in_(dates))
+    
+        # Get sum_turns per trainer per date from task_raw
+        # Filter by derived_status (column AP) IN ('Completed', 'Reviewed', 'Rework', 'Validated')
+        task_raw_query = session.query(
+            TaskRaw.trainer,
+            TaskRaw.last_completed_date,
+            func.count(TaskRaw.task_id).label('unique_tasks_raw'),
+            func.sum(TaskRaw.number_of_turns).label('sum_turns')
+        ).filter(
+            TaskRaw.derived_status.in_(['Completed', 'Reviewed', 'Rework', 'Validated']),
+            TaskRaw.last_completed_date.isnot(None),
+            *scope
+        )
+        
+        # Apply project filter
+        if effective_project_id is not None:
+            task_raw_query = task_raw_query.filter(TaskRaw.project_id == effective_project_id)
+        
+        task_raw_daily = task_raw_query.group_by(TaskRaw.trainer, TaskRaw.last_completed_date).all()
+        
+        # Build trainer+date to task_raw stats map
+        task_raw_map = {}
+        for tr in task_raw_daily:
+            if tr.trainer and tr.last_completed_date:
+                key = (tr.trainer, tr.last_completed_date.isoformat())
+                task_raw_map[key] = {
+                    'unique_tasks_raw': tr.unique_tasks_raw or 0,
+                    'sum_turns': tr.sum_turns or 0
+                }
+        
+        # Get avg_rating per trainer per date from task_raw
+        # Formula: SUM(sum_score) / SUM(count_reviews) WHERE count_reviews > 0 AND sum_followup_required = 0
+        rating_query = session.query(
+            TaskRaw.trainer,
+            TaskRaw.last_completed_date,
+            func.sum(TaskRaw.sum_score).label('total_score'),
+            func.sum(TaskRaw.count_reviews).label('total_reviews')
+        ).filter(
+            TaskRaw.count_reviews > 0,
+            # Removed sum_followup_required filter to include tasks sent to rework
+            TaskRaw.last_completed_date.isnot(None),
+            *scope
+        )
+        
+        # Apply project filter
+        if effective_project_id is not None:
+            rating_query = rating_query.filter(TaskRaw.project_id == effective_project_id)
+        
+        rating_daily = rating_query.group_by(TaskRaw.trainer, TaskRaw.last_completed_date).all()
+        
+        # Build trainer+date to rating map
+        rating_map = {}
+        for r in rating_daily:
+            if r.trainer and r.last_completed_date:
+                key = (r.trainer, r.last_completed_date.isoformat())
+                total_score = r.total_score or 0
+                total_reviews = r.total_reviews or 0
+                avg_rating = round(total_score / total_reviews, 2) if total_reviews > 0 else None
+                rating_map[key] = avg_rating
+        
+        result = []
+        for stat in daily_stats:
+            contributor_info = contributor_map.get(stat.contributor_id, {})
+            name = contributor_info.get('name', 'Unknown')
+            status = contributor_info.get('status', None)
+            email = contributor_info.get('email')
+            
+            new_tasks = stat.new_tasks_submitted or 0
+            rework = stat.rework_submitted or 0
+            unique_tasks = stat.unique_tasks or 0
+            
+            # Get task_raw stats for this trainer on this date
+            date_str = stat.submission_date.isoformat() if stat.submission_date else None
+            tr_stats = task_raw_map.get((email, date_str), {})
+            unique_tasks_from_raw = tr_stats.get('unique_tasks_raw', 0)
+            sum_turns = tr_stats.get('sum_turns', 0)
+            
+            # Avg Rework = ((total_completions / unique_tasks) - 1) * 100
+            # Where total_completions = new_tasks + rework
+            avg_rework = None
+            total_completions = new_tasks + rework
+            if unique_tasks > 0:
+                avg_rework = round((total_completions / unique_tasks) - 1, 2)
+            
+            # Rework % = rework / (rework + new_tasks) * 100
+            rework_percent = None
+            if (rework + new_tasks) > 0:
+                rework_percent = round((rework / (rework + new_tasks)) * 100, 0)
+            
+            # Get avg_rating for this trainer on this date
+            avg_rating = rating_map.get((email, date_str))
+            
+            result.append({
+                'trainer_id': stat.contributor_id,
+                'trainer_name': self._format_name_with_status(name, status),
+                'trainer_email': email,
+                'submission_date': date_str,
+                'new_tasks_submitted': new_tasks,
+                'rework_submitted': rework,
+                'total_submissions': stat.total_submissions or 0,
+                'unique_tasks': unique_tasks_from_raw if unique_tasks_from_raw > 0 else unique_tasks,
+                'tasks_ready_for_delivery': getattr(stat, 'tasks_ready_for_delivery', 0) or 0,
+                'sum_number_of_turns': sum_turns,
+                'avg_rework': avg_rework,
+                'rework_percent': rework_percent,
+                'avg_rating': avg_rating,
+            })
+        
+        return result
+    
+    @cached(prefix="trainer_overall_stats")
     def get_trainer_overall_stats(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get overall trainer stats using:
@@ -1555,6 +1864,7 @@ class QueryService:
             logger.error(f"Error getting trainer overall stats: {e}")
             raise
     
+    @cached(prefix="reviewer_daily_stats")
     def get_reviewer_daily_stats(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewer stats at date level - reviewer x date granularity"""
         try:
@@ -1643,6 +1953,7 @@ class QueryService:
             logger.error(f"Error getting reviewer daily stats: {e}")
             raise
     
+    @cached(prefix="trainers_by_reviewer_date")
     def get_trainers_by_reviewer_date(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get trainers reviewed by each reviewer on each date with full metrics"""
         try:
@@ -1734,6 +2045,7 @@ class QueryService:
             logger.error(f"Error getting trainers by reviewer date: {e}")
             raise
 
+    @cached(prefix="rating_trends")
     def get_rating_trends(self, trainer_email: str = None, granularity: str = "weekly") -> Dict[str, Any]:
         """Get rating trends over time"""
         try:
@@ -1852,6 +2164,7 @@ class QueryService:
             logger.error(f"Error getting rating trends: {e}")
             raise
 
+    @cached(prefix="rating_comparison")
     def get_rating_comparison(self, period1_start: str, period1_end: str, 
                                period2_start: str, period2_end: str,
                                trainer_email: str = None) -> Dict[str, Any]:
@@ -1993,6 +2306,7 @@ class QueryService:
             logger.error(f"Error getting rating comparison: {e}")
             raise
 
+    @cached(prefix="pod_lead_stats")
     def get_pod_lead_stats_with_trainers(self, start_date: str = None, end_date: str = None, timeframe: str = 'overall', project_id: int = None) -> List[Dict[str, Any]]:
         """
         Get POD Lead stats with trainers under each POD Lead.
@@ -2037,450 +2351,438 @@ class QueryService:
                 logger.info(f"Found {len(trainer_to_pod)} trainer-pod mappings, {len(pod_trainers)} unique POD Leads, filtering by project_id: {filter_project_ids}")
                 
                 # ---------------------------------------------------------
-                # STEP 1: Get metrics from task_history_raw using actual author
-                # Only count tasks whose current derived_status is still in the completed pipeline
+                # STEPS 1-5: Task, approval, delivery, revenue and review metrics
+                # Range-summed from the trainer fact tables built at sync time;
+                # computed from the raw tables below until they have been built.
                 # ---------------------------------------------------------
-                valid_tasks_pod = self._valid_task_ids_subquery(session, filter_project_ids)
+                facts = self._load_trainer_facts(session, filter_project_ids, start_date, end_date)
+                
+                if facts is not None:
+                    trainer_history = self._fact_history_map(facts)
+                    trainer_turns = self._fact_measure_map(facts, 'sum_turns')
+                    trainer_approved = self._fact_measure_map(facts, 'approved_tasks')
+                    trainer_approved_rework = self._fact_measure_map(facts, 'approved_rework')
+                    trainer_delivered = self._fact_measure_map(facts, 'delivered_tasks')
+                    trainer_in_queue = self._fact_measure_map(facts, 'in_delivery_queue')
+                    trainer_revenue = self._fact_measure_map(facts, 'revenue')
+                    trainer_total_reviews = self._fact_measure_map(facts, 'manual_reviews')
+                    trainer_total_scores = {e: facts[e]['manual_score'] for e in trainer_total_reviews}
+                    trainer_ratings = {
+                        e: r for e, r in self._fact_rating_map(facts, 'manual_reviews', 'manual_score').items() if r is not None
+                    }
+                    trainer_agentic_reviews = self._fact_measure_map(facts, 'agentic_reviews')
+                    trainer_agentic_scores = {e: facts[e]['agentic_score'] for e in trainer_agentic_reviews}
+                    trainer_agentic_ratings = {
+                        e: r for e, r in self._fact_rating_map(facts, 'agentic_reviews', 'agentic_score').items() if r is not None
+                    }
+                    logger.info(f"Loaded fact metrics for {len(facts)} trainers")
+                else:
+                    # ---------------------------------------------------------
+                    # STEP 1: Get metrics from task_history_raw using actual author
+                    # Only count tasks whose current derived_status is still in the completed pipeline
+                    # ---------------------------------------------------------
+                    valid_tasks_pod = self._valid_task_ids_subquery(session, filter_project_ids)
                 
-                history_query = session.query(
-                    TaskHistoryRaw.author,
-                    func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks'),
-                    func.sum(case(
-                        (TaskHistoryRaw.completed_status_count == 1, 1),
-                        else_=0
-                    )).label('new_tasks'),
-                    func.sum(case(
-                        (TaskHistoryRaw.completed_status_count > 1, 1),
-                        else_=0
-                    )).label('rework'),
-                    func.count(distinct(case(
-                        (TaskHistoryRaw.completed_status_count > 1, TaskHistoryRaw.task_id),
-                        else_=None
-                    ))).label('tasks_with_rework')
-                ).filter(
-                    TaskHistoryRaw.new_status == 'completed',
-                    TaskHistoryRaw.old_status != 'completed-approval',
-                    TaskHistoryRaw.project_id.in_(filter_project_ids),
-                    TaskHistoryRaw.author.isnot(None),
-                    TaskHistoryRaw.task_id.in_(session.query(valid_tasks_pod))
-                )
+                    history_query = session.query(
+                        TaskHistoryRaw.author,
+                        func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks'),
+                        func.sum(case(
+                            (TaskHistoryRaw.completed_status_count == 1, 1),
+                            else_=0
+                        )).label('new_tasks'),
+                        func.sum(case(
+                            (TaskHistoryRaw.completed_status_count > 1, 1),
+                            else_=0
+                        )).label('rework'),
+                        func.count(distinct(case(
+                            (TaskHistoryRaw.completed_status_count > 1, TaskHistoryRaw.task_id),
+                            else_=None
+                        ))).label('tasks_with_rework')
+                    ).filter(
+                        TaskHistoryRaw.new_status == 'completed',
+                        TaskHistoryRaw.old_status != 'completed-approval',
+                        TaskHistoryRaw.project_id.in_(filter_project_ids),
+                        TaskHistoryRaw.author.isnot(None),
+                        TaskHistoryRaw.task_id.in_(session.query(valid_tasks_pod))
+                    )
                 
-                # Apply date filters on task_history_raw.date
-                if start_date:
-                    history_query = history_query.filter(TaskHistoryRaw.date >= start_date)
-                if end_date:
-                    history_query = history_query.filter(TaskHistoryRaw.date <= end_date)
+                    # Apply date filters on task_history_raw.date
+                    if start_date:
+                        history_query = history_query.filter(TaskHistoryRaw.date >= start_date)
+                    if end_date:
+                        history_query = history_query.filter(TaskHistoryRaw.date <= end_date)
                 
-                history_query = history_query.group_by(TaskHistoryRaw.author)
-                history_results = history_query.all()
+                    history_query = history_query.group_by(TaskHistoryRaw.author)
+                    history_results = history_query.all()
                 
-                # Build trainer email to history stats map
-                trainer_history = {}
-                for hs in history_results:
-                    if hs.author:
-                        email = hs.author.lower().strip()
-                        trainer_history[email] = {
-                            'unique_tasks': hs.unique_tasks or 0,
-                            'new_tasks': hs.new_tasks or 0,
-                            'rework': hs.rework or 0,
-                            'tasks_with_rework': hs.tasks_with_rework or 0  # NEW: unique tasks with rework
-                        }
+                    # Build trainer email to history stats map
+                    trainer_history = {}
+                    for hs in history_results:
+                        if hs.author:
+                            email = hs.author.lower().strip()
+                            trainer_history[email] = {
+                                'unique_tasks': hs.unique_tasks or 0,
+                                'new_tasks': hs.new_tasks or 0,
+                                'rework': hs.rework or 0,
+                                'tasks_with_rework': hs.tasks_with_rework or 0  # NEW: unique tasks with rework
+                            }
                 
-                logger.info(f"Found history stats for {len(trainer_history)} trainers")
+                    logger.info(f"Found history stats for {len(trainer_history)} trainers")
                 
-                # ---------------------------------------------------------
-                # STEP 2: Get sum_turns from task_raw for avg_rework calculation
-                # Filter by derived_status (column AP) IN ('Completed', 'Reviewed', 'Rework', 'Validated')
-                # Formula: (SUM(number_of_turns) / unique_tasks) - 1
-                # ---------------------------------------------------------
-                task_raw_query = session.query(
-                    TaskRaw.trainer,
-                    func.sum(TaskRaw.number_of_turns).label('sum_turns')
-                ).filter(
-                    TaskRaw.derived_status.in_(['Completed', 'Reviewed', 'Rework', 'Validated']),
-                    TaskRaw.last_completed_date.isnot(None),
-                    TaskRaw.project_id.in_(filter_project_ids)
-                )
+                    # ---------------------------------------------------------
+                    # STEP 2: Get sum_turns from task_raw for avg_rework calculation
+                    # Filter by derived_status (column AP) IN ('Completed', 'Reviewed', 'Rework', 'Validated')
+                    # Formula: (SUM(number_of_turns) / unique_tasks) - 1
+                    # ---------------------------------------------------------
+                    task_raw_query = session.query(
+                        TaskRaw.trainer,
+                        func.sum(TaskRaw.number_of_turns).label('sum_turns')
+                    ).filter(
+                        TaskRaw.derived_status.in_(['Completed', 'Reviewed', 'Rework', 'Validated']),
+                        TaskRaw.last_completed_date.isnot(None),
+                        TaskRaw.project_id.in_(filter_project_ids)
+                    )
                 
-                if start_date:
-                    task_raw_query = task_raw_query.filter(TaskRaw.last_completed_date >= start_date)
-                if end_date:
-                    task_raw_query = task_raw_query.filter(TaskRaw.last_completed_date <= end_date)
+                    if start_date:
+                        task_raw_query = task_raw_query.filter(TaskRaw.last_completed_date >= start_date)
+                    if end_date:
+                        task_raw_query = task_raw_query.filter(TaskRaw.last_completed_date <= end_date)
                 
-                task_raw_query = task_raw_query.group_by(TaskRaw.trainer)
-                task_raw_results = task_raw_query.all()
+                    task_raw_query = task_raw_query.group_by(TaskRaw.trainer)
+                    task_raw_results = task_raw_query.all()
                 
-                trainer_turns = {}
-                for tr in task_raw_results:
-                    if tr.trainer:
-                        email = tr.trainer.lower().strip()
-                        trainer_turns[email] = tr.sum_turns or 0
+                    trainer_turns = {}
+                    for tr in task_raw_results:
+                        if tr.trainer:
+                            email = tr.trainer.lower().strip()
+                            trainer_turns[email] = tr.sum_turns or 0
                 
-                # ---------------------------------------------------------
-                # STEP 3: Get Approved Tasks with proper attribution
-                # 
-                # Approved Task = task_status='completed', count_reviews > 0, review_action_type != 'rework'
-                # 
-                # Attribution RULE:
-                # - Find the FIRST author (who originally completed the task)
-                # - Find the LAST completer (who completed it when it got approved)
-                # - If FIRST author == LAST completer → Approved (original owner got it approved)
-                # - If FIRST author != LAST completer → Approved Rework (someone else fixed it)
-                #
-                # This ensures:
-                # - Trainer A completes → approved → A gets "Approved"
-                # - Trainer A completes → rejected → A reworks → approved → A gets "Approved" (A is first author)
-                # - Trainer A completes → rejected → B reworks → approved → B gets "Approved Rework" (B is not first author)
-                # ---------------------------------------------------------
+                    # ---------------------------------------------------------
+                    # STEP 3: Get Approved Tasks with proper attribution
+                    # 
+                    # Approved Task = task_status='completed', count_reviews > 0, review_action_type != 'rework'
+                    # 
+                    # Attribution RULE:
+                    # - Find the FIRST author (who originally completed the task)
+                    # - Find the LAST completer (who completed it when it got approved)
+                    # - If FIRST author == LAST completer → Approved (original owner got it approved)
+                    # - If FIRST author != LAST completer → Approved Rework (someone else fixed it)
+                    #
+                    # This ensures:
+                    # - Trainer A completes → approved → A gets "Approved"
+                    # - Trainer A completes → rejected → A reworks → approved → A gets "Approved" (A is first author)
+                    # - Trainer A completes → rejected → B reworks → approved → B gets "Approved Rework" (B is not first author)
+                    # ---------------------------------------------------------
                 
-                # First, get list of approved task IDs
-                approved_tasks_subquery = session.query(
-                    TaskRaw.task_id
-                ).filter(
-                    func.lower(TaskRaw.task_status) == 'completed',
-                    TaskRaw.count_reviews > 0,
-                    or_(
-                        TaskRaw.review_action_type != 'rework',
-                        TaskRaw.review_action_type.is_(None)
-                    ),
-                    TaskRaw.project_id.in_(filter_project_ids)
-                )
+                    # First, get list of approved task IDs
+                    approved_tasks_subquery = session.query(
+                        TaskRaw.task_id
+                    ).filter(
+                        func.lower(TaskRaw.task_status) == 'completed',
+                        TaskRaw.count_reviews > 0,
+                        or_(
+                            TaskRaw.review_action_type != 'rework',
+                            TaskRaw.review_action_type.is_(None)
+                        ),
+                        TaskRaw.project_id.in_(filter_project_ids)
+                    )
                 
-                if start_date:
-                    approved_tasks_subquery = approved_tasks_subquery.filter(TaskRaw.last_completed_date >= start_date)
-                if end_date:
-                    approved_tasks_subquery = approved_tasks_subquery.filter(TaskRaw.last_completed_date <= end_date)
+                    if start_date:
+                        approved_tasks_subquery = approved_tasks_subquery.filter(TaskRaw.last_completed_date >= start_date)
+                    if end_date:
+                        approved_tasks_subquery = approved_tasks_subquery.filter(TaskRaw.last_completed_date <= end_date)
                 
-                approved_task_ids = [r.task_id for r in approved_tasks_subquery.all()]
+                    approved_task_ids = [r.task_id for r in approved_tasks_subquery.all()]
                 
-                logger.info(f"Found {len(approved_task_ids)} approved tasks")
+                    logger.info(f"Found {len(approved_task_ids)} approved tasks")
                 
-                # Now find completion events and attribute based on first author rule
-                trainer_approved = {}  # Approved tasks (first author got approval)
-                trainer_approved_rework = {}  # Approved rework (someone else got approval)
+                    # Now find completion events and attribute based on first author rule
+                    trainer_approved = {}  # Approved tasks (first author got approval)
+                    trainer_approved_rework = {}  # Approved rework (someone else got approval)
                 
-                if approved_task_ids:
-                    # Get all completion events for approved tasks
-                    completion_events = session.query(
-                        TaskHistoryRaw.task_id,
-                        TaskHistoryRaw.author,
-                        TaskHistoryRaw.completed_status_count,
-                        TaskHistoryRaw.time_stamp
-                    ).filter(
-                        TaskHistoryRaw.task_id.in_(approved_task_ids),
-                        TaskHistoryRaw.new_status == 'completed',
-                        TaskHistoryRaw.old_status != 'completed-approval',
-                        TaskHistoryRaw.author.isnot(None)
-                    ).all()
+                    if approved_task_ids:
+                        # Get all completion events for approved tasks
+                        completion_events = session.query(
+                            TaskHistoryRaw.task_id,
+                            TaskHistoryRaw.author,
+                            TaskHistoryRaw.completed_status_count,
+                            TaskHistoryRaw.time_stamp
+                        ).filter(
+                            TaskHistoryRaw.task_id.in_(approved_task_ids),
+                            TaskHistoryRaw.new_status == 'completed',
+                            TaskHistoryRaw.old_status != 'completed-approval',
+                            TaskHistoryRaw.author.isnot(None)
+                        ).all()
                     
-                    # Group by task_id
-                    task_completions = defaultdict(list)
-                    for event in completion_events:
-                        task_completions[event.task_id].append({
-                            'author': event.author.lower().strip() if event.author else None,
-                            'completed_status_count': event.completed_status_count,
-                            'time_stamp': event.time_stamp
-                        })
+                        # Group by task_id
+                        task_completions = defaultdict(list)
+                        for event in completion_events:
+                            task_completions[event.task_id].append({
+                                'author': event.author.lower().strip() if event.author else None,
+                                'completed_status_count': event.completed_status_count,
+                                'time_stamp': event.time_stamp
+                            })
                     
-                    # For each task, find FIRST author and LAST completer
-                    for task_id, completions in task_completions.items():
-                        if not completions:
-                            continue
+                        # For each task, find FIRST author and LAST completer
+                        for task_id, completions in task_completions.items():
+                            if not completions:
+                                continue
                         
-                        # Sort by timestamp ascending to find first, descending to find last
-                        completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
+                            # Sort by timestamp ascending to find first, descending to find last
+                            completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
                         
-                        # First author = person who made the FIRST completion (completed_status_count = 1)
-                        first_completion = completions_sorted[0]
-                        first_author = first_completion['author']
+                            # First author = person who made the FIRST completion (completed_status_count = 1)
+                            first_completion = completions_sorted[0]
+                            first_author = first_completion['author']
                         
-                        # Last completer = person who made the LAST completion (got it approved)
-                        last_completion = completions_sorted[-1]
-                        last_completer = last_completion['author']
+                            # Last completer = person who made the LAST completion (got it approved)
+                            last_completion = completions_sorted[-1]
+                            last_completer = last_completion['author']
                         
-                        if not last_completer:
-                            continue
+                            if not last_completer:
+                                continue
                         
-                        # Apply the RULE:
-                        # If first author == last completer → Approved
-                        # If first author != last completer → Approved Rework
-                        if first_author == last_completer:
-                            # Original author got their task approved
-                            trainer_approved[last_completer] = trainer_approved.get(last_completer, 0) + 1
-                        else:
-                            # Someone else fixed the task and got it approved
-                            trainer_approved_rework[last_completer] = trainer_approved_rework.get(last_completer, 0) + 1
+                            # Apply the RULE:
+                            # If first author == last completer → Approved
+                            # If first author != last completer → Approved Rework
+                            if first_author == last_completer:
+                                # Original author got their task approved
+                                trainer_approved[last_completer] = trainer_approved.get(last_completer, 0) + 1
+                            else:
+                                # Someone else fixed the task and got it approved
+                                trainer_approved_rework[last_completer] = trainer_approved_rework.get(last_completer, 0) + 1
                 
-                logger.info(f"Attributed approved tasks to {len(trainer_approved)} trainers (original author), {len(trainer_approved_rework)} trainers (fixed others' work)")
+                    logger.info(f"Attributed approved tasks to {len(trainer_approved)} trainers (original author), {len(trainer_approved_rework)} trainers (fixed others' work)")
                 
-                # ---------------------------------------------------------
-                # STEP 3.5: Get delivery stats with proper attribution
-                # 
-                # Delivered Tasks = Tasks where delivery_status = 'delivered'
-                # In Delivery Queue = Tasks where delivery_batch_name IS NOT NULL AND delivery_status != 'delivered'
-                #
-                # Attribution: Use the LAST COMPLETER from task_history_raw (same as Approved)
-                # This ensures consistency - the person who completed the work gets credit for delivery
-                # ---------------------------------------------------------
+                    # ---------------------------------------------------------
+                    # STEP 3.5: Get delivery stats with proper attribution
+                    # 
+                    # Delivered Tasks = Tasks where delivery_status = 'delivered'
+                    # In Delivery Queue = Tasks where delivery_batch_name IS NOT NULL AND delivery_status != 'delivered'
+                    #
+                    # Attribution: Use the LAST COMPLETER from task_history_raw (same as Approved)
+                    # This ensures consistency - the person who completed the work gets credit for delivery
+                    # ---------------------------------------------------------
                 
-                # Get delivered task IDs
-                # Filter by delivery_date (when the batch was actually delivered)
-                delivered_tasks_query = session.query(
-                    TaskRaw.task_id
-                ).filter(
-                    func.lower(TaskRaw.delivery_status) == 'delivered',
-                    TaskRaw.project_id.in_(filter_project_ids)
-                )
-                if start_date:
-                    delivered_tasks_query = delivered_tasks_query.filter(TaskRaw.delivery_date >= start_date)
-                if end_date:
-                    delivered_tasks_query = delivered_tasks_query.filter(TaskRaw.delivery_date <= end_date)
-                delivered_task_ids = [r.task_id for r in delivered_tasks_query.all()]
+                    # Get delivered task IDs
+                    # Filter by delivery_date (when the batch was actually delivered)
+                    delivered_tasks_query = session.query(
+                        TaskRaw.task_id
+                    ).filter(
+                        func.lower(TaskRaw.delivery_status) == 'delivered',
+                        TaskRaw.project_id.in_(filter_project_ids)
+                    )
+                    if start_date:
+                        delivered_tasks_query = delivered_tasks_query.filter(TaskRaw.delivery_date >= start_date)
+                    if end_date:
+                        delivered_tasks_query = delivered_tasks_query.filter(TaskRaw.delivery_date <= end_date)
+                    delivered_task_ids = [r.task_id for r in delivered_tasks_query.all()]
                 
-                # Get in-queue task IDs
-                # NOTE: Don't filter by date - "In Queue" is a CURRENT status, not historical
-                in_queue_tasks_query = session.query(
-                    TaskRaw.task_id
-                ).filter(
-                    TaskRaw.delivery_batch_name.isnot(None),
-                    TaskRaw.delivery_batch_name != '',
-                    or_(
-                        func.lower(TaskRaw.delivery_status) != 'delivered',
-                        TaskRaw.delivery_status.is_(None)
-                    ),
-                    TaskRaw.project_id.in_(filter_project_ids)
-                )
-                # No date filter - show current queue status regardless of timeframe
-                in_queue_task_ids = [r.task_id for r in in_queue_tasks_query.all()]
+                    # Get in-queue task IDs
+                    # NOTE: Don't filter by date - "In Queue" is a CURRENT status, not historical
+                    in_queue_tasks_query = session.query(
+                        TaskRaw.task_id
+                    ).filter(
+                        TaskRaw.delivery_batch_name.isnot(None),
+                        TaskRaw.delivery_batch_name != '',
+                        or_(
+                            func.lower(TaskRaw.delivery_status) != 'delivered',
+                            TaskRaw.delivery_status.is_(None)
+                        ),
+                        TaskRaw.project_id.in_(filter_project_ids)
+                    )
+                    # No date filter - show current queue status regardless of timeframe
+                    in_queue_task_ids = [r.task_id for r in in_queue_tasks_query.all()]
                 
-                logger.info(f"Found {len(delivered_task_ids)} delivered tasks, {len(in_queue_task_ids)} in-queue tasks")
+                    logger.info(f"Found {len(delivered_task_ids)} delivered tasks, {len(in_queue_task_ids)} in-queue tasks")
                 
-                # Attribute delivery stats to last completer
-                trainer_delivered = {}
-                trainer_in_queue = {}
+                    # Attribute delivery stats to last completer
+                    trainer_delivered = {}
+                    trainer_in_queue = {}
                 
-                all_delivery_task_ids = list(set(delivered_task_ids + in_queue_task_ids))
-                delivery_task_completions = defaultdict(list)
+                    all_delivery_task_ids = list(set(delivered_task_ids + in_queue_task_ids))
+                    delivery_task_completions = defaultdict(list)
                 
-                if all_delivery_task_ids:
-                    # Get completion events for delivery tasks
-                    delivery_completion_events = session.query(
-                        TaskHistoryRaw.task_id,
-                        TaskHistoryRaw.author,
-                        TaskHistoryRaw.time_stamp
-                    ).filter(
-                        TaskHistoryRaw.task_id.in_(all_delivery_task_ids),
-                        TaskHistoryRaw.new_status == 'completed',
-                        TaskHistoryRaw.old_status != 'completed-approval',
-                        TaskHistoryRaw.author.isnot(None)
-                    ).all()
+                    if all_delivery_task_ids:
+                        # Get completion events for delivery tasks
+                        delivery_completion_events = session.query(
+                            TaskHistoryRaw.task_id,
+                            TaskHistoryRaw.author,
+                            TaskHistoryRaw.time_stamp
+                        ).filter(
+                            TaskHistoryRaw.task_id.in_(all_delivery_task_ids),
+                            TaskHistoryRaw.new_status == 'completed',
+                            TaskHistoryRaw.old_status != 'completed-approval',
+                            TaskHistoryRaw.author.isnot(None)
+                        ).all()
                     
-                    # Group by task_id and find last completer
-                    for event in delivery_completion_events:
-                        delivery_task_completions[event.task_id].append({
-                            'author': event.author.lower().strip() if event.author else None,
-                            'time_stamp': event.time_stamp
-                        })
+                        # Group by task_id and find last completer
+                        for event in delivery_completion_events:
+                            delivery_task_completions[event.task_id].append({
+                                'author': event.author.lower().strip() if event.author else None,
+                                'time_stamp': event.time_stamp
+                            })
                     
-                    # Attribute to last completer
-                    delivered_set = set(delivered_task_ids)
-                    in_queue_set = set(in_queue_task_ids)
+                        # Attribute to last completer
+                        delivered_set = set(delivered_task_ids)
+                        in_queue_set = set(in_queue_task_ids)
                     
-                    for task_id, completions in delivery_task_completions.items():
-                        if not completions:
-                            continue
-                        # Find last completer
-                        completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
-                        last_completer = completions_sorted[-1]['author']
+                        for task_id, completions in delivery_task_completions.items():
+                            if not completions:
+                                continue
+                            # Find last completer
+                            completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
+                            last_completer = completions_sorted[-1]['author']
                         
-                        if not last_completer:
-                            continue
+                            if not last_completer:
+                                continue
                         
-                        if task_id in delivered_set:
-                            trainer_delivered[last_completer] = trainer_delivered.get(last_completer, 0) + 1
-                        if task_id in in_queue_set:
-                            trainer_in_queue[last_completer] = trainer_in_queue.get(last_completer, 0) + 1
+                            if task_id in delivered_set:
+                                trainer_delivered[last_completer] = trainer_delivered.get(last_completer, 0) + 1
+                            if task_id in in_queue_set:
+                                trainer_in_queue[last_completer] = trainer_in_queue.get(last_completer, 0) + 1
                 
-                logger.info(f"Attributed delivery stats to {len(trainer_delivered)} trainers (delivered), {len(trainer_in_queue)} trainers (in queue)")
+                    logger.info(f"Attributed delivery stats to {len(trainer_delivered)} trainers (delivered), {len(trainer_in_queue)} trainers (in queue)")
                 
-                # ---------------------------------------------------------
-                # STEP 3.6: Compute trainer-level revenue
-                #
-                # For each delivered task, look up the bill_rate_task from
-                # ProjectRevenueWeekly for that project + delivery week.
-                # trainer_revenue = SUM(bill_rate_task for each delivered task)
-                #
-                # Handles:
-                # - Different bill rates per week for the same project
-                # - MC vs MC-Advanced split via batch_name (both project_id=37)
-                # - Tasks outside any sheet week get rate=0 (no revenue)
-                # ---------------------------------------------------------
-                trainer_revenue = {}
-                
-                if delivered_task_ids:
-                    # Get rate entries from ProjectRevenueWeekly
-                    from datetime import timedelta as td
-                    rate_rows = session.query(
-                        ProjectRevenueWeekly.jibble_project_name,
-                        ProjectRevenueWeekly.week_start_date,
-                        ProjectRevenueWeekly.week_end_date,
-                        ProjectRevenueWeekly.bill_rate_task,
-                    ).filter(
-                        ProjectRevenueWeekly.bill_rate_task.isnot(None),
-                        ProjectRevenueWeekly.bill_rate_task > 0,
-                    ).all()
-                    
-                    rate_entries = []
-                    for rr in rate_rows:
-                        rate_entries.append({
-                            'jibble_name': rr.jibble_project_name,
-                            'week_start': rr.week_start_date,
-                            'week_end': rr.week_end_date or (rr.week_start_date + td(days=6)),
-                            'bill_rate': float(rr.bill_rate_task),
-                        })
+                    # ---------------------------------------------------------
+                    # STEP 3.6: Compute trainer-level revenue
+                    #
+                    # For each delivered task, look up the bill_rate_task from
+                    # ProjectRevenueWeekly for that project + delivery week.
+                    # trainer_revenue = SUM(bill_rate_task for each delivered task)
+                    #
+                    # Handles:
+                    # - Different bill rates per week for the same project
+                    # - MC vs MC-Advanced split via batch_name (both project_id=37)
+                    # - Tasks outside any sheet week get rate=0 (no revenue)
+                    # ---------------------------------------------------------
+                    trainer_revenue = {}
+                
+                    if delivered_task_ids:
+                        # Weekly bill rates, indexed by project and week start
+                        rate_index = get_rate_index(session)
                     
-                    # Get delivered tasks with batch_name and delivery_date
-                    delivered_task_details = session.query(
-                        TaskRaw.task_id,
-                        TaskRaw.project_id,
-                        TaskRaw.batch_name,
-                        TaskRaw.delivery_date,
-                    ).filter(
-                        TaskRaw.task_id.in_(delivered_task_ids),
-                    ).all()
+                        # Get delivered tasks with batch_name and delivery_date
+                        delivered_task_details = session.query(
+                            TaskRaw.task_id,
+                            TaskRaw.project_id,
+                            TaskRaw.batch_name,
+                            TaskRaw.delivery_date,
+                        ).filter(
+                            TaskRaw.task_id.in_(delivered_task_ids),
+                        ).all()
                     
-                    # Map task_id -> (project_id, batch_name, delivery_date)
-                    task_detail_map = {}
-                    for td_row in delivered_task_details:
-                        task_detail_map[td_row.task_id] = {
-                            'project_id': td_row.project_id,
-                            'batch_name': td_row.batch_name,
-                            'delivery_date': td_row.delivery_date,
-                        }
+                        # Map task_id -> (project_id, batch_name, delivery_date)
+                        task_detail_map = {}
+                        for td_row in delivered_task_details:
+                            task_detail_map[td_row.task_id] = {
+                                'project_id': td_row.project_id,
+                                'batch_name': td_row.batch_name,
+                                'delivery_date': td_row.delivery_date,
+                            }
                     
-                    def _get_jibble_name(pid, batch_name):
-                        """Map project_id to sheet's jibble_project_name."""
-                        _pid_map = {
-                            36: 'Nvidia - SysBench',
-                            37: 'Nvidia - Multichallenge',
-                            38: 'Nvidia - InverseIFEval',
-                            39: 'Nvidia - CFBench Multilingual',
-                            59: 'NVIDIA_STEM Math_Proof_Eval',
-                        }
-                        return _pid_map.get(pid, '')
-                    
-                    def _find_bill_rate(jibble_name, delivery_date):
-                        """Find bill_rate for a project + delivery date from rate entries."""
-                        if not delivery_date or not jibble_name:
-                            return 0
-                        for entry in rate_entries:
-                            if entry['jibble_name'] == jibble_name and entry['week_start'] <= delivery_date <= entry['week_end']:
-                                return entry['bill_rate']
-                        return 0
-                    
-                    # For each delivered task, find last completer and compute revenue
-                    for task_id in delivered_task_ids:
-                        detail = task_detail_map.get(task_id)
-                        if not detail or not detail['delivery_date']:
-                            continue
+                        # For each delivered task, find last completer and compute revenue
+                        for task_id in delivered_task_ids:
+                            detail = task_detail_map.get(task_id)
+                            if not detail or not detail['delivery_date']:
+                                continue
                         
-                        # Get trainer attribution (last completer)
-                        completions = delivery_task_completions.get(task_id, [])
-                        if completions:
-                            completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
-                            trainer_email = completions_sorted[-1]['author']
-                        else:
-                            continue
+                            # Get trainer attribution (last completer)
+                            completions = delivery_task_completions.get(task_id, [])
+                            if completions:
+                                completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
+                                trainer_email = completions_sorted[-1]['author']
+                            else:
+                                continue
                         
-                        if not trainer_email:
-                            continue
+                            if not trainer_email:
+                                continue
                         
-                        jibble_name = _get_jibble_name(detail['project_id'], detail['batch_name'])
-                        bill_rate = _find_bill_rate(jibble_name, detail['delivery_date'])
+                            bill_rate = rate_index.project_rate(detail['project_id'], detail['delivery_date'])
                         
-                        if bill_rate > 0:
-                            trainer_revenue[trainer_email] = trainer_revenue.get(trainer_email, 0) + bill_rate
+                            if bill_rate > 0:
+                                trainer_revenue[trainer_email] = trainer_revenue.get(trainer_email, 0) + bill_rate
                     
-                    logger.info(f"Computed revenue for {len(trainer_revenue)} trainers, total=${sum(trainer_revenue.values()):,.0f}")
+                        logger.info(f"Computed revenue for {len(trainer_revenue)} trainers, total=${sum(trainer_revenue.values()):,.0f}")
                 
-                # ---------------------------------------------------------
-                # STEP 4 & 5: Get avg_rating and total_reviews from trainer_review_stats
-                # 
-                # NEW APPROACH: Each review is attributed to the trainer who did the work
-                # that was reviewed (not the current task owner).
-                #
-                # Example:
-                # - Trainer A completes task -> rejected (3.3) -> reworks -> approved (4.8)
-                #   Trainer A gets 2 reviews: avg = (3.3 + 4.8) / 2 = 4.05
-                #
-                # - Trainer A completes task -> rejected (2.3) -> Trainer B reworks -> approved (5.0)
-                #   Trainer A gets 1 review: 2.3
-                #   Trainer B gets 1 review: 5.0
-                # ---------------------------------------------------------
+                    # ---------------------------------------------------------
+                    # STEP 4 & 5: Get avg_rating and total_reviews from trainer_review_stats
+                    # 
+                    # NEW APPROACH: Each review is attributed to the trainer who did the work
+                    # that was reviewed (not the current task owner).
+                    #
+                    # Example:
+                    # - Trainer A completes task -> rejected (3.3) -> reworks -> approved (4.8)
+                    #   Trainer A gets 2 reviews: avg = (3.3 + 4.8) / 2 = 4.05
+                    #
+                    # - Trainer A completes task -> rejected (2.3) -> Trainer B reworks -> approved (5.0)
+                    #   Trainer A gets 1 review: 2.3
+                    #   Trainer B gets 1 review: 5.0
+                    # ---------------------------------------------------------
                 
-                # Query for MANUAL reviews
-                trainer_review_query = session.query(
-                    TrainerReviewStats.trainer_email,
-                    func.count(TrainerReviewStats.review_id).label('total_reviews'),
-                    func.sum(TrainerReviewStats.score).label('total_score')
-                ).filter(
-                    TrainerReviewStats.project_id.in_(filter_project_ids),
-                    TrainerReviewStats.score.isnot(None),
-                    or_(TrainerReviewStats.review_type == 'manual', TrainerReviewStats.review_type.is_(None))
-                )
+                    # Query for MANUAL reviews
+                    trainer_review_query = session.query(
+                        TrainerReviewStats.trainer_email,
+                        func.count(TrainerReviewStats.review_id).label('total_reviews'),
+                        func.sum(TrainerReviewStats.score).label('total_score')
+                    ).filter(
+                        TrainerReviewStats.project_id.in_(filter_project_ids),
+                        TrainerReviewStats.score.isnot(None),
+                        or_(TrainerReviewStats.review_type == 'manual', TrainerReviewStats.review_type.is_(None))
+                    )
                 
-                if start_date:
-                    trainer_review_query = trainer_review_query.filter(TrainerReviewStats.review_date >= start_date)
-                if end_date:
-                    trainer_review_query = trainer_review_query.filter(TrainerReviewStats.review_date <= end_date)
-                
-                trainer_review_query = trainer_review_query.group_by(TrainerReviewStats.trainer_email)
-                trainer_review_results = trainer_review_query.all()
-                
-                trainer_ratings = {}
-                trainer_total_reviews = {}
-                trainer_total_scores = {}  # For POD-level aggregation
-                for r in trainer_review_results:
-                    if r.trainer_email:
-                        email = r.trainer_email.lower().strip()
-                        trainer_total_reviews[email] = r.total_reviews or 0
-                        trainer_total_scores[email] = float(r.total_score or 0)
-                        if r.total_reviews and r.total_reviews > 0 and r.total_score:
-                            trainer_ratings[email] = round(float(r.total_score) / float(r.total_reviews), 2)
-                
-                logger.info(f"Found trainer-attributed manual reviews for {len(trainer_total_reviews)} trainers")
-                
-                # Query for AGENTIC (auto) reviews
-                agentic_review_query = session.query(
-                    TrainerReviewStats.trainer_email,
-                    func.count(TrainerReviewStats.review_id).label('total_reviews'),
-                    func.sum(TrainerReviewStats.score).label('total_score')
-                ).filter(
-                    TrainerReviewStats.project_id.in_(filter_project_ids),
-                    TrainerReviewStats.score.isnot(None),
-                    TrainerReviewStats.review_type == 'auto'
-                )
+                    if start_date:
+                        trainer_review_query = trainer_review_query.filter(TrainerReviewStats.review_date >= start_date)
+                    if end_date:
+                        trainer_review_query = trainer_review_query.filter(TrainerReviewStats.review_date <= end_date)
                 
-                if start_date:
-                    agentic_review_query = agentic_review_query.filter(TrainerReviewStats.review_date >= start_date)
-                if end_date:
-                    agentic_review_query = agentic_review_query.filter(TrainerReviewStats.review_date <= end_date)
+                    trainer_review_query = trainer_review_query.group_by(TrainerReviewStats.trainer_email)
+                    trainer_review_results = trainer_review_query.all()
+                
+                    trainer_ratings = {}
+                    trainer_total_reviews = {}
+                    trainer_total_scores = {}  # For POD-level aggregation
+                    for r in trainer_review_results:
+                        if r.trainer_email:
+                            email = r.trainer_email.lower().strip()
+                            trainer_total_reviews[email] = r.total_reviews or 0
+                            trainer_total_scores[email] = float(r.total_score or 0)
+                            if r.total_reviews and r.total_reviews > 0 and r.total_score:
+                                trainer_ratings[email] = round(float(r.total_score) / float(r.total_reviews), 2)
+                
+                    logger.info(f"Found trainer-attributed manual reviews for {len(trainer_total_reviews)} trainers")
+                
+                    # Query for AGENTIC (auto) reviews
+                    agentic_review_query = session.query(
+                        TrainerReviewStats.trainer_email,
+                        func.count(TrainerReviewStats.review_id).label('total_reviews'),
+                        func.sum(TrainerReviewStats.score).label('total_score')
+                    ).filter(
+                        TrainerReviewStats.project_id.in_(filter_project_ids),
+                        TrainerReviewStats.score.isnot(None),
+                        TrainerReviewStats.review_type == 'auto'
+                    )
+                
+                    if start_date:
+                        agentic_review_query = agentic_review_query.filter(TrainerReviewStats.review_date >= start_date)
+                    if end_date:
+                        agentic_review_query = agentic_review_query.filter(TrainerReviewStats.review_date <= end_date)
                 
-                agentic_review_query = agentic_review_query.group_by(TrainerReviewStats.trainer_email)
-                agentic_review_results = agentic_review_query.all()
+                    agentic_review_query = agentic_review_query.group_by(TrainerReviewStats.trainer_email)
+                    agentic_review_results = agentic_review_query.all()
                 
-                trainer_agentic_ratings = {}
-                trainer_agentic_reviews = {}
-                trainer_agentic_scores = {}  # For POD-level aggregation
-                for r in agentic_review_results:
-                    if r.trainer_email:
-                        email = r.trainer_email.lower().strip()
-                        trainer_agentic_reviews[email] = r.total_reviews or 0
-                        trainer_agentic_scores[email] = float(r.total_score or 0)
-                        if r.total_reviews and r.total_reviews > 0 and r.total_score:
-                            trainer_agentic_ratings[email] = round(float(r.total_score) / float(r.total_reviews), 2)
+                    trainer_agentic_ratings = {}
+                    trainer_agentic_reviews = {}
+                    trainer_agentic_scores = {}  # For POD-level aggregation
+                    for r in agentic_review_results:
+                        if r.trainer_email:
+                            email = r.trainer_email.lower().strip()
+                            trainer_agentic_reviews[email] = r.total_reviews or 0
+                            trainer_agentic_scores[email] = float(r.total_score or 0)
+                            if r.total_reviews and r.total_reviews > 0 and r.total_score:
+                                trainer_agentic_ratings[email] = round(float(r.total_score) / float(r.total_reviews), 2)
                 
-                logger.info(f"Found trainer-attributed agentic reviews for {len(trainer_agentic_reviews)} trainers")
+                    logger.info(f"Found trainer-attributed agentic reviews for {len(trainer_agentic_reviews)} trainers")
                 
                 # ---------------------------------------------------------
                 # STEP 6: Get Jibble hours for trainers AND POD Leads
@@ -2543,12 +2845,19 @@ class QueryService:
                 # ---------------------------------------------------------
                 pod_results = []
                 
+                # Contributor names, loaded once instead of one query per person
+                contributor_names = {}
+                email_to_name_fallback = {}
+                for c in session.query(Contributor.turing_email, Contributor.name).all():
+                    if c.turing_email:
+                        email = c.turing_email.lower().strip()
+                        contributor_names.setdefault(email, c.name)
+                        if c.name:
+                            email_to_name_fallback[email] = c.name
+                
                 for pod_email, trainer_emails in pod_trainers.items():
                     # Get POD Lead name from contributor table
-                    pod_contributor = session.query(Contributor).filter(
-                        func.lower(Contributor.turing_email) == pod_email.lower()
-                    ).first()
-                    pod_name = pod_contributor.name if pod_contributor else pod_email.split('@')[0].replace('.', ' ').title()
+                    pod_name = contributor_names[pod_email] if pod_email in contributor_names else pod_email.split('@')[0].replace('.', ' ').title()
                     
                     # Aggregate stats from all trainers under this POD
                     pod_totals = {
@@ -2570,10 +2879,7 @@ class QueryService:
                         trainer_info = trainer_to_pod.get(trainer_email, {})
                         
                         # Get trainer name from contributor
-                        trainer_contributor = session.query(Contributor).filter(
-                            func.lower(Contributor.turing_email) == trainer_email.lower()
-                        ).first()
-                        trainer_name = trainer_contributor.name if trainer_contributor else trainer_info.get('trainer_name', trainer_email)
+                        trainer_name = contributor_names[trainer_email] if trainer_email in contributor_names else trainer_info.get('trainer_name', trainer_email)
                         
                         # Get stats from each data source
                         hist = trainer_history.get(trainer_email, {})
@@ -2731,13 +3037,6 @@ class QueryService:
                 NO_POD_LEAD_EMAIL = "no_pod_lead"
                 NO_POD_LEAD_NAME = "No Pod Lead"
                 
-                # Build email_to_name for name-based fallback
-                all_contributors = session.query(Contributor).all()
-                email_to_name_fallback = {}
-                for c in all_contributors:
-                    if c.turing_email and c.name:
-                        email_to_name_fallback[c.turing_email.lower().strip()] = c.name
-
                 # Find trainers with data but no mapping (from task history)
                 # Try name-based fallback before declaring unmapped
                 unmapped_trainers_from_history = set()
@@ -2795,10 +3094,7 @@ class QueryService:
                     
                     for trainer_email in unmapped_trainers:
                         # Get trainer name from contributor table
-                        trainer_contributor = session.query(Contributor).filter(
-                            func.lower(Contributor.turing_email) == trainer_email.lower()
-                        ).first()
-                        trainer_name = trainer_contributor.name if trainer_contributor else trainer_email.split('@')[0].replace('.', ' ').title()
+                        trainer_name = contributor_names[trainer_email] if trainer_email in contributor_names else trainer_email.split('@')[0].replace('.', ' ').title()
                         
                         # Get stats from data sources
                         hist = trainer_history.get(trainer_email, {})
@@ -2919,6 +3215,362 @@ class QueryService:
             logger.error(f"Error getting pod lead stats: {e}")
             raise
 
+    def iter_project_task_rows(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        One row per project, POD lead, trainer and task, streamed for exports.
+
+        Builds the same task rows as include_tasks=True, one project at a time
+        through ``_trainer_task_rows``, without the project/trainer aggregates
+        and without going through the result cache.
+        """
+        project_names = self.settings.project_names
+
+        with self.db_service.get_session() as session:
+            trainer_to_pod, name_to_pod, email_to_name = self._pod_lead_maps(session)
+            calibrator_emails_set = self._calibrator_emails(session)
+
+            for project_id in self.settings.all_project_ids_list:
+                trainer_tasks = self._trainer_task_rows(
+                    session, project_id, start_date, end_date, calibrator_emails_set
+                )
+                for trainer_email, tasks in trainer_tasks.items():
+                    pod_info = self._trainer_pod_info(trainer_email, trainer_to_pod, name_to_pod, email_to_name)
+                    if pod_info:
+                        pod_lead_email = pod_info['pod_lead_email']
+                        pod_lead_name = pod_lead_email.split('@')[0]
+                        trainer_name = pod_info.get('trainer_name', trainer_email.split('@')[0])
+                    else:
+                        pod_lead_email, pod_lead_name = "no_pod_lead", "No Pod Lead"
+                        trainer_name = email_to_name.get(trainer_email, trainer_email.split('@')[0])
+                    for task in tasks:
+                        yield {
+                            'project_id': project_id,
+                            'project_name': project_names.get(project_id, f"Project {project_id}"),
+                            'pod_lead_email': pod_lead_email,
+                            'pod_lead_name': pod_lead_name,
+                            'trainer_email': trainer_email,
+                            'trainer_name': trainer_name,
+                            **task,
+                        }
+
+    def _pod_lead_maps(self, session) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """
+        Trainer -> POD lead info by trainer email and by trainer name, and
+        contributor name by email (for the name-based fallback).
+        """
+        trainer_to_pod = {}
+        name_to_pod = {}
+        for mapping in session.query(PodLeadMapping).all():
+            if mapping.trainer_email and mapping.pod_lead_email:
+                trainer_email = mapping.trainer_email.lower().strip()
+                trainer_to_pod[trainer_email] = {
+                    'pod_lead_email': mapping.pod_lead_email.lower().strip(),
+                    'pod_lead_name': mapping.pod_lead_email.split('@')[0] if mapping.pod_lead_email else 'Unknown',
+                    'trainer_name': mapping.trainer_name or trainer_email.split('@')[0],
+                    'status': mapping.current_status,
+                    'role': mapping.role or 'Trainer',
+                }
+                if mapping.trainer_name:
+                    name_to_pod[mapping.trainer_name.lower().strip()] = trainer_to_pod[trainer_email]
+
+        email_to_name = {}
+        for c in session.query(Contributor.turing_email, Contributor.name).all():
+            if c.turing_email and c.name:
+                email_to_name[c.turing_email.lower().strip()] = c.name
+
+        return trainer_to_pod, name_to_pod, email_to_name
+
+    @staticmethod
+    def _trainer_pod_info(
+        trainer_email: str,
+        trainer_to_pod: Dict[str, Dict[str, Any]],
+        name_to_pod: Dict[str, Dict[str, Any]],
+        email_to_name: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """POD lead info for a trainer by email, falling back to the contributor name"""
+        pod_info = trainer_to_pod.get(trainer_email)
+        if not pod_info:
+            contributor_name = email_to_name.get(trainer_email, '').lower().strip()
+            if contributor_name and contributor_name in name_to_pod:
+                pod_info = name_to_pod[contributor_name]
+                logger.info(f"Name-based fallback matched '{contributor_name}' ({trainer_email}) to pod lead {pod_info['pod_lead_email']}")
+        return pod_info
+
+    def _calibrator_emails(self, session) -> Set[str]:
+        """Emails of calibrators, auditors and team leads (reviews by them count as calibrations)"""
+        calibrator_emails_set: set = set()
+        pod_role_rows = session.query(PodLeadMapping.trainer_email, PodLeadMapping.role).all()
+        for pr in pod_role_rows:
+            if pr.trainer_email and pr.role:
+                rl = pr.role.lower().strip()
+                if rl in ('calibrator', 'auditor', 'team lead'):
+                    calibrator_emails_set.add(pr.trainer_email.lower().strip())
+        try:
+            from app.services.quality_rubrics_service import QualityRubricsService
+            qr_svc = QualityRubricsService()
+            for email, role in qr_svc._fetch_team_roles().items():
+                if role == 'calibrator':
+                    calibrator_emails_set.add(email.lower().strip())
+        except Exception:
+            pass
+        return calibrator_emails_set
+
+    def _trainer_task_rows(
+        self,
+        session,
+        project_id: int,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        calibrator_emails_set: Set[str],
+        trainer_email: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Task-level rows per trainer email for one project (the 4th level of the
+        project hierarchy), most recently completed first.
+        
+        Args:
+            trainer_email: Only build rows for this trainer
+        """
+        valid_tasks_proj = self._valid_task_ids_subquery(session, [project_id])
+        trainer_tasks = {}
+        
+        # Get detailed task history with completion info per trainer
+        task_history_query = session.query(
+            TaskHistoryRaw.task_id,
+            TaskHistoryRaw.author,
+            TaskHistoryRaw.completed_status_count,
+            TaskHistoryRaw.date,
+            TaskHistoryRaw.time_stamp
+        ).filter(
+            TaskHistoryRaw.new_status == 'completed',
+            TaskHistoryRaw.old_status != 'completed-approval',
+            TaskHistoryRaw.project_id == project_id,
+            TaskHistoryRaw.author.isnot(None),
+            TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
+        )
+
+        if start_date:
+            task_history_query = task_history_query.filter(TaskHistoryRaw.date >= start_date)
+        if end_date:
+            task_history_query = task_history_query.filter(TaskHistoryRaw.date <= end_date)
+        if trainer_email:
+            # Authors are stored as synced (not case- or whitespace-normalized), so
+            # match like the grouping below; the index narrows on (project_id, date) only
+            task_history_query = task_history_query.filter(
+                func.lower(func.trim(TaskHistoryRaw.author)) == trainer_email.lower().strip()
+            )
+
+        task_history_details = task_history_query.all()
+
+        # Group task IDs by trainer email
+        trainer_task_ids = defaultdict(set)
+        task_completion_info = {}  # (task_id, email) -> {is_new, rework_count, completion_date, ...}
+
+        for th in task_history_details:
+            email = th.author.lower().strip()
+            trainer_task_ids[email].add(th.task_id)
+
+            # Track the completion info for each (task_id, trainer) pair
+            # Key insight: 
+            #   - is_new should be TRUE if the FIRST completion by this trainer had completed_status_count == 1
+            #   - rework_count = (total completions by this trainer) - 1
+            key = (th.task_id, email)
+            if key not in task_completion_info:
+                # First time seeing this (task, trainer) pair
+                task_completion_info[key] = {
+                    'is_new': th.completed_status_count == 1,  # Was this a NEW task completion?
+                    'total_completions': 1,  # Count of completions by this trainer
+                    'completion_date': th.date,
+                    '_first_ts': th.time_stamp,  # Track first completion timestamp
+                    '_last_ts': th.time_stamp,   # Track last completion for date
+                    '_first_count': th.completed_status_count,  # The count at first completion
+                }
+            else:
+                # Already seen this (task, trainer) pair - update tracking
+                info = task_completion_info[key]
+                info['total_completions'] += 1
+
+                # Update is_new based on EARLIEST completion (lowest completed_status_count or earliest timestamp)
+                if th.time_stamp and info.get('_first_ts'):
+                    if th.time_stamp < info['_first_ts']:
+                        # This event is earlier, update first completion info
+                        info['is_new'] = th.completed_status_count == 1
+                        info['_first_ts'] = th.time_stamp
+                        info['_first_count'] = th.completed_status_count
+
+                # Update completion_date to latest
+                if th.time_stamp and (not info.get('_last_ts') or th.time_stamp > info['_last_ts']):
+                    info['completion_date'] = th.date
+                    info['_last_ts'] = th.time_stamp
+
+        # Calculate rework_count from total_completions
+        for key, info in task_completion_info.items():
+            # rework_count = total completions - 1 (if new task) or total completions (if started as rework)
+            # Actually, simpler: rework_count = completions where count > 1
+            # For the trainer, rework_count = total_completions - 1 if is_new, else total_completions
+            if info['is_new']:
+                info['rework_count'] = max(0, info['total_completions'] - 1)
+            else:
+                # Task was already rework when this trainer first completed it
+                info['rework_count'] = info['total_completions']
+
+        # Get all unique task IDs for this project
+        all_task_ids = set()
+        for ids in trainer_task_ids.values():
+            all_task_ids.update(ids)
+
+        # Fetch task details from TaskRaw
+        task_details = {}
+        if all_task_ids:
+            task_raw_query = session.query(TaskRaw).filter(
+                TaskRaw.task_id.in_(list(all_task_ids)),
+                TaskRaw.project_id == project_id
+            )
+
+            for task in task_raw_query.all():
+                reviewer_email = (task.reviewer or '').lower().strip()
+                is_calibrated = 1 if reviewer_email and reviewer_email in calibrator_emails_set else 0
+                cal_passed = 1 if is_calibrated and (task.review_action_type or '').lower() != 'rework' else 0
+                task_details[task.task_id] = {
+                    'task_id': task.task_id,
+                    'colab_link': task.colab_link,
+                    'task_status': task.task_status,
+                    'delivery_status': task.delivery_status,
+                    'delivery_batch_name': task.delivery_batch_name,
+                    'count_reviews': task.count_reviews or 0,
+                    'avg_rating': round(float(task.sum_score) / float(task.count_reviews), 2) if task.count_reviews and task.count_reviews > 0 and task.sum_score else None,
+                    'number_of_turns': task.number_of_turns or 0,
+                    'last_completed_date': task.last_completed_date.isoformat() if task.last_completed_date else None,
+                    'created_date': task.created_date.isoformat() if task.created_date else None,
+                    'task_duration': task.task_duration,  # AHT in minutes
+                    'is_calibrated': is_calibrated,
+                    'calibration_passed': cal_passed,
+                }
+
+        # Get per-task agentic review data
+        task_agentic_reviews = {}
+        if all_task_ids:
+            agentic_per_task = session.query(
+                TrainerReviewStats.task_id,
+                func.count(TrainerReviewStats.review_id).label('agentic_count'),
+                func.sum(TrainerReviewStats.score).label('agentic_score_sum')
+            ).filter(
+                TrainerReviewStats.task_id.in_(list(all_task_ids)),
+                TrainerReviewStats.project_id == project_id,
+                TrainerReviewStats.score.isnot(None),
+                TrainerReviewStats.review_type == 'auto'
+            )
+
+            if start_date:
+                agentic_per_task = agentic_per_task.filter(TrainerReviewStats.review_date >= start_date)
+            if end_date:
+                agentic_per_task = agentic_per_task.filter(TrainerReviewStats.review_date <= end_date)
+
+            agentic_per_task = agentic_per_task.group_by(TrainerReviewStats.task_id)
+
+            for ar in agentic_per_task.all():
+                task_agentic_reviews[ar.task_id] = {
+                    'count': ar.agentic_count or 0,
+                    'avg_rating': round(float(ar.agentic_score_sum) / float(ar.agentic_count), 2) if ar.agentic_count and ar.agentic_count > 0 and ar.agentic_score_sum else None
+                }
+
+        # Build task list for each trainer
+        for email, task_ids in trainer_task_ids.items():
+            tasks_list = []
+            for task_id in task_ids:
+                task_info = task_details.get(task_id, {})
+                completion_info = task_completion_info.get((task_id, email), {})
+                agentic_info = task_agentic_reviews.get(task_id, {})
+
+                # Determine delivery status display
+                is_delivered = task_info.get('delivery_status', '').lower() == 'delivered' if task_info.get('delivery_status') else False
+                is_in_queue = (
+                    task_info.get('delivery_batch_name') and 
+                    not is_delivered
+                )
+
+                # Determine if new or rework for this task submission
+                is_new = completion_info.get('is_new', False)
+                rework_count = completion_info.get('rework_count', 0)
+                total_completions = completion_info.get('total_completions', 1)
+
+                # Calculate task-level accounted hours using new logic
+                # NEW LOGIC (Feb 2026):
+                # - New task: credit 10 hours
+                # - Rework: credit 4 hours ONCE per task (capped by MAX_REWORKS_TO_REWARD)
+                # This prevents rewarding multiple low-quality reworks by same trainer
+                aht_config = self._constants.aht
+                task_accounted_hrs = aht_config.calculate_task_accounted_hours(
+                    is_new=is_new,
+                    rework_count=rework_count
+                )
+
+                # Rework percentage = rework_count / total_submissions × 100
+                # total_submissions = 1 (if new) + rework_count OR just rework_count (if not new)
+                total_submissions = (1 if is_new else 0) + rework_count
+                if total_submissions > 0:
+                    task_rework_pct = round((rework_count / total_submissions) * 100, 1)
+                else:
+                    task_rework_pct = 0
+
+                # Task-level merged AHT = accounted_hours for this single task
+                # (For a single task, merged AHT = accounted_hours since unique_tasks = 1)
+                task_merged_aht = task_accounted_hrs
+
+                tasks_list.append({
+                    'task_id': task_id,
+                    'colab_link': task_info.get('colab_link'),
+                    'is_new': is_new,
+                    'rework_count': rework_count,
+                    'reviews': task_info.get('count_reviews', 0),
+                    'avg_rating': task_info.get('avg_rating'),
+                    'agentic_reviews': agentic_info.get('count', 0),
+                    'agentic_rating': agentic_info.get('avg_rating'),
+                    'is_delivered': is_delivered,
+                    'is_in_queue': is_in_queue,
+                    'task_status': task_info.get('task_status'),
+                    'last_completed_date': completion_info.get('completion_date').isoformat() if completion_info.get('completion_date') else task_info.get('last_completed_date'),
+                    'aht_mins': task_merged_aht,
+                    'accounted_hours': task_accounted_hrs,
+                    'rework_percent': task_rework_pct,
+                    'is_calibrated': task_info.get('is_calibrated', 0),
+                    'calibration_passed': task_info.get('calibration_passed', 0),
+                })
+
+            # Sort tasks by last_completed_date (most recent first)
+            tasks_list.sort(key=lambda x: x.get('last_completed_date') or '', reverse=True)
+            trainer_tasks[email] = tasks_list
+        
+        return trainer_tasks
+
+    @cached(prefix="project_trainer_tasks")
+    def get_project_trainer_tasks(
+        self,
+        project_id: int,
+        trainer_email: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Task rows for one trainer in one project, loaded on demand when the
+        trainer is expanded (same rows as include_tasks=True).
+        """
+        try:
+            with self.db_service.get_session() as session:
+                trainer_tasks = self._trainer_task_rows(
+                    session, project_id, start_date, end_date,
+                    self._calibrator_emails(session), trainer_email=trainer_email
+                )
+                return trainer_tasks.get(trainer_email.lower().strip(), [])
+        except Exception as e:
+            logger.error(f"Error getting trainer tasks: {e}")
+            raise
+
+    @cached(prefix="project_stats")
     def get_project_stats_with_pod_leads(
         self,
         start_date: Optional[str] = None,
@@ -2944,41 +3596,11 @@ class QueryService:
             all_project_ids = self.settings.all_project_ids_list
             
             with self.db_service.get_session() as session:
-                # Get POD Lead mappings
-                pod_mappings = session.query(PodLeadMapping).all()
-                
-                # Build trainer -> pod lead mapping (with name-based fallback)
-                trainer_to_pod = {}
-                name_to_pod = {}
-                for mapping in pod_mappings:
-                    if mapping.trainer_email and mapping.pod_lead_email:
-                        trainer_email = mapping.trainer_email.lower().strip()
-                        trainer_to_pod[trainer_email] = {
-                            'pod_lead_email': mapping.pod_lead_email.lower().strip(),
-                            'pod_lead_name': mapping.pod_lead_email.split('@')[0] if mapping.pod_lead_email else 'Unknown',
-                            'trainer_name': mapping.trainer_name or trainer_email.split('@')[0],
-                            'status': mapping.current_status,
-                            'role': mapping.role or 'Trainer',
-                        }
-                        if mapping.trainer_name:
-                            name_to_pod[mapping.trainer_name.lower().strip()] = trainer_to_pod[trainer_email]
+                # Trainer -> POD lead mapping, with name-based fallback
+                trainer_to_pod, name_to_pod, email_to_name = self._pod_lead_maps(session)
                 
                 # Build calibrator email set once (shared across all projects)
-                calibrator_emails_set: set = set()
-                pod_role_rows = session.query(PodLeadMapping.trainer_email, PodLeadMapping.role).all()
-                for pr in pod_role_rows:
-                    if pr.trainer_email and pr.role:
-                        rl = pr.role.lower().strip()
-                        if rl in ('calibrator', 'auditor', 'team lead'):
-                            calibrator_emails_set.add(pr.trainer_email.lower().strip())
-                try:
-                    from app.services.quality_rubrics_service import QualityRubricsService
-                    qr_svc = QualityRubricsService()
-                    for email, role in qr_svc._fetch_team_roles().items():
-                        if role == 'calibrator':
-                            calibrator_emails_set.add(email.lower().strip())
-                except Exception:
-                    pass
+                calibrator_emails_set = self._calibrator_emails(session)
                 
                 # For each project
                 for project_id in all_project_ids:
@@ -2986,114 +3608,83 @@ class QueryService:
                     
                     valid_tasks_proj = self._valid_task_ids_subquery(session, [project_id])
                     
-                    # ---------------------------------------------------------
-                    # FIX: Get TRUE unique_tasks count at project level
-                    # Only count tasks still in completed pipeline
-                    # ---------------------------------------------------------
-                    true_unique_query = session.query(
-                        func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks')
-                    ).filter(
-                        TaskHistoryRaw.new_status == 'completed',
-                        TaskHistoryRaw.old_status != 'completed-approval',
-                        TaskHistoryRaw.project_id == project_id,
-                        TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
-                    )
-                    
-                    if start_date:
-                        true_unique_query = true_unique_query.filter(TaskHistoryRaw.date >= start_date)
-                    if end_date:
-                        true_unique_query = true_unique_query.filter(TaskHistoryRaw.date <= end_date)
-                    
-                    true_unique_result = true_unique_query.first()
-                    project_true_unique_tasks = true_unique_result.unique_tasks if true_unique_result else 0
-                    
-                    # ---------------------------------------------------------
-                    # FIX: Get TRUE tasks_with_new and tasks_with_rework at project level
-                    # This prevents inflation when tasks are worked on by multiple trainers
-                    # - tasks_with_new = unique tasks that had their FIRST completion (completed_status_count=1)
-                    # - tasks_with_rework = unique tasks that had REWORK completions (completed_status_count>1)
-                    # Note: A task can appear in BOTH if it was new AND reworked in the same period
-                    # ---------------------------------------------------------
-                    true_aht_query = session.query(
-                        func.count(distinct(case(
-                            (TaskHistoryRaw.completed_status_count == 1, TaskHistoryRaw.task_id),
-                            else_=None
-                        ))).label('tasks_with_new'),
-                        func.count(distinct(case(
-                            (TaskHistoryRaw.completed_status_count > 1, TaskHistoryRaw.task_id),
-                            else_=None
-                        ))).label('tasks_with_rework')
-                    ).filter(
-                        TaskHistoryRaw.new_status == 'completed',
-                        TaskHistoryRaw.old_status != 'completed-approval',
-                        TaskHistoryRaw.project_id == project_id,
-                        TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
-                    )
+                    # Range-sum the trainer fact tables built at sync time; fall back
+                    # to the raw tables until they have been built
+                    facts = self._load_trainer_facts(session, [project_id], start_date, end_date)
                     
-                    if start_date:
-                        true_aht_query = true_aht_query.filter(TaskHistoryRaw.date >= start_date)
-                    if end_date:
-                        true_aht_query = true_aht_query.filter(TaskHistoryRaw.date <= end_date)
-                    
-                    true_aht_result = true_aht_query.first()
-                    project_true_tasks_with_new = true_aht_result.tasks_with_new if true_aht_result else 0
-                    project_true_tasks_with_rework = true_aht_result.tasks_with_rework if true_aht_result else 0
-                    
-                    history_query = session.query(
-                        TaskHistoryRaw.author,
-                        func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks'),
-                        func.sum(case(
-                            (TaskHistoryRaw.completed_status_count == 1, 1),
-                            else_=0
-                        )).label('new_tasks'),
-                        func.sum(case(
-                            (TaskHistoryRaw.completed_status_count > 1, 1),
-                            else_=0
-                        )).label('rework'),
-                        func.count(distinct(case(
-                            (TaskHistoryRaw.completed_status_count > 1, TaskHistoryRaw.task_id),
-                            else_=None
-                        ))).label('tasks_with_rework')
-                    ).filter(
-                        TaskHistoryRaw.new_status == 'completed',
-                        TaskHistoryRaw.old_status != 'completed-approval',
-                        TaskHistoryRaw.project_id == project_id,
-                        TaskHistoryRaw.author.isnot(None),
-                        TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
-                    )
+                    if facts is not None:
+                        (project_true_unique_tasks, project_true_tasks_with_new,
+                         project_true_tasks_with_rework) = self._count_fact_tasks(session, [project_id], start_date, end_date)
+                        trainer_history = self._fact_history_map(facts)
+                    else:
+                        # ---------------------------------------------------------
+                        # FIX: Get TRUE unique_tasks count at project level
+                        # Only count tasks still in completed pipeline
+                        # ---------------------------------------------------------
+                        true_unique_query = session.query(
+                            func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks')
+                        ).filter(
+                            TaskHistoryRaw.new_status == 'completed',
+                            TaskHistoryRaw.old_status != 'completed-approval',
+                            TaskHistoryRaw.project_id == project_id,
+                            TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
+                        )
                     
-                    if start_date:
-                        history_query = history_query.filter(TaskHistoryRaw.date >= start_date)
-                    if end_date:
-                        history_query = history_query.filter(TaskHistoryRaw.date <= end_date)
+                        if start_date:
+                            true_unique_query = true_unique_query.filter(TaskHistoryRaw.date >= start_date)
+                        if end_date:
+                            true_unique_query = true_unique_query.filter(TaskHistoryRaw.date <= end_date)
                     
-                    history_query = history_query.group_by(TaskHistoryRaw.author)
-                    history_results = history_query.all()
+                        true_unique_result = true_unique_query.first()
+                        project_true_unique_tasks = true_unique_result.unique_tasks if true_unique_result else 0
                     
-                    # Build trainer -> history stats
-                    trainer_history = {}
-                    for hs in history_results:
-                        if hs.author:
-                            email = hs.author.lower().strip()
-                            trainer_history[email] = {
-                                'unique_tasks': hs.unique_tasks or 0,
-                                'new_tasks': hs.new_tasks or 0,
-                                'rework': hs.rework or 0,
-                                'tasks_with_rework': hs.tasks_with_rework or 0  # NEW: unique tasks with rework
-                            }
+                        # ---------------------------------------------------------
+                        # FIX: Get TRUE tasks_with_new and tasks_with_rework at project level
+                        # This prevents inflation when tasks are worked on by multiple trainers
+                        # - tasks_with_new = unique tasks that had their FIRST completion (completed_status_count=1)
+                        # - tasks_with_rework = unique tasks that had REWORK completions (completed_status_count>1)
+                        # Note: A task can appear in BOTH if it was new AND reworked in the same period
+                        # ---------------------------------------------------------
+                        true_aht_query = session.query(
+                            func.count(distinct(case(
+                                (TaskHistoryRaw.completed_status_count == 1, TaskHistoryRaw.task_id),
+                                else_=None
+                            ))).label('tasks_with_new'),
+                            func.count(distinct(case(
+                                (TaskHistoryRaw.completed_status_count > 1, TaskHistoryRaw.task_id),
+                                else_=None
+                            ))).label('tasks_with_rework')
+                        ).filter(
+                            TaskHistoryRaw.new_status == 'completed',
+                            TaskHistoryRaw.old_status != 'completed-approval',
+                            TaskHistoryRaw.project_id == project_id,
+                            TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
+                        )
                     
-                    # ---------------------------------------------------------
-                    # If include_tasks=True, get task-level details for each trainer
-                    # ---------------------------------------------------------
-                    trainer_tasks = {}
-                    if include_tasks:
-                        # Get detailed task history with completion info per trainer
-                        task_history_query = session.query(
-                            TaskHistoryRaw.task_id,
+                        if start_date:
+                            true_aht_query = true_aht_query.filter(TaskHistoryRaw.date >= start_date)
+                        if end_date:
+                            true_aht_query = true_aht_query.filter(TaskHistoryRaw.date <= end_date)
+                    
+                        true_aht_result = true_aht_query.first()
+                        project_true_tasks_with_new = true_aht_result.tasks_with_new if true_aht_result else 0
+                        project_true_tasks_with_rework = true_aht_result.tasks_with_rework if true_aht_result else 0
+                    
+                        history_query = session.query(
                             TaskHistoryRaw.author,
-                            TaskHistoryRaw.completed_status_count,
-                            TaskHistoryRaw.date,
-                            TaskHistoryRaw.time_stamp
+                            func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks'),
+                            func.sum(case(
+                                (TaskHistoryRaw.completed_status_count == 1, 1),
+                                else_=0
+                            )).label('new_tasks'),
+                            func.sum(case(
+                                (TaskHistoryRaw.completed_status_count > 1, 1),
+                                else_=0
+                            )).label('rework'),
+                            func.count(distinct(case(
+                                (TaskHistoryRaw.completed_status_count > 1, TaskHistoryRaw.task_id),
+                                else_=None
+                            ))).label('tasks_with_rework')
                         ).filter(
                             TaskHistoryRaw.new_status == 'completed',
                             TaskHistoryRaw.old_status != 'completed-approval',
@@ -3101,430 +3692,247 @@ class QueryService:
                             TaskHistoryRaw.author.isnot(None),
                             TaskHistoryRaw.task_id.in_(session.query(valid_tasks_proj))
                         )
-                        
+                    
                         if start_date:
-                            task_history_query = task_history_query.filter(TaskHistoryRaw.date >= start_date)
+                            history_query = history_query.filter(TaskHistoryRaw.date >= start_date)
                         if end_date:
-                            task_history_query = task_history_query.filter(TaskHistoryRaw.date <= end_date)
-                        
-                        task_history_details = task_history_query.all()
-                        
-                        # Group task IDs by trainer email
-                        trainer_task_ids = defaultdict(set)
-                        task_completion_info = {}  # (task_id, email) -> {is_new, rework_count, completion_date, ...}
-                        
-                        for th in task_history_details:
-                            email = th.author.lower().strip()
-                            trainer_task_ids[email].add(th.task_id)
-                            
-                            # Track the completion info for each (task_id, trainer) pair
-                            # Key insight: 
-                            #   - is_new should be TRUE if the FIRST completion by this trainer had completed_status_count == 1
-                            #   - rework_count = (total completions by this trainer) - 1
-                            key = (th.task_id, email)
-                            if key not in task_completion_info:
-                                # First time seeing this (task, trainer) pair
-                                task_completion_info[key] = {
-                                    'is_new': th.completed_status_count == 1,  # Was this a NEW task completion?
-                                    'total_completions': 1,  # Count of completions by this trainer
-                                    'completion_date': th.date,
-                                    '_first_ts': th.time_stamp,  # Track first completion timestamp
-                                    '_last_ts': th.time_stamp,   # Track last completion for date
-                                    '_first_count': th.completed_status_count,  # The count at first completion
-                                }
-                            else:
-                                # Already seen this (task, trainer) pair - update tracking
-                                info = task_completion_info[key]
-                                info['total_completions'] += 1
-                                
-                                # Update is_new based on EARLIEST completion (lowest completed_status_count or earliest timestamp)
-                                if th.time_stamp and info.get('_first_ts'):
-                                    if th.time_stamp < info['_first_ts']:
-                                        # This event is earlier, update first completion info
-                                        info['is_new'] = th.completed_status_count == 1
-                                        info['_first_ts'] = th.time_stamp
-                                        info['_first_count'] = th.completed_status_count
-                                
-                                # Update completion_date to latest
-                                if th.time_stamp and (not info.get('_last_ts') or th.time_stamp > info['_last_ts']):
-                                    info['completion_date'] = th.date
-                                    info['_last_ts'] = th.time_stamp
-                        
-                        # Calculate rework_count from total_completions
-                        for key, info in task_completion_info.items():
-                            # rework_count = total completions - 1 (if new task) or total completions (if started as rework)
-                            # Actually, simpler: rework_count = completions where count > 1
-                            # For the trainer, rework_count = total_completions - 1 if is_new, else total_completions
-                            if info['is_new']:
-                                info['rework_count'] = max(0, info['total_completions'] - 1)
-                            else:
-                                # Task was already rework when this trainer first completed it
-                                info['rework_count'] = info['total_completions']
-                        
-                        # Get all unique task IDs for this project
-                        all_task_ids = set()
-                        for ids in trainer_task_ids.values():
-                            all_task_ids.update(ids)
-                        
-                        # Fetch task details from TaskRaw
-                        task_details = {}
-                        if all_task_ids:
-                            task_raw_query = session.query(TaskRaw).filter(
-                                TaskRaw.task_id.in_(list(all_task_ids)),
-                                TaskRaw.project_id == project_id
-                            )
-                            
-                            for task in task_raw_query.all():
-                                reviewer_email = (task.reviewer or '').lower().strip()
-                                is_calibrated = 1 if reviewer_email and reviewer_email in calibrator_emails_set else 0
-                                cal_passed = 1 if is_calibrated and (task.review_action_type or '').lower() != 'rework' else 0
-                                task_details[task.task_id] = {
-                                    'task_id': task.task_id,
-                                    'colab_link': task.colab_link,
-                                    'task_status': task.task_status,
-                                    'delivery_status': task.delivery_status,
-                                    'delivery_batch_name': task.delivery_batch_name,
-                                    'count_reviews': task.count_reviews or 0,
-                                    'avg_rating': round(float(task.sum_score) / float(task.count_reviews), 2) if task.count_reviews and task.count_reviews > 0 and task.sum_score else None,
-                                    'number_of_turns': task.number_of_turns or 0,
-                                    'last_completed_date': task.last_completed_date.isoformat() if task.last_completed_date else None,
-                                    'created_date': task.created_date.isoformat() if task.created_date else None,
-                                    'task_duration': task.task_duration,  # AHT in minutes
-                                    'is_calibrated': is_calibrated,
-                                    'calibration_passed': cal_passed,
-                                }
-                        
-                        # Get per-task agentic review data
-                        task_agentic_reviews = {}
-                        if all_task_ids:
-                            agentic_per_task = session.query(
-                                TrainerReviewStats.task_id,
-                                func.count(TrainerReviewStats.review_id).label('agentic_count'),
-                                func.sum(TrainerReviewStats.score).label('agentic_score_sum')
-                            ).filter(
-                                TrainerReviewStats.task_id.in_(list(all_task_ids)),
-                                TrainerReviewStats.project_id == project_id,
-                                TrainerReviewStats.score.isnot(None),
-                                TrainerReviewStats.review_type == 'auto'
-                            )
-                            
-                            if start_date:
-                                agentic_per_task = agentic_per_task.filter(TrainerReviewStats.review_date >= start_date)
-                            if end_date:
-                                agentic_per_task = agentic_per_task.filter(TrainerReviewStats.review_date <= end_date)
-                            
-                            agentic_per_task = agentic_per_task.group_by(TrainerReviewStats.task_id)
-                            
-                            for ar in agentic_per_task.all():
-                                task_agentic_reviews[ar.task_id] = {
-                                    'count': ar.agentic_count or 0,
-                                    'avg_rating': round(float(ar.agentic_score_sum) / float(ar.agentic_count), 2) if ar.agentic_count and ar.agentic_count > 0 and ar.agentic_score_sum else None
+                            history_query = history_query.filter(TaskHistoryRaw.date <= end_date)
+                    
+                        history_query = history_query.group_by(TaskHistoryRaw.author)
+                        history_results = history_query.all()
+                    
+                        # Build trainer -> history stats
+                        trainer_history = {}
+                        for hs in history_results:
+                            if hs.author:
+                                email = hs.author.lower().strip()
+                                trainer_history[email] = {
+                                    'unique_tasks': hs.unique_tasks or 0,
+                                    'new_tasks': hs.new_tasks or 0,
+                                    'rework': hs.rework or 0,
+                                    'tasks_with_rework': hs.tasks_with_rework or 0  # NEW: unique tasks with rework
                                 }
-                        
-                        # Build task list for each trainer
-                        for email, task_ids in trainer_task_ids.items():
-                            tasks_list = []
-                            for task_id in task_ids:
-                                task_info = task_details.get(task_id, {})
-                                completion_info = task_completion_info.get((task_id, email), {})
-                                agentic_info = task_agentic_reviews.get(task_id, {})
-                                
-                                # Determine delivery status display
-                                is_delivered = task_info.get('delivery_status', '').lower() == 'delivered' if task_info.get('delivery_status') else False
-                                is_in_queue = (
-                                    task_info.get('delivery_batch_name') and 
-                                    not is_delivered
-                                )
-                                
-                                # Determine if new or rework for this task submission
-                                is_new = completion_info.get('is_new', False)
-                                rework_count = completion_info.get('rework_count', 0)
-                                total_completions = completion_info.get('total_completions', 1)
-                                
-                                # Calculate task-level accounted hours using new logic
-                                # NEW LOGIC (Feb 2026):
-                                # - New task: credit 10 hours
-                                # - Rework: credit 4 hours ONCE per task (capped by MAX_REWORKS_TO_REWARD)
-                                # This prevents rewarding multiple low-quality reworks by same trainer
-                                aht_config = self._constants.aht
-                                task_accounted_hrs = aht_config.calculate_task_accounted_hours(
-                                    is_new=is_new,
-                                    rework_count=rework_count
-                                )
-                                
-                                # Rework percentage = rework_count / total_submissions × 100
-                                # total_submissions = 1 (if new) + rework_count OR just rework_count (if not new)
-                                total_submissions = (1 if is_new else 0) + rework_count
-                                if total_submissions > 0:
-                                    task_rework_pct = round((rework_count / total_submissions) * 100, 1)
-                                else:
-                                    task_rework_pct = 0
-                                
-                                # Task-level merged AHT = accounted_hours for this single task
-                                # (For a single task, merged AHT = accounted_hours since unique_tasks = 1)
-                                task_merged_aht = task_accounted_hrs
-                                
-                                tasks_list.append({
-                                    'task_id': task_id,
-                                    'colab_link': task_info.get('colab_link'),
-                                    'is_new': is_new,
-                                    'rework_count': rework_count,
-                                    'reviews': task_info.get('count_reviews', 0),
-                                    'avg_rating': task_info.get('avg_rating'),
-                                    'agentic_reviews': agentic_info.get('count', 0),
-                                    'agentic_rating': agentic_info.get('avg_rating'),
-                                    'is_delivered': is_delivered,
-                                    'is_in_queue': is_in_queue,
-                                    'task_status': task_info.get('task_status'),
-                                    'last_completed_date': completion_info.get('completion_date').isoformat() if completion_info.get('completion_date') else task_info.get('last_completed_date'),
-                                    'aht_mins': task_merged_aht,
-                                    'accounted_hours': task_accounted_hrs,
-                                    'rework_percent': task_rework_pct,
-                                    'is_calibrated': task_info.get('is_calibrated', 0),
-                                    'calibration_passed': task_info.get('calibration_passed', 0),
-                                })
-                            
-                            # Sort tasks by last_completed_date (most recent first)
-                            tasks_list.sort(key=lambda x: x.get('last_completed_date') or '', reverse=True)
-                            trainer_tasks[email] = tasks_list
                     
                     # ---------------------------------------------------------
-                    # Get total_reviews and avg_rating from TrainerReviewStats
-                    # FIX: Use TrainerReviewStats for proper attribution (same as POD Lead tab)
-                    # This ensures reviews are attributed to the trainer who did the work,
-                    # not the current task owner.
-                    #
-                    # Edge case handled:
-                    # - Trainer A completes task -> rejected (2.3) -> Trainer B reworks -> approved (5.0)
-                    #   Trainer A gets 1 review: 2.3
-                    #   Trainer B gets 1 review: 5.0
+                    # If include_tasks=True, get task-level details for each trainer
                     # ---------------------------------------------------------
-                    # Query for MANUAL reviews
-                    reviews_query = session.query(
-                        TrainerReviewStats.trainer_email,
-                        func.count(TrainerReviewStats.review_id).label('total_reviews'),
-                        func.sum(TrainerReviewStats.score).label('total_score')
-                    ).filter(
-                        TrainerReviewStats.project_id == project_id,
-                        TrainerReviewStats.score.isnot(None),
-                        or_(TrainerReviewStats.review_type == 'manual', TrainerReviewStats.review_type.is_(None))
-                    )
-                    
-                    if start_date:
-                        reviews_query = reviews_query.filter(TrainerReviewStats.review_date >= start_date)
-                    if end_date:
-                        reviews_query = reviews_query.filter(TrainerReviewStats.review_date <= end_date)
-                    
-                    reviews_query = reviews_query.group_by(TrainerReviewStats.trainer_email)
-                    reviews_results = reviews_query.all()
-                    
-                    trainer_reviews = {}
-                    trainer_avg_rating = {}
-                    trainer_manual_scores = {}  # For aggregation
-                    for rr in reviews_results:
-                        if rr.trainer_email:
-                            email = rr.trainer_email.lower().strip()
-                            trainer_reviews[email] = rr.total_reviews or 0
-                            trainer_manual_scores[email] = float(rr.total_score or 0)
-                            if rr.total_reviews and rr.total_reviews > 0 and rr.total_score:
-                                trainer_avg_rating[email] = round(float(rr.total_score) / float(rr.total_reviews), 2)
-                            else:
-                                trainer_avg_rating[email] = None
-                    
-                    # Query for AGENTIC (auto) reviews
-                    agentic_query = session.query(
-                        TrainerReviewStats.trainer_email,
-                        func.count(TrainerReviewStats.review_id).label('total_reviews'),
-                        func.sum(TrainerReviewStats.score).label('total_score')
-                    ).filter(
-                        TrainerReviewStats.project_id == project_id,
-                        TrainerReviewStats.score.isnot(None),
-                        TrainerReviewStats.review_type == 'auto'
-                    )
-                    
-                    if start_date:
-                        agentic_query = agentic_query.filter(TrainerReviewStats.review_date >= start_date)
-                    if end_date:
-                        agentic_query = agentic_query.filter(TrainerReviewStats.review_date <= end_date)
-                    
-                    agentic_query = agentic_query.group_by(TrainerReviewStats.trainer_email)
-                    agentic_results = agentic_query.all()
+                    trainer_tasks = {}
+                    if include_tasks:
+                        trainer_tasks = self._trainer_task_rows(
+                            session, project_id, start_date, end_date, calibrator_emails_set
+                        )
                     
-                    trainer_agentic_reviews = {}
-                    trainer_agentic_rating = {}
-                    trainer_agentic_scores = {}  # For aggregation
-                    for ar in agentic_results:
-                        if ar.trainer_email:
-                            email = ar.trainer_email.lower().strip()
-                            trainer_agentic_reviews[email] = ar.total_reviews or 0
-                            trainer_agentic_scores[email] = float(ar.total_score or 0)
-                            if ar.total_reviews and ar.total_reviews > 0 and ar.total_score:
-                                trainer_agentic_rating[email] = round(float(ar.total_score) / float(ar.total_reviews), 2)
-                            else:
-                                trainer_agentic_rating[email] = None
+                    if facts is not None:
+                        # Reviews, deliveries and revenue from the trainer fact tables
+                        trainer_reviews = self._fact_measure_map(facts, 'manual_reviews')
+                        trainer_manual_scores = {e: facts[e]['manual_score'] for e in trainer_reviews}
+                        trainer_avg_rating = self._fact_rating_map(facts, 'manual_reviews', 'manual_score')
+                        trainer_agentic_reviews = self._fact_measure_map(facts, 'agentic_reviews')
+                        trainer_agentic_scores = {e: facts[e]['agentic_score'] for e in trainer_agentic_reviews}
+                        trainer_agentic_rating = self._fact_rating_map(facts, 'agentic_reviews', 'agentic_score')
+                        trainer_delivered = self._fact_measure_map(facts, 'delivered_tasks')
+                        trainer_in_queue = self._fact_measure_map(facts, 'in_delivery_queue')
+                        trainer_revenue_map = self._fact_measure_map(facts, 'revenue')
+                    else:
+                        # ---------------------------------------------------------
+                        # Get total_reviews and avg_rating from TrainerReviewStats
+                        # FIX: Use TrainerReviewStats for proper attribution (same as POD Lead tab)
+                        # This ensures reviews are attributed to the trainer who did the work,
+                        # not the current task owner.
+                        #
+                        # Edge case handled:
+                        # - Trainer A completes task -> rejected (2.3) -> Trainer B reworks -> approved (5.0)
+                        #   Trainer A gets 1 review: 2.3
+                        #   Trainer B gets 1 review: 5.0
+                        # ---------------------------------------------------------
+                        # Query for MANUAL reviews
+                        reviews_query = session.query(
+                            TrainerReviewStats.trainer_email,
+                            func.count(TrainerReviewStats.review_id).label('total_reviews'),
+                            func.sum(TrainerReviewStats.score).label('total_score')
+                        ).filter(
+                            TrainerReviewStats.project_id == project_id,
+                            TrainerReviewStats.score.isnot(None),
+                            or_(TrainerReviewStats.review_type == 'manual', TrainerReviewStats.review_type.is_(None))
+                        )
                     
-                    # ---------------------------------------------------------
-                    # Get delivered and in_queue counts with proper attribution
-                    # FIX: Use LAST COMPLETER from TaskHistoryRaw (same as POD Lead tab)
-                    # Use delivery_status and delivery_batch_name (same as POD Lead tab)
-                    # ---------------------------------------------------------
+                        if start_date:
+                            reviews_query = reviews_query.filter(TrainerReviewStats.review_date >= start_date)
+                        if end_date:
+                            reviews_query = reviews_query.filter(TrainerReviewStats.review_date <= end_date)
+                    
+                        reviews_query = reviews_query.group_by(TrainerReviewStats.trainer_email)
+                        reviews_results = reviews_query.all()
+                    
+                        trainer_reviews = {}
+                        trainer_avg_rating = {}
+                        trainer_manual_scores = {}  # For aggregation
+                        for rr in reviews_results:
+                            if rr.trainer_email:
+                                email = rr.trainer_email.lower().strip()
+                                trainer_reviews[email] = rr.total_reviews or 0
+                                trainer_manual_scores[email] = float(rr.total_score or 0)
+                                if rr.total_reviews and rr.total_reviews > 0 and rr.total_score:
+                                    trainer_avg_rating[email] = round(float(rr.total_score) / float(rr.total_reviews), 2)
+                                else:
+                                    trainer_avg_rating[email] = None
                     
-                    # Get delivered task IDs (delivery_status = 'delivered')
-                    # Filter by delivery_date (when the batch was actually delivered)
-                    delivered_tasks_q = session.query(TaskRaw.task_id).filter(
-                        func.lower(TaskRaw.delivery_status) == 'delivered',
-                        TaskRaw.project_id == project_id
-                    )
-                    if start_date:
-                        delivered_tasks_q = delivered_tasks_q.filter(TaskRaw.delivery_date >= start_date)
-                    if end_date:
-                        delivered_tasks_q = delivered_tasks_q.filter(TaskRaw.delivery_date <= end_date)
-                    delivered_task_ids = [r.task_id for r in delivered_tasks_q.all()]
+                        # Query for AGENTIC (auto) reviews
+                        agentic_query = session.query(
+                            TrainerReviewStats.trainer_email,
+                            func.count(TrainerReviewStats.review_id).label('total_reviews'),
+                            func.sum(TrainerReviewStats.score).label('total_score')
+                        ).filter(
+                            TrainerReviewStats.project_id == project_id,
+                            TrainerReviewStats.score.isnot(None),
+                            TrainerReviewStats.review_type == 'auto'
+                        )
                     
-                    # Get in_queue task IDs (has delivery_batch_name but not yet delivered)
-                    # NOTE: Don't filter by date - "In Queue" is a CURRENT status, not historical
-                    queue_tasks_q = session.query(TaskRaw.task_id).filter(
-                        TaskRaw.delivery_batch_name.isnot(None),
-                        TaskRaw.delivery_batch_name != '',
-                        or_(
-                            func.lower(TaskRaw.delivery_status) != 'delivered',
-                            TaskRaw.delivery_status.is_(None)
-                        ),
-                        TaskRaw.project_id == project_id
-                    )
-                    # No date filter - show current queue status regardless of timeframe
-                    in_queue_task_ids = [r.task_id for r in queue_tasks_q.all()]
+                        if start_date:
+                            agentic_query = agentic_query.filter(TrainerReviewStats.review_date >= start_date)
+                        if end_date:
+                            agentic_query = agentic_query.filter(TrainerReviewStats.review_date <= end_date)
+                    
+                        agentic_query = agentic_query.group_by(TrainerReviewStats.trainer_email)
+                        agentic_results = agentic_query.all()
+                    
+                        trainer_agentic_reviews = {}
+                        trainer_agentic_rating = {}
+                        trainer_agentic_scores = {}  # For aggregation
+                        for ar in agentic_results:
+                            if ar.trainer_email:
+                                email = ar.trainer_email.lower().strip()
+                                trainer_agentic_reviews[email] = ar.total_reviews or 0
+                                trainer_agentic_scores[email] = float(ar.total_score or 0)
+                                if ar.total_reviews and ar.total_reviews > 0 and ar.total_score:
+                                    trainer_agentic_rating[email] = round(float(ar.total_score) / float(ar.total_reviews), 2)
+                                else:
+                                    trainer_agentic_rating[email] = None
                     
-                    # Attribute to LAST COMPLETER from TaskHistoryRaw
-                    trainer_delivered = {}
-                    trainer_in_queue = {}
-                    all_delivery_task_ids = list(set(delivered_task_ids + in_queue_task_ids))
-                    task_completions = defaultdict(list)  # Initialize before conditional block
+                        # ---------------------------------------------------------
+                        # Get delivered and in_queue counts with proper attribution
+                        # FIX: Use LAST COMPLETER from TaskHistoryRaw (same as POD Lead tab)
+                        # Use delivery_status and delivery_batch_name (same as POD Lead tab)
+                        # ---------------------------------------------------------
                     
-                    if all_delivery_task_ids:
-                        # Get completion events
-                        completion_events = session.query(
-                            TaskHistoryRaw.task_id,
-                            TaskHistoryRaw.author,
-                            TaskHistoryRaw.time_stamp
-                        ).filter(
-                            TaskHistoryRaw.task_id.in_(all_delivery_task_ids),
-                            TaskHistoryRaw.new_status == 'completed',
-                            TaskHistoryRaw.old_status != 'completed-approval',
-                            TaskHistoryRaw.author.isnot(None)
-                        ).all()
+                        # Get delivered task IDs (delivery_status = 'delivered')
+                        # Filter by delivery_date (when the batch was actually delivered)
+                        delivered_tasks_q = session.query(TaskRaw.task_id).filter(
+                            func.lower(TaskRaw.delivery_status) == 'delivered',
+                            TaskRaw.project_id == project_id
+                        )
+                        if start_date:
+                            delivered_tasks_q = delivered_tasks_q.filter(TaskRaw.delivery_date >= start_date)
+                        if end_date:
+                            delivered_tasks_q = delivered_tasks_q.filter(TaskRaw.delivery_date <= end_date)
+                        delivered_task_ids = [r.task_id for r in delivered_tasks_q.all()]
+                    
+                        # Get in_queue task IDs (has delivery_batch_name but not yet delivered)
+                        # NOTE: Don't filter by date - "In Queue" is a CURRENT status, not historical
+                        queue_tasks_q = session.query(TaskRaw.task_id).filter(
+                            TaskRaw.delivery_batch_name.isnot(None),
+                            TaskRaw.delivery_batch_name != '',
+                            or_(
+                                func.lower(TaskRaw.delivery_status) != 'delivered',
+                                TaskRaw.delivery_status.is_(None)
+                            ),
+                            TaskRaw.project_id == project_id
+                        )
+                        # No date filter - show current queue status regardless of timeframe
+                        in_queue_task_ids = [r.task_id for r in queue_tasks_q.all()]
+                    
+                        # Attribute to LAST COMPLETER from TaskHistoryRaw
+                        trainer_delivered = {}
+                        trainer_in_queue = {}
+                        all_delivery_task_ids = list(set(delivered_task_ids + in_queue_task_ids))
+                        task_completions = defaultdict(list)  # Initialize before conditional block
+                    
+                        if all_delivery_task_ids:
+                            # Get completion events
+                            completion_events = session.query(
+                                TaskHistoryRaw.task_id,
+                                TaskHistoryRaw.author,
+                                TaskHistoryRaw.time_stamp
+                            ).filter(
+                                TaskHistoryRaw.task_id.in_(all_delivery_task_ids),
+                                TaskHistoryRaw.new_status == 'completed',
+                                TaskHistoryRaw.old_status != 'completed-approval',
+                                TaskHistoryRaw.author.isnot(None)
+                            ).all()
                         
-                        # Group by task_id
-                        from collections import defaultdict as dd
-                        task_completions = dd(list)
-                        for event in completion_events:
-                            task_completions[event.task_id].append({
-                                'author': event.author.lower().strip() if event.author else None,
-                                'time_stamp': event.time_stamp
-                            })
+                            # Group by task_id
+                            from collections import defaultdict as dd
+                            task_completions = dd(list)
+                            for event in completion_events:
+                                task_completions[event.task_id].append({
+                                    'author': event.author.lower().strip() if event.author else None,
+                                    'time_stamp': event.time_stamp
+                                })
                         
-                        # Attribute to last completer
-                        delivered_set = set(delivered_task_ids)
-                        in_queue_set = set(in_queue_task_ids)
+                            # Attribute to last completer
+                            delivered_set = set(delivered_task_ids)
+                            in_queue_set = set(in_queue_task_ids)
                         
-                        for task_id, completions in task_completions.items():
-                            if not completions:
-                                continue
-                            # Find last completer
-                            completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
-                            last_completer = completions_sorted[-1]['author']
+                            for task_id, completions in task_completions.items():
+                                if not completions:
+                                    continue
+                                # Find last completer
+                                completions_sorted = sorted(completions, key=lambda x: x['time_stamp'] or '')
+                                last_completer = completions_sorted[-1]['author']
                             
-                            if not last_completer:
-                                continue
+                                if not last_completer:
+                                    continue
                             
-                            if task_id in delivered_set:
-                                trainer_delivered[last_completer] = trainer_delivered.get(last_completer, 0) + 1
-                            if task_id in in_queue_set:
-                                trainer_in_queue[last_completer] = trainer_in_queue.get(last_completer, 0) + 1
+                                if task_id in delivered_set:
+                                    trainer_delivered[last_completer] = trainer_delivered.get(last_completer, 0) + 1
+                                if task_id in in_queue_set:
+                                    trainer_in_queue[last_completer] = trainer_in_queue.get(last_completer, 0) + 1
                     
-                    # ---------------------------------------------------------
-                    # Compute trainer-level revenue for this project
-                    # Trainer revenue = SUM(bill_rate_task for each delivered task)
-                    # Uses week-aware rate lookup from ProjectRevenueWeekly
-                    # ---------------------------------------------------------
-                    trainer_revenue_map = {}
+                        # ---------------------------------------------------------
+                        # Compute trainer-level revenue for this project
+                        # Trainer revenue = SUM(bill_rate_task for each delivered task)
+                        # Uses week-aware rate lookup from ProjectRevenueWeekly
+                        # ---------------------------------------------------------
+                        trainer_revenue_map = {}
                     
-                    if delivered_task_ids:
-                        from datetime import timedelta as _td
-                        
-                        # Get rate entries from ProjectRevenueWeekly for this project
-                        _rate_rows = session.query(
-                            ProjectRevenueWeekly.jibble_project_name,
-                            ProjectRevenueWeekly.week_start_date,
-                            ProjectRevenueWeekly.week_end_date,
-                            ProjectRevenueWeekly.bill_rate_task,
-                        ).filter(
-                            ProjectRevenueWeekly.bill_rate_task.isnot(None),
-                            ProjectRevenueWeekly.bill_rate_task > 0,
-                        ).all()
-                        
-                        _rate_entries = []
-                        for _rr in _rate_rows:
-                            _rate_entries.append({
-                                'jibble_name': _rr.jibble_project_name,
-                                'week_start': _rr.week_start_date,
-                                'week_end': _rr.week_end_date or (_rr.week_start_date + _td(days=6)),
-                                'bill_rate': float(_rr.bill_rate_task),
-                            })
-                        
-                        # Get delivered task details
-                        _dtd = session.query(
-                            TaskRaw.task_id,
-                            TaskRaw.project_id,
-                            TaskRaw.batch_name,
-                            TaskRaw.delivery_date,
-                        ).filter(
-                            TaskRaw.task_id.in_(delivered_task_ids),
-                        ).all()
+                        if delivered_task_ids:
+                            # Weekly bill rates, indexed by project and week start
+                            _rate_index = get_rate_index(session)
                         
-                        _task_detail = {}
-                        for _row in _dtd:
-                            _task_detail[_row.task_id] = {
-                                'project_id': _row.project_id,
-                                'batch_name': _row.batch_name,
-                                'delivery_date': _row.delivery_date,
-                            }
-                        
-                        def _get_jibble_name_proj(pid, batch_name):
-                            _pid_m = {
-                                36: 'Nvidia - SysBench',
-                                37: 'Nvidia - Multichallenge',
-                                38: 'Nvidia - InverseIFEval',
-                                39: 'Nvidia - CFBench Multilingual',
-                                59: 'NVIDIA_STEM Math_Proof_Eval',
-                            }
-                            return _pid_m.get(pid, '')
+                            # Get delivered task details
+                            _dtd = session.query(
+                                TaskRaw.task_id,
+                                TaskRaw.project_id,
+                                TaskRaw.batch_name,
+                                TaskRaw.delivery_date,
+                            ).filter(
+                                TaskRaw.task_id.in_(delivered_task_ids),
+                            ).all()
                         
-                        def _find_rate(jn, dd):
-                            if not dd or not jn:
-                                return 0
-                            for ent in _rate_entries:
-                                if ent['jibble_name'] == jn and ent['week_start'] <= dd <= ent['week_end']:
-                                    return ent['bill_rate']
-                            return 0
+                            _task_detail = {}
+                            for _row in _dtd:
+                                _task_detail[_row.task_id] = {
+                                    'project_id': _row.project_id,
+                                    'batch_name': _row.batch_name,
+                                    'delivery_date': _row.delivery_date,
+                                }
                         
-                        # Use task_completions (already computed above for delivery attribution)
-                        for _tid in delivered_task_ids:
-                            _det = _task_detail.get(_tid)
-                            if not _det or not _det['delivery_date']:
-                                continue
-                            _comps = task_completions.get(_tid, [])
-                            if _comps:
-                                _sorted = sorted(_comps, key=lambda x: x['time_stamp'] or '')
-                                _trainer = _sorted[-1]['author']
-                            else:
-                                continue
-                            if not _trainer:
-                                continue
-                            _jn = _get_jibble_name_proj(_det['project_id'], _det['batch_name'])
-                            _br = _find_rate(_jn, _det['delivery_date'])
-                            if _br > 0:
-                                trainer_revenue_map[_trainer] = trainer_revenue_map.get(_trainer, 0) + _br
+                            # Use task_completions (already computed above for delivery attribution)
+                            for _tid in delivered_task_ids:
+                                _det = _task_detail.get(_tid)
+                                if not _det or not _det['delivery_date']:
+                                    continue
+                                _comps = task_completions.get(_tid, [])
+                                if _comps:
+                                    _sorted = sorted(_comps, key=lambda x: x['time_stamp'] or '')
+                                    _trainer = _sorted[-1]['author']
+                                else:
+                                    continue
+                                if not _trainer:
+                                    continue
+                                _br = _rate_index.project_rate(_det['project_id'], _det['delivery_date'])
+                                if _br > 0:
+                                    trainer_revenue_map[_trainer] = trainer_revenue_map.get(_trainer, 0) + _br
                     
                     # Get Jibble hours for all trainers - use project-specific data only
                     # Map project_id to exact Jibble project name (from centralized constants)
@@ -3610,13 +4018,6 @@ class QueryService:
                                 trainer_cal_passed_map[cr.trainer.lower().strip()] = cr.passed or 0
                                 trainer_calibrated_map[cr.trainer.lower().strip()] = cr.cnt
                     
-                    # Get contributor name by email for fallback matching
-                    contributors = session.query(Contributor).all()
-                    email_to_name = {}
-                    for c in contributors:
-                        if c.turing_email and c.name:
-                            email_to_name[c.turing_email.lower().strip()] = c.name
-                    
                     # Aggregate by POD Lead - now includes trainer details
                     pod_aggregates = defaultdict(lambda: {
                         'unique_tasks': 0,
@@ -3652,14 +4053,7 @@ class QueryService:
                     pod_trainer_emails = defaultdict(list)
                     
                     for trainer_email, hist in trainer_history.items():
-                        pod_info = trainer_to_pod.get(trainer_email)
-                        
-                        # Fallback: try name-based matching if email not found
-                        if not pod_info:
-                            contributor_name = email_to_name.get(trainer_email, '').lower().strip()
-                            if contributor_name and contributor_name in name_to_pod:
-                                pod_info = name_to_pod[contributor_name]
-                                logger.info(f"Name-based fallback matched '{contributor_name}' ({trainer_email}) to pod lead {pod_info['pod_lead_email']}")
+                        pod_info = self._trainer_pod_info(trainer_email, trainer_to_pod, name_to_pod, email_to_name)
                         
                         # Determine POD Lead email and trainer name
                         if pod_info:
@@ -4061,7 +4455,12 @@ class QueryService:
                         # ---------------------------------------------------------
                         pod_trainers = pod_trainer_emails.get(pod_email, [])
                         
-                        if len(pod_trainers) > 1:
+                        if len(pod_trainers) > 1 and facts is not None:
+                            # Multiple trainers - TRUE POD-level metrics from the task facts
+                            pod_true_unique, pod_true_tasks_with_new, pod_true_tasks_with_rework = self._count_fact_tasks(
+                                session, [project_id], start_date, end_date, trainer_emails=pod_trainers
+                            )
+                        elif len(pod_trainers) > 1:
                             # Multiple trainers - query TRUE POD-level metrics
                             pod_true_query = session.query(
                                 func.count(distinct(TaskHistoryRaw.task_id)).label('unique_tasks'),
@@ -4389,6 +4788,7 @@ class QueryService:
             logger.error(f"Error getting project stats: {e}")
             raise
     
+    @cached(prefix="financial_metrics", ignore=('session',))
     def get_financial_metrics(
         self,
         start_date: Optional[str] = None,
@@ -4581,10 +4981,10 @@ class QueryService:
         start_date: str = None,
         end_date: str = None,
     ) -> dict:
-        """Compute Reviewer FPY and Auditor FPY per project from BigQuery reviews.
+        """Compute Reviewer FPY and Auditor FPY per project from the synced fpy_review table.
 
         Logic:
-        - For each task, get ALL published reviews ordered by time.
+        - For each task, take its published manual reviews ordered by time.
         - Determine reviewer role (reviewer vs calibrator) using the team sheet
           for Math Proof Eval, or PodLeadMapping.role for other projects.
         - For each task+role combo, check the FIRST review action:
@@ -4593,147 +4993,26 @@ class QueryService:
         - Reviewer FPY  = reviewer-pass / reviewer-total
         - Auditor  FPY  = calibrator-pass / calibrator-total  (null if no calibrators)
         """
-        from collections import defaultdict
-        from app.config import get_settings
-        from app.models.db_models import PodLeadMapping
+        from app.services.fpy_reviews import fpy_counts, fpy_rates
 
         if not project_ids:
             return {}
 
-        s = get_settings()
-        bq_client = self._get_bq_client()
-        if not bq_client:
-            return {}
-
-        p, d = s.gcp_project_id, s.bigquery_dataset
-        pid_list = ','.join(str(i) for i in project_ids)
-
-        date_clause = ""
-        if start_date:
-            date_clause += f" AND DATE(r.submitted_at) >= '{start_date}'"
-        if end_date:
-            date_clause += f" AND DATE(r.submitted_at) <= '{end_date}'"
-
-        query = f"""
-        SELECT
-            conv.project_id,
-            r.conversation_id,
-            cont.turing_email AS reviewer_email,
-            JSON_EXTRACT_SCALAR(r.review_action, '$.type') AS action_type,
-            r.submitted_at
-        FROM `{p}.{d}.review` r
-        JOIN `{p}.{d}.conversation` conv ON conv.id = r.conversation_id
-        LEFT JOIN `{p}.{d}.contributor` cont ON cont.id = r.reviewer_id
-        WHERE conv.project_id IN ({pid_list})
-          AND r.review_type = 'manual'
-          AND r.status = 'published'
-          AND r.submitted_at IS NOT NULL
-          {date_clause}
-        ORDER BY r.conversation_id, r.submitted_at ASC
-        """
-
-        try:
-            rows = list(bq_client.query(query).result())
-        except Exception as e:
-            logger.error(f"FPY BigQuery query failed: {e}")
-            return {}
-
-        # Build role mapping: email → 'reviewer' | 'calibrator'
-        role_map: dict[str, str] = {}
-
-        # From PodLeadMapping (all projects)
         with self.db_service.get_session() as session:
-            pod_rows = session.query(
-                PodLeadMapping.trainer_email,
-                PodLeadMapping.role
-            ).all()
-            for pr in pod_rows:
-                if pr.trainer_email and pr.role:
-                    role_lower = pr.role.lower().strip()
-                    email_lower = pr.trainer_email.lower().strip()
-                    if role_lower in ('pod lead', 'sub pod lead', 'pod_lead'):
-                        role_map[email_lower] = 'reviewer'
-                    elif role_lower in ('calibrator', 'auditor', 'team lead'):
-                        role_map[email_lower] = 'calibrator'
-
-        # Try team sheet for Math Proof Eval (has calibrator mapping)
-        try:
-            from app.services.quality_rubrics_service import QualityRubricsService
-            qr_service = QualityRubricsService()
-            team_roles = qr_service._fetch_team_roles()
-            for email, role in team_roles.items():
-                role_map[email.lower().strip()] = role
-        except Exception as e:
-            logger.warning(f"Could not load team sheet roles for FPY: {e}")
-
-        # Group reviews by (project_id, conversation_id)
-        # Key: (project_id, conversation_id) → list of (reviewer_email, action_type)
-        reviews_by_task: dict[tuple, list] = defaultdict(list)
-        for row in rows:
-            key = (row['project_id'], row['conversation_id'])
-            reviews_by_task[key].append({
-                'reviewer_email': (row['reviewer_email'] or '').lower().strip(),
-                'action_type': (row['action_type'] or '').lower(),
-            })
-
-        # Compute FPY per project
-        # For each task, find the FIRST review by a reviewer and by a calibrator
-        project_fpy: dict[int, dict] = {pid: {
-            'r_total': 0, 'r_pass': 0,
-            'a_total': 0, 'a_pass': 0,
-        } for pid in project_ids}
-
-        for (pid, conv_id), reviews in reviews_by_task.items():
-            first_reviewer_seen = False
-            first_calibrator_seen = False
-
-            for rev in reviews:  # already sorted by submitted_at ASC
-                email = rev['reviewer_email']
-                action = rev['action_type']
-                role = role_map.get(email, 'reviewer')  # default to reviewer
-
-                if role == 'reviewer' and not first_reviewer_seen:
-                    first_reviewer_seen = True
-                    project_fpy[pid]['r_total'] += 1
-                    if action != 'rework':
-                        project_fpy[pid]['r_pass'] += 1
-
-                elif role == 'calibrator' and not first_calibrator_seen:
-                    first_calibrator_seen = True
-                    project_fpy[pid]['a_total'] += 1
-                    if action != 'rework':
-                        project_fpy[pid]['a_pass'] += 1
+            counts = fpy_counts(session, project_ids, start_date, end_date)
 
         result = {}
         for pid in project_ids:
-            counts = project_fpy[pid]
-            r_fpy = round(counts['r_pass'] / counts['r_total'] * 100, 1) if counts['r_total'] > 0 else None
-            a_fpy = round(counts['a_pass'] / counts['a_total'] * 100, 1) if counts['a_total'] > 0 else None
+            reviewer_fpy, auditor_fpy = fpy_rates(counts.get((pid, None), {}))
             result[pid] = {
-                'reviewer_fpy': r_fpy,
-                'auditor_fpy': a_fpy,
+                'reviewer_fpy': reviewer_fpy,
+                'auditor_fpy': auditor_fpy,
             }
 
-        logger.info(f"FPY computed for {len(project_ids)} projects from {len(rows)} reviews")
+        logger.info(f"FPY computed for {len(project_ids)} projects")
         return result
 
-    def _get_bq_client(self):
-        """Get BigQuery client, returning None if unavailable."""
-        try:
-            from app.config import get_settings
-            from google.cloud import bigquery
-            s = get_settings()
-            if s.google_application_credentials:
-                from google.oauth2 import service_account
-                creds = service_account.Credentials.from_service_account_file(
-                    s.google_application_credentials
-                )
-                return bigquery.Client(project=s.gcp_project_id, credentials=creds)
-            return bigquery.Client(project=s.gcp_project_id)
-        except Exception as e:
-            logger.warning(f"BigQuery client unavailable for FPY: {e}")
-            return None
-
+    @cached(prefix="project_summary")
     def get_project_summary(self, start_date: str = None, end_date: str = None) -> list:
         """
         Return one row per project with metrics for the executive summary page.
@@ -0,0 +1,133 @@
+"""
+Weekly bill-rate lookups for revenue attribution.
+
+Trainer revenue is the sum of bill_rate_task over delivered tasks, where the
+rate is the one for the task's project and the ProjectRevenueWeekly week
+containing its delivery date. ``RateIndex`` keeps each sheet project's weeks
+sorted by start date so that lookup is a bisect (O(log weeks)) instead of a
+scan over every week for every delivered task.
+
+The index changes only when the revenue sheet is synced, so one instance is
+shared per process: ``get_rate_index`` compares a cheap fingerprint of
+project_revenue_weekly (row count and latest last_synced) and reloads the
+rows only after a sync.
+"""
+import logging
+import threading
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.db_models import ProjectRevenueWeekly
+
+logger = logging.getLogger(__name__)
+
+# Project -> 'Projects WoW Revenue' sheet name, for bill_rate_task lookups
+REVENUE_SHEET_PROJECT_NAMES = {
+    36: 'Nvidia - SysBench',
+    37: 'Nvidia - Multichallenge',
+    38: 'Nvidia - InverseIFEval',
+    39: 'Nvidia - CFBench Multilingual',
+    59: 'NVIDIA_STEM Math_Proof_Eval',
+}
+
+_index: Optional["RateIndex"] = None
+_index_fingerprint: Optional[Tuple] = None
+_index_lock = threading.Lock()
+
+
+class RateIndex:
+    """
+    Bill rates per sheet project name, looked up by date.
+
+    Weeks without an end date span 7 days. If weeks overlap, the one that
+    started last wins.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, date, Optional[date], float]]):
+        grouped: Dict[str, List[Tuple[date, date, float]]] = defaultdict(list)
+        for name, week_start, week_end, rate in entries:
+            grouped[name].append((week_start, week_end or week_start + timedelta(days=6), rate))
+
+        # name -> (sorted week starts, running max of week ends, weeks)
+        self._weeks = {}
+        for name, weeks in grouped.items():
+            weeks.sort(key=lambda week: week[0])
+            self._weeks[name] = (
+                [week[0] for week in weeks],
+                list(accumulate((week[1] for week in weeks), max)),
+                weeks,
+            )
+
+    def __len__(self) -> int:
+        return sum(len(weeks) for _, _, weeks in self._weeks.values())
+
+    def rate(self, jibble_name: Optional[str], day: Optional[date]) -> float:
+        """bill_rate_task for a sheet project on ``day`` (0 if no week covers it)."""
+        if not jibble_name or not day:
+            return 0
+        index = self._weeks.get(jibble_name)
+        if index is None:
+            return 0
+
+        starts, reach, weeks = index
+        i = bisect_right(starts, day) - 1
+        # Earlier weeks only need checking while one could still reach ``day``
+        while i >= 0 and reach[i] >= day:
+            _, week_end, rate = weeks[i]
+            if day <= week_end:
+                return rate
+            i -= 1
+        return 0
+
+    def project_rate(self, project_id: int, day: Optional[date]) -> float:
+        """bill_rate_task for a project's delivery on ``day``."""
+        return self.rate(REVENUE_SHEET_PROJECT_NAMES.get(project_id), day)
+
+
+def load_rate_index(session: Session) -> RateIndex:
+    """Build a RateIndex from every positive bill_rate_task in project_revenue_weekly."""
+    rows = session.query(
+        ProjectRevenueWeekly.jibble_project_name,
+        ProjectRevenueWeekly.week_start_date,
+        ProjectRevenueWeekly.week_end_date,
+        ProjectRevenueWeekly.bill_rate_task,
+    ).filter(
+        ProjectRevenueWeekly.bill_rate_task.isnot(None),
+        ProjectRevenueWeekly.bill_rate_task > 0,
+    ).all()
+    return RateIndex(
+        (r.jibble_project_name, r.week_start_date, r.week_end_date, float(r.bill_rate_task))
+        for r in rows
+    )
+
+
+def get_rate_index(session: Session) -> RateIndex:
+    """Get the shared RateIndex, rebuilding it if project_revenue_weekly was re-synced."""
+    global _index, _index_fingerprint
+    fingerprint = tuple(session.query(
+        func.count(ProjectRevenueWeekly.id),
+        func.max(ProjectRevenueWeekly.last_synced),
+    ).one())
+
+    with _index_lock:
+        if _index is not None and _index_fingerprint == fingerprint:
+            return _index
+
+    index = load_rate_index(session)
+    with _index_lock:
+        _index, _index_fingerprint = index, fingerprint
+    logger.info(f"Rate index built: {len(index)} weekly bill rates")
+    return index
+
+
+def invalidate_rate_index():
+    """Drop the shared index so the next lookup reloads it."""
+    global _index, _index_fingerprint
+    with _index_lock:
+        _index, _index_fingerprint = None, None
@@ -0,0 +1,214 @@
+"""
+Shadow-table loads with an atomic swap (PostgreSQL only).
+
+A full table reload is written into ``<table>__shadow`` while readers keep
+using the live table, then swapped in by renames inside one short
+transaction. The replaced copy stays behind as ``<table>__prev`` until the
+next swap, so ``restore_previous_table`` can roll back instantly.
+
+Index names are carried over so the live table always has its canonical
+index names; serial sequences are re-owned by whichever copy is live.
+Outgoing foreign keys also follow the live copy: ``__prev`` is left without
+them, so reloading a referenced table (e.g. ``contributor``) can't cascade
+into the rollback copy.
+"""
+import logging
+import re
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import Table, text
+from sqlalchemy.orm import Session
+
+from app.services.bulk_loader import bulk_load
+
+logger = logging.getLogger(__name__)
+
+SHADOW_SUFFIX = '__shadow'
+PREVIOUS_SUFFIX = '__prev'
+
+# Don't let the swap queue behind long-running reads (and block new ones) forever
+SWAP_LOCK_TIMEOUT = '10s'
+
+# Postgres truncates identifiers beyond 63 bytes
+_MAX_IDENTIFIER = 63
+
+
+def _table_of(model_or_table) -> Table:
+    return model_or_table if isinstance(model_or_table, Table) else model_or_table.__table__
+
+
+def _ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def supports_table_swap(session: Session, model_or_table) -> bool:
+    """
+    True when a table can be reloaded through a shadow swap.
+
+    Requires PostgreSQL, and no other table may reference this one by foreign
+    key (those constraints would keep pointing at the renamed-away copy).
+    """
+    if session.get_bind().dialect.name != 'postgresql':
+        return False
+    table = _table_of(model_or_table)
+    for other in table.metadata.tables.values():
+        if other is not table and any(fk.column.table is table for fk in other.foreign_keys):
+            return False
+    return True
+
+
+def _index_definitions(session: Session, table_name: str) -> Dict[str, str]:
+    """Map index name -> definition with the index and table names stripped."""
+    rows = session.execute(text(
+        "SELECT indexname, indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() AND tablename = :table"
+    ), {'table': table_name}).fetchall()
+    return {
+        name: re.sub(r'^CREATE (UNIQUE )?INDEX \S+ ON \S+ ', r'\1', definition)
+        for name, definition in rows
+    }
+
+
+def _serial_sequences(session: Session, table_name: str) -> List[Dict[str, Any]]:
+    """Sequences owned by the table's serial columns."""
+    rows = session.execute(text(
+        "SELECT a.attname, pg_get_serial_sequence(quote_ident(:table), a.attname) "
+        "FROM pg_attribute a "
+        "WHERE a.attrelid = to_regclass(quote_ident(:table)) AND a.attnum > 0 AND NOT a.attisdropped"
+    ), {'table': table_name}).fetchall()
+    return [{'column': column, 'sequence': sequence} for column, sequence in rows if sequence]
+
+
+def _foreign_keys(session: Session, table_name: str) -> Dict[str, str]:
+    """Map outgoing foreign key constraint name -> definition."""
+    rows = session.execute(text(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(quote_ident(:table)) AND contype = 'f'"
+    ), {'table': table_name}).fetchall()
+    return dict(rows)
+
+
+def _table_exists(session: Session, table_name: str) -> bool:
+    return session.execute(
+        text("SELECT to_regclass(quote_ident(:table)) IS NOT NULL"), {'table': table_name}
+    ).scalar()
+
+
+def create_shadow_table(session: Session, table_name: str) -> str:
+    """
+    (Re)create an empty ``<table>__shadow`` with the live table's columns,
+    defaults, constraints, indexes and outgoing foreign keys.
+    """
+    shadow = table_name + SHADOW_SUFFIX
+    session.execute(text(f"DROP TABLE IF EXISTS {_ident(shadow)}"))
+    session.execute(text(f"CREATE TABLE {_ident(shadow)} (LIKE {_ident(table_name)} INCLUDING ALL)"))
+
+    # LIKE does not copy foreign keys; constraint names are per-table so they can be reused as-is
+    for name, definition in _foreign_keys(session, table_name).items():
+        session.execute(text(f"ALTER TABLE {_ident(shadow)} ADD CONSTRAINT {_ident(name)} {definition}"))
+
+    return shadow
+
+
+def swap_tables(session: Session, table_name: str, incoming: str):
+    """
+    Make ``incoming`` the live ``table_name`` and keep the replaced copy as
+    ``<table>__prev``, all within the session's current transaction.
+
+    The replaced copy's foreign keys are dropped and any the incoming copy
+    lacks (a restored ``__prev``) are re-added as NOT VALID: rows deleted from
+    the referenced table while it was parked can't be cascaded retroactively.
+    """
+    previous = table_name + PREVIOUS_SUFFIX
+    retiring = table_name + '__swap'
+
+    session.execute(text(f"SET LOCAL lock_timeout = '{SWAP_LOCK_TIMEOUT}'"))
+    if incoming != previous:
+        session.execute(text(f"DROP TABLE IF EXISTS {_ident(previous)}"))
+
+    live_indexes = _index_definitions(session, table_name)
+    incoming_indexes = _index_definitions(session, incoming)
+    sequences = _serial_sequences(session, table_name)
+    live_foreign_keys = _foreign_keys(session, table_name)
+    incoming_foreign_keys = _foreign_keys(session, incoming)
+
+    # Park the live indexes under temporary names so the canonical names are free
+    parked = {}
+    for i, name in enumerate(sorted(live_indexes)):
+        parked[name] = f"{table_name[:40]}__swap_ix{i}"
+        session.execute(text(f"ALTER INDEX {_ident(name)} RENAME TO {_ident(parked[name])}"))
+
+    session.execute(text(f"ALTER TABLE {_ident(table_name)} RENAME TO {_ident(retiring)}"))
+    session.execute(text(f"ALTER TABLE {_ident(incoming)} RENAME TO {_ident(table_name)}"))
+    session.execute(text(f"ALTER TABLE {_ident(retiring)} RENAME TO {_ident(previous)}"))
+
+    # Give the incoming copy's indexes the canonical names, matched by definition
+    unmatched = dict(incoming_indexes)
+    for name, definition in sorted(live_indexes.items()):
+        match = next((n for n, d in unmatched.items() if d == definition), None)
+        if match is not None:
+            del unmatched[match]
+            session.execute(text(f"ALTER INDEX {_ident(match)} RENAME TO {_ident(name)}"))
+        else:
+            logger.warning(f"No matching index for {name} on {incoming}")
+        retired_name = name[:_MAX_IDENTIFIER - len(PREVIOUS_SUFFIX)] + PREVIOUS_SUFFIX
+        session.execute(text(f"ALTER INDEX {_ident(parked[name])} RENAME TO {_ident(retired_name)}"))
+
+    for name, definition in sorted(live_foreign_keys.items()):
+        session.execute(text(f"ALTER TABLE {_ident(previous)} DROP CONSTRAINT {_ident(name)}"))
+        if name not in incoming_foreign_keys:
+            session.execute(text(
+                f"ALTER TABLE {_ident(table_name)} ADD CONSTRAINT {_ident(name)} {definition} NOT VALID"
+            ))
+
+    # Sequences are dropped with their owning table, so the live copy must own them
+    for seq in sequences:
+        session.execute(text(
+            f"ALTER SEQUENCE {seq['sequence']} OWNED BY {_ident(table_name)}.{_ident(seq['column'])}"
+        ))
+
+
+def load_via_shadow_table(
+    session: Session,
+    model_or_table,
+    records: Iterable[Dict[str, Any]],
+    batch_size: int = 5000
+) -> int:
+    """
+    Replace a table's contents without readers ever seeing it empty or partial.
+
+    Loads into a shadow copy (committed separately, invisible to readers),
+    then swaps it in with renames in one transaction.
+
+    Returns:
+        Number of rows loaded
+    """
+    table_name = _table_of(model_or_table).name
+
+    shadow = create_shadow_table(session, table_name)
+    count = bulk_load(session, model_or_table, records, batch_size=batch_size, table_name=shadow)
+    session.execute(text(f"ANALYZE {_ident(shadow)}"))
+    session.commit()
+
+    swap_tables(session, table_name, shadow)
+    session.commit()
+    logger.info(f"Swapped {count} rows into {table_name} (previous copy kept as {table_name}{PREVIOUS_SUFFIX})")
+    return count
+
+
+def restore_previous_table(session: Session, model_or_table) -> bool:
+    """
+    Roll a table back to the copy replaced by its last shadow swap.
+
+    The current copy becomes ``<table>__prev``, so calling this again undoes it.
+    Returns False when there is no previous copy.
+    """
+    table_name = _table_of(model_or_table).name
+    previous = table_name + PREVIOUS_SUFFIX
+    if not _table_exists(session, previous):
+        return False
+
+    swap_tables(session, table_name, previous)
+    session.commit()
+    logger.info(f"Restored previous copy of {table_name}")
+    return True
@@ -10,15 +10,15 @@ Supports:
 """
 import logging
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from sqlalchemy import func, and_, or_
+from sqlalchemy import case, distinct, func, and_, or_
 from sqlalchemy.orm import Session
 
 from ..models.db_models import (
-    TaskHistoryRaw, TaskRaw, TrainerReviewStats, 
+    TaskHistoryRaw, TaskRaw,
     Contributor, PodLeadMapping
 )
 from .db_service import get_db_service
@@ -27,6 +27,11 @@ from .configuration_service import get_configuration_service, ConfigType
 logger = logging.getLogger(__name__)
 
 
+# Daily targets when neither the entity nor the project has one configured
+DEFAULT_TRAINER_TARGET = 5
+DEFAULT_REVIEWER_TARGET = 20
+
+
 class RollupPeriod(str, Enum):
     DAILY = "daily"
     WEEKLY = "weekly"
@@ -101,16 +106,16 @@ class TargetComparisonService:
         working_days = self._count_working_days(start_date, end_date)
         
         with self.db_service.get_session() as session:
-            # Get actual completions from task_history_raw
+            # New tasks (first completion) and rework (later completions) in one pass
             query = session.query(
                 TaskHistoryRaw.author,
-                func.count(TaskHistoryRaw.id).label('completion_count')
+                func.sum(case((TaskHistoryRaw.completed_status_count == 1, 1), else_=0)).label('new_count'),
+                func.sum(case((TaskHistoryRaw.completed_status_count > 1, 1), else_=0)).label('rework_count')
             ).filter(
                 TaskHistoryRaw.project_id == project_id,
                 TaskHistoryRaw.new_status == 'completed',
-                TaskHistoryRaw.completed_status_count == 1,  # New tasks only
-                func.date(TaskHistoryRaw.transition_time) >= start_date,
-                func.date(TaskHistoryRaw.transition_time) <= end_date
+                TaskHistoryRaw.date >= start_date,
+                TaskHistoryRaw.date <= end_date
             )
             
             if trainer_email:
@@ -118,50 +123,33 @@ class TargetComparisonService:
             
             query = query.group_by(TaskHistoryRaw.author)
             
-            actual_data = {row.author: row.completion_count for row in query.all()}
-            
-            # Also count rework completions
-            rework_query = session.query(
-                TaskHistoryRaw.author,
-                func.count(TaskHistoryRaw.id).label('rework_count')
-            ).filter(
-                TaskHistoryRaw.project_id == project_id,
-                TaskHistoryRaw.new_status == 'completed',
-                TaskHistoryRaw.completed_status_count > 1,  # Rework
-                func.date(TaskHistoryRaw.transition_time) >= start_date,
-                func.date(TaskHistoryRaw.transition_time) <= end_date
-            )
-            
-            if trainer_email:
-                rework_query = rework_query.filter(TaskHistoryRaw.author == trainer_email)
-            
-            rework_query = rework_query.group_by(TaskHistoryRaw.author)
-            rework_data = {row.author: row.rework_count for row in rework_query.all()}
-            
             # Combine new tasks + rework for total throughput
-            all_trainers = set(actual_data.keys()) | set(rework_data.keys())
+            actual_data = {
+                row.author: (row.new_count or 0) + (row.rework_count or 0)
+                for row in query.all()
+                if row.new_count or row.rework_count
+            }
+            all_trainers = set(actual_data.keys())
             
             # If specific trainer requested but no data, still return comparison
             if trainer_email and trainer_email not in all_trainers:
                 all_trainers.add(trainer_email)
             
+            contributors = self._load_contributors(session, all_trainers)
+            targets = self._load_targets(project_id, 'trainer', contributors, DEFAULT_TRAINER_TARGET)
+            
             results = []
             for email in all_trainers:
-                actual = actual_data.get(email, 0) + rework_data.get(email, 0)
+                actual = actual_data.get(email, 0)
+                contributor = contributors.get(email)
                 
-                # Get target for this trainer
-                target_daily, target_source = self._get_trainer_target(project_id, email, session)
+                target_daily, target_source = targets(contributor)
                 target_period = target_daily * working_days
                 
                 # Calculate comparison
                 gap = actual - target_period
                 achievement = (actual / target_period * 100) if target_period > 0 else 0
                 
-                # Get trainer name
-                contributor = session.query(Contributor).filter(
-                    Contributor.email == email
-                ).first()
-                
                 results.append(TargetComparison(
                     entity_type='trainer',
                     entity_id=contributor.id if contributor else None,
@@ -193,7 +181,9 @@ class TargetComparisonService:
         """
         Get target vs actual comparison for reviewer(s).
         
-        Reviewers are measured by number of reviews performed.
+        Reviewers are measured by number of reviews performed: tasks in the
+        project whose latest review they submitted in the period (task_raw's
+        latest-review columns, as in the analytics 'reviewed' count).
         """
         if end_date is None:
             end_date = date.today()
@@ -203,54 +193,46 @@ class TargetComparisonService:
         working_days = self._count_working_days(start_date, end_date)
         
         with self.db_service.get_session() as session:
-            # Get actual reviews from trainer_review_stats
-            # Count reviews where this person was the reviewer
-            query = session.query(
-                TrainerReviewStats.trainer_email,  # This is actually the reviewer in this context
-                func.count(TrainerReviewStats.id).label('review_count')
-            ).filter(
-                TrainerReviewStats.project_id == project_id,
-                TrainerReviewStats.review_date >= start_date,
-                TrainerReviewStats.review_date <= end_date
-            )
-            
-            if reviewer_email:
-                query = query.filter(TrainerReviewStats.trainer_email == reviewer_email)
-            
-            query = query.group_by(TrainerReviewStats.trainer_email)
-            
-            # Note: trainer_review_stats tracks trainer attributions, not reviewer counts
-            # For reviewer metrics, we need to look at different data
-            # Let's use pod_lead_mapping to identify reviewers and count their reviews differently
-            
-            # Get POD leads for this project
+            # Get POD leads for this project (leads of trainers with tasks in it)
+            project_trainers = session.query(TaskHistoryRaw.author).filter(
+                TaskHistoryRaw.project_id == project_id
+            ).distinct()
             pod_leads = session.query(PodLeadMapping.pod_lead_email).filter(
-                PodLeadMapping.project_id == project_id
+                PodLeadMapping.trainer_email.in_(project_trainers.scalar_subquery()),
+                PodLeadMapping.pod_lead_email.isnot(None)
             ).distinct().all()
             pod_lead_emails = {p.pod_lead_email for p in pod_leads}
+            if reviewer_email:
+                pod_lead_emails &= {reviewer_email}
+            
+            actual_data = {}
+            if pod_lead_emails:
+                reviews = session.query(
+                    TaskRaw.reviewer,
+                    func.count(distinct(TaskRaw.task_id)).label('review_count')
+                ).filter(
+                    TaskRaw.project_id == project_id,
+                    TaskRaw.r_updated_at >= datetime.combine(start_date, datetime.min.time()),
+                    TaskRaw.r_updated_at < datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
+                    TaskRaw.count_reviews > 0,
+                    TaskRaw.reviewer.in_(pod_lead_emails)
+                ).group_by(TaskRaw.reviewer)
+                actual_data = {row.reviewer: row.review_count for row in reviews.all()}
             
-            # For now, return empty if no specific reviewer metrics
-            # This would need to be enhanced based on how reviewer performance is tracked
+            contributors = self._load_contributors(session, pod_lead_emails)
+            targets = self._load_targets(project_id, 'reviewer', contributors, DEFAULT_REVIEWER_TARGET)
             
             results = []
             for email in pod_lead_emails:
-                if reviewer_email and email != reviewer_email:
-                    continue
+                actual = actual_data.get(email, 0)
+                contributor = contributors.get(email)
                 
-                # Get review count for this POD lead
-                # This is a placeholder - actual implementation would depend on review tracking
-                actual = 0  # TODO: Implement actual review counting
-                
-                target_daily, target_source = self._get_reviewer_target(project_id, email, session)
+                target_daily, target_source = targets(contributor)
                 target_period = target_daily * working_days
                 
                 gap = actual - target_period
                 achievement = (actual / target_period * 100) if target_period > 0 else 0
                 
-                contributor = session.query(Contributor).filter(
-                    Contributor.email == email
-                ).first()
-                
                 results.append(TargetComparison(
                     entity_type='reviewer',
                     entity_id=contributor.id if contributor else None,
@@ -331,65 +313,47 @@ class TargetComparisonService:
             }
         }
     
-    def _get_trainer_target(
-        self, 
-        project_id: int, 
-        trainer_email: str,
-        session: Session
-    ) -> Tuple[int, str]:
-        """
-        Get throughput target for a trainer.
+    def _load_contributors(
+        self,
+        session: Session,
+        emails: Iterable[str]
+    ) -> Dict[str, Contributor]:
+        """Load contributors for a set of emails in one query, keyed by email."""
+        emails = [email for email in emails if email]
+        if not emails:
+            return {}
         
-        Returns (target_daily, source) where source is 'individual' or 'project_default'.
+        contributors = session.query(Contributor).filter(
+            Contributor.turing_email.in_(emails)
+        ).all()
+        return {c.turing_email: c for c in contributors}
+    
+    def _load_targets(
+        self,
+        project_id: int,
+        entity_type: str,
+        contributors: Dict[str, Contributor],
+        fallback: int
+    ):
         """
-        # First try individual target
-        contributor = session.query(Contributor).filter(
-            Contributor.email == trainer_email
-        ).first()
+        Load every applicable throughput target in one query.
         
-        if contributor:
-            individual_target = self.config_service.get_throughput_target(
-                project_id=project_id,
-                entity_type='trainer',
-                entity_id=contributor.id
-            )
-            if individual_target:
-                return (individual_target, 'individual')
-        
-        # Fall back to project default
-        default_target = self.config_service.get_throughput_target(
+        Returns a function mapping a contributor (or None) to
+        (target_daily, source) where source is 'individual' or 'project_default'.
+        """
+        default_target, individual_targets = self.config_service.get_throughput_targets(
             project_id=project_id,
-            entity_type='trainer'
+            entity_type=entity_type,
+            entity_ids=[c.id for c in contributors.values()]
         )
         
-        return (default_target or 5, 'project_default')
-    
-    def _get_reviewer_target(
-        self, 
-        project_id: int, 
-        reviewer_email: str,
-        session: Session
-    ) -> Tuple[int, str]:
-        """Get throughput target for a reviewer."""
-        contributor = session.query(Contributor).filter(
-            Contributor.email == reviewer_email
-        ).first()
-        
-        if contributor:
-            individual_target = self.config_service.get_throughput_target(
-                project_id=project_id,
-                entity_type='reviewer',
-                entity_id=contributor.id
-            )
+        def resolve(contributor: Optional[Contributor]) -> Tuple[int, str]:
+            individual_target = individual_targets.get(contributor.id) if contributor else None
             if individual_target:
                 return (individual_target, 'individual')
+            return (default_target or fallback, 'project_default')
         
-        default_target = self.config_service.get_throughput_target(
-            project_id=project_id,
-            entity_type='reviewer'
-        )
-        
-        return (default_target or 20, 'project_default')
+        return resolve
     
     def _get_period_start(self, end_date: date, rollup: RollupPeriod) -> date:
         """Calculate period start date based on rollup type."""
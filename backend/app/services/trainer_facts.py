@@ -0,0 +1,210 @@
+"""
+Trainer fact tables for the POD Lead and Project hierarchies.
+
+Rebuilt from the synced local tables (task_raw, task_history_raw,
+trainer_review_stats, project_revenue_weekly) as the last stage of
+``sync_all_tables``, using the same filters and attribution rules as the
+live hierarchy queries in ``QueryService``:
+
+- ``trainer_task_daily_fact``: completions per trainer x project x task x day,
+  for exact distinct counts over any date range / group of trainers
+- ``trainer_daily_fact``: additive measures per trainer x project x day
+
+Jibble hours are not materialized: several dashboard projects share one
+Jibble project name, so they can't be attributed to a single project row.
+"""
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session
+
+from app.models.db_models import TaskHistoryRaw, TaskRaw, TrainerReviewStats
+from app.services.query_service import COMPLETED_PIPELINE_STATUSES
+from app.services.rate_index import get_rate_index
+
+logger = logging.getLogger(__name__)
+
+# task_raw statuses whose number_of_turns feed avg_rework
+SUM_TURNS_STATUSES = ('Completed', 'Reviewed', 'Rework', 'Validated')
+
+DAILY_MEASURES = (
+    'sum_turns', 'approved_tasks', 'approved_rework', 'delivered_tasks', 'in_delivery_queue',
+    'revenue', 'manual_reviews', 'manual_score', 'agentic_reviews', 'agentic_score',
+)
+_FLOAT_MEASURES = {'revenue', 'manual_score', 'agentic_score'}
+
+
+def _email(column):
+    return func.lower(func.trim(column))
+
+
+def _completion_events():
+    """Filter for trainer completion events in task_history_raw."""
+    return and_(
+        TaskHistoryRaw.new_status == 'completed',
+        TaskHistoryRaw.old_status != 'completed-approval',
+    )
+
+
+def build_task_fact_records(session: Session) -> List[Dict[str, Any]]:
+    """Completions grouped by trainer x project x task x day."""
+    author = func.coalesce(_email(TaskHistoryRaw.author), '')
+    rows = session.query(
+        author.label('trainer_email'),
+        TaskHistoryRaw.project_id,
+        TaskHistoryRaw.task_id,
+        TaskHistoryRaw.date,
+        func.sum(case((TaskHistoryRaw.completed_status_count == 1, 1), else_=0)).label('new_completions'),
+        func.sum(case((TaskHistoryRaw.completed_status_count > 1, 1), else_=0)).label('rework_completions'),
+    ).join(
+        TaskRaw,
+        and_(TaskRaw.task_id == TaskHistoryRaw.task_id, TaskRaw.project_id == TaskHistoryRaw.project_id)
+    ).filter(
+        _completion_events(),
+        TaskRaw.derived_status.in_(COMPLETED_PIPELINE_STATUSES),
+    ).group_by(
+        author, TaskHistoryRaw.project_id, TaskHistoryRaw.task_id, TaskHistoryRaw.date
+    ).all()
+
+    return [
+        {
+            'trainer_email': r.trainer_email,
+            'project_id': r.project_id,
+            'task_id': r.task_id,
+            'fact_date': r.date,
+            'new_completions': int(r.new_completions or 0),
+            'rework_completions': int(r.rework_completions or 0),
+        }
+        for r in rows
+    ]
+
+
+def _task_completers(session: Session, task_ids_query) -> Dict[int, Tuple[str, str]]:
+    """task_id -> (first author, last completer) from completion events."""
+    events = defaultdict(list)
+    for e in session.query(
+        TaskHistoryRaw.task_id,
+        TaskHistoryRaw.author,
+        TaskHistoryRaw.time_stamp,
+    ).filter(
+        TaskHistoryRaw.task_id.in_(task_ids_query),
+        _completion_events(),
+        TaskHistoryRaw.author.isnot(None),
+    ).all():
+        events[e.task_id].append((e.time_stamp, e.author.lower().strip()))
+
+    completers = {}
+    for task_id, task_events in events.items():
+        # Events without a timestamp sort first
+        task_events.sort(key=lambda ev: (ev[0] is not None, ev[0]))
+        completers[task_id] = (task_events[0][1], task_events[-1][1])
+    return completers
+
+
+def build_daily_fact_records(session: Session) -> List[Dict[str, Any]]:
+    """Additive trainer measures grouped by trainer x project x day."""
+    facts: Dict[Tuple[str, int, Any], Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    # avg_rework input: number_of_turns by current trainer and last completion date
+    for r in session.query(
+        _email(TaskRaw.trainer).label('trainer_email'),
+        TaskRaw.project_id,
+        TaskRaw.last_completed_date,
+        func.sum(TaskRaw.number_of_turns).label('sum_turns'),
+    ).filter(
+        TaskRaw.derived_status.in_(SUM_TURNS_STATUSES),
+        TaskRaw.last_completed_date.isnot(None),
+        TaskRaw.trainer.isnot(None),
+        TaskRaw.project_id.isnot(None),
+    ).group_by(_email(TaskRaw.trainer), TaskRaw.project_id, TaskRaw.last_completed_date).all():
+        facts[(r.trainer_email, r.project_id, r.last_completed_date)]['sum_turns'] += r.sum_turns or 0
+
+    # Reviews, attributed to the trainer whose work was reviewed
+    is_manual = or_(TrainerReviewStats.review_type == 'manual', TrainerReviewStats.review_type.is_(None))
+    is_agentic = TrainerReviewStats.review_type == 'auto'
+    for r in session.query(
+        _email(TrainerReviewStats.trainer_email).label('trainer_email'),
+        TrainerReviewStats.project_id,
+        TrainerReviewStats.review_date,
+        func.sum(case((is_manual, 1), else_=0)).label('manual_reviews'),
+        func.sum(case((is_manual, TrainerReviewStats.score), else_=0)).label('manual_score'),
+        func.sum(case((is_agentic, 1), else_=0)).label('agentic_reviews'),
+        func.sum(case((is_agentic, TrainerReviewStats.score), else_=0)).label('agentic_score'),
+    ).filter(
+        TrainerReviewStats.score.isnot(None),
+        TrainerReviewStats.trainer_email.isnot(None),
+        TrainerReviewStats.project_id.isnot(None),
+    ).group_by(
+        _email(TrainerReviewStats.trainer_email), TrainerReviewStats.project_id, TrainerReviewStats.review_date
+    ).all():
+        row = facts[(r.trainer_email, r.project_id, r.review_date)]
+        row['manual_reviews'] += r.manual_reviews or 0
+        row['manual_score'] += float(r.manual_score or 0)
+        row['agentic_reviews'] += r.agentic_reviews or 0
+        row['agentic_score'] += float(r.agentic_score or 0)
+
+    # Approvals and deliveries, attributed to the last completer
+    is_approved = and_(
+        func.lower(TaskRaw.task_status) == 'completed',
+        TaskRaw.count_reviews > 0,
+        or_(TaskRaw.review_action_type != 'rework', TaskRaw.review_action_type.is_(None)),
+    )
+    is_delivered = func.lower(TaskRaw.delivery_status) == 'delivered'
+    is_in_queue = and_(
+        TaskRaw.delivery_batch_name.isnot(None),
+        TaskRaw.delivery_batch_name != '',
+        or_(func.lower(TaskRaw.delivery_status) != 'delivered', TaskRaw.delivery_status.is_(None)),
+    )
+    candidates = session.query(TaskRaw.task_id).filter(
+        or_(is_approved, is_delivered, is_in_queue),
+        TaskRaw.project_id.isnot(None),
+    )
+    completers = _task_completers(session, candidates)
+    rates = get_rate_index(session)
+
+    for t in session.query(
+        TaskRaw.task_id,
+        TaskRaw.project_id,
+        TaskRaw.last_completed_date,
+        TaskRaw.delivery_date,
+        case((is_approved, 1), else_=0).label('approved'),
+        case((is_delivered, 1), else_=0).label('delivered'),
+        case((is_in_queue, 1), else_=0).label('in_queue'),
+    ).filter(TaskRaw.task_id.in_(candidates)).all():
+        first_author, last_completer = completers.get(t.task_id, (None, None))
+        if not last_completer:
+            continue
+        if t.approved:
+            measure = 'approved_tasks' if first_author == last_completer else 'approved_rework'
+            facts[(last_completer, t.project_id, t.last_completed_date)][measure] += 1
+        if t.delivered:
+            row = facts[(last_completer, t.project_id, t.delivery_date)]
+            row['delivered_tasks'] += 1
+            row['revenue'] += rates.project_rate(t.project_id, t.delivery_date)
+        if t.in_queue:
+            facts[(last_completer, t.project_id, None)]['in_delivery_queue'] += 1
+
+    records = []
+    for (trainer_email, project_id, fact_date), measures in facts.items():
+        if not trainer_email:
+            continue
+        record: Dict[str, Any] = {
+            'trainer_email': trainer_email,
+            'project_id': project_id,
+            'fact_date': fact_date,
+        }
+        for name in DAILY_MEASURES:
+            value = measures.get(name, 0)
+            record[name] = float(value) if name in _FLOAT_MEASURES else int(value)
+        records.append(record)
+    return records
+
+
+def build_trainer_facts(session: Session) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Build (task fact records, daily fact records) from the local synced tables."""
+    task_facts = build_task_fact_records(session)
+    daily_facts = build_daily_fact_records(session)
+    logger.info(f"Built {len(task_facts)} trainer task facts and {len(daily_facts)} trainer daily facts")
+    return task_facts, daily_facts
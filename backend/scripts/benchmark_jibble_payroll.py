@@ -0,0 +1,92 @@
+"""
+Benchmark: batched payroll-hours engine vs the per-person calculation.
+
+Generates synthetic TimeEntries (shuffled, with breaks, project switches and
+missing Outs) and times
+- the per-person oracle from tests/test_jibble_payroll.py, once per person
+  per project (how syncs used to compute payroll hours)
+- jibble_payroll.project_payroll_hours, all people and projects at once
+then checks that both give the same hours.
+
+Usage (from backend/):
+    python scripts/benchmark_jibble_payroll.py [--people 500] [--days 90] [--projects 5]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.jibble_payroll import project_payroll_hours  # noqa: E402
+from tests.test_jibble_payroll import project_payroll_reference  # noqa: E402
+
+
+def generate(people: int, days: int, projects: list, seed: int = 0):
+    rng = random.Random(seed)
+    entries_by_person, payroll_by_person = {}, {}
+    start = datetime(2025, 1, 1, 8)
+    for p in range(people):
+        entries, payroll = [], {}
+        for d in range(days):
+            day = (start + timedelta(days=d)).strftime("%Y-%m-%d")
+            clock = start + timedelta(days=d, minutes=rng.randint(0, 120))
+            tracked = 0.0
+            for _ in range(rng.randint(0, 4)):
+                entries.append({"type": "In", "projectId": rng.choice(projects), "belongsToDate": day,
+                                "time": clock.strftime("%Y-%m-%dT%H:%M:%SZ")})
+                length = timedelta(minutes=rng.randint(10, 240))
+                clock += length
+                if rng.random() < 0.9:
+                    entries.append({"type": "Out", "time": clock.strftime("%Y-%m-%dT%H:%M:%SZ")})
+                    clock += timedelta(minutes=rng.randint(0, 60))
+                tracked += length.total_seconds() / 3600
+            if tracked and rng.random() < 0.9:
+                payroll[day] = round(tracked * rng.uniform(0.8, 1.0), 3)
+        rng.shuffle(entries)
+        entries_by_person[f"person-{p}"] = entries
+        payroll_by_person[f"person-{p}"] = payroll
+    return entries_by_person, payroll_by_person
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--people", type=int, default=500)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--projects", type=int, default=5)
+    args = parser.parse_args()
+
+    projects = [f"project-{i}" for i in range(args.projects)]
+    entries, payroll = generate(args.people, args.days, projects)
+    print(f"{args.people} people, {sum(len(e) for e in entries.values())} entries, {len(projects)} projects")
+
+    start = time.perf_counter()
+    expected = {}
+    for person_id, person_entries in entries.items():
+        for project_id in projects:
+            daily = project_payroll_reference(payroll[person_id], list(person_entries), project_id)
+            for day, hours in daily.items():
+                if hours > 0:
+                    expected[(project_id, person_id, day)] = hours
+    per_person = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = project_payroll_hours(entries, payroll)
+    batched = time.perf_counter() - start
+
+    result = {(r.project_id, r.person_id, r.entry_date): r.logged_hours for r in frame.itertuples(index=False)}
+    mismatched = [key for key in expected if abs(result.get(key, -1) - expected[key]) > 0.0100001]
+    exact = sum(result.get(key) == hours for key, hours in expected.items())
+
+    print(f"per-person: {per_person:.3f}s")
+    print(f"batched:    {batched:.3f}s ({per_person / batched:.1f}x)")
+    print(f"rows: {len(expected)} expected, {len(result)} batched, {exact} identical, "
+          f"{len(expected) - exact - len(mismatched)} within 0.01 (rounding), {len(mismatched)} mismatched")
+    if mismatched or result.keys() != expected.keys():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,12 @@ This module provides:
 - Common test fixtures
 """
 import os
+import uuid
 import pytest
 from typing import Generator
 from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
@@ -66,6 +67,31 @@ def test_session(test_engine) -> Generator[Session, None, None]:
         session.close()
 
 
+@pytest.fixture(scope="function")
+def postgres_session() -> Generator[Session, None, None]:
+    """
+    Session on a throwaway schema of the PostgreSQL database at
+    ``TEST_POSTGRES_URL``, for behaviour SQLite can't show (skipped when unset).
+    """
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    engine = create_engine(url, connect_args={"options": f"-csearch_path={schema}"})
+    with engine.begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+        Base.metadata.create_all(bind=connection)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        with engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def mock_db_service(test_engine, test_session):
     """Create a mock database service for testing."""
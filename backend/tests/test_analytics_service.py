@@ -0,0 +1,179 @@
+"""
+Unit tests for the analytics time-series engine.
+
+Tests cover:
+- Period bucketing helpers
+- The single-pass multi-project engine matching per-project
+  get_analytics_time_series results for every granularity
+"""
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.models.db_models import (
+    Contributor, FpyReview, JibbleHours, PodLeadMapping, ProjectCostDaily, ProjectRevenueWeekly,
+    ReviewDetail, Task, TaskHistoryRaw, TaskRaw, TrainerReviewStats,
+)
+from app.services.analytics_service import (
+    _period_start,
+    get_analytics_time_series,
+    get_analytics_time_series_by_project,
+)
+
+# SQLite can't read back the server-side now() default
+SYNCED = datetime(2025, 1, 6)
+
+
+def _review(review_id, conversation_id, project_id, email, action, day, hour=9):
+    return FpyReview(review_id=review_id, conversation_id=conversation_id, project_id=project_id,
+                     reviewer_email=email, action_type=action, review_date=date(2025, 1, day),
+                     submitted_at=datetime(2025, 1, day, hour), last_synced=SYNCED)
+
+
+def _completion(task_id, author, count, day, project_id=36):
+    return TaskHistoryRaw(
+        task_id=task_id, author=author, completed_status_count=count, project_id=project_id,
+        new_status='completed', old_status='pending', date=date(2025, 1, day),
+    )
+
+
+def _hours(email, day, hours, project='Nvidia - SysBench'):
+    return JibbleHours(turing_email=email, entry_date=date(2025, 1, day), project=project,
+                       logged_hours=hours, last_synced=SYNCED)
+
+
+@pytest.fixture
+def seeded_session(test_session):
+    """Activity across projects 36, 37 and 59 (which shares its Jibble project with 60)."""
+    test_session.add_all([
+        PodLeadMapping(trainer_email='a@x.com', pod_lead_email='p@x.com', role='Trainer',
+                       jibble_project='Nvidia - SysBench'),
+        PodLeadMapping(trainer_email='p@x.com', pod_lead_email='p@x.com', role='Pod Lead',
+                       jibble_project='Nvidia - SysBench'),
+        PodLeadMapping(trainer_email='b@x.com', pod_lead_email='q@x.com', role='Trainer',
+                       jibble_project='Nvidia - Multichallenge'),
+        PodLeadMapping(trainer_email='cal@x.com', role='Calibrator', jibble_project='Nvidia - Multichallenge'),
+        _completion(1, 'a@x.com', 1, 6), _completion(1, 'a@x.com', 2, 6), _completion(1, 'a@x.com', 3, 8),
+        _completion(2, 'p@x.com', 1, 7), _completion(3, 'b@x.com', 1, 7, project_id=37),
+        _completion(4, 'c@x.com', 2, 13, project_id=59),
+        TaskRaw(task_id=1, project_id=36, trainer='a@x.com', delivery_status='delivered',
+                delivery_date=date(2025, 1, 9)),
+        TaskRaw(task_id=2, project_id=36, trainer='p@x.com', derived_status='In Queue',
+                last_completed_date=date(2025, 1, 7)),
+        TaskRaw(task_id=3, project_id=37, trainer='b@x.com', delivery_status='delivered',
+                delivery_date=date(2025, 1, 7)),
+        TaskRaw(task_id=4, project_id=59, trainer='c@x.com'),
+        TrainerReviewStats(review_id=1, task_id=1, project_id=36, score=4.0, review_type='manual',
+                           review_date=date(2025, 1, 6), last_synced=SYNCED),
+        TrainerReviewStats(review_id=2, task_id=1, project_id=36, score=3.0, review_type='auto',
+                           review_date=date(2025, 1, 8), last_synced=SYNCED),
+        TrainerReviewStats(review_id=3, task_id=3, project_id=37, score=5.0,
+                           review_date=date(2025, 1, 7), last_synced=SYNCED),
+        # Outsider hours are filtered out by the labeling-active emails
+        _hours('a@x.com', 6, 6.5), _hours('P@x.com', 7, 2.0), _hours('outsider@x.com', 7, 8.0),
+        _hours('b@x.com', 7, 3.0, project='Nvidia - Multichallenge Advanced'),
+        _hours('c@x.com', 13, 4.0, project='NVIDIA_STEM Math_Proof_Eval'),
+        ProjectRevenueWeekly(week_start_date=date(2025, 1, 6), week_end_date=date(2025, 1, 12),
+                             jibble_project_name='Nvidia - SysBench', project_id=36, actual_revenue=1000.0),
+        ProjectRevenueWeekly(week_start_date=date(2024, 12, 30), week_end_date=date(2025, 1, 5),
+                             jibble_project_name='Nvidia - Multichallenge', project_id=37, actual_revenue=500.0),
+        ProjectCostDaily(date=date(2025, 1, 6), jibble_project_name='Nvidia - SysBench', project_id=36,
+                         activity_type='Work Activity', total_cost=120.0),
+        ProjectCostDaily(date=date(2025, 1, 8), jibble_project_name='Nvidia - SysBench', project_id=36,
+                         activity_type='Non-Work Activity', total_cost=30.0),
+        _review(1, 1, 36, 'p@x.com', 'approve', 7), _review(2, 1, 36, 'r@x.com', 'approve', 7, hour=10),
+        _review(3, 2, 37, 'cal@x.com', 'rework', 7),
+        _review(4, 1, 36, 'r@x.com', 'rework', 8), _review(5, 3, 36, 'r@x.com', 'rework', 8),
+        _review(6, 4, 59, 'r@x.com', None, 8),
+    ])
+    test_session.commit()
+    return test_session
+
+
+@pytest.fixture(autouse=True)
+def no_team_sheet():
+    with patch('app.services.quality_rubrics_service.QualityRubricsService') as rubrics:
+        rubrics.return_value._fetch_team_roles.return_value = {}
+        yield
+
+
+class TestPeriodStart:
+    """Tests for folding dates into periods."""
+
+    def test_granularities(self):
+        """Test weeks start on Monday and months on the 1st."""
+        d = date(2025, 1, 15)  # Wednesday
+        assert _period_start(d, 'daily') == d
+        assert _period_start(d, 'weekly') == date(2025, 1, 13)
+        assert _period_start(d, 'monthly') == date(2025, 1, 1)
+
+    def test_db_values(self):
+        """Test datetimes and ISO strings (SQLite date()) are normalized."""
+        assert _period_start(datetime(2025, 1, 15, 18, 30), 'daily') == date(2025, 1, 15)
+        assert _period_start('2025-01-15', 'weekly') == date(2025, 1, 13)
+
+
+class TestTimeSeriesByProject:
+    """Tests for the single-pass multi-project engine."""
+
+    @pytest.mark.parametrize('granularity,start_date,end_date', [
+        ('daily', '2025-01-06', '2025-01-12'),
+        ('weekly', '2025-01-08', '2025-01-20'),
+        ('monthly', '2025-01-01', '2025-01-31'),
+    ])
+    def test_parity_with_per_project_series(self, seeded_session, granularity, start_date, end_date):
+        """Test every project matches a per-project get_analytics_time_series call."""
+        project_ids = [36, 37, 38, 59, 60]
+        by_project = get_analytics_time_series_by_project.__wrapped__(
+            seeded_session, start_date, end_date, granularity, project_ids,
+        )
+
+        assert list(by_project) == project_ids
+        for pid in project_ids:
+            single = get_analytics_time_series.__wrapped__(
+                seeded_session, start_date, end_date, granularity, project_id=pid,
+            )
+            assert by_project[pid] == single['data'], f"project {pid}"
+
+    def test_daily_values(self, seeded_session):
+        """Test per-project daily values, including hours from a shared Jibble project."""
+        by_project = get_analytics_time_series_by_project.__wrapped__(
+            seeded_session, '2025-01-06', '2025-01-13', 'daily', [36, 60],
+        )
+        day = {p['period']: p for p in by_project[36]}
+
+        assert (day['2025-01-06']['unique_tasks'], day['2025-01-06']['rework_tasks']) == (1, 1)
+        assert day['2025-01-06']['jibble_hours'] == 6.5
+        assert day['2025-01-07']['jibble_hours'] == 2.0
+        assert day['2025-01-07']['target'] == 0
+        assert day['2025-01-07']['reviewer_fpy_pct'] == 100.0
+        assert day['2025-01-08']['reviewer_fpy_pct'] == 0.0
+        assert day['2025-01-07']['auditor_fpy_pct'] is None
+        assert day['2025-01-09']['revenue'] == 1000.0
+        assert day['2025-01-09']['delivered'] == 1
+        assert day['2025-01-08']['agentic_avg_rating'] == 3.0
+        assert by_project[36][0]['team_size'] == 2
+        # Project 60 has no task activity but shares Math Proof Eval Jibble hours with 59
+        assert by_project[60][-1]['jibble_hours'] == 4.0
+
+    def test_reviewer_activity(self, seeded_session):
+        """Test reviewers count toward labeling-tool people and reviewed tasks are bucketed."""
+        seeded_session.add_all([
+            Contributor(id=7, name='Rev', turing_email='Rev@x.com'),
+            Task(id=2, project_id=36),
+            ReviewDetail(reviewer_id=7, conversation_id=2, updated_at=datetime(2025, 1, 7, 10)),
+        ])
+        seeded_session.query(TaskRaw).filter(TaskRaw.task_id == 2).update(
+            {'r_updated_at': datetime(2025, 1, 8, 12), 'count_reviews': 1}
+        )
+        seeded_session.commit()
+
+        by_project = get_analytics_time_series_by_project.__wrapped__(
+            seeded_session, '2025-01-06', '2025-01-12', 'weekly', [36],
+        )
+        week = by_project[36][0]
+
+        assert week['trainers_active'] == 2
+        assert week['labeling_tool_people'] == 3
+        assert week['reviewed'] == 1
@@ -0,0 +1,71 @@
+"""
+Unit tests for async/sync bridge utilities.
+
+Tests cover:
+- Running blocking reads in the dedicated read pool
+- Context propagation into pool threads
+- Read pool queue-depth and wait-time metrics
+"""
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from app.core.async_utils import run_read
+from app.core.metrics import READ_POOL_ACTIVE, READ_POOL_QUEUE_DEPTH, READ_POOL_WAIT_SECONDS
+
+
+def _gauge(metric) -> float:
+    return metric._value.get()
+
+
+def _wait_count() -> float:
+    return next(
+        s.value for s in READ_POOL_WAIT_SECONDS.collect()[0].samples if s.name.endswith('_count')
+    )
+
+
+@pytest.fixture(autouse=True)
+def running_app(monkeypatch):
+    """Undo the shutdown flag left behind by app lifespan tests."""
+    monkeypatch.setattr("app.core.async_utils._shutdown_requested", False)
+
+
+class TestReadPool:
+    """Tests for run_read."""
+
+    async def test_runs_off_the_event_loop(self):
+        """Test that the call runs in a read pool thread and returns its result."""
+        result = await run_read(lambda a, b=0: (threading.current_thread().name, a + b), 1, b=2)
+
+        thread_name, value = result
+        assert thread_name.startswith("read_worker_")
+        assert value == 3
+
+    async def test_context_is_propagated(self):
+        """Test that context variables (e.g. request IDs) reach the pool thread."""
+        request_id = contextvars.ContextVar("request_id", default=None)
+        request_id.set("abc123")
+
+        assert await run_read(request_id.get) == "abc123"
+
+    async def test_metrics_settle_after_calls(self):
+        """Test that queue depth and active gauges return to zero and waits are recorded."""
+        depth_before = _gauge(READ_POOL_QUEUE_DEPTH)
+        active_before = _gauge(READ_POOL_ACTIVE)
+        waits_before = _wait_count()
+
+        await asyncio.gather(*(run_read(sum, [i, 1]) for i in range(20)))
+
+        assert _gauge(READ_POOL_QUEUE_DEPTH) == depth_before
+        assert _gauge(READ_POOL_ACTIVE) == active_before
+        assert _wait_count() == waits_before + 20
+
+    async def test_exceptions_propagate(self):
+        """Test that errors raised in the pool reach the caller."""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await run_read(fail)
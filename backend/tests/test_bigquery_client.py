@@ -0,0 +1,130 @@
+"""
+Unit tests for the shared BigQuery access layer.
+
+Tests cover:
+- One client per process
+- Content-addressed result caching keyed on SQL text and parameters
+- Query latency, bytes and cache-hit metrics
+"""
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.cloud import bigquery
+
+from app.core import bigquery_client
+from app.core.bigquery_client import execute_query, result_cache_key, run_query
+from app.core.cache import QueryCache
+from app.core.metrics import (
+    BIGQUERY_BYTES_BILLED_TOTAL,
+    BIGQUERY_QUERIES_TOTAL,
+    BIGQUERY_RESULT_CACHE_TOTAL,
+)
+
+
+def _value(metric, **labels):
+    return metric.labels(**labels)._value.get()
+
+
+class FakeRows(list):
+    """Stands in for a RowIterator: iterable rows plus their schema."""
+
+    def __init__(self, rows, names):
+        super().__init__(bigquery.Row(values, {name: i for i, name in enumerate(names)}) for values in rows)
+        self.schema = [bigquery.SchemaField(name, 'STRING') for name in names]
+
+
+def _client(rows=((1, 'a'), (2, 'b')), names=('id', 'name'), bytes_billed=10485760):
+    job = MagicMock(total_bytes_processed=1024, total_bytes_billed=bytes_billed, cache_hit=False)
+    job.result.return_value = FakeRows(rows, names)
+    client = MagicMock()
+    client.query.return_value = job
+    return client
+
+
+@pytest.fixture
+def bq_client():
+    """A fake shared client and an empty result cache."""
+    client = _client()
+    with patch.object(bigquery_client, '_client', client), \
+            patch.object(bigquery_client, '_result_cache', QueryCache(default_ttl=60)):
+        yield client
+
+
+class TestSharedClient:
+    """Tests for the process-wide client."""
+
+    def test_client_is_built_once(self):
+        """Test every caller gets the same client."""
+        with patch.object(bigquery_client, '_client', None), \
+                patch('google.cloud.bigquery.Client') as client_cls:
+            first = bigquery_client.get_bigquery_client()
+            second = bigquery_client.get_bigquery_client()
+
+        assert first is second
+        client_cls.assert_called_once()
+
+
+class TestResultCache:
+    """Tests for cached BigQuery reads."""
+
+    def test_repeated_query_runs_once(self, bq_client):
+        """Test the second identical read is served from the cache."""
+        hits = _value(BIGQUERY_RESULT_CACHE_TOTAL, operation='test_repeat', result='hit')
+
+        first = run_query('SELECT id, name FROM t', operation='test_repeat')
+        second = run_query('SELECT id, name FROM t', operation='test_repeat')
+
+        assert bq_client.query.call_count == 1
+        assert [row.name for row in second] == ['a', 'b']
+        assert [dict(row) for row in first] == [dict(row) for row in second] == [
+            {'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'},
+        ]
+        assert _value(BIGQUERY_RESULT_CACHE_TOTAL, operation='test_repeat', result='hit') == hits + 1
+
+    def test_parameters_are_part_of_the_key(self, bq_client):
+        """Test the same SQL with different parameters is not shared."""
+        sql = 'SELECT id, name FROM t WHERE project_id = @project_id'
+        for project_id in (36, 37, 36):
+            run_query(sql, [bigquery.ScalarQueryParameter('project_id', 'INT64', project_id)])
+
+        assert bq_client.query.call_count == 2
+        job_config = bq_client.query.call_args.kwargs['job_config']
+        assert job_config.query_parameters[0].value == 37
+
+    def test_key_ignores_surrounding_whitespace(self):
+        """Test keys are content-addressed on the SQL text."""
+        assert result_cache_key('\n  SELECT 1\n') == result_cache_key('SELECT 1')
+        assert result_cache_key('SELECT 1') != result_cache_key('SELECT 2')
+
+    def test_empty_results_are_cached(self, bq_client):
+        """Test a query returning no rows is not re-run."""
+        bq_client.query.return_value.result.return_value = FakeRows([], ('id',))
+
+        assert run_query('SELECT id FROM empty') == []
+        assert run_query('SELECT id FROM empty') == []
+        assert bq_client.query.call_count == 1
+
+
+class TestExecuteQuery:
+    """Tests for uncached queries and their metrics."""
+
+    def test_records_bytes(self, bq_client):
+        """Test billed bytes are accumulated per operation."""
+        billed = _value(BIGQUERY_BYTES_BILLED_TOTAL, operation='test_bytes')
+
+        execute_query('SELECT 1', operation='test_bytes')
+        execute_query('SELECT 1', operation='test_bytes')
+
+        assert bq_client.query.call_count == 2
+        assert _value(BIGQUERY_BYTES_BILLED_TOTAL, operation='test_bytes') == billed + 2 * 10485760
+
+    def test_errors_are_counted_and_raised(self):
+        """Test failed jobs count as errors and propagate."""
+        client = MagicMock()
+        client.query.side_effect = RuntimeError('quota exceeded')
+        errors = _value(BIGQUERY_QUERIES_TOTAL, operation='test_error', status='error')
+
+        with pytest.raises(RuntimeError):
+            execute_query('SELECT 1', operation='test_error', client=client)
+
+        assert _value(BIGQUERY_QUERIES_TOTAL, operation='test_error', status='error') == errors + 1
@@ -0,0 +1,55 @@
+"""
+Unit tests for BigQueryService query building.
+
+Tests cover:
+- Filter values bound as query parameters instead of spliced into SQL
+- One SQL text per query regardless of filter values
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.services.bigquery_service import BigQueryService
+
+
+@pytest.fixture
+def service():
+    with patch('app.services.bigquery_service.get_bigquery_client'):
+        yield BigQueryService()
+
+
+def _params(service, filters):
+    return {p.name: (p.type_, p.value) for p in service._query_parameters(filters)}
+
+
+class TestQueryParameters:
+    """Tests for parameterized filters."""
+
+    def test_filters_are_bound(self, service):
+        """Test filter values become typed parameters."""
+        params = _params(service, {'domain': 'Math', 'reviewer': '12', 'min_score': 3})
+
+        assert params['domain'] == ('STRING', 'Math')
+        assert params['reviewer_id'] == ('INT64', 12)
+        assert params['min_score'] == ('FLOAT64', 3.0)
+        assert params['human_role_id'] == ('INT64', None)
+        assert params['project_id'] == ('INT64', service.settings.project_id_filter)
+
+    def test_unset_filters_are_null(self, service):
+        """Test missing or empty filters bind NULL, which matches every row."""
+        params = _params(service, {'domain': '', 'max_score': None})
+
+        assert all(value is None for name, (_, value) in params.items() if name != 'project_id')
+        assert '(@domain IS NULL OR task_.domain = @domain)' in service._review_detail_sql
+
+    async def test_sql_text_is_shared(self, service):
+        """Test different filter values run the same SQL, with values only in parameters."""
+        injected = "x' OR '1'='1"
+        with patch('app.services.bigquery_service.run_query', return_value=[]) as run_query:
+            await service.get_domain_aggregation({'domain': 'Math'})
+            await service.get_domain_aggregation({'domain': injected, 'min_score': 2})
+
+        (first_sql, first_params), (second_sql, second_params) = [c.args for c in run_query.call_args_list]
+        assert first_sql == second_sql
+        assert injected not in second_sql
+        assert {p.name: p.value for p in second_params}['domain'] == injected
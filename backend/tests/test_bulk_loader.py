@@ -0,0 +1,78 @@
+"""
+Unit tests for the streaming bulk loader.
+
+Tests cover:
+- COPY text rendering of values
+- Lazy COPY input stream
+- Executemany fallback on non-PostgreSQL databases
+"""
+import pytest
+from datetime import date, datetime
+
+from app.models.db_models import ProjectCostDaily, TaskRaw
+from app.services.bulk_loader import _CopyStream, _copy_value, bulk_load
+
+
+class TestCopyFormatting:
+    """Tests for COPY text format rendering."""
+
+    def test_copy_value(self):
+        """Test NULLs, booleans, dates and escaping."""
+        column = TaskRaw.__table__.c.colab_link
+        assert _copy_value(None, column) == '\\N'
+        assert _copy_value(True, column) == 't'
+        assert _copy_value(datetime(2025, 1, 2, 3, 4, 5), column) == '2025-01-02 03:04:05'
+        assert _copy_value(date(2025, 1, 2), column) == '2025-01-02'
+        assert _copy_value('a\tb\nc\\d', column) == 'a\\tb\\nc\\\\d'
+
+    def test_integral_float_for_integer_column(self):
+        """Test that floats are rendered as integers for integer columns."""
+        assert _copy_value(3.0, TaskRaw.__table__.c.number_of_turns) == '3'
+
+    def test_copy_stream_reads_lazily(self):
+        """Test that the stream only pulls as many lines as a read needs."""
+        pulled = []
+
+        def lines():
+            for i in range(100):
+                pulled.append(i)
+                yield f'{i}\n'
+
+        stream = _CopyStream(lines())
+        assert stream.read(4) == b'0\n1\n'
+        assert len(pulled) == 2
+        assert stream.read(-1).startswith(b'2\n')
+
+
+class TestBulkLoad:
+    """Tests for bulk_load on SQLite."""
+
+    def test_streams_generator_in_batches(self, test_session):
+        """Test loading a generator with Python defaults applied."""
+        records = ({'task_id': i} for i in range(1, 12))
+
+        count = bulk_load(test_session, TaskRaw, records, batch_size=5)
+        test_session.commit()
+
+        assert count == 11
+        rows = test_session.query(TaskRaw).order_by(TaskRaw.task_id).all()
+        assert [r.task_id for r in rows] == list(range(1, 12))
+        assert rows[0].number_of_turns == 0
+
+    def test_serial_primary_key_is_generated(self, test_session):
+        """Test that autoincrement IDs are left to the database."""
+        bulk_load(test_session, ProjectCostDaily, [
+            {'date': date(2025, 1, 1), 'jibble_project_name': 'a', 'activity_type': 'Work Activity'},
+            {'date': date(2025, 1, 1), 'jibble_project_name': 'b', 'activity_type': 'Work Activity'},
+        ])
+        test_session.commit()
+
+        rows = test_session.query(ProjectCostDaily).all()
+        assert sorted(r.id for r in rows) == [1, 2]
+        assert all(r.total_cost == 0 for r in rows)
+
+    def test_empty_and_unknown_columns(self, test_session):
+        """Test that empty input is a no-op and unknown columns are rejected."""
+        assert bulk_load(test_session, TaskRaw, iter([])) == 0
+        with pytest.raises(ValueError):
+            bulk_load(test_session, TaskRaw, [{'task_id': 1, 'bogus': 1}])
@@ -0,0 +1,278 @@
+"""
+Unit tests for the query result cache.
+
+Tests cover:
+- Normalized cache keys for service methods
+- Per-prefix hit/miss statistics
+- Invalidation, including results computed across an invalidation
+- LRU eviction within entry, memory and per-prefix budgets
+- Sharing results and invalidations between workers via an L2 backend
+- Coalescing concurrent identical misses (single-flight)
+"""
+import pytest
+
+from app.core.cache import QueryCache, cached, estimate_size, normalize_cache_arg
+
+
+@pytest.fixture
+def fresh_cache():
+    """Swap in an empty global cache for the test."""
+    from unittest.mock import patch
+
+    cache = QueryCache()
+    with patch("app.core.cache.get_query_cache", return_value=cache):
+        yield cache
+
+
+class TestCacheKeys:
+    """Tests for cache key normalization."""
+
+    def test_normalize_filters(self):
+        """Test that unset filters and key order don't change the key."""
+        assert normalize_cache_arg({'b': 1, 'a': None, 'c': [2, 1]}) == {'b': 1, 'c': [2, 1]}
+        assert normalize_cache_arg({'x': 1, 'y': 2}) == normalize_cache_arg({'y': 2, 'x': 1})
+
+    def test_equivalent_calls_share_entry(self, fresh_cache):
+        """Test positional, keyword and default arguments map to one entry."""
+        calls = []
+
+        class Service:
+            @cached(prefix="trainer_stats")
+            def get_stats(self, filters=None, timeframe='overall'):
+                calls.append(filters)
+                return [{'filters': filters}]
+
+        service = Service()
+        service.get_stats({'domain': 'x', 'trainer': None})
+        service.get_stats(filters={'domain': 'x'})
+        service.get_stats({'domain': 'x'}, 'overall')
+        service.get_stats({'domain': 'y'})
+
+        assert len(calls) == 2
+
+    def test_ignored_arguments(self, fresh_cache):
+        """Test that ignored parameters (e.g. sessions) are not part of the key."""
+        calls = []
+
+        @cached(prefix="series", ignore=("session",))
+        def get_series(session, start_date):
+            calls.append(session)
+            return {'data': [start_date]}
+
+        get_series(object(), '2025-01-01')
+        get_series(object(), '2025-01-01')
+
+        assert len(calls) == 1
+
+
+class TestCacheStats:
+    """Tests for cache statistics and invalidation."""
+
+    def test_per_prefix_stats(self, fresh_cache):
+        """Test that hits and misses are reported per prefix."""
+        @cached(prefix="pod_lead_stats")
+        def get_pod_leads(start_date=None):
+            return ['row']
+
+        get_pod_leads('2025-01-01')
+        get_pod_leads('2025-01-01')
+        get_pod_leads('2025-01-02')
+
+        stats = fresh_cache.get_stats()['by_prefix']['pod_lead_stats']
+        assert stats['entries'] == 2
+        assert (stats['hits'], stats['misses'], stats['hit_rate_percent']) == (1, 2, 33.33)
+        assert stats['bytes'] > 0
+
+    def test_stale_result_not_stored_after_invalidation(self, fresh_cache):
+        """Test that a result computed across an invalidation is not cached."""
+        @cached(prefix="project_stats")
+        def get_projects():
+            fresh_cache.clear()  # sync finishes while this computes
+            return ['stale']
+
+        get_projects()
+
+        assert fresh_cache.get_stats()['size'] == 0
+
+    def test_sync_invalidates_cache(self, fresh_cache):
+        """Test that finishing sync_all_tables clears cached reads."""
+        from unittest.mock import MagicMock, patch
+        from app.services.data_sync_service import DataSyncService
+
+        fresh_cache.set("project_stats:abc", ['row'])
+        service = DataSyncService.__new__(DataSyncService)
+        service.settings = MagicMock(sync_max_workers=1)
+        service.bq_client = MagicMock()
+
+        with patch.object(DataSyncService, "get_sync_nodes", return_value=[]):
+            service.sync_all_tables('manual')
+
+        assert fresh_cache.get("project_stats:abc") is None
+
+
+class TestCacheEviction:
+    """Tests for LRU eviction and memory budgets."""
+
+    def test_lru_evicts_least_recently_read(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = QueryCache(max_size=2, stripes=1)
+        cache.set("a:1", 1)
+        cache.set("a:2", 2)
+        cache.get("a:1")
+        cache.set("a:3", 3)
+
+        assert cache.get("a:1") == 1
+        assert cache.get("a:2") is None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_memory_budget(self):
+        """Test that total approximate bytes stay within the budget."""
+        payload = ['x' * 1000]
+        size = estimate_size(list(payload))
+        cache = QueryCache(max_bytes=size * 3, stripes=1)
+        for i in range(10):
+            cache.set(f"rows:{i}", list(payload))
+
+        stats = cache.get_stats()
+        assert stats['bytes'] <= size * 3
+        assert stats['size'] == 3
+        assert cache.get("rows:9") is not None
+
+    def test_prefix_quota_only_evicts_own_prefix(self):
+        """Test that a prefix over its quota evicts its own entries, not others'."""
+        payload = ['x' * 1000]
+        size = estimate_size(list(payload))
+        cache = QueryCache(max_bytes=size * 100, prefix_quotas={"big": size * 2}, stripes=1)
+        cache.set("small:1", list(payload))
+        for i in range(5):
+            cache.set(f"big:{i}", list(payload))
+
+        by_prefix = cache.get_stats()['by_prefix']
+        assert by_prefix['big']['entries'] == 2
+        assert cache.get("small:1") is not None
+
+    def test_oversized_value_not_cached(self):
+        """Test that a value larger than the budget is skipped without flushing the cache."""
+        cache = QueryCache(max_bytes=10_000, stripes=1)
+        cache.set("a:1", [1])
+        cache.set("a:2", ['x' * 50_000])
+
+        assert cache.get("a:2") is None
+        assert cache.get("a:1") == [1]
+        assert cache.get_stats()['rejected_oversized'] == 1
+
+    def test_striped_clear(self):
+        """Test that clear and clear_prefix reach every stripe."""
+        cache = QueryCache(stripes=4)
+        for i in range(20):
+            cache.set(f"p{i % 2}:{i}", i)
+        cache.clear_prefix("p0")
+        assert cache.get_stats()['size'] == 10
+        cache.clear()
+        assert cache.get_stats()['size'] == 0
+
+
+class TestSharedCacheBackend:
+    """Tests for the shared L2 backend (two caches stand in for two workers)."""
+
+    @pytest.fixture
+    def workers(self, tmp_path):
+        from app.core.cache_backends import SQLiteCacheBackend
+
+        path = str(tmp_path / "cache.sqlite3")
+        return (
+            QueryCache(backend=SQLiteCacheBackend(path), generation_check_interval=0),
+            QueryCache(backend=SQLiteCacheBackend(path), generation_check_interval=0),
+        )
+
+    def test_result_shared_between_workers(self, workers):
+        """Test that one worker's result is served to another from L2."""
+        first, second = workers
+        first.set("project_stats:abc", [{'project': 'x'}])
+
+        assert second.get("project_stats:abc") == [{'project': 'x'}]
+        assert second.get_stats()['shared']['hits'] == 1
+        # Now promoted into the second worker's L1
+        assert second.get_stats()['size'] == 1
+
+    def test_invalidation_broadcast(self, workers):
+        """Test that clearing on one worker invalidates the other's L1 and L2."""
+        first, second = workers
+        first.set("project_stats:abc", ['old'])
+        assert second.get("project_stats:abc") == ['old']
+
+        first.clear()
+
+        assert second.get("project_stats:abc") is None
+        assert second.get_stats()['shared']['generation'] == first.get_stats()['shared']['generation']
+
+    def test_backend_errors_degrade_to_local(self):
+        """Test that a failing backend doesn't break caching."""
+        from unittest.mock import MagicMock
+
+        backend = MagicMock()
+        backend.name = "broken"
+        backend.get.side_effect = ConnectionError("down")
+        backend.set.side_effect = ConnectionError("down")
+        backend.get_generation.side_effect = ConnectionError("down")
+        cache = QueryCache(backend=backend, generation_check_interval=0)
+
+        cache.set("a:1", 1)
+        assert cache.get("a:1") == 1
+        assert cache.get("a:2") is None
+        assert cache.get_stats()['shared']['errors'] >= 3
+
+
+class TestSingleFlight:
+    """Tests for coalescing concurrent identical cache misses."""
+
+    def _run_concurrently(self, func, count):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            futures = [pool.submit(func) for _ in range(count)]
+            return [f.result() for f in futures]
+
+    def test_concurrent_misses_share_one_computation(self, fresh_cache):
+        """Test that identical concurrent calls run the query once."""
+        import threading
+        import time
+
+        calls = []
+        lock = threading.Lock()
+
+        @cached(prefix="pod_lead_stats")
+        def get_pod_leads(start_date=None):
+            with lock:
+                calls.append(start_date)
+            time.sleep(0.2)
+            return ['row']
+
+        results = self._run_concurrently(lambda: get_pod_leads('2025-01-01'), 8)
+
+        assert results == [['row']] * 8
+        assert len(calls) == 1
+        assert fresh_cache.get_stats()['by_prefix']['pod_lead_stats']['coalesced'] == 7
+
+    def test_error_shared_and_not_cached(self, fresh_cache):
+        """Test that waiters get the leader's exception and the next call retries."""
+        import time
+
+        attempts = []
+
+        def compute():
+            attempts.append(1)
+            time.sleep(0.1)
+            raise RuntimeError("query failed")
+
+        def call():
+            try:
+                return fresh_cache.get_or_compute("project_stats:abc", compute)
+            except RuntimeError as e:
+                return str(e)
+
+        results = self._run_concurrently(call, 4)
+
+        assert results == ["query failed"] * 4
+        assert len(attempts) == 1
+        assert fresh_cache.get_or_compute("project_stats:abc", lambda: ['ok']) == ['ok']
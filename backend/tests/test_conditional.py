@@ -0,0 +1,96 @@
+"""
+Unit tests for conditional GETs.
+
+Tests cover:
+- ETag/Last-Modified/Cache-Control on API GETs and 304s without running the route
+- New validators after a cache invalidation (sync)
+- Query parameter order, excluded paths and unauthenticated requests
+"""
+from email.utils import formatdate
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.cache import get_query_cache
+from app.core.conditional import ConditionalGetMiddleware, make_etag
+
+AUTH = {'Authorization': 'Bearer good'}
+
+
+@pytest.fixture
+def app_and_calls():
+    calls = []
+    app = FastAPI()
+    app.add_middleware(ConditionalGetMiddleware, prefix='/api', authorize=lambda value: value == 'Bearer good')
+
+    @app.get('/api/stats')
+    async def stats(a: int = 0, b: int = 0):
+        calls.append((a, b))
+        return {'a': a, 'b': b}
+
+    @app.get('/api/sync-info')
+    async def sync_info():
+        calls.append('sync-info')
+        return {}
+
+    return TestClient(app), calls
+
+
+class TestConditionalGet:
+    """Tests for ConditionalGetMiddleware."""
+
+    def test_not_modified_skips_route(self, app_and_calls):
+        """Test a matching If-None-Match gets an empty 304 without calling the route."""
+        client, calls = app_and_calls
+
+        first = client.get('/api/stats?a=1', headers=AUTH)
+        etag = first.headers['etag']
+        assert first.status_code == 200 and etag.startswith('W/"')
+        assert first.headers['cache-control'] == 'no-cache, must-revalidate'
+        assert first.headers['last-modified']
+
+        again = client.get('/api/stats?a=1', headers={**AUTH, 'If-None-Match': f'"other", {etag}'})
+        assert again.status_code == 304 and again.content == b''
+        assert again.headers['etag'] == etag
+        assert calls == [(1, 0)]
+
+    def test_new_etag_after_sync(self, app_and_calls):
+        """Test an invalidated cache changes the ETag and the route runs again."""
+        client, calls = app_and_calls
+        etag = client.get('/api/stats', headers=AUTH).headers['etag']
+
+        get_query_cache().clear()
+
+        response = client.get('/api/stats', headers={**AUTH, 'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+        assert len(calls) == 2
+
+    def test_etag_per_request(self, app_and_calls):
+        """Test query order is ignored but values, paths and Accept are not."""
+        client, _ = app_and_calls
+        etag = client.get('/api/stats?a=1&b=2', headers=AUTH).headers['etag']
+
+        assert client.get('/api/stats?b=2&a=1', headers=AUTH).headers['etag'] == etag
+        assert client.get('/api/stats?a=1&b=3', headers=AUTH).headers['etag'] != etag
+        assert make_etag('v', '/api/stats', b'a=1', 'application/vnd.columnar+json') != make_etag('v', '/api/stats', b'a=1')
+
+    def test_if_modified_since(self, app_and_calls):
+        """Test If-Modified-Since is honoured when no If-None-Match is sent."""
+        client, calls = app_and_calls
+        last_modified = client.get('/api/stats', headers=AUTH).headers['last-modified']
+
+        assert client.get('/api/stats', headers={**AUTH, 'If-Modified-Since': last_modified}).status_code == 304
+        older = formatdate(0, usegmt=True)
+        assert client.get('/api/stats', headers={**AUTH, 'If-Modified-Since': older}).status_code == 200
+        assert len(calls) == 2
+
+    def test_excluded_and_unauthenticated(self, app_and_calls):
+        """Test excluded paths and requests without valid credentials are passed through."""
+        client, calls = app_and_calls
+
+        assert 'etag' not in client.get('/api/sync-info', headers=AUTH).headers
+        response = client.get('/api/stats', headers={'Authorization': 'Bearer bad', 'If-None-Match': '*'})
+        assert response.status_code == 200 and 'etag' not in response.headers
+        assert calls == ['sync-info', (0, 0)]
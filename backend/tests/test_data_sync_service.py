@@ -0,0 +1,318 @@
+"""
+Unit tests for DataSyncService.
+
+Tests cover:
+- Full vs incremental sync decision from per-table watermarks
+- Task ID filter generation
+- Full and incremental writes of task-keyed rows
+- Jibble sync cursors and changed-day upserts
+- Dependency-aware parallel sync scheduling
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from app.models.db_models import JibbleHours, SyncWatermark, TaskRaw
+
+
+@pytest.fixture
+def sync_service(mock_db_service):
+    """DataSyncService backed by the in-memory test database."""
+    from app.services.data_sync_service import DataSyncService
+
+    settings = MagicMock(
+        incremental_sync_enabled=True,
+        full_sync_interval_hours=24,
+        incremental_sync_lookback_minutes=60,
+        jibble_incremental_lookback_days=3,
+    )
+    with patch("app.services.data_sync_service.get_settings", return_value=settings), \
+         patch("app.services.data_sync_service.get_db_service", return_value=mock_db_service):
+        yield DataSyncService()
+
+
+class TestSyncCutoff:
+    """Tests for choosing between full and incremental syncs."""
+
+    def test_full_sync_without_watermark(self, sync_service):
+        """Test that a table with no watermark gets a full sync."""
+        assert sync_service.get_sync_cutoff('task_raw') is None
+
+    def test_incremental_after_recent_full_sync(self, sync_service):
+        """Test that the cutoff is the watermark minus the lookback window."""
+        mark = datetime.utcnow() - timedelta(hours=1)
+        sync_service.save_sync_watermark('task_raw', mark, full=True, rows_changed=10)
+
+        assert sync_service.get_sync_cutoff('task_raw') == mark - timedelta(minutes=60)
+
+    def test_forced_full_sync(self, sync_service):
+        """Test that 'full' and 'initial' sync types ignore the watermark."""
+        sync_service.save_sync_watermark('task_raw', datetime.utcnow(), full=True, rows_changed=10)
+
+        assert sync_service.get_sync_cutoff('task_raw', 'full') is None
+        assert sync_service.get_sync_cutoff('task_raw', 'initial') is None
+
+    def test_periodic_full_reconciliation(self, sync_service, test_session):
+        """Test that a stale full sync forces a reconciliation reload."""
+        sync_service.save_sync_watermark('task_raw', datetime.utcnow() - timedelta(hours=30), full=True, rows_changed=10)
+        sync_service.save_sync_watermark('task_raw', datetime.utcnow(), full=False, rows_changed=2)
+
+        watermark = test_session.query(SyncWatermark).filter_by(table_name='task_raw').one()
+        assert watermark.last_sync_mode == 'incremental'
+        assert sync_service.get_sync_cutoff('task_raw') is None
+
+    def test_disabled(self, sync_service):
+        """Test that disabling incremental sync always reloads."""
+        sync_service.save_sync_watermark('task_raw', datetime.utcnow(), full=True, rows_changed=10)
+        sync_service.settings.incremental_sync_enabled = False
+
+        assert sync_service.get_sync_cutoff('task_raw') is None
+
+
+class TestTaskRowWrites:
+    """Tests for writing task-keyed rows."""
+
+    def test_task_id_filter_sql(self):
+        """Test the task ID predicate binds one array parameter instead of inlining IDs."""
+        from app.services.data_sync_service import DataSyncService
+
+        assert DataSyncService._task_id_filter_sql('t.id', None) == ""
+        assert DataSyncService._task_id_filter_sql('t.id', [1, 2]) == "AND t.id IN UNNEST(@task_ids)"
+
+        assert DataSyncService._task_id_params(None) is None
+        [param] = DataSyncService._task_id_params(list(range(50000)))
+        assert (param.name, param.array_type, len(param.values)) == ('task_ids', 'INT64', 50000)
+
+    def test_full_write_replaces_table(self, sync_service, test_session):
+        """Test that a full write replaces all existing rows."""
+        sync_service._write_task_rows(TaskRaw, 'task_id', [{'task_id': 1}, {'task_id': 2}], None)
+        sync_service._write_task_rows(TaskRaw, 'task_id', [{'task_id': 3}], None)
+
+        assert [r.task_id for r in test_session.query(TaskRaw).all()] == [3]
+
+    def test_incremental_write_replaces_changed_tasks(self, sync_service, test_session):
+        """Test that an incremental write only touches the changed tasks."""
+        sync_service._write_task_rows(
+            TaskRaw, 'task_id',
+            [{'task_id': 1, 'task_status': 'labeling'}, {'task_id': 2}, {'task_id': 3}],
+            None
+        )
+        # Task 1 changed, task 2 no longer qualifies upstream, task 3 untouched
+        sync_service._write_task_rows(TaskRaw, 'task_id', [{'task_id': 1, 'task_status': 'completed'}], [1, 2])
+
+        rows = {r.task_id: r.task_status for r in test_session.query(TaskRaw).all()}
+        assert rows == {1: 'completed', 3: None}
+
+
+class TestJibbleIncrementalWrites:
+    """Tests for cursor-based Jibble hours syncs."""
+
+    SYNCED = datetime(2025, 1, 1)
+
+    def _hours(self, member_code, day, hours, project='P1', source='jibble_api_timeentries'):
+        return JibbleHours(member_code=member_code, entry_date=day, project=project, full_name=member_code.upper(),
+                           logged_hours=hours, source=source, last_synced=self.SYNCED)
+
+    def _record(self, member_code, day, hours, project='P1'):
+        return {'member_code': member_code, 'entry_date': day, 'project': project,
+                'full_name': member_code.upper(), 'logged_hours': hours, 'turing_email': None}
+
+    def test_only_changed_days_are_written(self, sync_service, test_session):
+        """Test re-fetched days are updated, inserted or deleted, and nothing else is touched."""
+        jan = lambda d: date(2025, 1, d)
+        test_session.add_all([
+            self._hours('a', jan(1), 8.0),   # before the window
+            self._hours('a', jan(5), 8.0),   # unchanged
+            self._hours('a', jan(6), 8.0),   # edited
+            self._hours('a', jan(7), 4.0),   # deleted in Jibble
+            self._hours('b', jan(6), 6.0),   # person not re-synced
+        ])
+        test_session.commit()
+
+        records = [self._record('a', jan(5), 8.0), self._record('a', jan(6), 6.5), self._record('a', jan(8), 2.0)]
+        changed = sync_service._upsert_jibble_days(
+            'jibble_api_timeentries', records,
+            lambda member_code, project, entry_date: member_code == 'a' and entry_date >= jan(5),
+            since=jan(5),
+        )
+
+        rows = test_session.query(JibbleHours).order_by(JibbleHours.member_code, JibbleHours.entry_date).all()
+        assert changed == 3
+        assert [(r.member_code, r.entry_date.day, r.logged_hours) for r in rows] == [
+            ('a', 1, 8.0), ('a', 5, 8.0), ('a', 6, 6.5), ('a', 8, 2.0), ('b', 6, 6.0),
+        ]
+        assert [r.last_synced == self.SYNCED for r in rows] == [True, True, False, False, True]
+
+    def test_cursor_round_trip(self, sync_service):
+        """Test saved cursors come back as start days with the lookback applied."""
+        synced_at = datetime(2025, 1, 10, 12, 0)
+        sync_service._save_jibble_cursors('jibble_api_timeentries', ['p1'], [('p1', 'a')], synced_at)
+        sync_service._save_jibble_cursors('jibble_api_timeentries', [], [('p1', 'a')], synced_at + timedelta(days=1))
+
+        project_since, person_since = sync_service._load_jibble_cursors('jibble_api_timeentries')
+
+        assert project_since == {'p1': date(2025, 1, 7)}
+        assert person_since == {('p1', 'a'): date(2025, 1, 8)}
+        assert sync_service._load_jibble_cursors('jibble_api') == ({}, {})
+
+    def test_failed_page_keeps_days_and_cursors(self, sync_service, test_session):
+        """Test a person whose second page failed keeps their days and cursors."""
+        from app.models.db_models import JibbleSyncCursor
+        from app.services.jibble_timeentries_sync import NVIDIA_PROJECTS, JibbleTimeEntriesSync
+        from tests.test_jibble_client import FakeJibble, _client
+
+        project_id, project = next(iter(NVIDIA_PROJECTS.items()))
+        test_session.add_all([
+            self._hours('a', date(2025, 1, 8), 8.0, project),
+            self._hours('a', date(2025, 1, 9), 7.5, project),
+            self._hours('b', date(2025, 1, 8), 6.0, project),
+        ])
+        test_session.commit()
+        sync_service._save_jibble_cursors(
+            'jibble_api_timeentries', [project_id], [(project_id, 'a'), (project_id, 'b')], self.SYNCED
+        )
+        sync_service.save_sync_watermark('jibble_hours_by_project', datetime.utcnow(), full=True, rows_changed=3)
+
+        def shift(person, start):
+            common = {'personId': person, 'projectId': project_id, 'person': {'fullName': person.upper()}}
+            day = start.date().isoformat()
+            return [
+                {**common, 'type': 'In', 'belongsToDate': day, 'time': f"{start.isoformat()}Z"},
+                {**common, 'type': 'Out', 'time': f"{(start + timedelta(minutes=30)).isoformat()}Z"},
+            ]
+
+        # 300 shifts for "a" fill the first 500-entry page; the second one fails
+        a_entries = [e for i in range(300) for e in shift('a', datetime(2024, 12, 29, 0) + timedelta(hours=i))]
+        b_entries = shift('b', datetime(2024, 12, 30, 9))
+        since = "time ge 2024-12-28T00:00:00Z"
+        fake = FakeJibble(
+            {
+                f"projectId eq {project_id} and {since}": a_entries[:2] + b_entries,
+                f"personId eq a and {since}": a_entries,
+                f"personId eq b and {since}": b_entries,
+            },
+            failing=[(f"personId eq a and {since}", 500)],
+        )
+
+        with patch.object(JibbleTimeEntriesSync, '_client', lambda self: _client(fake)):
+            assert sync_service.sync_jibble_hours_by_project()
+
+        rows = test_session.query(JibbleHours).order_by(JibbleHours.member_code, JibbleHours.entry_date).all()
+        assert [(r.member_code, r.entry_date.day, r.logged_hours) for r in rows] == [
+            ('a', 8, 8.0), ('a', 9, 7.5), ('b', 30, 0.5),
+        ]
+        cursors = {c.cursor_key: c.synced_at for c in test_session.query(JibbleSyncCursor)}
+        assert cursors[project_id] == self.SYNCED
+        assert cursors[f"{project_id}:a"] == self.SYNCED
+        assert cursors[f"{project_id}:b"] > self.SYNCED
+
+    def test_failed_timesheet_chunk_is_not_overwritten(self, sync_service, test_session):
+        """Test days of a failed TimesheetsSummary chunk keep their rows and the watermark resumes there."""
+        start = datetime.now() - timedelta(days=28)
+        first_chunk_day, failed_chunk_day = (start + timedelta(days=2)).date(), (start + timedelta(days=20)).date()
+        test_session.add_all([
+            self._hours('p', first_chunk_day, 8.0, 'Jibble API', source='jibble_api'),
+            self._hours('p', failed_chunk_day, 7.0, 'Jibble API', source='jibble_api'),
+        ])
+        test_session.commit()
+
+        class FakeJibbleService:
+            def test_connection(self):
+                return {'success': True}
+
+            def get_timesheets_summary(self, chunk_start, chunk_end, raise_errors=False):
+                assert raise_errors
+                if chunk_start.date() > first_chunk_day:
+                    raise RuntimeError('503')
+                return {'p': {'_name': 'P', '_total': 5.0, first_chunk_day.isoformat(): 5.0}}
+
+        with patch('app.services.jibble_service.JibbleService', FakeJibbleService):
+            assert sync_service.sync_jibble_hours_from_api(days_back=28)
+
+        rows = test_session.query(JibbleHours).order_by(JibbleHours.entry_date).all()
+        assert [(r.entry_date, r.logged_hours) for r in rows] == [(first_chunk_day, 5.0), (failed_chunk_day, 7.0)]
+        watermark = test_session.query(SyncWatermark).filter_by(table_name='jibble_hours_api').one()
+        assert watermark.high_water_mark.date() == (start + timedelta(days=15)).date()
+        assert watermark.last_full_sync_at is None
+
+
+class TestSyncDag:
+    """Tests for the dependency-aware sync scheduler."""
+
+    def test_dependencies_run_first(self):
+        """Test that a node starts only after its dependencies finish."""
+        from app.services.data_sync_service import SyncNode, run_sync_dag
+
+        finished = []
+
+        def make(name):
+            def sync(sync_type):
+                finished.append(name)
+                return True
+            return sync
+
+        nodes = [
+            SyncNode('contributor', make('contributor')),
+            SyncNode('task', make('task'), ['contributor']),
+            SyncNode('task_aht', make('task_aht'), ['task']),
+            SyncNode('task_raw', make('task_raw')),
+        ]
+        results = run_sync_dag(nodes, 'manual', max_workers=4)
+
+        assert list(results) == ['contributor', 'task', 'task_aht', 'task_raw']
+        assert all(results.values())
+        assert finished.index('contributor') < finished.index('task') < finished.index('task_aht')
+
+    def test_independent_nodes_run_concurrently(self):
+        """Test that independent nodes overlap on the worker pool."""
+        import threading
+        from app.services.data_sync_service import SyncNode, run_sync_dag
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def sync(sync_type):
+            barrier.wait()
+            return True
+
+        nodes = [SyncNode(f'table_{i}', sync) for i in range(3)]
+
+        assert all(run_sync_dag(nodes, 'manual', max_workers=3).values())
+
+    def test_failures_do_not_block_dependents(self):
+        """Test that a failed or raising node is reported and dependents still run."""
+        from app.services.data_sync_service import SyncNode, run_sync_dag
+
+        def boom(sync_type):
+            raise RuntimeError("boom")
+
+        errors = []
+        nodes = [
+            SyncNode('contributor', boom),
+            SyncNode('task', lambda sync_type: True, ['contributor']),
+        ]
+        results = run_sync_dag(nodes, 'manual', on_error=lambda name, e, start: errors.append(name))
+
+        assert results == {'contributor': False, 'task': True}
+        assert errors == ['contributor']
+
+    def test_invalid_graphs(self):
+        """Test that unknown dependencies and cycles are rejected."""
+        from app.services.data_sync_service import SyncNode, run_sync_dag
+
+        with pytest.raises(ValueError):
+            run_sync_dag([SyncNode('task', lambda t: True, ['missing'])], 'manual')
+        with pytest.raises(ValueError):
+            run_sync_dag([
+                SyncNode('a', lambda t: True, ['b']),
+                SyncNode('b', lambda t: True, ['a']),
+            ], 'manual')
+
+    def test_service_graph_is_valid(self, sync_service):
+        """Test that the service's sync graph covers every table without cycles."""
+        from app.services.data_sync_service import SyncNode, run_sync_dag
+
+        nodes = [SyncNode(n.name, lambda t: True, n.depends_on) for n in sync_service.get_sync_nodes()]
+        results = run_sync_dag(nodes, 'manual')
+
+        assert len(results) == len(nodes)
+        assert 'jibble_hours' in results
@@ -0,0 +1,199 @@
+"""
+Unit tests for streaming exports.
+
+Tests cover:
+- NDJSON, CSV and XLSX encoding, chunking and download headers
+- Streamed task-level rows matching the task-level list
+- Time theft rows filtered and ordered by hours while streaming
+- Project stats task rows streamed per project without the cached hierarchy
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from openpyxl import load_workbook
+
+from app.constants import get_constants
+from app.core import export
+from app.core.export import ExportFormat, export_response, iter_csv, iter_ndjson, iter_xlsx
+from app.models.db_models import (
+    Contributor, JibbleHours, PodLeadMapping, ReviewDetail, Task, TaskAHT, TaskHistoryRaw, TaskRaw,
+    TimeTheftExclusion,
+)
+from app.routers.jibble import iter_time_theft
+from app.services.query_service import QueryService
+
+ROWS = [
+    {'task_id': i, 'name': f'task, "{i}"', 'score': i / 4, 'dims': {'Accuracy': i}}
+    for i in range(7)
+]
+COLUMNS = ['task_id', 'name', 'score', 'dims']
+PROJECT_CONTEXT = ['project_id', 'project_name', 'pod_lead_email', 'pod_lead_name', 'trainer_email', 'trainer_name']
+
+
+@pytest.fixture
+def query_service(mock_db_service):
+    service = QueryService.__new__(QueryService)
+    service.settings = MagicMock(project_id_filter=None)
+    service.db_service = mock_db_service
+    return service
+
+
+class TestFormats:
+    """Tests for the row encoders."""
+
+    def test_ndjson_chunks(self, monkeypatch):
+        """Test one JSON object per line, split into CHUNK_ROWS-row chunks."""
+        monkeypatch.setattr(export, 'CHUNK_ROWS', 3)
+        chunks = list(iter_ndjson(iter(ROWS)))
+
+        assert [chunk.count(b'\n') for chunk in chunks] == [3, 3, 1]
+        assert [json.loads(line) for line in b''.join(chunks).splitlines()] == ROWS
+
+    def test_csv_chunks(self, monkeypatch):
+        """Test a header row, quoted values and nested values as JSON."""
+        monkeypatch.setattr(export, 'CHUNK_ROWS', 3)
+        chunks = list(iter_csv(iter(ROWS), COLUMNS))
+
+        assert len(chunks) == 3
+        parsed = list(csv.DictReader(io.StringIO(b''.join(chunks).decode())))
+        assert [row['name'] for row in parsed] == [row['name'] for row in ROWS]
+        assert json.loads(parsed[2]['dims']) == {'Accuracy': 2}
+        assert list(csv.reader(io.StringIO(b''.join(iter_csv(iter([]), COLUMNS)).decode()))) == [COLUMNS]
+
+    def test_xlsx_round_trip(self):
+        """Test the streamed workbook reads back with every row."""
+        data = b''.join(iter_xlsx(iter(ROWS), COLUMNS, sheet_title='tasks'))
+
+        sheet = load_workbook(io.BytesIO(data)).active
+        values = list(sheet.iter_rows(values_only=True))
+        assert sheet.title == 'tasks'
+        assert list(values[0]) == COLUMNS
+        assert [row[0] for row in values[1:]] == list(range(7))
+        assert values[2][2] == 0.25
+
+    def test_response_headers(self):
+        """Test media type and attachment name per format."""
+        for export_format, media_type in [
+            (ExportFormat.NDJSON, 'application/x-ndjson'),
+            (ExportFormat.CSV, 'text/csv'),
+            (ExportFormat.XLSX, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+        ]:
+            response = export_response(iter(ROWS), COLUMNS, export_format, 'tasks')
+            assert response.media_type.startswith(media_type)
+            assert response.headers['content-disposition'] == f'attachment; filename="tasks.{export_format.value}"'
+
+
+class TestTaskLevelExport:
+    """Tests for streamed task-level rows."""
+
+    def test_matches_task_level_list(self, test_session, query_service):
+        """Test batched streaming yields the same rows as get_task_level_data."""
+        test_session.add(Contributor(id=1, name='Ann', turing_email='ann@x.com'))
+        for task_id in range(1, 8):
+            test_session.add(Task(id=task_id, colab_link=f'link-{task_id}', week_number=1, rework_count=0))
+            test_session.add(TaskAHT(task_id=task_id, duration_minutes=10.0 * task_id))
+        # Interleave tasks so rows only come out grouped because of the ORDER BY
+        for dimension in ('Accuracy', 'Clarity', 'Style'):
+            for task_id in range(7, 0, -1):
+                if dimension == 'Style' and task_id % 2:
+                    continue
+                test_session.add(ReviewDetail(
+                    conversation_id=task_id, human_role_id=1, reviewer_id=1, is_delivered='False',
+                    name=dimension, score=task_id / 2, task_score=task_id / 3, updated_at=date(2025, 1, task_id),
+                ))
+        test_session.commit()
+
+        streamed = list(query_service.iter_task_level_rows({}, batch_size=2))
+
+        assert streamed == QueryService.get_task_level_data.__wrapped__(query_service, {})
+        assert streamed[1]['quality_dimensions'] == {'Accuracy': 1.0, 'Clarity': 1.0, 'Style': 1.0}
+        assert streamed[1]['duration_minutes'] == 20.0
+        assert query_service.get_task_level_dimensions({}) == ['Accuracy', 'Clarity', 'Style']
+
+
+class TestTimeTheftExport:
+    """Tests for iter_time_theft."""
+
+    def test_filters_and_orders(self, test_session):
+        """Test active and excluded people are dropped and rows come most hours first."""
+        def hours(email, day, logged):
+            return JibbleHours(full_name=email.split('@')[0], turing_email=email, jibble_email=None,
+                               project='Nvidia - SysBench', entry_date=day, logged_hours=logged,
+                               last_synced=datetime(2025, 1, 4))
+
+        test_session.add_all([
+            hours('idle@x.com', date(2025, 1, 2), 3.0),
+            hours('idle@x.com', date(2025, 1, 3), 4.5),
+            hours('busier@x.com', date(2025, 1, 2), 9.0),
+            hours('author@x.com', date(2025, 1, 2), 20.0),
+            hours('reviewer@x.com', date(2025, 1, 2), 20.0),
+            hours('manager@x.com', date(2025, 1, 2), 8.0),
+            JibbleHours(full_name='Other', turing_email='other@x.com', project='Other project',
+                        entry_date=date(2025, 1, 2), logged_hours=50.0, last_synced=datetime(2025, 1, 4)),
+            TaskHistoryRaw(task_id=1, project_id=36, author='Author@x.com', new_status='completed',
+                           date=date(2025, 1, 2)),
+            TaskRaw(task_id=1, project_id=36, reviewer='reviewer@x.com'),
+            TimeTheftExclusion(turing_email='manager@x.com'),
+        ])
+        test_session.commit()
+
+        rows = list(iter_time_theft(test_session, project_id=36, batch_size=2))
+        assert [(row['turing_email'], row['total_hours']) for row in rows] == [
+            ('busier@x.com', 9.0), ('idle@x.com', 7.5),
+        ]
+
+        with_excluded = list(iter_time_theft(test_session, project_id=36, show_excluded=True))
+        assert [row['turing_email'] for row in with_excluded] == ['busier@x.com', 'manager@x.com', 'idle@x.com']
+        assert with_excluded[1]['excluded'] is True
+
+
+class TestProjectTaskRows:
+    """Tests for streaming project stats task rows."""
+
+    def test_one_row_per_task(self, test_session, query_service):
+        """Test rows stream per project with their POD lead and trainer, matching the trainer task rows."""
+        def completion(task_id, author, count, day):
+            return TaskHistoryRaw(task_id=task_id, project_id=36, author=author, new_status='completed',
+                                  old_status='in_progress', completed_status_count=count,
+                                  date=date(2025, 1, day), time_stamp=datetime(2025, 1, day, 9))
+
+        test_session.add_all([
+            TaskRaw(task_id=1, project_id=36, derived_status='Reviewed'),
+            TaskRaw(task_id=2, project_id=36, derived_status='Rework'),
+            PodLeadMapping(trainer_email='ann@x.com', trainer_name='Ann', pod_lead_email='Lead@x.com'),
+            Contributor(name='Bob B', turing_email='bob@x.com'),
+            completion(1, 'ann@x.com', 1, 2),
+            completion(2, 'ann@x.com', 1, 3),
+            completion(2, 'bob@x.com', 2, 4),
+        ])
+        test_session.commit()
+        query_service.settings.all_project_ids_list = [36, 37]
+        query_service.settings.project_names = {36: 'SysBench'}
+        query_service._constants = get_constants()
+
+        with patch('app.services.quality_rubrics_service.QualityRubricsService._fetch_team_roles', return_value={}), \
+             patch.object(QueryService, 'get_project_stats_with_pod_leads') as hierarchy:
+            rows = list(query_service.iter_project_task_rows('2025-01-01', '2025-01-07'))
+            expected = query_service._trainer_task_rows(
+                test_session, 36, '2025-01-01', '2025-01-07', query_service._calibrator_emails(test_session)
+            )
+        hierarchy.assert_not_called()
+
+        assert sorted((row['trainer_email'], row['task_id']) for row in rows) == [
+            ('ann@x.com', 1), ('ann@x.com', 2), ('bob@x.com', 2),
+        ]
+        for row in rows:
+            context = {key: row.pop(key) for key in PROJECT_CONTEXT}
+            assert row in expected[context['trainer_email']]
+            assert (context['project_id'], context['project_name']) == (36, 'SysBench')
+            if context['trainer_email'] == 'ann@x.com':
+                assert (context['pod_lead_email'], context['pod_lead_name'], context['trainer_name']) == (
+                    'lead@x.com', 'lead', 'Ann')
+            else:
+                assert (context['pod_lead_email'], context['pod_lead_name'], context['trainer_name']) == (
+                    'no_pod_lead', 'No Pod Lead', 'Bob B')
+
@@ -0,0 +1,80 @@
+"""
+Unit tests for FPY computed from the fpy_review table.
+
+Tests cover:
+- First review per conversation and role deciding pass / fail
+- Reviewer roles from pod_lead_mapping and the team sheet
+- Per-period first reviews
+"""
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.models.db_models import FpyReview, PodLeadMapping
+from app.services.fpy_reviews import fpy_counts, fpy_rates, load_fpy_role_map
+
+# SQLite can't read back the server-side now() default
+SYNCED = datetime(2025, 1, 6)
+
+
+def _review(review_id, conversation_id, email, action, day, hour=9, project_id=36):
+    return FpyReview(review_id=review_id, conversation_id=conversation_id, project_id=project_id,
+                     reviewer_email=email, action_type=action, review_date=date(2025, 1, day),
+                     submitted_at=datetime(2025, 1, day, hour), last_synced=SYNCED)
+
+
+@pytest.fixture
+def seeded_session(test_session):
+    test_session.add_all([
+        PodLeadMapping(trainer_email='P@x.com', role='Pod Lead'),
+        PodLeadMapping(trainer_email='cal@x.com', role='Auditor'),
+        # Conversation 1: reviewer fails first, passes later; calibrator passes
+        _review(1, 1, 'p@x.com', 'rework', 6), _review(2, 1, 'p@x.com', 'approve', 7),
+        _review(3, 1, 'cal@x.com', 'approve', 8),
+        # Conversation 2: unmapped reviewer (counts as reviewer) with no action type
+        _review(4, 2, 'someone@x.com', None, 7),
+        # Conversation 3: calibrator sends to rework, another project
+        _review(5, 3, 'cal@x.com', 'rework', 7, project_id=37),
+    ])
+    test_session.commit()
+    return test_session
+
+
+@pytest.fixture(autouse=True)
+def team_sheet():
+    with patch('app.services.quality_rubrics_service.QualityRubricsService') as rubrics:
+        rubrics.return_value._fetch_team_roles.return_value = {'Sheet@x.com': 'calibrator'}
+        yield rubrics
+
+
+class TestFpy:
+    """Tests for FPY counts."""
+
+    def test_role_map(self, seeded_session):
+        """Test pod_lead_mapping roles are normalized and the team sheet is merged in."""
+        assert load_fpy_role_map(seeded_session) == {
+            'p@x.com': 'reviewer', 'cal@x.com': 'calibrator', 'sheet@x.com': 'calibrator',
+        }
+
+    def test_first_review_per_role(self, seeded_session):
+        """Test only the first review per conversation and role counts."""
+        counts = fpy_counts(seeded_session, [36, 37])
+
+        assert counts[(36, None)] == {'r_total': 2, 'r_pass': 1, 'a_total': 1, 'a_pass': 1}
+        assert counts[(37, None)] == {'r_total': 0, 'r_pass': 0, 'a_total': 1, 'a_pass': 0}
+        assert fpy_rates(counts[(36, None)]) == (50.0, 100.0)
+        assert fpy_rates(counts[(37, None)]) == (None, 0.0)
+
+    def test_date_range(self, seeded_session):
+        """Test the first review is taken within the date range."""
+        counts = fpy_counts(seeded_session, [36], date(2025, 1, 7), date(2025, 1, 7))
+
+        assert counts[(36, None)] == {'r_total': 2, 'r_pass': 2, 'a_total': 0, 'a_pass': 0}
+
+    def test_per_period(self, seeded_session):
+        """Test first reviews are taken per period."""
+        counts = fpy_counts(seeded_session, [36], period=FpyReview.review_date)
+
+        assert counts[(36, date(2025, 1, 6))]['r_pass'] == 0
+        assert counts[(36, date(2025, 1, 7))] == {'r_total': 2, 'r_pass': 2, 'a_total': 0, 'a_pass': 0}
@@ -0,0 +1,207 @@
+"""
+Unit tests for the pooled Jibble API client.
+
+Tests cover:
+- OAuth token reuse across requests and clients
+- Adaptive rate limiting on 429 / Retry-After
+- Concurrent per-person fetches in the TimeEntries payroll sync
+- Incremental windows from per-project and per-person start days
+"""
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.core.exceptions import JibbleException
+from app.services import jibble_client
+from app.services.jibble_client import AdaptiveTokenBucket, AsyncJibbleClient
+from app.services.jibble_timeentries_sync import JibbleTimeEntriesSync
+
+API = "https://time-tracking.prod.jibble.io/v1/TimeEntries"
+
+
+@pytest.fixture(autouse=True)
+def fresh_tokens():
+    jibble_client._token_cache.clear()
+    yield
+    jibble_client._token_cache.clear()
+
+
+class FakeJibble:
+    """httpx handler recording requests; ``routes`` maps a $filter to pages of entries.
+
+    ``failing`` lists ($filter, $skip) pages answered with a 500.
+    """
+
+    def __init__(self, routes=None, throttle_first=0, failing=()):
+        self.routes = routes or {}
+        self.failing = set(failing)
+        self.throttle_first = throttle_first
+        self.token_requests = 0
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request):
+        if request.url.host == "identity.prod.jibble.io":
+            self.token_requests += 1
+            return httpx.Response(200, json={"access_token": f"t{self.token_requests}", "expires_in": 3600})
+        self.calls.append(request)
+        if self.throttle_first:
+            self.throttle_first -= 1
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        params = request.url.params
+        if (params.get("$filter"), int(params.get("$skip", 0))) in self.failing:
+            return httpx.Response(500)
+        entries = self.routes.get(params.get("$filter"), [])
+        skip, top = int(params.get("$skip", 0)), int(params.get("$top", 1000))
+        return httpx.Response(200, json={"value": entries[skip:skip + top]})
+
+
+def _client(fake, **kwargs):
+    return AsyncJibbleClient("id", "secret", transport=httpx.MockTransport(fake),
+                             requests_per_second=kwargs.pop("rate", 1000), **kwargs)
+
+
+class TestAsyncJibbleClient:
+    """Tests for tokens, retries and paging."""
+
+    async def test_token_is_reused(self):
+        """Test one OAuth token serves every request and client until it expires."""
+        fake = FakeJibble()
+        async with _client(fake) as client:
+            await asyncio.gather(*(client.get_json(API, {}) for _ in range(5)))
+        async with _client(fake) as client:
+            await client.get_json(API, {})
+
+        assert fake.token_requests == 1
+        assert {c.headers["Authorization"] for c in fake.calls} == {"Bearer t1"}
+
+    async def test_expired_token_is_refreshed(self):
+        """Test a 401 drops the cached token and retries once."""
+        fake = FakeJibble()
+        original = fake.__call__
+        statuses = iter([401])
+
+        async def handler(request):
+            if request.url.host != "identity.prod.jibble.io" and next(statuses, None) == 401:
+                fake.calls.append(request)
+                return httpx.Response(401)
+            return await original(request)
+
+        async with AsyncJibbleClient("id", "secret", transport=httpx.MockTransport(handler)) as client:
+            assert await client.get_json(API, {}) == {"value": []}
+        assert fake.token_requests == 2
+
+    async def test_429_slows_the_bucket(self):
+        """Test a 429 is retried after Retry-After and halves the request rate."""
+        fake = FakeJibble(throttle_first=1)
+        async with _client(fake, rate=8) as client:
+            assert await client.get_json(API, {}) == {"value": []}
+            assert client.bucket.rate == pytest.approx(4.1)  # halved, then one success step
+        assert len(fake.calls) == 2
+
+    async def test_get_paged(self):
+        """Test $top/$skip pages are fetched until a short page."""
+        fake = FakeJibble({"projectId eq p": [{"id": i} for i in range(5)]})
+        async with _client(fake) as client:
+            entries = await client.get_paged(API, {"$filter": "projectId eq p"}, page_size=2)
+
+        assert [e["id"] for e in entries] == [0, 1, 2, 3, 4]
+        assert len(fake.calls) == 3
+
+    async def test_get_paged_failed_page_raises(self):
+        """Test a failed page raises instead of returning the pages before it."""
+        fake = FakeJibble({"projectId eq p": [{"id": i} for i in range(5)]}, failing=[("projectId eq p", 2)])
+        async with _client(fake) as client:
+            with pytest.raises(JibbleException):
+                await client.get_paged(API, {"$filter": "projectId eq p"}, page_size=2)
+
+
+class TestAdaptiveTokenBucket:
+    """Tests for the rate adaptation."""
+
+    def test_throttle_and_recover(self):
+        """Test the rate halves (to a floor) on 429 and recovers additively."""
+        bucket = AdaptiveTokenBucket(rate=1.0, min_rate=0.2, recovery_step=0.25)
+        for _ in range(4):
+            bucket.throttle(0)
+        assert bucket.rate == 0.2
+
+        for _ in range(10):
+            bucket.succeed()
+        assert bucket.rate == 1.0
+
+
+class TestPayrollSync:
+    """Tests for the concurrent TimeEntries payroll sync."""
+
+    async def test_people_fetched_concurrently_and_once(self):
+        """Test people are fetched in parallel, once per run even across projects."""
+        def shift(person, project, day):
+            common = {"personId": person, "projectId": project, "person": {"fullName": person.upper()}}
+            return [
+                {**common, "type": "In", "belongsToDate": day, "time": f"{day}T09:00:00Z"},
+                {**common, "type": "Out", "time": f"{day}T11:00:00Z"},
+            ]
+
+        people = ["a", "b", "c", "d"]
+        routes = {f"personId eq {p}": shift(p, "p1", "2025-01-06") for p in people}
+        routes["personId eq a"] += shift("a", "p2", "2025-01-07")
+        routes["projectId eq p1"] = [e for p in people for e in routes[f"personId eq {p}"] if e["projectId"] == "p1"]
+        routes["projectId eq p2"] = [e for e in routes["personId eq a"] if e["projectId"] == "p2"]
+        fake = FakeJibble(routes)
+
+        sync = JibbleTimeEntriesSync()
+        with patch.object(sync, "_client", lambda: _client(fake, max_concurrency=8)):
+            results = await sync.sync_projects({"p1": "Project 1", "p2": "Project 2"})
+
+        assert sorted(r["person_id"] for r in results["Project 1"]) == people
+        assert [(r["full_name"], r["entry_date"], r["logged_hours"]) for r in results["Project 2"]] == [
+            ("A", "2025-01-07", 2.0),
+        ]
+        def calls(person, endpoint):
+            return [c for c in fake.calls
+                    if c.url.params.get("$filter") == f"personId eq {person}" and c.url.path.endswith(endpoint)]
+
+        # "a" works on both projects but is fetched like everyone else
+        assert len(calls("a", "TimeEntries")) == 1
+        assert len(calls("a", "TimesheetsSummary")) == len(calls("b", "TimesheetsSummary"))
+        assert fake.max_in_flight > 1
+
+    async def test_incremental_windows(self):
+        """Test start days narrow the fetches and the returned days."""
+        def shift(day, hours):
+            common = {"personId": "a", "projectId": "p1", "person": {"fullName": "A"}}
+            return [
+                {**common, "type": "In", "belongsToDate": day, "time": f"{day}T09:00:00Z"},
+                {**common, "type": "Out", "time": f"{day}T{9 + hours:02d}:00:00Z"},
+            ]
+
+        entries = shift("2025-01-05", 2) + shift("2025-01-06", 3)
+        since = "time ge 2025-01-05T00:00:00Z"
+        fake = FakeJibble({
+            f"projectId eq p1 and {since}": entries,
+            f"personId eq a and {since}": entries,
+        })
+
+        sync = JibbleTimeEntriesSync()
+        with patch.object(sync, "_client", lambda: _client(fake)):
+            results = await sync.sync_projects(
+                {"p1": "Project 1"},
+                project_since={"p1": date(2025, 1, 6)},
+                person_since={("p1", "a"): date(2025, 1, 6)},
+            )
+
+        # The day before is fetched to pair In/Out entries but not returned
+        assert [(r["entry_date"], r["logged_hours"]) for r in results["Project 1"]] == [("2025-01-06", 3.0)]
+        assert sync.project_windows == {"p1": date(2025, 1, 6)}
+        assert sync.person_windows == {("p1", "a"): date(2025, 1, 6)}
+        summary = [c for c in fake.calls if c.url.path.endswith("TimesheetsSummary")]
+        assert summary[0].url.params["date"] == "2025-01-06"
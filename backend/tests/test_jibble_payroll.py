@@ -0,0 +1,166 @@
+"""
+Unit tests for the batched Jibble payroll-hours engine.
+
+Tests cover:
+- In/Out pairing, including project switches and unpaired entries
+- Proportional payroll split and tracked-hours fallback
+- Parity with the per-person calculation syncs used before
+"""
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.jibble_payroll import project_payroll_hours
+
+
+def _entry(kind, project, when, day=None):
+    entry = {"type": kind, "projectId": project, "time": when}
+    if kind == "In":
+        entry["belongsToDate"] = day or when[:10]
+    return entry
+
+
+def _as_dict(frame):
+    return {
+        (row.project_id, row.person_id, row.entry_date): row.logged_hours
+        for row in frame.itertuples(index=False)
+    }
+
+
+def _random_people(seed, people=50, days=10):
+    """Shuffled entries with breaks, project switches, missing Outs and missing payroll."""
+    rng = random.Random(seed)
+    entries_by_person, payroll_by_person = {}, {}
+    start = datetime(2025, 1, 1, 8)
+    for p in range(people):
+        entries, payroll = [], {}
+        for d in range(days):
+            day = (start + timedelta(days=d)).strftime("%Y-%m-%d")
+            clock = start + timedelta(days=d, minutes=rng.randint(0, 120))
+            tracked = 0.0
+            for _ in range(rng.randint(0, 4)):
+                entries.append(_entry("In", rng.choice(["p1", "p2", "p3"]), clock.strftime("%Y-%m-%dT%H:%M:%SZ"), day))
+                length = timedelta(minutes=rng.randint(10, 240))
+                clock += length
+                if rng.random() < 0.85:  # otherwise the next In switches project without an Out
+                    entries.append(_entry("Out", None, clock.strftime("%Y-%m-%dT%H:%M:%SZ")))
+                    clock += timedelta(minutes=rng.randint(0, 60))
+                tracked += length.total_seconds() / 3600
+            if tracked and rng.random() < 0.8:
+                payroll[day] = round(tracked * rng.uniform(0.8, 1.0), 3)
+        rng.shuffle(entries)
+        entries_by_person[f"person-{p}"] = entries
+        payroll_by_person[f"person-{p}"] = payroll
+    return entries_by_person, payroll_by_person
+
+
+def tracked_hours(person_entries, project_id=None):
+    """Per-person oracle: tracked hours per day from each In and the next Out (of any project)."""
+    daily_hours = defaultdict(float)
+    person_entries.sort(key=lambda x: x.get("time", ""))
+    for i, entry in enumerate(person_entries):
+        if project_id is not None and entry.get("projectId") != project_id:
+            continue
+        if entry.get("type") != "In" or not entry.get("time"):
+            continue
+        try:
+            in_time = datetime.fromisoformat(entry["time"].replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        for later in person_entries[i + 1:]:
+            if later.get("type") == "Out":
+                if later.get("time"):
+                    try:
+                        out_time = datetime.fromisoformat(later["time"].replace("Z", "+00:00"))
+                    except ValueError:
+                        break
+                    duration_hours = (out_time - in_time).total_seconds() / 3600
+                    if 0 < duration_hours < 24:
+                        daily_hours[entry.get("belongsToDate")] += duration_hours
+                break
+    return dict(daily_hours)
+
+
+def project_payroll_reference(payroll_hours, person_entries, project_id):
+    """Per-person oracle: payroll × (project tracked / total tracked), or tracked hours without payroll."""
+    project_tracked = tracked_hours(person_entries, project_id)
+    total_tracked = tracked_hours(person_entries)
+    daily_payroll = {}
+    for day, project_hours in project_tracked.items():
+        total_hours = total_tracked.get(day, project_hours)
+        day_payroll = payroll_hours.get(day, 0)
+        if total_hours > 0 and day_payroll > 0:
+            daily_payroll[day] = round(day_payroll * project_hours / total_hours, 2)
+        elif project_hours > 0:
+            daily_payroll[day] = round(project_hours, 2)
+    return daily_payroll
+
+
+def _reference(entries_by_person, payroll_by_person, projects=("p1", "p2", "p3")):
+    expected = {}
+    for person_id, entries in entries_by_person.items():
+        for project_id in projects:
+            daily = project_payroll_reference(payroll_by_person[person_id], list(entries), project_id)
+            for day, hours in daily.items():
+                if hours > 0:
+                    expected[(project_id, person_id, day)] = hours
+    return expected
+
+
+class TestProjectPayrollHours:
+    """Tests for the batched payroll split."""
+
+    def test_pairs_and_splits(self):
+        """Test a project switch is split by payroll and unpaired entries are ignored."""
+        entries = {
+            "a": [
+                _entry("In", "p1", "2025-01-06T09:00:00Z"),
+                _entry("Out", None, "2025-01-06T11:00:00Z"),
+                _entry("In", "p2", "2025-01-06T12:00:00Z"),
+                _entry("Out", None, "2025-01-06T14:00:00Z"),
+                _entry("In", "p1", "2025-01-07T09:00:00Z"),  # never clocked out
+            ],
+            "b": [
+                _entry("Out", None, "2025-01-06T08:00:00Z"),  # Out without an In
+                _entry("In", "p1", "2025-01-06T09:00:00Z"),
+                _entry("Out", None, "2025-01-06T12:30:00Z"),
+            ],
+        }
+        payroll = {"a": {"2025-01-06": 3.0}, "b": {}}
+
+        result = _as_dict(project_payroll_hours(entries, payroll))
+
+        assert result == {
+            ("p1", "a", "2025-01-06"): 1.5,
+            ("p2", "a", "2025-01-06"): 1.5,
+            ("p1", "b", "2025-01-06"): 3.5,  # no payroll: tracked hours
+        }
+
+    def test_pairs_filter(self):
+        """Test only the requested (project, person) pairs are returned."""
+        entries, payroll = _random_people(seed=1, people=5)
+
+        result = _as_dict(project_payroll_hours(entries, payroll, pairs=[("p2", "person-3")]))
+
+        assert result
+        assert {(project, person) for project, person, _ in result} == {("p2", "person-3")}
+
+    def test_empty(self):
+        """Test no entries gives an empty frame."""
+        assert project_payroll_hours({}, {}).empty
+        assert project_payroll_hours({"a": []}, {"a": {}}, pairs=[]).empty
+
+    @pytest.mark.parametrize("seed", [7, 21, 42])
+    def test_matches_per_person_calculation(self, seed):
+        """Test the batched engine reproduces the per-person calculation for every person and project."""
+        entries, payroll = _random_people(seed)
+
+        expected = _reference(entries, payroll)
+        result = _as_dict(project_payroll_hours(entries, payroll))
+
+        assert result.keys() == expected.keys()
+        for key, hours in expected.items():
+            # Summation order may differ in the last bit, which can flip a 2dp rounding
+            assert result[key] == pytest.approx(hours, abs=0.0100001)
@@ -0,0 +1,146 @@
+"""
+Unit tests for keyset pagination.
+
+Tests cover:
+- Cursor round-trips and rejection of tampered or mismatched cursors
+- Walking every page (both directions, NULL sort keys) visits each row once
+- Paged task-level and trainer-daily reads matching the full lists
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.core.pagination import PageRequest, decode_cursor, encode_cursor, paginate
+from app.models.db_models import Contributor, ContributorDailyStats, ReviewDetail, Task, TaskAHT
+from app.services.query_service import QueryService
+
+
+@pytest.fixture
+def query_service(mock_db_service):
+    service = QueryService.__new__(QueryService)
+    service.settings = MagicMock(project_id_filter=None)
+    service.db_service = mock_db_service
+    return service
+
+
+@pytest.fixture
+def daily_stats(test_session):
+    test_session.add_all([
+        Contributor(id=1, name='Ann', turing_email='ann@x.com', status='active'),
+        Contributor(id=2, name='Bob', turing_email='bob@x.com', status='active'),
+    ])
+    for i in range(23):
+        test_session.add(ContributorDailyStats(
+            contributor_id=1 + i % 2,
+            submission_date=None if i % 7 == 0 else date(2025, 1, 1 + i % 5),
+            new_tasks_submitted=i, rework_submitted=1, total_submissions=i % 4, unique_tasks=1,
+        ))
+    test_session.commit()
+    return test_session
+
+
+def _walk(fetch, **kwargs):
+    """Every page's rows, following next_cursor until the last page."""
+    pages, cursor = [], None
+    while True:
+        page = fetch(PageRequest(cursor=cursor, **kwargs))
+        pages.append(page)
+        cursor = page['next_cursor'] if isinstance(page, dict) else page.next_cursor
+        if cursor is None:
+            return pages
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test dates, datetimes and None survive a round trip."""
+        for key in [(date(2025, 1, 2), 7), (datetime(2025, 1, 2, 3, 4, 5), 8), (None, 9), (4.5, 10)]:
+            assert decode_cursor(encode_cursor('s', True, key), 's', True) == key
+
+    def test_rejects_bad_cursors(self):
+        """Test garbage and cursors for another sort are rejected as validation errors."""
+        cursor = encode_cursor('submission_date', False, (date(2025, 1, 2), 7))
+        for bad, sort, descending in [
+            ('not-a-cursor', 'submission_date', False),
+            (cursor, 'trainer_id', False),
+            (cursor, 'submission_date', True),
+        ]:
+            with pytest.raises(ValidationException):
+                decode_cursor(bad, sort, descending)
+        with pytest.raises(ValidationException):
+            PageRequest(sort='x', page_size=0)
+
+
+class TestPaginate:
+    """Tests for walking keyset pages."""
+
+    @pytest.mark.parametrize('descending', [False, True])
+    def test_walk_visits_every_row_once_in_order(self, daily_stats, descending):
+        """Test pages concatenate to the fully sorted table, NULL dates last."""
+        query = daily_stats.query(ContributorDailyStats)
+        column = ContributorDailyStats.submission_date
+
+        pages = _walk(
+            lambda page: paginate(query, column, ContributorDailyStats.id, page,
+                                  key=lambda row: (row.submission_date, row.id)),
+            sort='submission_date', descending=descending, page_size=4, include_total=True,
+        )
+
+        walked = [row.id for page in pages for row in page.items]
+        rows = query.all()
+        dated = sorted((r for r in rows if r.submission_date), key=lambda r: (r.submission_date, r.id),
+                       reverse=descending)
+        undated = sorted((r for r in rows if not r.submission_date), key=lambda r: r.id, reverse=descending)
+        assert walked == [r.id for r in dated + undated]
+        assert [len(page.items) for page in pages] == [4, 4, 4, 4, 4, 3]
+        assert {page.total for page in pages} == {23}
+
+
+class TestPagedEndpoints:
+    """Tests that paged reads match the full lists."""
+
+    def test_trainer_daily_pages(self, daily_stats, query_service):
+        """Test filtered trainer-daily pages match the filtered full list."""
+        full = QueryService.get_trainer_daily_stats.__wrapped__(query_service, {})
+        fetch = QueryService.get_trainer_daily_stats_page.__wrapped__
+        filters = {'trainer': 2, 'start_date': date(2025, 1, 2), 'end_date': date(2025, 1, 4)}
+
+        pages = _walk(lambda page: fetch(query_service, filters, page),
+                      sort='total_submissions', descending=True, page_size=2)
+
+        paged = [row for page in pages for row in page['data']]
+        expected = [
+            row for row in full
+            if row['trainer_id'] == 2 and row['submission_date'] and '2025-01-02' <= row['submission_date'] <= '2025-01-04'
+        ]
+        assert sorted(paged, key=repr) == sorted(expected, key=repr)
+        assert [row['total_submissions'] for row in paged] == sorted(
+            (row['total_submissions'] for row in paged), reverse=True
+        )
+        assert all(page['has_more'] for page in pages[:-1]) and not pages[-1]['has_more']
+
+    def test_task_level_pages(self, test_session, query_service):
+        """Test task-level pages sorted by updated_at match the full list."""
+        test_session.add(Contributor(id=1, name='Ann', turing_email='ann@x.com'))
+        for task_id in range(1, 8):
+            test_session.add(Task(id=task_id, colab_link=f'link-{task_id}', week_number=1, rework_count=0))
+            test_session.add(TaskAHT(task_id=task_id, duration_minutes=10.0 * task_id))
+            for dimension in ('Accuracy', 'Clarity'):
+                test_session.add(ReviewDetail(
+                    conversation_id=task_id, human_role_id=1, reviewer_id=1, is_delivered='False',
+                    name=dimension, score=task_id / 2, task_score=task_id / 3,
+                    updated_at=date(2025, 1, 10 - task_id % 4),
+                ))
+        test_session.commit()
+
+        full = {row['task_id']: row for row in query_service.get_task_level_data({})}
+        fetch = QueryService.get_task_level_page.__wrapped__
+        pages = _walk(lambda page: fetch(query_service, {}, page), sort='updated_at', page_size=3)
+
+        paged = [row for page in pages for row in page['data']]
+        assert [row['task_id'] for row in paged] == sorted(full, key=lambda t: (full[t]['updated_at'], t))
+        assert paged == [full[row['task_id']] for row in paged]
+        assert paged[0]['quality_dimensions'] == {'Accuracy': 1.5, 'Clarity': 1.5}
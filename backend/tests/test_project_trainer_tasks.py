@@ -0,0 +1,84 @@
+"""
+Unit tests for on-demand trainer task rows in the project hierarchy.
+
+Tests cover:
+- Per-trainer rows matching the rows include_tasks embeds for that trainer
+- New/rework, calibration and rating fields of a task row
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.constants import get_constants
+from app.models.db_models import PodLeadMapping, TaskHistoryRaw, TaskRaw
+from app.services.query_service import QueryService
+
+
+@pytest.fixture
+def query_service(mock_db_service):
+    service = QueryService.__new__(QueryService)
+    service.settings = MagicMock(project_id_filter=None)
+    service.db_service = mock_db_service
+    service._constants = get_constants()
+    return service
+
+
+@pytest.fixture(autouse=True)
+def no_rubric_roles():
+    with patch('app.services.quality_rubrics_service.QualityRubricsService._fetch_team_roles', return_value={}):
+        yield
+
+
+@pytest.fixture
+def history(test_session):
+    def completion(task_id, author, count, day, hour):
+        return TaskHistoryRaw(task_id=task_id, project_id=36, author=author, new_status='completed',
+                              old_status='in_progress', completed_status_count=count,
+                              date=date(2025, 1, day), time_stamp=datetime(2025, 1, day, hour))
+
+    test_session.add_all([
+        TaskRaw(task_id=1, project_id=36, derived_status='Reviewed', reviewer='cal@x.com',
+                review_action_type='approve', count_reviews=2, sum_score=9.0, colab_link='link-1'),
+        TaskRaw(task_id=2, project_id=36, derived_status='Rework', reviewer='rev@x.com', count_reviews=1, sum_score=3.0),
+        TaskRaw(task_id=3, project_id=36, derived_status='In Progress'),  # regressed: excluded
+        PodLeadMapping(trainer_email='cal@x.com', pod_lead_email='lead@x.com', role='Calibrator'),
+        completion(1, 'Ann@x.com', 1, 2, 9),
+        completion(1, 'ann@x.com', 2, 3, 9),
+        completion(2, '  Bob@x.com ', 1, 2, 10),  # padded as synced
+        completion(2, 'ann@x.com', 2, 4, 9),
+        completion(3, 'ann@x.com', 1, 4, 10),
+        completion(1, 'bob@x.com', 3, 9, 9),  # outside the window
+    ])
+    test_session.commit()
+    return test_session
+
+
+class TestProjectTrainerTasks:
+    """Tests for get_project_trainer_tasks."""
+
+    def test_matches_embedded_rows(self, history, query_service):
+        """Test each trainer's lazily loaded rows equal the include_tasks rows."""
+        fetch = QueryService.get_project_trainer_tasks.__wrapped__
+        embedded = query_service._trainer_task_rows(
+            history, 36, '2025-01-01', '2025-01-07', query_service._calibrator_emails(history)
+        )
+
+        assert set(embedded) == {'ann@x.com', 'bob@x.com'}
+        for email, rows in embedded.items():
+            assert fetch(query_service, 36, email.upper(), '2025-01-01', '2025-01-07') == rows
+        assert fetch(query_service, 36, 'nobody@x.com', '2025-01-01', '2025-01-07') == []
+
+    def test_task_fields(self, history, query_service):
+        """Test new/rework counts, ordering, calibration and ratings of a trainer's tasks."""
+        rows = QueryService.get_project_trainer_tasks.__wrapped__(query_service, 36, 'ann@x.com', '2025-01-01', '2025-01-07')
+
+        assert [row['task_id'] for row in rows] == [2, 1]
+        rework_only, new_and_rework = rows
+        assert (new_and_rework['is_new'], new_and_rework['rework_count']) == (True, 1)
+        assert (rework_only['is_new'], rework_only['rework_count']) == (False, 1)
+        assert new_and_rework['last_completed_date'] == '2025-01-03'
+        assert (new_and_rework['is_calibrated'], new_and_rework['calibration_passed']) == (1, 1)
+        assert rework_only['is_calibrated'] == 0
+        assert new_and_rework['avg_rating'] == 4.5
+        assert new_and_rework['colab_link'] == 'link-1'
@@ -0,0 +1,123 @@
+"""
+Query-plan regression tests for task_history_raw / task_raw hot paths.
+
+Every statement the analytics series and target comparisons run against
+these tables is re-run under SQLite's EXPLAIN QUERY PLAN; a full table scan
+means a predicate stopped being sargable or an index went missing.
+
+These check SQLite plans only (the partial indexes carry a matching
+``sqlite_where``). ``TestPostgresQueryPlans`` re-checks the analytics series
+under PostgreSQL's EXPLAIN when ``TEST_POSTGRES_URL`` is set; the planner
+there prefers sequential scans on near-empty tables, so it is asked to avoid
+them and the test only asserts that an index path exists.
+"""
+from contextlib import contextmanager
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.services.analytics_service import get_analytics_time_series, get_analytics_time_series_by_project
+from app.services.query_service import QueryService
+from app.services.target_comparison_service import TargetComparisonService
+
+HOT_TABLES = ('task_history_raw', 'task_raw')
+
+
+@pytest.fixture(autouse=True)
+def no_team_sheet():
+    with patch('app.services.quality_rubrics_service.QualityRubricsService') as rubrics:
+        rubrics.return_value._fetch_team_roles.return_value = {}
+        yield
+
+
+@contextmanager
+def capture(engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, *args):
+        if any(table in statement for table in HOT_TABLES):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def plans(engine, statements):
+    with engine.connect() as conn:
+        return [
+            [row[3] for row in conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)]
+            for statement, parameters in statements
+        ]
+
+
+def postgres_plans(engine, statements):
+    with engine.connect() as conn:
+        conn.exec_driver_sql('SET enable_seqscan = off')
+        return [
+            [row[0] for row in conn.exec_driver_sql(f'EXPLAIN {statement}', parameters)]
+            for statement, parameters in statements
+        ]
+
+
+def full_scans(plan):
+    return [step for step in plan if step.split(' USING ')[0] in {f'SCAN {t}' for t in HOT_TABLES}]
+
+
+class TestHotQueryPlans:
+    """Tests that hot queries search an index instead of scanning."""
+
+    def test_analytics_series(self, test_session, test_engine):
+        """Test both analytics engines use the composite indexes."""
+        with capture(test_engine) as statements:
+            get_analytics_time_series(test_session, '2025-02-03', '2025-02-16', 'weekly', project_id=36)
+            get_analytics_time_series_by_project(test_session, '2025-02-03', '2025-02-16', 'weekly', [36, 37])
+
+        assert statements
+        steps = [step for plan in plans(test_engine, statements) for step in plan]
+        assert full_scans(steps) == []
+        assert any('ix_task_history_completed_project_date' in step for step in steps)
+        assert any('ix_task_raw_project_status_completed' in step for step in steps)
+        assert any('ix_task_raw_project_reviewed' in step and 'r_updated_at>' in step for step in steps)
+
+    def test_target_comparison(self, mock_db_service, test_engine):
+        """Test trainer completions are read by project and date range from the partial index."""
+        with patch('app.services.target_comparison_service.get_db_service', return_value=mock_db_service), \
+             patch('app.services.target_comparison_service.get_configuration_service') as config:
+            config.return_value.get_throughput_targets.return_value = (None, {})
+            service = TargetComparisonService()
+            with capture(test_engine) as statements:
+                service.get_trainer_comparison(36, start_date=date(2025, 2, 3), end_date=date(2025, 2, 7))
+
+        [plan] = plans(test_engine, statements)
+        assert full_scans(plan) == []
+        assert any('ix_task_history_completed_project_date' in step and 'date>' in step for step in plan)
+
+    def test_valid_task_subquery(self, test_session, test_engine):
+        """Test the completed-pipeline task filter searches by project and status."""
+        subquery = QueryService._valid_task_ids_subquery(test_session, [36, 37])
+        with capture(test_engine) as statements:
+            test_session.query(subquery).all()
+
+        [plan] = plans(test_engine, statements)
+        assert full_scans(plan) == []
+        assert any('ix_task_raw_project_status_completed' in step for step in plan)
+
+
+class TestPostgresQueryPlans:
+    """Tests that hot queries have an index path under PostgreSQL."""
+
+    def test_analytics_series(self, postgres_session):
+        """Test the analytics series can be served without scanning the hot tables."""
+        engine = postgres_session.get_bind()
+        with capture(engine) as statements:
+            get_analytics_time_series(postgres_session, '2025-02-03', '2025-02-16', 'weekly', project_id=36)
+
+        assert statements
+        steps = [step for plan in postgres_plans(engine, statements) for step in plan]
+        assert not [step for step in steps if any(f'Seq Scan on {t}' in step for t in HOT_TABLES)]
+        assert any('ix_task_history_completed_project_date' in step for step in steps)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the weekly bill-rate index.
+
+Tests cover:
+- Week boundary, gap and open-ended week lookups
+- Agreement with a linear scan over the weeks
+- Reuse of the shared index until project_revenue_weekly is re-synced
+"""
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models.db_models import ProjectRevenueWeekly
+from app.services import rate_index
+from app.services.rate_index import RateIndex, get_rate_index
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    rate_index.invalidate_rate_index()
+    yield
+    rate_index.invalidate_rate_index()
+
+
+def _week(name, start, rate, end=None, synced=datetime(2025, 1, 1)):
+    return ProjectRevenueWeekly(jibble_project_name=name, week_start_date=start, week_end_date=end,
+                                bill_rate_task=rate, last_synced=synced)
+
+
+class TestRateIndex:
+    """Tests for date lookups."""
+
+    def test_lookup(self):
+        """Test weeks are inclusive, gaps and unknown projects give 0."""
+        index = RateIndex([
+            ('Nvidia - SysBench', date(2025, 1, 13), date(2025, 1, 19), 12.0),
+            ('Nvidia - SysBench', date(2025, 1, 6), date(2025, 1, 12), 10.0),
+            ('Nvidia - SysBench', date(2025, 1, 27), None, 15.0),  # open-ended: 7 days
+        ])
+
+        assert index.rate('Nvidia - SysBench', date(2025, 1, 6)) == 10.0
+        assert index.rate('Nvidia - SysBench', date(2025, 1, 12)) == 10.0
+        assert index.rate('Nvidia - SysBench', date(2025, 1, 13)) == 12.0
+        assert index.rate('Nvidia - SysBench', date(2025, 1, 22)) == 0
+        assert index.rate('Nvidia - SysBench', date(2025, 2, 2)) == 15.0
+        assert index.rate('Nvidia - SysBench', date(2025, 2, 3)) == 0
+        assert index.rate('Nvidia - SysBench', date(2025, 1, 5)) == 0
+        assert index.rate('Other', date(2025, 1, 6)) == 0
+        assert index.project_rate(36, date(2025, 1, 6)) == 10.0
+        assert index.project_rate(36, None) == 0
+        assert index.project_rate(999, date(2025, 1, 6)) == 0
+
+    def test_long_week_still_found(self):
+        """Test a long earlier interval is found past shorter later ones."""
+        index = RateIndex([
+            ('P', date(2025, 1, 1), date(2025, 3, 31), 5.0),
+            ('P', date(2025, 1, 6), date(2025, 1, 7), 9.0),
+        ])
+
+        assert index.rate('P', date(2025, 1, 7)) == 9.0
+        assert index.rate('P', date(2025, 2, 1)) == 5.0
+
+    def test_matches_linear_scan(self):
+        """Test every lookup agrees with scanning the weeks."""
+        rng = random.Random(3)
+        weeks = []
+        for name in ('A', 'B'):
+            start = date(2024, 1, 1)
+            for _ in range(80):
+                start += timedelta(days=rng.choice([7, 7, 7, 14]))  # some gaps
+                weeks.append((name, start, start + timedelta(days=6), float(rng.randint(1, 50))))
+        index = RateIndex(weeks)
+
+        def scan(name, day):
+            for n, start, end, rate in weeks:
+                if n == name and start <= day <= end:
+                    return rate
+            return 0
+
+        for offset in range(0, 1000, 3):
+            day = date(2024, 1, 1) + timedelta(days=offset)
+            assert index.rate('A', day) == scan('A', day)
+            assert index.rate('B', day) == scan('B', day)
+
+
+class TestSharedIndex:
+    """Tests for get_rate_index."""
+
+    def test_rebuilt_only_after_resync(self, test_session):
+        """Test the index is reused until the revenue rows change."""
+        test_session.add_all([
+            _week('Nvidia - SysBench', date(2025, 1, 6), 10.0),
+            _week('Nvidia - SysBench', date(2025, 1, 13), None),  # no task rate
+        ])
+        test_session.commit()
+
+        first = get_rate_index(test_session)
+        assert get_rate_index(test_session) is first
+        assert len(first) == 1
+
+        test_session.query(ProjectRevenueWeekly).update({'bill_rate_task': 20.0, 'last_synced': datetime(2025, 1, 8)})
+        test_session.commit()
+
+        second = get_rate_index(test_session)
+        assert second is not first
+        assert second.project_rate(36, date(2025, 1, 14)) == 20.0
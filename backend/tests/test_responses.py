@@ -0,0 +1,98 @@
+"""
+Unit tests for response encoding.
+
+Tests cover:
+- orjson rendering of numpy scalars, Decimals and non-string keys
+- Columnar conversion of nested row lists
+- Accept/format negotiation and gzip compression
+"""
+import gzip
+from decimal import Decimal
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from app.core.responses import COLUMNAR_MEDIA_TYPE, ORJSONResponse, negotiated_response, to_columnar
+
+ROWS = [
+    {'project_id': 36, 'pod_leads': [{'name': 'a', 'tasks': 3}, {'name': 'b', 'tasks': 4}]},
+    {'project_id': 37, 'pod_leads': [], 'revenue': 1.5},
+]
+
+
+def _client():
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+
+    @app.get('/rows')
+    async def rows(request: Request):
+        return negotiated_response(request, ROWS * 50)
+
+    return TestClient(app)
+
+
+class TestORJSONResponse:
+    """Tests for rendering."""
+
+    def test_renders_numpy_and_decimal(self):
+        """Test values from pandas and numeric columns serialize."""
+        body = ORJSONResponse({
+            1: np.int64(3), 'f': np.float32(0.5), 'd': Decimal('2.25'), 'a': np.array([1, 2]),
+        }).body
+        assert body == b'{"1":3,"f":0.5,"d":2.25,"a":[1,2]}'
+
+
+class TestColumnar:
+    """Tests for to_columnar."""
+
+    def test_nested_tables(self):
+        """Test row lists at every depth become columns; missing keys become None."""
+        assert to_columnar(ROWS) == {
+            'columns': ['project_id', 'pod_leads', 'revenue'],
+            'data': [
+                [36, 37],
+                [{'columns': ['name', 'tasks'], 'data': [['a', 'b'], [3, 4]]}, []],
+                [None, 1.5],
+            ],
+        }
+
+    def test_leaves_other_values(self):
+        """Test dicts of tables, scalars and scalar lists keep their shape."""
+        assert to_columnar({'36': [{'x': 1}], 'n': [1, 2], 's': 'x'}) == {
+            '36': {'columns': ['x'], 'data': [[1]]}, 'n': [1, 2], 's': 'x',
+        }
+
+
+class TestNegotiation:
+    """Tests for negotiated_response behind GZipMiddleware."""
+
+    def test_plain_and_columnar(self):
+        """Test Accept header and format parameter select the columnar form."""
+        client = _client()
+
+        plain = client.get('/rows')
+        assert plain.json() == ROWS * 50
+        assert plain.headers['content-type'] == 'application/json'
+
+        for response in (
+            client.get('/rows', headers={'Accept': COLUMNAR_MEDIA_TYPE}),
+            client.get('/rows?format=columnar'),
+        ):
+            assert response.headers['content-type'] == COLUMNAR_MEDIA_TYPE
+            assert response.json() == to_columnar(ROWS * 50)
+            assert len(response.content) < len(plain.content)
+        assert 'Accept' in plain.headers['vary']
+
+    def test_gzip_when_accepted(self):
+        """Test large bodies are gzipped for clients that accept it."""
+        client = _client()
+
+        response = client.get('/rows', headers={'Accept-Encoding': 'gzip'})
+        raw = client.get('/rows', headers={'Accept-Encoding': 'identity'})
+
+        assert response.headers['content-encoding'] == 'gzip'
+        assert 'content-encoding' not in raw.headers
+        assert response.json() == raw.json()
+        assert len(gzip.compress(raw.content)) < len(raw.content) / 5
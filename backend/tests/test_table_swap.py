@@ -0,0 +1,138 @@
+"""
+Unit tests for shadow-table swaps.
+
+Tests cover:
+- Which tables can be reloaded through a swap
+- The rename sequence issued for a swap
+- Foreign keys following the live copy, so reloading a referenced table
+  leaves the rollback copy intact (PostgreSQL, needs TEST_POSTGRES_URL)
+"""
+from unittest.mock import MagicMock
+
+from sqlalchemy import delete, insert, select, text
+
+from app.models.db_models import Contributor, ContributorTaskStats, Task, TaskHistoryRaw, TaskRaw
+from app.services.table_swap import load_via_shadow_table, restore_previous_table, supports_table_swap, swap_tables
+
+
+def _postgres_session():
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = 'postgresql'
+    return session
+
+
+def _swap_ddl(indexes, foreign_keys, table_name, incoming):
+    """DDL issued by swap_tables against mocked catalog lookups."""
+    session = _postgres_session()
+    executed = []
+
+    def execute(statement, params=None):
+        sql = str(statement)
+        executed.append(sql)
+        result = MagicMock()
+        if 'pg_indexes' in sql:
+            result.fetchall.return_value = indexes.get(params['table'], [])
+        elif 'pg_constraint' in sql:
+            result.fetchall.return_value = foreign_keys.get(params['table'], [])
+        else:
+            result.fetchall.return_value = []
+        return result
+
+    session.execute.side_effect = execute
+    swap_tables(session, table_name, incoming)
+    return [sql for sql in executed if sql.startswith(('ALTER', 'DROP'))]
+
+
+class TestSupportsTableSwap:
+    """Tests for swap eligibility."""
+
+    def test_not_on_sqlite(self, test_session):
+        """Test that non-PostgreSQL databases reload in place."""
+        assert supports_table_swap(test_session, TaskRaw) is False
+
+    def test_tables_without_inbound_foreign_keys(self):
+        """Test that only tables nothing references are swapped."""
+        session = _postgres_session()
+        assert supports_table_swap(session, TaskRaw)
+        assert supports_table_swap(session, TaskHistoryRaw)
+        assert not supports_table_swap(session, Task)
+        assert not supports_table_swap(session, Contributor)
+
+
+class TestSwapTables:
+    """Tests for the swap statement sequence."""
+
+    def test_renames(self):
+        """Test that indexes keep canonical names and the old copy is kept."""
+        indexes = {
+            'task_raw': [('task_raw_pkey', 'CREATE UNIQUE INDEX task_raw_pkey ON public.task_raw USING btree (task_id)')],
+            'task_raw__shadow': [('task_raw__shadow_pkey', 'CREATE UNIQUE INDEX task_raw__shadow_pkey ON public.task_raw__shadow USING btree (task_id)')],
+        }
+        ddl = _swap_ddl(indexes, {}, 'task_raw', 'task_raw__shadow')
+        assert ddl == [
+            'DROP TABLE IF EXISTS "task_raw__prev"',
+            'ALTER INDEX "task_raw_pkey" RENAME TO "task_raw__swap_ix0"',
+            'ALTER TABLE "task_raw" RENAME TO "task_raw__swap"',
+            'ALTER TABLE "task_raw__shadow" RENAME TO "task_raw"',
+            'ALTER TABLE "task_raw__swap" RENAME TO "task_raw__prev"',
+            'ALTER INDEX "task_raw__shadow_pkey" RENAME TO "task_raw_pkey"',
+            'ALTER INDEX "task_raw__swap_ix0" RENAME TO "task_raw_pkey__prev"',
+        ]
+
+    def test_foreign_keys_follow_live_copy(self):
+        """Test the parked copy loses its foreign keys and a restored copy gets them back."""
+        fk = ('contributor_task_stats_contributor_id_fkey',
+              'FOREIGN KEY (contributor_id) REFERENCES contributor(id) ON DELETE CASCADE')
+
+        swapped = _swap_ddl({}, {'contributor_task_stats': [fk], 'contributor_task_stats__shadow': [fk]},
+                            'contributor_task_stats', 'contributor_task_stats__shadow')
+        assert swapped[-1] == (
+            'ALTER TABLE "contributor_task_stats__prev" DROP CONSTRAINT "contributor_task_stats_contributor_id_fkey"'
+        )
+
+        restored = _swap_ddl({}, {'contributor_task_stats': [fk]},
+                             'contributor_task_stats', 'contributor_task_stats__prev')
+        assert restored[-2:] == [
+            'ALTER TABLE "contributor_task_stats__prev" DROP CONSTRAINT "contributor_task_stats_contributor_id_fkey"',
+            'ALTER TABLE "contributor_task_stats" ADD CONSTRAINT "contributor_task_stats_contributor_id_fkey" '
+            'FOREIGN KEY (contributor_id) REFERENCES contributor(id) ON DELETE CASCADE NOT VALID',
+        ]
+
+
+class TestRestoreAfterReload:
+    """Tests for rolling back after the referenced table was reloaded (PostgreSQL)."""
+
+    def test_contributor_reload_keeps_previous_copy(self, postgres_session):
+        """Test reloading contributor doesn't cascade into contributor_task_stats__prev."""
+        session = postgres_session
+        contributors = [{'id': 1, 'name': 'Ann'}, {'id': 2, 'name': 'Bob'}]
+        session.execute(insert(Contributor), contributors)
+        session.execute(insert(ContributorTaskStats), [
+            {'contributor_id': 1, 'new_tasks_submitted': 1},
+            {'contributor_id': 2, 'new_tasks_submitted': 2},
+        ])
+        session.commit()
+
+        load_via_shadow_table(session, ContributorTaskStats, [
+            {'contributor_id': 1, 'new_tasks_submitted': 10},
+            {'contributor_id': 2, 'new_tasks_submitted': 20},
+        ])
+
+        # Reload contributor in place, as sync_contributor does
+        session.execute(delete(Contributor))
+        session.execute(insert(Contributor), contributors)
+        session.commit()
+
+        assert restore_previous_table(session, ContributorTaskStats)
+        rows = session.execute(
+            select(ContributorTaskStats.contributor_id, ContributorTaskStats.new_tasks_submitted)
+            .order_by(ContributorTaskStats.contributor_id)
+        ).all()
+        assert [tuple(row) for row in rows] == [(1, 1), (2, 2)]
+
+        foreign_keys = dict(session.execute(text(
+            "SELECT conrelid::regclass::text, count(*) FROM pg_constraint "
+            "WHERE contype = 'f' AND conrelid::regclass::text LIKE 'contributor_task_stats%' "
+            "GROUP BY 1"
+        )).all())
+        assert foreign_keys == {'contributor_task_stats': 1}
@@ -0,0 +1,178 @@
+"""
+Unit tests for target vs actual comparisons.
+
+Tests cover:
+- New + rework throughput counted from one grouped query
+- Reviewer actuals from the latest review of each task
+- Individual, project default and fallback targets, effective-dated
+- A constant number of queries regardless of trainer count
+"""
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.models.db_models import Contributor, PodLeadMapping, ProjectConfiguration, TaskHistoryRaw, TaskRaw
+from app.services.target_comparison_service import RollupPeriod, TargetComparisonService
+
+DAY = date(2025, 1, 6)  # Monday
+
+
+@pytest.fixture
+def service(mock_db_service):
+    with patch("app.services.target_comparison_service.get_db_service", return_value=mock_db_service), \
+         patch("app.services.configuration_service.get_db_service", return_value=mock_db_service), \
+         patch("app.services.target_comparison_service.get_configuration_service") as get_config_service:
+        from app.services.configuration_service import ConfigurationService
+        get_config_service.return_value = ConfigurationService()
+        yield TargetComparisonService()
+
+
+@contextmanager
+def count_queries(engine):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _target(target, key="daily_tasks_default", entity_type=None, entity_id=None,
+            effective_from=date(2025, 1, 1), effective_to=None):
+    return ProjectConfiguration(
+        project_id=36, config_type="throughput_target", config_key=key,
+        entity_type=entity_type, entity_id=entity_id,
+        config_value=json.dumps({"target": target, "unit": "tasks"}),
+        effective_from=effective_from, effective_to=effective_to,
+        created_at=datetime(2025, 1, 1), updated_at=datetime(2025, 1, 1),
+    )
+
+
+def _completions(email, new=0, rework=0, day=DAY):
+    return (
+        [TaskHistoryRaw(author=email, project_id=36, new_status="completed", completed_status_count=1, date=day)
+         for _ in range(new)]
+        + [TaskHistoryRaw(author=email, project_id=36, new_status="completed", completed_status_count=2, date=day)
+           for _ in range(rework)]
+    )
+
+
+class TestTrainerComparison:
+    """Tests for get_trainer_comparison."""
+
+    def test_actuals_and_targets(self, service, test_session):
+        """Test new + rework totals and individual/default target resolution."""
+        test_session.add_all([
+            Contributor(id=1, name="Ann", turing_email="ann@turing.com"),
+            Contributor(id=2, name="Bob", turing_email="bob@turing.com"),
+            _target(8),
+            _target(10, key="daily_tasks", entity_type="trainer", entity_id=1),
+            # Superseded override and one for a reviewer are ignored
+            _target(2, key="daily_tasks", entity_type="trainer", entity_id=2, effective_to=date(2025, 1, 3)),
+            _target(30, key="daily_tasks", entity_type="reviewer", entity_id=2),
+            *_completions("ann@turing.com", new=4, rework=2),
+            *_completions("bob@turing.com", new=1),
+            *_completions("bob@turing.com", new=5, day=date(2025, 1, 7)),  # outside the period
+            TaskHistoryRaw(author="ann@turing.com", project_id=36, new_status="review",
+                           completed_status_count=1, date=DAY),
+        ])
+        test_session.commit()
+
+        results = service.get_trainer_comparison(36, start_date=DAY, end_date=DAY)
+
+        by_email = {r.entity_email: r for r in results}
+        assert set(by_email) == {"ann@turing.com", "bob@turing.com"}
+        ann, bob = by_email["ann@turing.com"], by_email["bob@turing.com"]
+        assert (ann.entity_id, ann.entity_name, ann.actual) == (1, "Ann", 6)
+        assert (ann.target_daily, ann.target_source, ann.achievement_percent) == (10, "individual", 60.0)
+        assert (bob.actual, bob.target_daily, bob.target_source) == (1, 8, "project_default")
+
+    def test_unknown_trainer_uses_fallback(self, service, test_session):
+        """Test a requested trainer with no data or config gets the fallback target."""
+        results = service.get_trainer_comparison(
+            36, trainer_email="new@turing.com", start_date=DAY, end_date=date(2025, 1, 10),
+            rollup=RollupPeriod.WEEKLY,
+        )
+
+        assert len(results) == 1
+        assert results[0].entity_id is None
+        assert (results[0].actual, results[0].target_daily, results[0].target_period) == (0, 5, 25)
+
+    def test_query_count_is_constant(self, service, test_session, test_engine):
+        """Test the number of queries does not grow with the number of trainers."""
+        def run(trainers):
+            for i in range(trainers):
+                email = f"t{trainers}-{i}@turing.com"
+                test_session.add(Contributor(name=f"T{i}", turing_email=email))
+                test_session.add_all(_completions(email, new=1, rework=1))
+            test_session.commit()
+            with count_queries(test_engine) as statements:
+                results = service.get_trainer_comparison(36, start_date=DAY, end_date=DAY)
+            return len(results), len(statements)
+
+        assert run(2) == (2, 3)
+        assert run(20) == (22, 3)
+
+
+class TestReviewerComparison:
+    """Tests for get_reviewer_comparison."""
+
+    def test_targets(self, service, test_session):
+        """Test leads of the project's trainers resolve reviewer overrides, then the fallback."""
+        test_session.add_all([
+            Contributor(id=1, name="Lead", turing_email="lead@turing.com"),
+            _target(25, key="daily_tasks", entity_type="reviewer", entity_id=1),
+            PodLeadMapping(trainer_email="a@turing.com", pod_lead_email="lead@turing.com"),
+            PodLeadMapping(trainer_email="b@turing.com", pod_lead_email="other@turing.com"),
+            PodLeadMapping(trainer_email="c@turing.com", pod_lead_email="elsewhere@turing.com"),
+            *_completions("a@turing.com", new=1),
+            *_completions("b@turing.com", rework=1),
+        ])
+        test_session.commit()
+
+        results = service.get_reviewer_comparison(36, start_date=DAY, end_date=DAY)
+
+        targets = {r.entity_email: (r.target_daily, r.target_source) for r in results}
+        assert targets == {
+            "lead@turing.com": (25, "individual"),
+            "other@turing.com": (20, "project_default"),
+        }
+        only = service.get_reviewer_comparison(36, reviewer_email="other@turing.com", start_date=DAY, end_date=DAY)
+        assert [r.entity_email for r in only] == ["other@turing.com"]
+
+    def test_actuals(self, service, test_session):
+        """Test reviews are tasks of the project whose latest review the lead submitted in the period."""
+        def reviewed(task_id, reviewer, when, project_id=36, count_reviews=1):
+            return TaskRaw(task_id=task_id, project_id=project_id, reviewer=reviewer,
+                           r_updated_at=when, count_reviews=count_reviews)
+
+        test_session.add_all([
+            PodLeadMapping(trainer_email="a@turing.com", pod_lead_email="lead@turing.com"),
+            PodLeadMapping(trainer_email="b@turing.com", pod_lead_email="other@turing.com"),
+            *_completions("a@turing.com", new=1),
+            *_completions("b@turing.com", new=1),
+            reviewed(1, "lead@turing.com", datetime(2025, 1, 6, 9)),
+            reviewed(2, "lead@turing.com", datetime(2025, 1, 6, 23, 59)),
+            reviewed(3, "lead@turing.com", datetime(2025, 1, 7, 0, 0)),  # next day
+            reviewed(4, "lead@turing.com", datetime(2025, 1, 6, 10), project_id=37),
+            reviewed(5, "lead@turing.com", datetime(2025, 1, 6, 10), count_reviews=0),
+            reviewed(6, "someone@turing.com", datetime(2025, 1, 6, 10)),
+        ])
+        test_session.commit()
+
+        results = service.get_reviewer_comparison(36, start_date=DAY, end_date=DAY)
+
+        assert {r.entity_email: (r.actual, r.gap) for r in results} == {
+            "lead@turing.com": (2, -18),
+            "other@turing.com": (0, -20),
+        }
+        assert results[0].entity_email == "lead@turing.com"
+        assert results[0].achievement_percent == 10.0
@@ -0,0 +1,159 @@
+"""
+Unit tests for the trainer fact tables.
+
+Tests cover:
+- Building task-grain and daily facts from the synced raw tables
+- POD Lead and Project hierarchies returning the same results from the
+  facts as from the live raw-table queries
+"""
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.constants import get_constants
+from app.models.db_models import (
+    Contributor, PodLeadMapping, ProjectRevenueWeekly, TaskHistoryRaw, TaskRaw,
+    TrainerDailyFact, TrainerReviewStats, TrainerTaskDailyFact,
+)
+from app.services.query_service import QueryService
+from app.services.trainer_facts import build_trainer_facts
+
+# SQLite can't read back the server-side now() default
+SYNCED = datetime(2025, 1, 6)
+
+
+def _completion(task_id, author, count, day, hour=9):
+    return TaskHistoryRaw(
+        task_id=task_id, author=author, completed_status_count=count, project_id=36,
+        new_status='completed', old_status='pending', date=date(2025, 1, day),
+        time_stamp=datetime(2025, 1, day, hour),
+    )
+
+
+@pytest.fixture
+def seeded_session(test_session):
+    """Two mapped trainers, one unmapped trainer and an authorless completion in project 36."""
+    test_session.add_all([
+        PodLeadMapping(trainer_email='a@x.com', pod_lead_email='p@x.com', trainer_name='A', role='Trainer'),
+        PodLeadMapping(trainer_email='b@x.com', pod_lead_email='p@x.com', trainer_name='B', role='Trainer'),
+        Contributor(id=1, name='Alice', turing_email='A@x.com'),
+        # Reworked by its own author, approved and delivered
+        _completion(1, 'a@x.com', 1, 2), _completion(1, 'a@x.com', 2, 3),
+        TaskRaw(task_id=1, project_id=36, trainer='a@x.com', derived_status='Reviewed', task_status='completed',
+                count_reviews=2, review_action_type='delivery', number_of_turns=2,
+                last_completed_date=date(2025, 1, 3), delivery_status='delivered', delivery_date=date(2025, 1, 6)),
+        # Reworked by someone else, approved and in the delivery queue
+        _completion(2, 'a@x.com', 1, 2, hour=10), _completion(2, 'b@x.com', 2, 4),
+        TaskRaw(task_id=2, project_id=36, trainer='b@x.com', derived_status='Reviewed', task_status='completed',
+                count_reviews=1, number_of_turns=2, last_completed_date=date(2025, 1, 4),
+                delivery_batch_name='db1'),
+        _completion(3, 'c@x.com', 1, 5),
+        TaskRaw(task_id=3, project_id=36, trainer='c@x.com', derived_status='Completed', task_status='completed',
+                count_reviews=0, number_of_turns=1, last_completed_date=date(2025, 1, 5)),
+        # Regressed out of the completed pipeline - not counted
+        _completion(4, 'b@x.com', 1, 3),
+        TaskRaw(task_id=4, project_id=36, trainer='b@x.com', derived_status='In Progress'),
+        _completion(5, None, 1, 2),
+        TaskRaw(task_id=5, project_id=36, derived_status='Completed', last_completed_date=date(2025, 1, 2)),
+        TrainerReviewStats(review_id=1, task_id=1, trainer_email='a@x.com', project_id=36, score=4.0,
+                           review_type='manual', review_date=date(2025, 1, 3), last_synced=SYNCED),
+        TrainerReviewStats(review_id=2, task_id=1, trainer_email='a@x.com', project_id=36, score=3.0,
+                           review_date=date(2025, 1, 4), last_synced=SYNCED),
+        TrainerReviewStats(review_id=3, task_id=2, trainer_email='b@x.com', project_id=36, score=5.0,
+                           review_type='auto', review_date=date(2025, 1, 4), last_synced=SYNCED),
+        ProjectRevenueWeekly(week_start_date=date(2025, 1, 6), jibble_project_name='Nvidia - SysBench',
+                             project_id=36, bill_rate_task=50.0),
+    ])
+    test_session.commit()
+    return test_session
+
+
+@pytest.fixture
+def query_service(mock_db_service):
+    service = QueryService.__new__(QueryService)
+    service.settings = MagicMock(all_project_ids_list=[36], project_names={36: 'SysBench'})
+    service.db_service = mock_db_service
+    service._constants = get_constants()
+    service._allowed_quality_dimensions_cache = None
+    with patch.object(QueryService, 'get_financial_metrics', return_value={}), \
+            patch('app.services.quality_rubrics_service.QualityRubricsService') as rubrics:
+        rubrics.return_value._fetch_team_roles.return_value = {}
+        yield service
+
+
+def _load_facts(session):
+    task_facts, daily_facts = build_trainer_facts(session)
+    session.bulk_insert_mappings(TrainerTaskDailyFact, task_facts)
+    session.bulk_insert_mappings(TrainerDailyFact, daily_facts)
+    session.commit()
+
+
+class TestBuildTrainerFacts:
+    """Tests for building the fact rows."""
+
+    def test_task_facts(self, seeded_session):
+        """Test completions are grouped per trainer/task/day and stale tasks are skipped."""
+        task_facts, _ = build_trainer_facts(seeded_session)
+
+        keys = {(f['trainer_email'], f['task_id'], f['fact_date'].day) for f in task_facts}
+        assert keys == {('a@x.com', 1, 2), ('a@x.com', 1, 3), ('a@x.com', 2, 2), ('b@x.com', 2, 4),
+                        ('c@x.com', 3, 5), ('', 5, 2)}
+        rework = {(f['trainer_email'], f['task_id']) for f in task_facts if f['rework_completions']}
+        assert rework == {('a@x.com', 1), ('b@x.com', 2)}
+
+    def test_daily_facts_attribution(self, seeded_session):
+        """Test approvals, deliveries and revenue go to the last completer."""
+        _, daily_facts = build_trainer_facts(seeded_session)
+
+        def total(email, measure):
+            return sum(f[measure] for f in daily_facts if f['trainer_email'] == email)
+
+        assert (total('a@x.com', 'approved_tasks'), total('a@x.com', 'approved_rework')) == (1, 0)
+        assert (total('b@x.com', 'approved_tasks'), total('b@x.com', 'approved_rework')) == (0, 1)
+        assert total('a@x.com', 'delivered_tasks') == 1
+        assert total('a@x.com', 'revenue') == 50.0
+        queue = [f for f in daily_facts if f['in_delivery_queue']]
+        assert [(f['trainer_email'], f['fact_date']) for f in queue] == [('b@x.com', None)]
+        assert (total('a@x.com', 'manual_reviews'), total('a@x.com', 'manual_score')) == (2, 7.0)
+        assert (total('b@x.com', 'agentic_reviews'), total('b@x.com', 'agentic_score')) == (1, 5.0)
+
+
+class TestFactParity:
+    """Tests that the hierarchies match the live computation when served from facts."""
+
+    @pytest.mark.parametrize('start_date,end_date', [(None, None), ('2025-01-03', '2025-01-05')])
+    def test_pod_lead_hierarchy(self, seeded_session, query_service, start_date, end_date):
+        """Test get_pod_lead_stats_with_trainers parity."""
+        method = QueryService.get_pod_lead_stats_with_trainers.__wrapped__
+        live = method(query_service, start_date=start_date, end_date=end_date)
+        _load_facts(seeded_session)
+        from_facts = method(query_service, start_date=start_date, end_date=end_date)
+
+        assert live
+        assert from_facts == live
+
+    @pytest.mark.parametrize('start_date,end_date', [(None, None), ('2025-01-03', '2025-01-05')])
+    def test_project_hierarchy(self, seeded_session, query_service, start_date, end_date):
+        """Test get_project_stats_with_pod_leads parity, including TRUE project counts."""
+        method = QueryService.get_project_stats_with_pod_leads.__wrapped__
+        live = method(query_service, start_date=start_date, end_date=end_date)
+        _load_facts(seeded_session)
+        from_facts = method(query_service, start_date=start_date, end_date=end_date)
+
+        assert live[0]['pod_leads']
+        assert from_facts == live
+
+    def test_facts_are_used(self, seeded_session, query_service):
+        """Test that built facts are read instead of the raw tables."""
+        _load_facts(seeded_session)
+        seeded_session.query(TaskHistoryRaw).delete()
+        seeded_session.commit()
+
+        method = QueryService.get_pod_lead_stats_with_trainers.__wrapped__
+        pods = {p['pod_lead_email']: p for p in method(query_service)}
+
+        assert pods['p@x.com']['unique_tasks'] == 3
+        assert pods['p@x.com']['pod_lead_name'] == 'p@x.com'.split('@')[0].title()
+        trainer_names = {t['trainer_email']: t['trainer_name'] for t in pods['p@x.com']['trainers']}
+        assert trainer_names['a@x.com'] == 'Alice'
@@ -39,7 +39,7 @@ import {
   Warning as WarningIcon,
 } from '@mui/icons-material'
 import { getTooltipForHeader } from '../../utils/columnTooltips'
-import { getProjectStats, getJibbleProjectHours, getTimeTheft, excludeFromTimeTheft, removeTimeTheftExclusion, JibbleUserHours, TimeTheftEntry, ProjectStats, PodLeadUnderProject, TrainerUnderPodLead, TaskUnderTrainer } from '../../services/api'
+import { getProjectStats, getProjectTrainerTasks, getJibbleProjectHours, getTimeTheft, excludeFromTimeTheft, removeTimeTheftExclusion, JibbleUserHours, TimeTheftEntry, ProjectStats, PodLeadUnderProject, TrainerUnderPodLead, TaskUnderTrainer } from '../../services/api'
 import AccessTimeIcon from '@mui/icons-material/AccessTime'
 import ReportProblemIcon from '@mui/icons-material/ReportProblem'
 import { Switch, FormControlLabel, Checkbox } from '@mui/material'
@@ -391,19 +391,55 @@ function TaskRow({ task }: { task: TaskUnderTrainer }) {
 // Responsive font sizes for trainer data
 const trainerFontSize = { xs: '0.58rem', sm: '0.63rem', md: '0.68rem' }
 
-// Trainer Row Component (Expandable - shows tasks underneath)
+// Project and date range whose task rows are loaded when a trainer is expanded
+interface TaskQuery {
+  projectId: number
+  startDate?: string
+  endDate?: string
+}
+
+// Trainer Row Component (Expandable - loads and shows tasks underneath)
 // COLOR CODING: Only RATE, R%, and EFF% should be color-coded per PMO requirements
 function TrainerRow({ 
   trainer, 
   colorSettings,
-  applyColors = true
+  applyColors = true,
+  taskQuery
 }: { 
   trainer: TrainerUnderPodLead
   colorSettings: ColorSettings
   applyColors?: boolean
+  taskQuery?: TaskQuery
 }) {
   const [open, setOpen] = useState(false)
-  const hasTasks = trainer.tasks && trainer.tasks.length > 0
+  const [tasks, setTasks] = useState<TaskUnderTrainer[] | null>(trainer.tasks ?? null)
+  const [tasksLoading, setTasksLoading] = useState(false)
+  const [tasksError, setTasksError] = useState<string | null>(null)
+  const hasTasks = tasks ? tasks.length > 0 : trainer.unique_tasks > 0 && !!taskQuery
+
+  useEffect(() => {
+    setTasks(trainer.tasks ?? null)
+    setTasksError(null)
+  }, [trainer])
+
+  const loadTasks = async () => {
+    if (!taskQuery) return
+    setTasksLoading(true)
+    setTasksError(null)
+    try {
+      setTasks(await getProjectTrainerTasks(taskQuery.projectId, trainer.trainer_email, taskQuery.startDate, taskQuery.endDate))
+    } catch (err) {
+      setTasksError('Failed to load tasks')
+    } finally {
+      setTasksLoading(false)
+    }
+  }
+
+  const toggle = () => {
+    const opening = !open
+    setOpen(opening)
+    if (opening && !tasks && !tasksLoading) loadTasks()
+  }
   
   return (
     <>
@@ -414,7 +450,7 @@ function TrainerRow({
           cursor: hasTasks ? 'pointer' : 'default',
           borderLeft: trainer.below_target ? '2px solid #EF4444' : open ? '2px solid #6366F1' : '2px solid transparent',
         }}
-        onClick={() => hasTasks && setOpen(!open)}
+        onClick={() => hasTasks && toggle()}
       >
         {/* Overview Group */}
         <TableCell sx={{ 
@@ -429,7 +465,7 @@ function TrainerRow({
         }}>
           <Box sx={{ display: 'flex', alignItems: 'center', gap: 0.3 }}>
             {hasTasks ? (
-              <IconButton size="small" sx={{ p: 0.1, minWidth: { xs: 10, md: 12 } }} onClick={(e) => { e.stopPropagation(); setOpen(!open) }}>
+              <IconButton size="small" sx={{ p: 0.1, minWidth: { xs: 10, md: 12 } }} onClick={(e) => { e.stopPropagation(); toggle() }}>
                 {open ? <KeyboardArrowUp sx={{ fontSize: { xs: 8, md: 10 } }} /> : <KeyboardArrowDown sx={{ fontSize: { xs: 8, md: 10 } }} />}
               </IconButton>
             ) : <Box sx={{ width: { xs: 10, md: 12 } }} />}
@@ -452,7 +488,7 @@ function TrainerRow({
         </TableCell>
         <TableCell align="center" sx={{ ...cellStyle, borderRight: `2px solid ${COLUMN_GROUPS.overview.borderColor}` }}>
           {hasTasks ? (
-            <Typography sx={{ fontSize: dataFontSize, fontWeight: 500, color: '#6366F1' }}>{trainer.tasks?.length}</Typography>
+            <Typography sx={{ fontSize: dataFontSize, fontWeight: 500, color: '#6366F1' }}>{tasks?.length ?? trainer.unique_tasks}</Typography>
           ) : (
             <Typography sx={{ color: '#94A3B8' }}>-</Typography>
           )}
@@ -572,7 +608,28 @@ function TrainerRow({
       </TableRow>
       
       {/* Render Task Rows when expanded */}
-      {hasTasks && open && trainer.tasks?.map((task) => (
+      {open && tasksLoading && (
+        <TableRow>
+          <TableCell colSpan={4} sx={{ ...cellStyle, pl: { xs: 4, sm: 5, md: 6 } }}>
+            <CircularProgress size={12} />
+          </TableCell>
+        </TableRow>
+      )}
+      {open && tasksError && (
+        <TableRow>
+          <TableCell colSpan={4} sx={{ ...cellStyle, pl: { xs: 4, sm: 5, md: 6 } }}>
+            <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
+              <Typography sx={{ fontSize: { xs: '0.55rem', sm: '0.58rem', md: '0.62rem' }, color: '#DC2626' }}>
+                {tasksError}
+              </Typography>
+              <Button size="small" sx={{ fontSize: '0.6rem', minWidth: 0, p: 0, textTransform: 'none' }} onClick={loadTasks}>
+                Retry
+              </Button>
+            </Box>
+          </TableCell>
+        </TableRow>
+      )}
+      {hasTasks && open && tasks?.map((task) => (
         <TaskRow key={task.task_id} task={task} />
       ))}
     </>
@@ -588,6 +645,7 @@ function PodLeadRow({
   applyColorsToTrainers = true,
   sortColumn = '',
   sortDirection = 'asc' as const,
+  taskQuery,
 }: { 
   podLead: PodLeadUnderProject
   colorSettings: ColorSettings
@@ -595,6 +653,7 @@ function PodLeadRow({
   applyColorsToTrainers?: boolean
   sortColumn?: string
   sortDirection?: 'asc' | 'desc'
+  taskQuery?: TaskQuery
 }) {
   const [open, setOpen] = useState(false)
   const hasTrainers = podLead.trainers && podLead.trainers.length > 0
@@ -777,7 +836,7 @@ function PodLeadRow({
       </TableRow>
       
       {hasTrainers && open && sortedTrainers.map((trainer, idx) => (
-        <TrainerRow key={idx} trainer={trainer} colorSettings={colorSettings} applyColors={applyColorsToTrainers} />
+        <TrainerRow key={idx} trainer={trainer} colorSettings={colorSettings} applyColors={applyColorsToTrainers} taskQuery={taskQuery} />
       ))}
     </>
   )
@@ -793,6 +852,7 @@ function ProjectRow({
   applyColorsToTrainers = true,
   sortColumn = '',
   sortDirection = 'asc' as const,
+  dateRange = {},
 }: { 
   project: ProjectStats
   colorSettings: ColorSettings
@@ -801,6 +861,7 @@ function ProjectRow({
   applyColorsToTrainers?: boolean
   sortColumn?: string
   sortDirection?: 'asc' | 'desc'
+  dateRange?: { startDate?: string; endDate?: string }
 }) {
   const [open, setOpen] = useState(false)
   const hasPodLeads = project.pod_leads && project.pod_leads.length > 0
@@ -1001,6 +1062,7 @@ function ProjectRow({
           applyColorsToTrainers={applyColorsToTrainers}
           sortColumn={sortColumn}
           sortDirection={sortDirection}
+          taskQuery={{ projectId: project.project_id, ...dateRange }}
         />
       ))}
     </>
@@ -1642,6 +1704,7 @@ export function ProjectsTab({ onSummaryUpdate, onSummaryLoading }: ProjectsTabPr
   const [flaggedOpen, setFlaggedOpen] = useState(false)
   const [jibbleOpen, setJibbleOpen] = useState(false)
   const [timeTheftOpen, setTimeTheftOpen] = useState(false)
+  const [loadedRange, setLoadedRange] = useState<{ startDate?: string; endDate?: string }>({})
   
   const [colorSettings, setColorSettings] = useColorSettings('projectsColorSettings')
   const [colorApplyLevel, setColorApplyLevel] = useState<ColorApplyLevel>('both')
@@ -1684,9 +1747,10 @@ export function ProjectsTab({ onSummaryUpdate, onSummaryLoading }: ProjectsTabPr
     onSummaryLoading?.()
     try {
       const { startDate, endDate } = getDateRange(timeframe, weekOffset, customStartDate, customEndDate)
-      // Include tasks for 4-level hierarchy (Project -> POD Lead -> Trainer -> Tasks)
-      const result = await getProjectStats(startDate, endDate, true)
+      // Aggregates only; each trainer's tasks (4th level) load when it is expanded
+      const result = await getProjectStats(startDate, endDate)
       setData(result)
+      setLoadedRange({ startDate, endDate })
     } catch (err) {
       setError('Failed to fetch Project stats')
     } finally {
@@ -2096,7 +2160,7 @@ export function ProjectsTab({ onSummaryUpdate, onSummaryLoading }: ProjectsTabPr
                 <ProjectRow 
                   key={idx} project={project} colorSettings={effectiveColorSettings} 
                   applyColors={applyColorsToProject} applyColorsToPodLeads={applyColorsToPodLeads} applyColorsToTrainers={applyColorsToPodLeads}
-                  sortColumn={sortColumn} sortDirection={sortDirection}
+                  sortColumn={sortColumn} sortDirection={sortDirection} dateRange={loadedRange}
                 />
               ))}
             </TableBody>
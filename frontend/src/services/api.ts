@@ -694,6 +694,22 @@ export const getProjectStats = async (
   return response.data
 }
 
+// Task rows under one trainer of the project hierarchy, loaded when the trainer is expanded
+export const getProjectTrainerTasks = async (
+  projectId: number,
+  trainerEmail: string,
+  startDate?: string,
+  endDate?: string
+): Promise<TaskUnderTrainer[]> => {
+  const params = new URLSearchParams()
+  params.append('project_id', String(projectId))
+  params.append('trainer_email', trainerEmail)
+  if (startDate) params.append('start_date', startDate)
+  if (endDate) params.append('end_date', endDate)
+  const response = await apiClient.get<TaskUnderTrainer[]>(`/project-stats/tasks?${params.toString()}`)
+  return response.data
+}
+
 
 // ============================================================================
 // JIBBLE HOURS API FUNCTIONS